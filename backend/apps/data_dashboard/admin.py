@@ -2,7 +2,23 @@
 Django admin configuration for data dashboard app.
 """
 from django.contrib import admin
-from .models import DepartmentKPI, Publication, Student, ResearchBudgetData, UploadHistory
+from .models import (
+    Department, DepartmentAlias, DepartmentKPI, Publication, Student,
+    ResearchBudgetData, ResearchProject, UploadHistory
+)
+
+
+class DepartmentAliasInline(admin.TabularInline):
+    model = DepartmentAlias
+    extra = 1
+
+
+@admin.register(Department)
+class DepartmentAdmin(admin.ModelAdmin):
+    list_display = ('id', 'college', 'name')
+    list_filter = ('college',)
+    search_fields = ('name', 'aliases__alias')
+    inlines = [DepartmentAliasInline]
 
 
 @admin.register(DepartmentKPI)
@@ -33,6 +49,13 @@ class ResearchBudgetDataAdmin(admin.ModelAdmin):
     search_fields = ('project_number', 'project_name', 'principal_investigator')
 
 
+@admin.register(ResearchProject)
+class ResearchProjectAdmin(admin.ModelAdmin):
+    list_display = ('project_number', 'project_name', 'department', 'total_budget')
+    list_filter = ('department',)
+    search_fields = ('project_number', 'project_name', 'principal_investigator')
+
+
 @admin.register(UploadHistory)
 class UploadHistoryAdmin(admin.ModelAdmin):
     list_display = ('file_name', 'file_type', 'status', 'records_processed', 'uploaded_at')
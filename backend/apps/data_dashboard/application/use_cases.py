@@ -3,9 +3,16 @@ Dashboard Use Cases Module
 Application layer for orchestrating dashboard workflows.
 Implements the GetDashboardDataUseCase following plan.md specifications.
 """
+import time
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any
 
+from asgiref.sync import async_to_sync
+from django.db import transaction
+
+from core import metrics, response_cache
+from core.concurrency import gather_queries
 from core.exceptions import NotFoundError, ValidationError
 
 
@@ -27,6 +34,21 @@ class GetDashboardDataUseCase:
     def execute(self) -> Dict[str, Any]:
         """
         Execute dashboard data retrieval workflow.
+        Synchronous entry point for execute_async().
+
+        Returns:
+            dict: Complete dashboard data, see execute_async()
+
+        Raises:
+            NotFoundError: If no data exists
+            ValidationError: If data is invalid
+        """
+        return async_to_sync(self.execute_async)()
+
+    async def execute_async(self) -> Dict[str, Any]:
+        """
+        Execute dashboard data retrieval workflow.
+        The four computations are independent and run concurrently.
 
         Returns:
             dict: Complete dashboard data including:
@@ -41,23 +63,19 @@ class GetDashboardDataUseCase:
             ValidationError: If data is invalid
         """
         try:
-            # Step 1: Calculate KPI metrics
-            kpi_data = self.service.calculate_kpi_metrics()
-
-            # Step 2: Calculate trend data
-            trend_data = self.service.calculate_trend_data()
-
-            # Step 3: Calculate department performance
-            department_data = self.service.calculate_department_performance()
-
-            # Step 4: Calculate budget allocation
-            budget_data = self.service.calculate_budget_allocation()
+            # Step 1: Calculate KPI, trend, department and budget data
+            kpi_data, trend_data, department_data, budget_data = await gather_queries(
+                self.service.calculate_kpi_metrics,
+                self.service.calculate_trend_data,
+                self.service.calculate_department_performance,
+                self.service.calculate_budget_allocation
+            )
 
-            # Step 5: Validate that we have at least some data
+            # Step 2: Validate that we have at least some data
             if not kpi_data or not trend_data:
                 raise NotFoundError("Dashboard data is empty. Please upload data first.")
 
-            # Step 6: Return aggregated data
+            # Step 3: Return aggregated data
             return {
                 'kpi_data': kpi_data,
                 'trend_data': trend_data,
@@ -109,6 +127,26 @@ class GetPerformanceDataUseCase:
     def execute(self, start_date, end_date, department=None, project=None):
         """
         Execute the performance data retrieval use case.
+        Synchronous entry point for execute_async().
+
+        Args:
+            start_date (date): Start date for filtering
+            end_date (date): End date for filtering
+            department (str, optional): Department filter
+            project (str, optional): Project filter
+
+        Returns:
+            dict: Performance data, see execute_async()
+
+        Raises:
+            ValidationError: If filters are invalid
+        """
+        return async_to_sync(self.execute_async)(start_date, end_date, department, project)
+
+    async def execute_async(self, start_date, end_date, department=None, project=None):
+        """
+        Execute the performance data retrieval use case.
+        The three repository queries are independent and run concurrently.
 
         Args:
             start_date (date): Start date for filtering
@@ -130,16 +168,10 @@ class GetPerformanceDataUseCase:
         self._validate_date_range(start_date, end_date)
 
         # 2. Fetch raw data from repository
-        trend_data = self.repository.get_performance_trend(
-            start_date, end_date, department, project
-        )
-
-        department_data = self.repository.get_department_comparison(
-            start_date, end_date, project
-        )
-
-        achievement_raw = self.repository.get_achievement_rate(
-            start_date, end_date, department
+        trend_data, department_data, achievement_raw = await gather_queries(
+            partial(self.repository.get_performance_trend, start_date, end_date, department, project),
+            partial(self.repository.get_department_comparison, start_date, end_date, project),
+            partial(self.repository.get_achievement_rate, start_date, end_date, department)
         )
 
         # 3. Apply business logic via service
@@ -187,20 +219,50 @@ class GetPapersAnalyticsUseCase:
     Orchestrates papers analytics workflow with filtering.
     """
 
-    def __init__(self):
+    def __init__(self, field_match='contains'):
         """
         Initialize use case with repository and service.
         Uses dependency injection pattern.
+
+        Args:
+            field_match (str): Match mode for the field filter
+                ('contains', 'prefix' or 'exact')
+
+        Raises:
+            ValidationError: If field_match is not supported
         """
-        from ..infrastructure.repositories import PapersAnalyticsRepository
+        from ..infrastructure.repositories import PapersAnalyticsRepository, TEXT_MATCH_MODES
         from ..domain.services import PapersAnalyticsService
 
-        self.repository = PapersAnalyticsRepository()
+        if field_match not in TEXT_MATCH_MODES:
+            raise ValidationError(
+                f"Invalid field_match: {field_match}. Must be one of: {', '.join(TEXT_MATCH_MODES)}"
+            )
+
+        self.repository = PapersAnalyticsRepository(field_match=field_match)
         self.service = PapersAnalyticsService(self.repository)
 
     def execute(self, year=None, journal_grade=None, field=None) -> Dict[str, Any]:
         """
         Execute the papers analytics use case.
+        Synchronous entry point for execute_async().
+
+        Args:
+            year (int, optional): Filter by year
+            journal_grade (str, optional): Filter by journal grade
+            field (str, optional): Filter by field/department
+
+        Returns:
+            dict: Papers analytics data, see execute_async()
+
+        Raises:
+            ValidationError: If filters are invalid
+        """
+        return async_to_sync(self.execute_async)(year, journal_grade, field)
+
+    async def execute_async(self, year=None, journal_grade=None, field=None) -> Dict[str, Any]:
+        """
+        Execute the papers analytics use case.
 
         Args:
             year (int, optional): Filter by year
@@ -223,7 +285,7 @@ class GetPapersAnalyticsUseCase:
             raise ValidationError("Invalid filter parameters")
 
         # Get analytics data
-        analytics_data = self.service.get_analytics(
+        analytics_data = await self.service.get_analytics_async(
             year, journal_grade, field
         )
 
@@ -240,6 +302,78 @@ class GetPapersAnalyticsUseCase:
         }
 
 
+class GetStudentsAnalyticsUseCase:
+    """
+    Use case for retrieving student analytics data.
+    Answers every filter combination from the student rollup.
+    """
+
+    def __init__(self):
+        """
+        Initialize use case with repository and service.
+        Uses dependency injection pattern.
+        """
+        from ..infrastructure.repositories import StudentRollupRepository
+        from ..domain.services import StudentAnalyticsService
+
+        self.repository = StudentRollupRepository()
+        self.service = StudentAnalyticsService()
+
+    def execute(self, filters: dict) -> Dict[str, Any]:
+        """
+        Execute the student analytics use case.
+
+        Args:
+            filters: Raw filter parameters (department, grade, year)
+
+        Returns:
+            dict: {
+                'total_students': int,
+                'department_stats': list,
+                'grade_distribution': list,
+                'enrollment_trend': list
+            }
+
+        Raises:
+            ValidationError: If filters are invalid
+        """
+        validated = self.service.validate_filters(filters)
+
+        cells = self.repository.get_cells(
+            department=validated.get('department'),
+            grade=validated.get('grade')
+        )
+
+        return self.service.summarize_cells(cells, year=validated.get('year'))
+
+
+class GetDepartmentsUseCase:
+    """
+    Use case for listing departments for filter dropdowns.
+    Reads the small department dimension instead of scanning fact tables.
+    """
+
+    def __init__(self):
+        """
+        Initialize use case with repository dependency.
+        """
+        from ..infrastructure.repositories import DepartmentRepository
+
+        self.repository = DepartmentRepository()
+
+    def execute(self, college=None) -> Dict[str, Any]:
+        """
+        List departments, optionally within one college.
+
+        Args:
+            college (str, optional): College filter
+
+        Returns:
+            dict: {'departments': [{'id': int, 'college': str, 'name': str}, ...]}
+        """
+        return {'departments': self.repository.get_departments(college=college)}
+
+
 class BudgetAnalysisUseCase:
     """
     Use case for budget analysis operations.
@@ -259,7 +393,8 @@ class BudgetAnalysisUseCase:
         self.repository = BudgetRepository()
         self.service = BudgetAnalysisService(self.repository)
 
-    def get_budget_allocation(self, department=None, year=None, category=None):
+    def get_budget_allocation(self, department=None, year=None, category=None,
+                              category_match='contains'):
         """
         Get department-wise budget allocation.
 
@@ -267,6 +402,8 @@ class BudgetAnalysisUseCase:
             department (str, optional): Filter by specific department
             year (int, optional): Filter by year (default: current year)
             category (str, optional): Filter by budget category
+            category_match (str): Match mode for the category filter
+                ('contains', 'prefix' or 'exact')
 
         Returns:
             list: List of budget allocation items with:
@@ -283,7 +420,8 @@ class BudgetAnalysisUseCase:
         result = self.service.calculate_budget_allocation(
             department=department,
             year=year,
-            category=category
+            category=category,
+            category_match=category_match
         )
 
         # Return empty list if no data found (consistent with other endpoints)
@@ -355,6 +493,172 @@ class BudgetAnalysisUseCase:
         return result
 
 
+class GetHomeBundleUseCase:
+    """
+    Use case for the dashboard home page bundle.
+    Computes any set of home widgets in one request. The widgets share one
+    department lookup and one latest-KPI-year query, which are loaded once
+    before the widgets run concurrently.
+    """
+
+    WIDGETS = (
+        'kpi',
+        'trends',
+        'department_performance',
+        'budget_summary',
+        'budget_allocation',
+        'papers',
+        'students',
+    )
+
+    # Widgets reading the latest KPI year
+    KPI_YEAR_WIDGETS = {'kpi', 'department_performance'}
+
+    def __init__(self):
+        """
+        Initialize use case with repositories sharing one department lookup.
+        """
+        from ..infrastructure.repositories import (
+            BudgetRepository,
+            DashboardRepository,
+            DepartmentRepository,
+            PapersAnalyticsRepository,
+            StudentRollupRepository
+        )
+        from ..domain.services import (
+            BudgetAnalysisService,
+            DashboardService,
+            PapersAnalyticsService,
+            StudentAnalyticsService
+        )
+
+        self.departments = DepartmentRepository()
+        self.dashboard_repository = DashboardRepository(department_repository=self.departments)
+        self.dashboard_service = DashboardService(self.dashboard_repository)
+        self.budget_service = BudgetAnalysisService(
+            BudgetRepository(department_repository=self.departments)
+        )
+        self.papers_service = PapersAnalyticsService(
+            PapersAnalyticsRepository(department_repository=self.departments)
+        )
+        self.student_repository = StudentRollupRepository(department_repository=self.departments)
+        self.student_service = StudentAnalyticsService()
+
+    def execute(self, widgets, department=None, year=None) -> Dict[str, Any]:
+        """
+        Compute the requested widgets.
+        Synchronous entry point for execute_async().
+
+        Args:
+            widgets (list): Widget ids, see WIDGETS
+            department (str, optional): Department filter shared by the widgets
+            year (int, optional): Year filter shared by the widgets
+
+        Returns:
+            dict: Widget data and errors, see execute_async()
+
+        Raises:
+            ValidationError: If no widget or an unknown widget is requested
+        """
+        return async_to_sync(self.execute_async)(widgets, department, year)
+
+    async def execute_async(self, widgets, department=None, year=None) -> Dict[str, Any]:
+        """
+        Compute the requested widgets.
+        Dashboard widgets are global; budget_allocation, papers and students
+        apply the shared department and year filters like their own endpoints.
+
+        Args:
+            widgets (list): Widget ids, see WIDGETS
+            department (str, optional): Department filter shared by the widgets
+            year (int, optional): Year filter shared by the widgets
+
+        Returns:
+            dict: {
+                'widgets': {widget_id: widget data},
+                'errors': {widget_id: message} for widgets whose filters
+                    are invalid or that have no data,
+                'last_updated': ISO timestamp
+            }
+
+        Raises:
+            ValidationError: If no widget or an unknown widget is requested
+        """
+        widgets = list(dict.fromkeys(widgets))
+        if not widgets:
+            raise ValidationError("At least one widget is required")
+
+        unknown = [widget for widget in widgets if widget not in self.WIDGETS]
+        if unknown:
+            raise ValidationError(
+                f"Unknown widgets: {', '.join(unknown)}. Must be among: {', '.join(self.WIDGETS)}"
+            )
+
+        # Load the shared intermediate results once, before the widgets fan out
+        shared = [self.departments.get_names]
+        if self.KPI_YEAR_WIDGETS.intersection(widgets):
+            shared.append(self.dashboard_repository.get_latest_kpi_year)
+        await gather_queries(*shared)
+
+        results = await gather_queries(*(
+            partial(self._compute, widget, department, year) for widget in widgets
+        ))
+
+        bundle = {'widgets': {}, 'errors': {}, 'last_updated': datetime.now().isoformat()}
+        for widget, (data, error) in zip(widgets, results):
+            if error is None:
+                bundle['widgets'][widget] = data
+            else:
+                bundle['errors'][widget] = error
+
+        return bundle
+
+    def _compute(self, widget, department, year):
+        """
+        Compute one widget, capturing the errors its own endpoint reports as 4xx.
+
+        Returns:
+            tuple: (data, None) on success, (None, error message) otherwise
+        """
+        try:
+            return getattr(self, f'_get_{widget}')(department, year), None
+        except (NotFoundError, ValidationError) as e:
+            return None, str(e)
+
+    def _get_kpi(self, department, year):
+        return self.dashboard_service.calculate_kpi_metrics()
+
+    def _get_trends(self, department, year):
+        return self.dashboard_service.calculate_trend_data()
+
+    def _get_department_performance(self, department, year):
+        return self.dashboard_service.calculate_department_performance()
+
+    def _get_budget_summary(self, department, year):
+        return self.dashboard_service.calculate_budget_allocation()
+
+    def _get_budget_allocation(self, department, year):
+        return self.budget_service.calculate_budget_allocation(
+            department=department,
+            year=year
+        ) or []
+
+    def _get_papers(self, department, year):
+        if not self.papers_service.validate_filters(year, None, department):
+            raise ValidationError("Invalid filter parameters")
+
+        analytics_data = self.papers_service.get_analytics(year, None, department)
+        return {
+            **analytics_data,
+            'has_data': any(analytics_data[key] for key in ('yearly_data', 'journal_data', 'field_data'))
+        }
+
+    def _get_students(self, department, year):
+        validated = self.student_service.validate_filters({'department': department, 'year': year})
+        cells = self.student_repository.get_cells(department=validated.get('department'))
+        return self.student_service.summarize_cells(cells, year=validated.get('year'))
+
+
 class UploadFileUseCase:
     """
     Use case for file upload workflow.
@@ -367,14 +671,29 @@ class UploadFileUseCase:
         Initialize use case with all required dependencies.
         """
         from ..domain.services import FileValidationService, DataProcessingService
-        from ..infrastructure.repositories import DataUploadRepository, UploadHistoryRepository
+        from ..infrastructure.repositories import (
+            DataUploadRepository,
+            UploadHistoryRepository,
+            BudgetCubeRepository,
+            StudentRollupRepository,
+            ResearchProjectRepository,
+            DepartmentRepository,
+            BudgetPartitionRepository
+        )
         from ..infrastructure.file_parsers import ParserFactory, ExcelParser
         import tempfile
         import os
 
         self.validation_service = FileValidationService()
         self.upload_repo = DataUploadRepository()
-        self.processing_service = DataProcessingService(self.upload_repo)
+        self.processing_service = DataProcessingService(
+            self.upload_repo,
+            budget_cube_repository=BudgetCubeRepository(),
+            student_rollup_repository=StudentRollupRepository(),
+            project_repository=ResearchProjectRepository(),
+            department_repository=DepartmentRepository(),
+            partition_repository=BudgetPartitionRepository()
+        )
         self.history_repository = UploadHistoryRepository()
         self.parser_factory = ParserFactory
         self.ExcelParser = ExcelParser  # Store class reference
@@ -414,6 +733,7 @@ class UploadFileUseCase:
 
         logger = logging.getLogger(__name__)
         temp_file_path = None
+        started = time.perf_counter()
 
         try:
             # Step 1: Validate file format and size
@@ -483,6 +803,8 @@ class UploadFileUseCase:
 
             records_processed = result['records_processed']
             logger.info(f"Processed {records_processed} records")
+            metrics.UPLOAD_ROWS.inc(records_processed, file_type=file_type)
+            metrics.UPLOAD_SECONDS.inc(time.perf_counter() - started, file_type=file_type)
 
             # Step 8: Record successful upload in history
             self.history_repository.create_history(
@@ -494,6 +816,9 @@ class UploadFileUseCase:
                 error_message=None
             )
 
+            # New data: cached analytics responses are stale once it commits
+            transaction.on_commit(response_cache.bump_version)
+
             # Step 9: Return success result
             return {
                 'success': True,
@@ -605,45 +930,86 @@ class GetUploadHistoryUseCase:
 
         self.history_repository = UploadHistoryRepository()
 
-    def execute(self, user_id: int, page: int = 1, page_size: int = 20, is_admin: bool = False) -> Dict:
+    COUNT_MODES = ('estimated', 'exact', 'none')
+
+    def execute(self, user_id: int, cursor: str = None, page_size: int = 20, is_admin: bool = False,
+                count: str = 'estimated') -> Dict:
         """
-        Get upload history.
+        Get a page of upload history, newest first.
         - Admin: See all uploads
         - Non-admin: See only own uploads
 
+        Pages are addressed by keyset cursors on (uploaded_at, id), so every
+        page costs the same however deep it is.
+
         Args:
             user_id: ID of requesting user
-            page: Page number (1-indexed)
+            cursor: next_cursor or prev_cursor of a previous page, None for the newest page
             page_size: Number of records per page
             is_admin: Whether user is admin
+            count: 'estimated' (planner estimate), 'exact', or 'none' to skip the total
 
         Returns:
             dict: {
-                'results': List[UploadHistory],
-                'total': int,
-                'page': int,
-                'page_size': int
+                'results': List[Dict],
+                'next_cursor': str or None,
+                'prev_cursor': str or None,
+                'page_size': int,
+                'total': int or None,
+                'total_is_estimate': bool
             }
+
+        Raises:
+            ValidationError: If the cursor or count mode is invalid
         """
+        from core.pagination import decode_cursor, encode_cursor
+
         # Validate pagination parameters
-        if page < 1:
-            page = 1
         if page_size < 1 or page_size > 100:
             page_size = 20
+        if count not in self.COUNT_MODES:
+            raise ValidationError(f"count must be one of: {', '.join(self.COUNT_MODES)}")
+
+        position, backwards = None, False
+        if cursor:
+            payload = decode_cursor(cursor)
+            try:
+                position = (datetime.fromisoformat(payload['uploaded_at']), int(payload['id']))
+            except (KeyError, TypeError, ValueError):
+                raise ValidationError("Invalid cursor")
+            backwards = bool(payload.get('backwards'))
 
-        # Get history based on user role
+        # Get history based on user role: admin sees all uploads
+        count_user_id = None if is_admin else user_id
         if is_admin:
-            # Admin sees all uploads
-            history_records = self.history_repository.get_history_list(page, page_size)
-            total = self.history_repository.get_history_count()
+            history_records, has_more = self.history_repository.get_history_list(
+                position, backwards, page_size
+            )
         else:
-            # Non-admin sees only own uploads
-            history_records = self.history_repository.get_history_by_user(
-                user_id, page, page_size
+            history_records, has_more = self.history_repository.get_history_by_user(
+                user_id, position, backwards, page_size
+            )
+
+        def cursor_at(record, backwards=False):
+            return encode_cursor({
+                'uploaded_at': record.uploaded_at.isoformat(),
+                'id': record.id,
+                'backwards': backwards
+            })
+
+        next_cursor = prev_cursor = None
+        if history_records:
+            # Coming back from a later page means there is a next one
+            if has_more if not backwards else position is not None:
+                next_cursor = cursor_at(history_records[-1])
+            if has_more if backwards else position is not None:
+                prev_cursor = cursor_at(history_records[0], backwards=True)
+
+        total = None
+        if count != 'none':
+            total = self.history_repository.get_history_count(
+                count_user_id, estimate=count == 'estimated'
             )
-            # Get total count for user
-            from ..models import UploadHistory
-            total = UploadHistory.objects.filter(user_id=user_id).count()
 
         # Serialize history records
         results = []
@@ -661,7 +1027,335 @@ class GetUploadHistoryUseCase:
 
         return {
             'results': results,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor,
+            'page_size': page_size,
             'total': total,
-            'page': page,
-            'page_size': page_size
+            'total_is_estimate': count == 'estimated'
+        }
+
+
+class BrowseRecordsUseCase:
+    """
+    Use case for browsing the raw rows of an uploaded dataset.
+    Validates the projection, filters and cursor up front, then encodes the
+    page as JSON chunks while its rows are read, so pages of any size can
+    be streamed without being held in memory.
+    """
+
+    # Rows read from the database cursor, and encoded, per chunk
+    CHUNK_ROWS = 2000
+
+    def __init__(self, dataset: str):
+        """
+        Initialize use case with repository dependency.
+
+        Args:
+            dataset: 'students', 'publications' or 'budget'
+
+        Raises:
+            ValidationError: If the dataset is unknown
+        """
+        from ..infrastructure.repositories import RecordRepository
+
+        self.repository = RecordRepository(dataset)
+
+    def execute(self, fields=None, filters=None, cursor: str = None, page_size: int = 100):
+        """
+        Get a page of raw rows in id order.
+
+        Args:
+            fields: Columns to include, None for all of them
+            filters: Raw filter values by parameter name
+            cursor: next_cursor of a previous page, None for the first page
+            page_size: Number of rows per page
+
+        Returns:
+            iterator: Byte chunks of the JSON body
+                {"results": [...], "next_cursor": str or null, "page_size": int}
+
+        Raises:
+            ValidationError: If the fields, filters, cursor or page size are invalid
+        """
+        from django.conf import settings
+        from core.pagination import decode_cursor
+
+        available = self.repository.spec['fields']
+        if fields:
+            fields = list(dict.fromkeys(fields))
+            unknown = [name for name in fields if name not in available]
+            if unknown:
+                raise ValidationError(f"Unknown fields: {', '.join(unknown)}")
+        else:
+            fields = list(available)
+
+        if page_size < 1 or page_size > settings.RECORDS_MAX_PAGE_SIZE:
+            raise ValidationError(f"page_size must be between 1 and {settings.RECORDS_MAX_PAGE_SIZE}")
+
+        after = None
+        if cursor:
+            after = decode_cursor(cursor).get('after')
+            if not isinstance(after, int):
+                raise ValidationError("Invalid cursor")
+
+        # The id leads every row for the cursor, projected or not
+        columns = ['id'] + [name for name in fields if name != 'id']
+        rows = self.repository.get_rows(columns, filters, after, page_size + 1)
+
+        # Coded columns go out as their labels
+        model = self.repository.model
+        labels = {
+            name: dict(model._meta.get_field(name).choices)
+            for name in fields if model._meta.get_field(name).choices
+        }
+
+        return self._encode(rows, [(name, columns.index(name)) for name in fields], labels, page_size)
+
+    def _encode(self, rows, positions, labels, page_size):
+        """
+        Encode rows as JSON chunks, reading one extra row to tell whether
+        another page follows.
+        """
+        from core.pagination import encode_cursor
+        from core.renderers import dumps
+
+        yield b'{"results":['
+
+        count, last_id, has_more = 0, None, False
+        batch, separator = [], b''
+        for row in rows.iterator(chunk_size=self.CHUNK_ROWS):
+            if count == page_size:
+                has_more = True
+                break
+
+            record = {name: row[position] for name, position in positions}
+            for name, choices in labels.items():
+                if record[name] is not None:
+                    record[name] = choices.get(record[name], record[name])
+            batch.append(record)
+            count += 1
+            last_id = row[0]
+
+            if len(batch) == self.CHUNK_ROWS:
+                yield separator + dumps(batch)[1:-1]
+                batch, separator = [], b','
+
+        if batch:
+            yield separator + dumps(batch)[1:-1]
+
+        next_cursor = encode_cursor({'after': last_id}) if has_more else None
+        yield b'],"next_cursor":' + dumps(next_cursor) + b',"page_size":' + dumps(page_size) + b'}'
+
+
+class ExportRecordsUseCase:
+    """
+    Use case for exporting a dataset as CSV in its upload format.
+    Columns follow the dataset's parser and coded values are written as
+    their labels, so an export can be uploaded again unchanged. Rows are
+    read through a server-side cursor and written chunk by chunk, so memory
+    stays flat whatever the table size.
+    """
+
+    HEADER_MODES = ('en', 'ko')
+
+    # Rows read from the database cursor, and written, per chunk
+    CHUNK_ROWS = 2000
+
+    def __init__(self, dataset: str):
+        """
+        Initialize use case with repository and parser dependencies.
+
+        Args:
+            dataset: 'students', 'publications' or 'budget'
+
+        Raises:
+            ValidationError: If the dataset is unknown
+        """
+        from ..infrastructure.repositories import RecordRepository
+        from ..infrastructure.file_parsers import ParserFactory
+
+        self.repository = RecordRepository(dataset)
+        self.parser = ParserFactory.get_parser(self.repository.spec['file_type'])
+
+    def get_header(self, headers: str = 'en'):
+        """
+        Get the CSV header row.
+
+        Args:
+            headers: 'en' for the column names, 'ko' for the first Korean
+                alias of each column in the parser's COLUMN_MAPPING
+
+        Returns:
+            list: Header names
+        """
+        columns = list(self.parser.REQUIRED_COLUMNS)
+        if headers == 'en':
+            return columns
+
+        aliases = {}
+        for alias, column in self.parser.COLUMN_MAPPING.items():
+            aliases.setdefault(column, alias)
+        return [aliases.get(column, column) for column in columns]
+
+    def execute(self, filters=None, headers: str = 'en'):
+        """
+        Export the rows of the dataset.
+
+        Args:
+            filters: Raw filter values by parameter name, as for BrowseRecordsUseCase
+            headers: 'en' or 'ko' header names
+
+        Returns:
+            iterator: Byte chunks of the UTF-8 CSV file
+
+        Raises:
+            ValidationError: If the filters or header mode are invalid
+        """
+        if headers not in self.HEADER_MODES:
+            raise ValidationError(f"headers must be one of: {', '.join(self.HEADER_MODES)}")
+
+        columns = list(self.parser.REQUIRED_COLUMNS)
+        rows = self.repository.get_rows(columns, filters, limit=None)
+
+        # Coded columns go out as the labels ingest reads back
+        model = self.repository.model
+        labels = {
+            index: dict(model._meta.get_field(name).choices)
+            for index, name in enumerate(columns) if model._meta.get_field(name).choices
         }
+
+        return self._write(rows, self.get_header(headers), labels)
+
+    def _write(self, rows, header, labels):
+        """
+        Write rows as CSV, yielding the buffer every CHUNK_ROWS rows.
+        """
+        import csv
+        import io
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # Byte order mark so Excel opens the file as UTF-8
+        buffer.write('\ufeff')
+        writer.writerow(header)
+
+        count = 0
+        for row in rows.iterator(chunk_size=self.CHUNK_ROWS):
+            if labels:
+                row = list(row)
+                for index, choices in labels.items():
+                    if row[index] is not None:
+                        row[index] = choices.get(row[index], row[index])
+            writer.writerow(row)
+            count += 1
+
+            if count % self.CHUNK_ROWS == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue().encode()
+
+
+class ColumnarExportUseCase:
+    """
+    Use case for exporting datasets and analytics results as Parquet or
+    Arrow IPC files. Dataset schemas mirror the model fields and analytics
+    schemas mirror the response serializers; rows are written one batch
+    at a time from the database cursor.
+    """
+
+    # Rows per record batch (and per database cursor fetch)
+    BATCH_ROWS = 10000
+
+    def __init__(self, file_format: str):
+        """
+        Initialize use case.
+
+        Args:
+            file_format: 'parquet' or 'arrow'
+
+        Raises:
+            ValidationError: If the format is unknown
+            BaseAPIException: If pyarrow is not installed
+        """
+        from core import columnar
+
+        columnar.check_format(file_format)
+        self.file_format = file_format
+
+    def export_dataset(self, dataset: str, sink, filters=None) -> int:
+        """
+        Export the rows of a dataset, coded columns as labels.
+
+        Args:
+            dataset: 'students', 'publications' or 'budget'
+            sink: Writable binary file or path
+            filters: Raw filter values by parameter name, as for BrowseRecordsUseCase
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ValidationError: If the dataset or filters are invalid
+        """
+        from core import columnar
+        from ..infrastructure.repositories import RecordRepository
+
+        repository = RecordRepository(dataset)
+        columns = list(repository.spec['fields'])
+        rows = repository.get_rows(columns, filters, limit=None)
+
+        model = repository.model
+        labels = {
+            index: dict(model._meta.get_field(name).choices)
+            for index, name in enumerate(columns) if model._meta.get_field(name).choices
+        }
+
+        return columnar.write(
+            self.file_format,
+            columnar.model_schema(model, columns),
+            self._batches(rows, labels),
+            sink
+        )
+
+    def export_rows(self, items, serializer_class, sink) -> int:
+        """
+        Export an analytics result.
+
+        Args:
+            items: List of result dicts
+            serializer_class: Flat serializer the result is rendered with
+            sink: Writable binary file or path
+
+        Returns:
+            int: Number of rows written
+        """
+        from core import columnar
+
+        return columnar.write(
+            self.file_format,
+            columnar.serializer_schema(serializer_class),
+            [columnar.serializer_rows(serializer_class, items)],
+            sink
+        )
+
+    def _batches(self, rows, labels):
+        """
+        Read rows in BATCH_ROWS lists, mapping coded columns to labels.
+        """
+        batch = []
+        for row in rows.iterator(chunk_size=self.BATCH_ROWS):
+            if labels:
+                row = list(row)
+                for index, choices in labels.items():
+                    if row[index] is not None:
+                        row[index] = choices.get(row[index], row[index])
+            batch.append(row)
+
+            if len(batch) == self.BATCH_ROWS:
+                yield batch
+                batch = []
+
+        yield batch
@@ -8,3 +8,10 @@ class DataDashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.data_dashboard'
     label = 'data_dashboard'
+
+    def ready(self):
+        from django.db.models import CharField
+        from core.lookups import TrigramIContains
+        import core.checks  # noqa: F401 (registers the checks)
+
+        CharField.register_lookup(TrigramIContains)
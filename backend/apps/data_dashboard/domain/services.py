@@ -4,10 +4,16 @@ Business logic for dashboard data calculations and aggregations.
 Follows the plan.md specifications and SOLID principles.
 """
 from decimal import Decimal
+from functools import partial
 from typing import Dict, List, Any
 
+import numpy as np
+from asgiref.sync import async_to_sync
+
+from core.concurrency import gather_queries
 from utils.formatters import format_percentage, format_currency
 from utils.date_utils import get_current_year
+from utils.vectorized import column, rates, round_decimals, round_floats, take
 
 
 class DashboardService:
@@ -267,24 +273,19 @@ class PerformanceService:
         Returns:
             list: Department data with percentage calculations
         """
-        # Calculate total
-        total = sum(item.get('value', 0) for item in department_data)
+        values = [item.get('value', 0) for item in department_data]
+        total = sum(values)
 
         if total == 0:
             return department_data
 
-        # Add percentage to each item
-        result = []
-        for item in department_data:
-            value = item.get('value', 0)
-            percentage = (value / total) * 100 if total > 0 else 0.0
+        # Percentage of each item, computed over the whole column
+        percentages = round_floats(rates(values, total))
 
-            result.append({
-                **item,
-                'percentage': round(percentage, 2)
-            })
-
-        return result
+        return [
+            {**item, 'percentage': percentage}
+            for item, percentage in zip(department_data, percentages)
+        ]
 
 
 class PapersAnalyticsService:
@@ -305,6 +306,22 @@ class PapersAnalyticsService:
     def get_analytics(self, year=None, journal_grade=None, field=None) -> Dict[str, Any]:
         """
         Get complete papers analytics data.
+        Synchronous entry point for get_analytics_async().
+
+        Args:
+            year (int, optional): Filter by year
+            journal_grade (str, optional): Filter by journal grade
+            field (str, optional): Filter by field/department
+
+        Returns:
+            dict: Papers analytics data, see get_analytics_async()
+        """
+        return async_to_sync(self.get_analytics_async)(year, journal_grade, field)
+
+    async def get_analytics_async(self, year=None, journal_grade=None, field=None) -> Dict[str, Any]:
+        """
+        Get complete papers analytics data.
+        The three aggregations are independent and run concurrently.
 
         Args:
             year (int, optional): Filter by year
@@ -318,16 +335,10 @@ class PapersAnalyticsService:
                 'field_data': [...]
             }
         """
-        yearly_data = self.repository.get_yearly_data(
-            year, journal_grade, field
-        )
-
-        journal_data = self.repository.get_journal_distribution(
-            year, journal_grade, field
-        )
-
-        field_data = self.repository.get_field_statistics(
-            year, journal_grade, field
+        yearly_data, journal_data, field_data = await gather_queries(
+            partial(self.repository.get_yearly_data, year, journal_grade, field),
+            partial(self.repository.get_journal_distribution, year, journal_grade, field),
+            partial(self.repository.get_field_statistics, year, journal_grade, field)
         )
 
         return {
@@ -358,13 +369,130 @@ class PapersAnalyticsService:
             return False
 
         # Validate journal grade
-        valid_grades = ['SCI', 'KCI', 'SCOPUS', '기타', None]
-        if journal_grade is not None and journal_grade not in valid_grades:
+        from ..models import JournalGrade
+
+        if journal_grade is not None and JournalGrade.from_label(journal_grade) is None:
             return False
 
         return True
 
 
+class StudentAnalyticsService:
+    """
+    Service for student analytics business logic.
+    Folds student rollup cells into the analytics breakdowns.
+    """
+
+    ACTIVE_STATUS = 1  # EnrollmentStatus.ENROLLED
+
+    @staticmethod
+    def validate_filters(filters: Dict) -> Dict:
+        """
+        Validate and sanitize filter parameters.
+
+        Args:
+            filters: Raw filter parameters from request
+
+        Returns:
+            Validated filters with department, grade and year keys
+
+        Raises:
+            ValidationError: If filters are invalid
+        """
+        from core.exceptions import ValidationError
+
+        validated = {}
+
+        if filters.get('department'):
+            validated['department'] = str(filters['department'])
+
+        if filters.get('grade') not in (None, ''):
+            try:
+                grade = int(filters['grade'])
+            except (ValueError, TypeError):
+                raise ValidationError("Invalid grade format")
+            if not (0 <= grade <= 4):
+                raise ValidationError("Grade must be between 0 and 4")
+            validated['grade'] = grade
+
+        if filters.get('year') not in (None, ''):
+            try:
+                year = int(filters['year'])
+            except (ValueError, TypeError):
+                raise ValidationError("Invalid year format")
+            if not (2000 <= year <= 2100):
+                raise ValidationError("Year must be between 2000 and 2100")
+            validated['year'] = year
+
+        return validated
+
+    @classmethod
+    def summarize_cells(cls, cells: List[Dict], year=None) -> Dict[str, Any]:
+        """
+        Build all analytics breakdowns from one set of rollup cells.
+
+        The cells are already filtered by department and grade. The year
+        filter applies to every breakdown except the enrollment trend,
+        whose axis is the admission year itself.
+
+        Args:
+            cells: Rollup cells from StudentRollupRepository.get_cells
+            year (int, optional): Admission year filter
+
+        Returns:
+            dict: {
+                'total_students': int,
+                'department_stats': [{'department', 'count'}],
+                'grade_distribution': [{'grade', 'count'}],
+                'enrollment_trend': [{'admission_year', 'total', 'enrolled'}]
+            }
+        """
+        departments = {}
+        grades = {}
+        trend = {}
+        total_students = 0
+
+        for cell in cells:
+            count = cell['student_count'] or 0
+            is_active = cell['enrollment_status'] == cls.ACTIVE_STATUS
+
+            item = trend.setdefault(cell['admission_year'], {
+                'admission_year': cell['admission_year'],
+                'total': 0,
+                'enrolled': 0
+            })
+            item['total'] += count
+            if is_active:
+                item['enrolled'] += count
+
+            if not is_active or (year and cell['admission_year'] != year):
+                continue
+
+            total_students += count
+            departments[cell['department']] = departments.get(cell['department'], 0) + count
+            grades[cell['grade']] = grades.get(cell['grade'], 0) + count
+
+        department_stats = [
+            {'department': department, 'count': count}
+            for department, count in departments.items()
+        ]
+        department_stats.sort(key=lambda x: x['count'], reverse=True)
+
+        grade_distribution = [
+            {'grade': grade, 'count': grades[grade]}
+            for grade in sorted(grades, key=lambda g: (g is None, g))
+        ]
+
+        enrollment_trend = [trend[y] for y in sorted(trend)]
+
+        return {
+            'total_students': total_students,
+            'department_stats': department_stats,
+            'grade_distribution': grade_distribution,
+            'enrollment_trend': enrollment_trend
+        }
+
+
 class BudgetAnalysisService:
     """
     Domain service for budget analysis business logic.
@@ -377,6 +505,8 @@ class BudgetAnalysisService:
     - Aggregate yearly trends
     """
 
+    EXECUTION_STATUSES = np.array(['normal', 'warning', 'critical'], dtype=object)
+
     def __init__(self, repository):
         """
         Initialize service with repository dependency injection.
@@ -386,7 +516,8 @@ class BudgetAnalysisService:
         """
         self.repository = repository
 
-    def calculate_budget_allocation(self, department=None, year=None, category=None):
+    def calculate_budget_allocation(self, department=None, year=None, category=None,
+                                    category_match='contains'):
         """
         Calculate department-wise budget allocation with percentages.
 
@@ -399,6 +530,7 @@ class BudgetAnalysisService:
             department (str, optional): Filter by department
             year (int, optional): Filter by year
             category (str, optional): Filter by category
+            category_match (str): Match mode for the category filter
 
         Returns:
             list: Budget allocation items with percentages
@@ -409,28 +541,29 @@ class BudgetAnalysisService:
         budget_data = self.repository.get_budget_by_department(
             department=department,
             year=year or datetime.now().year,
-            category=category
+            category=category,
+            category_match=category_match
         )
 
-        # Calculate total budget
-        total_budget = sum(item['total_budget'] for item in budget_data if item['total_budget'])
+        budgets = column(budget_data, 'total_budget', dtype=np.int64)
+        total_budget = int(budgets.sum())
 
-        # Calculate percentages
-        result = []
-        for item in budget_data:
-            budget = item['total_budget'] or 0
-            percentage = (budget / total_budget * 100) if total_budget > 0 else 0
-            result.append({
+        # Calculate percentages over the whole column
+        percentages = round_decimals(rates(budgets, total_budget))
+
+        # Sort by budget descending, keeping ties in repository order
+        order = np.argsort(-budgets, kind='stable')
+        return [
+            {
                 'department': item['department'],
                 'total_budget': budget,
-                'percentage': round(Decimal(str(percentage)), 2),
+                'percentage': percentage,
                 'project_count': item['project_count']
-            })
-
-        # Sort by budget descending
-        result.sort(key=lambda x: x['total_budget'], reverse=True)
-
-        return result
+            }
+            for item, budget, percentage in zip(
+                take(budget_data, order), budgets[order].tolist(), take(percentages, order)
+            )
+        ]
 
     def calculate_execution_status(self, department=None, year=None, start_date=None, end_date=None):
         """
@@ -463,35 +596,33 @@ class BudgetAnalysisService:
             end_date=end_date
         )
 
-        result = []
-        for item in execution_data:
-            total = item['total_budget'] or 0
-            executed = item['executed_amount'] or 0
+        totals = column(execution_data, 'total_budget', dtype=np.int64)
+        executed = column(execution_data, 'executed_amount', dtype=np.int64)
 
-            # Calculate execution rate (BR-2)
-            rate = (executed / total * 100) if total > 0 else 0
+        # Calculate execution rate (BR-2)
+        execution_rates = rates(executed, totals)
 
-            # Calculate remaining (BR-3)
-            remaining = total - executed
+        # Calculate remaining (BR-3)
+        remaining = (totals - executed).tolist()
 
-            # Determine status (BR-4)
-            if rate >= 100:
-                status = 'critical'
-            elif rate >= 90:
-                status = 'warning'
-            else:
-                status = 'normal'
+        # Determine status (BR-4): bucket 0 below 90%, 1 from 90%, 2 from 100%
+        buckets = (execution_rates >= 90).astype(np.intp) + (execution_rates >= 100)
+        statuses = self.EXECUTION_STATUSES[buckets].tolist()
 
-            result.append({
+        return [
+            {
                 'department': item['department'],
                 'total_budget': total,
-                'executed_amount': executed,
-                'execution_rate': round(Decimal(str(rate)), 2),
-                'remaining_budget': remaining,
+                'executed_amount': executed_amount,
+                'execution_rate': rate,
+                'remaining_budget': remaining_budget,
                 'status': status
-            })
-
-        return result
+            }
+            for item, total, executed_amount, rate, remaining_budget, status in zip(
+                execution_data, totals.tolist(), executed.tolist(),
+                round_decimals(execution_rates), remaining, statuses
+            )
+        ]
 
     def calculate_execution_summary(self, execution_data):
         """
@@ -531,23 +662,24 @@ class BudgetAnalysisService:
             end_year=end_year
         )
 
-        result = []
-        for item in trends_data:
-            total_budget = item['total_budget'] or 0
-            executed_amount = item['executed_amount'] or 0
-            rate = (executed_amount / total_budget * 100) if total_budget > 0 else 0
+        # Sort by year ascending
+        years = column(trends_data, 'year', dtype=np.int64)
+        order = np.argsort(years, kind='stable')
+        totals = column(trends_data, 'total_budget', dtype=np.int64)[order]
+        executed = column(trends_data, 'executed_amount', dtype=np.int64)[order]
 
-            result.append({
-                'year': item['year'],
+        return [
+            {
+                'year': year,
                 'total_budget': total_budget,
                 'executed_amount': executed_amount,
-                'execution_rate': round(Decimal(str(rate)), 2)
-            })
-
-        # Sort by year ascending
-        result.sort(key=lambda x: x['year'])
-
-        return result
+                'execution_rate': rate
+            }
+            for year, total_budget, executed_amount, rate in zip(
+                years[order].tolist(), totals.tolist(), executed.tolist(),
+                round_decimals(rates(executed, totals))
+            )
+        ]
 
 
 class FileValidationService:
@@ -649,8 +781,21 @@ class FileValidationService:
         Returns:
             List of validation errors (empty if all valid)
         """
+        from ..models import EnrollmentStatus, ExecutionStatus, ProgramType
+
         errors = []
 
+        # Labels that must map to a code (journal grade and gender fall back instead)
+        label_columns = {
+            'student_roster': {
+                'enrollment_status': EnrollmentStatus,
+                'program_type': ProgramType,
+            },
+            'research_project_data': {
+                'status': ExecutionStatus,
+            },
+        }
+
         for idx, row in enumerate(data):
             row_num = idx + 2  # +2 for Excel (1-indexed + header row)
 
@@ -665,27 +810,14 @@ class FileValidationService:
                         'severity': 'error'
                     })
 
-            # Validate enrollment_status for students
-            if file_type == 'student_roster' and 'enrollment_status' in row:
-                valid_statuses = ['재학', '휴학', '졸업', '자퇴', '제적']
-                status = row['enrollment_status']
-                if status and status not in valid_statuses:
-                    errors.append({
-                        'row': row_num,
-                        'column': 'enrollment_status',
-                        'message': f"Invalid enrollment status. Must be one of: {', '.join(valid_statuses)}",
-                        'severity': 'error'
-                    })
-
-            # Validate budget status
-            if file_type == 'research_project_data' and 'status' in row:
-                valid_statuses = ['집행완료', '처리중', '취소']
-                status = row['status']
-                if status and status not in valid_statuses:
+            # Validate coded label columns
+            for column, choices in label_columns.get(file_type, {}).items():
+                value = row.get(column)
+                if value and choices.from_label(value) is None:
                     errors.append({
                         'row': row_num,
-                        'column': 'status',
-                        'message': f"Invalid status. Must be one of: {', '.join(valid_statuses)}",
+                        'column': column,
+                        'message': f"Invalid {column.replace('_', ' ')}. Must be one of: {', '.join(choices.labels)}",
                         'severity': 'error'
                     })
 
@@ -699,14 +831,85 @@ class DataProcessingService:
     Coordinates between parser and repository.
     """
 
-    def __init__(self, repository):
+    def __init__(self, repository, budget_cube_repository=None, student_rollup_repository=None,
+                 project_repository=None, department_repository=None, partition_repository=None):
         """
         Initialize service with repository dependency injection.
 
         Args:
             repository: DataUploadRepository instance
+            budget_cube_repository: BudgetCubeRepository instance (optional)
+            student_rollup_repository: StudentRollupRepository instance (optional)
+            project_repository: ResearchProjectRepository instance (optional)
+            department_repository: DepartmentRepository instance (optional);
+                without it department keys are resolved row by row on save
+            partition_repository: BudgetPartitionRepository instance (optional);
+                without it new execution years land in the default partition
         """
         self.repository = repository
+        self.budget_cube_repository = budget_cube_repository
+        self.student_rollup_repository = student_rollup_repository
+        self.project_repository = project_repository
+        self.department_repository = department_repository
+        self.partition_repository = partition_repository
+
+    def resolve_departments(self, data: List[Dict]) -> List[Dict]:
+        """
+        Attach department keys and canonical names to ingest rows.
+
+        Args:
+            data: List of dictionaries with a 'department' (and optional 'college') value
+
+        Returns:
+            list: The same rows with department_ref_id set and department canonicalized
+        """
+        if not self.department_repository:
+            return data
+
+        for item in data:
+            department = self.department_repository.resolve(
+                item.get('department'), item.get('college')
+            )
+            item['department'] = department.name
+            item['department_ref_id'] = department.id
+
+        return data
+
+    @staticmethod
+    def encode_choices(data: List[Dict], coded_fields: Dict, fallbacks: Dict = None) -> List[Dict]:
+        """
+        Replace ingested labels with their smallint codes.
+
+        Args:
+            data: List of row dictionaries
+            coded_fields: {field: choices class}
+            fallbacks: {field: code} stored for unknown labels (optional)
+
+        Returns:
+            list: The same rows with coded fields
+
+        Raises:
+            ValidationError: If a label is unknown and the field has no fallback
+        """
+        from core.exceptions import ValidationError
+
+        fallbacks = fallbacks or {}
+
+        for item in data:
+            for field, choices in coded_fields.items():
+                value = item.get(field)
+                if value is None or str(value).strip() == '':
+                    item[field] = None
+                    continue
+
+                code = choices.from_label(value)
+                if code is None:
+                    if field not in fallbacks:
+                        raise ValidationError(f"Invalid {field} value: {value}")
+                    code = fallbacks[field]
+                item[field] = code
+
+        return data
 
     def process_department_kpi(self, data: List[Dict]) -> Dict:
         """
@@ -721,6 +924,7 @@ class DataProcessingService:
         from ..models import DepartmentKPI
 
         unique_fields = ['year', 'college', 'department']
+        data = self.resolve_departments(data)
 
         # Count existing records before upsert
         existing_count = self.repository.count_records(
@@ -753,9 +957,15 @@ class DataProcessingService:
         Returns:
             dict: {'records_processed': int, 'duplicates_found': int}
         """
-        from ..models import Publication
+        from ..models import Publication, JournalGrade
 
         unique_fields = ['publication_id']
+        data = self.resolve_departments(data)
+        data = self.encode_choices(
+            data,
+            {'journal_grade': JournalGrade},
+            fallbacks={'journal_grade': JournalGrade.OTHER}
+        )
 
         # Count existing publications
         existing_count = len([
@@ -785,9 +995,20 @@ class DataProcessingService:
         Returns:
             dict: {'records_processed': int, 'duplicates_found': int}
         """
-        from ..models import Student
+        from django.db import transaction
+        from ..models import Student, EnrollmentStatus, ProgramType, Gender
 
         unique_fields = ['student_id']
+        data = self.resolve_departments(data)
+        data = self.encode_choices(
+            data,
+            {
+                'enrollment_status': EnrollmentStatus,
+                'program_type': ProgramType,
+                'gender': Gender,
+            },
+            fallbacks={'gender': None}
+        )
 
         # Count existing students
         existing_count = len([
@@ -795,12 +1016,17 @@ class DataProcessingService:
             if Student.objects.filter(student_id=d.get('student_id')).exists()
         ])
 
-        # Bulk upsert
-        records_processed = self.repository.bulk_upsert(
-            Student,
-            data,
-            unique_fields
-        )
+        with transaction.atomic():
+            # Bulk upsert
+            records_processed = self.repository.bulk_upsert(
+                Student,
+                data,
+                unique_fields
+            )
+
+            # Rebuild analytics rollup from the merged roster
+            if self.student_rollup_repository:
+                self.student_rollup_repository.rebuild()
 
         return {
             'records_processed': records_processed,
@@ -817,9 +1043,12 @@ class DataProcessingService:
         Returns:
             dict: {'records_processed': int, 'duplicates_found': int}
         """
-        from ..models import ResearchBudgetData
+        from django.db import transaction
+        from ..models import ResearchBudgetData, ExecutionStatus
 
         unique_fields = ['execution_id']
+        data = self.resolve_departments(data)
+        data = self.encode_choices(data, {'status': ExecutionStatus})
 
         # Count existing executions
         existing_count = len([
@@ -827,12 +1056,48 @@ class DataProcessingService:
             if ResearchBudgetData.objects.filter(execution_id=d.get('execution_id')).exists()
         ])
 
-        # Bulk upsert
-        records_processed = self.repository.bulk_upsert(
-            ResearchBudgetData,
-            data,
-            unique_fields
-        )
+        execution_ids = [d.get('execution_id') for d in data]
+
+        with transaction.atomic():
+            # execution_id has no unique constraint on the partitioned table;
+            # serialize uploads of the same executions instead
+            self.repository.lock_execution_ids(execution_ids)
+
+            # Route the batch's execution years to their own partitions
+            if self.partition_repository:
+                execution_date = ResearchBudgetData._meta.get_field('execution_date')
+                self.partition_repository.ensure_years(
+                    execution_date.to_python(d['execution_date']).year
+                    for d in data if d.get('execution_date')
+                )
+
+            # Cube slices and projects the batch moves rows out of
+            stale_slices = set()
+            if self.budget_cube_repository:
+                stale_slices = self.budget_cube_repository.get_slices(execution_ids)
+
+            stale_projects = set()
+            if self.project_repository:
+                stale_projects = self.project_repository.get_project_numbers(execution_ids)
+
+            # Bulk upsert
+            records_processed = self.repository.bulk_upsert(
+                ResearchBudgetData,
+                data,
+                unique_fields
+            )
+
+            # Recompute only the cube cells touched by this batch
+            if self.budget_cube_repository:
+                self.budget_cube_repository.refresh_slices(
+                    stale_slices | self.budget_cube_repository.get_slices(execution_ids)
+                )
+
+            # Re-derive the touched projects from their latest execution rows
+            if self.project_repository:
+                self.project_repository.refresh_projects(
+                    stale_projects | {d.get('project_number') for d in data}
+                )
 
         return {
             'records_processed': records_processed,
@@ -159,8 +159,9 @@ class ExcelParser:
         # Clean data
         df = self.clean_data(df)
 
-        # Replace NaN with None for JSON compatibility
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for JSON compatibility (as object, since
+        # float columns such as an all-empty optional column keep NaN)
+        df = df.astype(object).where(pd.notnull(df), None)
 
         return df.to_dict('records')
 
@@ -247,8 +248,9 @@ class DepartmentKPIParser(ExcelParser):
         # Clean data
         df = self.clean_data(df)
 
-        # Replace NaN with None for JSON compatibility
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for JSON compatibility (as object, since
+        # float columns such as an all-empty optional column keep NaN)
+        df = df.astype(object).where(pd.notnull(df), None)
 
         return df.to_dict('records')
 
@@ -341,8 +343,9 @@ class PublicationParser(ExcelParser):
         # Clean data
         df = self.clean_data(df)
 
-        # Replace NaN with None for JSON compatibility
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for JSON compatibility (as object, since
+        # float columns such as an all-empty optional column keep NaN)
+        df = df.astype(object).where(pd.notnull(df), None)
 
         data = df.to_dict('records')
 
@@ -456,8 +459,9 @@ class StudentParser(ExcelParser):
         # Clean data
         df = self.clean_data(df)
 
-        # Replace NaN with None for JSON compatibility
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for JSON compatibility (as object, since
+        # float columns such as an all-empty optional column keep NaN)
+        df = df.astype(object).where(pd.notnull(df), None)
 
         return df.to_dict('records')
 
@@ -548,8 +552,9 @@ class ResearchBudgetParser(ExcelParser):
         # Clean data
         df = self.clean_data(df)
 
-        # Replace NaN with None for JSON compatibility
-        df = df.where(pd.notnull(df), None)
+        # Replace NaN with None for JSON compatibility (as object, since
+        # float columns such as an all-empty optional column keep NaN)
+        df = df.astype(object).where(pd.notnull(df), None)
 
         data = df.to_dict('records')
 
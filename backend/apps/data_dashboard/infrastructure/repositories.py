@@ -3,21 +3,271 @@ Dashboard Repository Module
 Data access layer for dashboard queries following the plan.md specifications.
 Implements all query methods for KPI, trend, department, and budget data.
 """
-from django.db import models
-from django.db.models import Avg, Sum, Count, Q, Max
-from django.db.models.functions import ExtractYear
-from datetime import datetime
+import json
+import re
+import zlib
 
-from ..models import DepartmentKPI, Publication, Student, ResearchBudgetData
+from django.db import models
+from django.db.models import Avg, Sum, Count, Q, Max, F, OuterRef, Subquery
+from django.db.models.functions import ExtractMonth
+from datetime import datetime, date, timedelta
+
+from ..models import (
+    Department,
+    DepartmentAlias,
+    DepartmentKPI,
+    Publication,
+    Student,
+    StudentRollup,
+    ResearchBudgetData,
+    ResearchProject,
+    BudgetCube,
+    EnrollmentStatus,
+    ExecutionStatus,
+    JournalGrade,
+    LabeledChoices
+)
 from utils.date_utils import get_current_year
+from core.db_router import reads_from_replica
+from core.metrics import record_cache_lookup
+from core.exceptions import ValidationError
+
+
+# Supported text filter modes
+TEXT_MATCH_MODES = ('contains', 'prefix', 'exact')
+
+
+def text_match(field_name, value, mode='contains'):
+    """
+    Build an index-friendly text filter.
+
+    Modes:
+        - contains: case-insensitive substring, served by a pg_trgm GIN index
+        - prefix: case-sensitive prefix, served by a varchar_pattern_ops index
+        - exact: equality, served by a btree index
+
+    Args:
+        field_name (str): Model field to filter
+        value (str): Filter value
+        mode (str): One of TEXT_MATCH_MODES
+
+    Returns:
+        Q: Filter expression
+
+    Raises:
+        ValidationError: If mode is not supported
+    """
+    if mode == 'exact':
+        return Q(**{field_name: value})
+
+    if mode == 'prefix':
+        return Q(**{f'{field_name}__startswith': value})
+
+    if mode == 'contains':
+        return Q(**{f'{field_name}__trgm_icontains': value})
+
+    raise ValidationError(
+        f"Invalid match mode: {mode}. Must be one of: {', '.join(TEXT_MATCH_MODES)}"
+    )
+
+
+def year_range(field_name, year):
+    """
+    Build a sargable filter for all dates of a year.
+
+    Compares the raw date column against [Jan 1, next Jan 1) so a btree
+    index on it can serve the filter, unlike EXTRACT(YEAR FROM ...).
+
+    Args:
+        field_name (str): Date field to filter
+        year (int): Target year
+
+    Returns:
+        Q: Filter expression
+    """
+    year = int(year)
+    return Q(**{
+        f'{field_name}__gte': date(year, 1, 1),
+        f'{field_name}__lt': date(year + 1, 1, 1)
+    })
+
+
+def with_department_names(rows, departments):
+    """
+    Replace department_ref keys of grouped rows with department names.
+
+    Args:
+        rows: Iterable of dicts with a department_ref key
+        departments: DepartmentRepository used to look up names
+
+    Returns:
+        list: Rows with a department name in place of the key, order kept
+    """
+    names = departments.get_names()
+
+    result = []
+    for row in rows:
+        row = dict(row)
+        row['department'] = names.get(row.pop('department_ref'))
+        result.append(row)
+
+    return result
 
 
+class DepartmentRepository:
+    """
+    Repository for the department dimension.
+
+    Name and alias lookups are cached in memory for the lifetime of the
+    instance, so ingest resolves each distinct department string once
+    per batch instead of once per row.
+    """
+
+    def __init__(self):
+        """Initialize repository with an empty lookup cache."""
+        self._by_name = None
+
+    def resolve(self, name, college=None):
+        """
+        Get the department for a raw name or alias, creating it if unknown.
+
+        Args:
+            name (str): Department name as ingested
+            college (str, optional): College name, recorded on new departments
+
+        Returns:
+            Department: Canonical department
+        """
+        by_name = self._get_lookup()
+
+        department = by_name.get(name)
+        record_cache_lookup('department_lookup', department is not None)
+        if department is None:
+            department = Department.objects.resolve(name, college)
+            by_name[name] = department
+
+        return department
+
+    def get_key(self, name):
+        """
+        Get the integer key of a department name or alias without creating it.
+
+        Args:
+            name (str): Department name or alias
+
+        Returns:
+            int or None: Department key, None if the name is unknown
+        """
+        department = self._get_lookup().get(name)
+        return department.id if department else None
+
+    def get_canonical_name(self, name):
+        """
+        Get the canonical spelling of a department name or alias.
+
+        Args:
+            name (str): Department name or alias
+
+        Returns:
+            str: Canonical name, or the input if it is unknown
+        """
+        department = self._get_lookup().get(name)
+        return department.name if department else name
+
+    def get_names(self):
+        """
+        Get the canonical name of every department key.
+
+        Returns:
+            dict: {department_key: name}
+        """
+        return {
+            department.id: department.name
+            for department in self._get_lookup().values()
+        }
+
+    def get_departments(self, college=None):
+        """
+        Get departments for filter dropdowns.
+
+        Args:
+            college (str, optional): Filter by college
+
+        Returns:
+            list: [{"id": 1, "college": "공과대학", "name": "컴퓨터공학과"}, ...]
+        """
+        queryset = Department.objects.all()
+
+        if college:
+            queryset = queryset.filter(college=college)
+
+        return list(queryset.values('id', 'college', 'name'))
+
+    def filter_by_name(self, name):
+        """
+        Build a filter on department_ref for a department name or alias.
+
+        Args:
+            name (str): Department name or alias
+
+        Returns:
+            Q: Filter expression matching no rows if the name is unknown
+        """
+        key = self.get_key(name)
+        if key is None:
+            return Q(pk__in=[])
+
+        return Q(department_ref_id=key)
+
+    def _get_lookup(self):
+        """
+        Load the name and alias lookup on first use.
+
+        Returns:
+            dict: {name or alias: Department}
+        """
+        if self._by_name is None:
+            by_name = {d.name: d for d in Department.objects.all()}
+            for alias in DepartmentAlias.objects.select_related('department'):
+                by_name[alias.alias] = alias.department
+            self._by_name = by_name
+
+        return self._by_name
+
+
+@reads_from_replica
 class DashboardRepository:
     """
     Repository for dashboard data queries.
     Provides data access methods for all dashboard metrics.
     """
 
+    def __init__(self, department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            department_repository: DepartmentRepository instance (optional)
+        """
+        self.departments = department_repository or DepartmentRepository()
+        self._latest_kpi_year = None
+
+    def get_latest_kpi_year(self):
+        """
+        Query the latest year with KPI data.
+        Cached for the lifetime of the instance, so every widget of one
+        request shares a single lookup.
+
+        Returns:
+            int or None: Latest KPI year, None if there is no KPI data
+        """
+        if self._latest_kpi_year is None:
+            self._latest_kpi_year = DepartmentKPI.objects.aggregate(
+                max_year=Max('year')
+            )['max_year']
+
+        return self._latest_kpi_year
+
     def get_latest_kpi_data(self):
         """
         Query latest year KPI data from department_kpis table.
@@ -26,10 +276,7 @@ class DashboardRepository:
             QuerySet of DepartmentKPI for the latest year
         """
         # Get the latest year that has data
-        latest_year_obj = DepartmentKPI.objects.aggregate(
-            max_year=Max('year')
-        )
-        latest_year = latest_year_obj['max_year']
+        latest_year = self.get_latest_kpi_year()
 
         if latest_year is None:
             return DepartmentKPI.objects.none()
@@ -46,20 +293,20 @@ class DashboardRepository:
         current_year = get_current_year()
 
         count = Publication.objects.filter(
-            publication_date__year=current_year
+            year_range('publication_date', current_year)
         ).count()
 
         return count
 
     def get_active_student_count(self):
         """
-        Query count of students with enrollment_status = '재학'.
+        Query count of enrolled (재학) students.
 
         Returns:
             int: Active student count
         """
         count = Student.objects.filter(
-            enrollment_status='재학'
+            enrollment_status=EnrollmentStatus.ENROLLED
         ).count()
 
         return count
@@ -71,30 +318,17 @@ class DashboardRepository:
         Returns:
             dict: {
                 'total_budget': sum of total_budget,
-                'executed_amount': sum of execution_amount where status='집행완료'
+                'executed_amount': sum of execution_amount where status=집행완료
             }
         """
-        # Get sum of distinct total_budget per project
-        # Use DISTINCT on project_number to avoid double counting
-        from django.db.models import Subquery, OuterRef
-
-        # Subquery to get unique projects with their total_budget
-        unique_projects = ResearchBudgetData.objects.filter(
-            project_number=OuterRef('project_number')
-        ).values('project_number').annotate(
-            budget=Max('total_budget')
-        ).values('budget')[:1]
-
-        # Get total budget (sum of distinct project budgets)
-        total_budget_result = ResearchBudgetData.objects.values('project_number').annotate(
-            project_budget=Max('total_budget')
-        ).aggregate(
-            total=Sum('project_budget')
+        # One row per project, so each budget is counted once
+        total_budget_result = ResearchProject.objects.aggregate(
+            total=Sum('total_budget')
         )
 
-        # Get executed amount (sum of all executions with status='집행완료')
+        # Get executed amount (sum of all completed executions)
         executed_result = ResearchBudgetData.objects.filter(
-            status='집행완료'
+            status=ExecutionStatus.COMPLETED
         ).aggregate(
             total=Sum('execution_amount')
         )
@@ -141,50 +375,73 @@ class DashboardRepository:
             year (int): Target year (default: latest year)
 
         Returns:
-            QuerySet: Department aggregated performance
+            list: Department aggregated performance
         """
         if year is None:
             # Get latest year
-            latest_year_obj = DepartmentKPI.objects.aggregate(
-                max_year=Max('year')
-            )
-            year = latest_year_obj['max_year']
+            year = self.get_latest_kpi_year()
 
             if year is None:
                 return DepartmentKPI.objects.none()
 
         performance = DepartmentKPI.objects.filter(
             year=year
-        ).values('department').annotate(
+        ).values('department_ref').annotate(
             avg_employment_rate=Avg('employment_rate'),
             total_revenue=Sum('tech_transfer_revenue')
         ).order_by('-avg_employment_rate')
 
-        return performance
+        return with_department_names(performance, self.departments)
 
     def get_budget_allocation(self):
         """
         Query budget allocation by department.
 
         Returns:
-            QuerySet: Department budget allocation with total_budget and executed_amount
+            list: Department budget allocation with total_budget and executed_amount,
+                sorted by total_budget descending
         """
-        # Group by department
-        # For each department, get sum of distinct project budgets and sum of executions
-        allocation = ResearchBudgetData.objects.values('department').annotate(
-            total_budget=Sum('total_budget', distinct=True),
+        budgets = ResearchProject.objects.values('department').annotate(
+            total_budget=Sum('total_budget')
+        ).order_by()
+
+        executions = ResearchBudgetData.objects.values('department_ref').annotate(
             executed_amount=Sum('execution_amount')
-        ).order_by('-total_budget')
+        ).order_by()
+        executed = {
+            row['department']: row['executed_amount']
+            for row in with_department_names(executions, self.departments)
+        }
+
+        allocation = [
+            {
+                'department': row['department'],
+                'total_budget': row['total_budget'],
+                'executed_amount': executed.get(row['department']) or 0
+            }
+            for row in budgets
+        ]
+        allocation.sort(key=lambda x: x['total_budget'] or 0, reverse=True)
 
         return allocation
 
 
+@reads_from_replica
 class PerformanceRepository:
     """
     Repository for performance analysis data access.
     Provides methods for retrieving performance metrics with filtering.
     """
 
+    def __init__(self, department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            department_repository: DepartmentRepository instance (optional)
+        """
+        self.departments = department_repository or DepartmentRepository()
+
     def get_performance_trend(self, start_date, end_date, department=None, project=None):
         """
         Get performance trend data over time period.
@@ -208,7 +465,7 @@ class PerformanceRepository:
 
         # Apply department filter if provided
         if department:
-            queryset = queryset.filter(department=department)
+            queryset = queryset.filter(self.departments.filter_by_name(department))
 
         # Group by month and aggregate
         trend_data = queryset.values('year').annotate(
@@ -249,11 +506,14 @@ class PerformanceRepository:
             year__lte=end_date.year
         )
 
-        # Group by department and aggregate
-        dept_data = queryset.values('department').annotate(
-            avg_employment_rate=Avg('employment_rate'),
-            total_revenue=Sum('tech_transfer_revenue')
-        ).order_by('-avg_employment_rate')
+        # Group by department key and aggregate
+        dept_data = with_department_names(
+            queryset.values('department_ref').annotate(
+                avg_employment_rate=Avg('employment_rate'),
+                total_revenue=Sum('tech_transfer_revenue')
+            ).order_by('-avg_employment_rate'),
+            self.departments
+        )
 
         # Calculate total for percentage
         total_value = sum(
@@ -294,7 +554,7 @@ class PerformanceRepository:
         )
 
         if department:
-            queryset = queryset.filter(department=department)
+            queryset = queryset.filter(self.departments.filter_by_name(department))
 
         # Calculate aggregate metrics
         aggregates = queryset.aggregate(
@@ -312,14 +572,25 @@ class PerformanceRepository:
         }
 
 
+@reads_from_replica
 class PapersAnalyticsRepository:
     """
     Repository for papers analytics data access.
     Provides methods for retrieving publication statistics with filtering.
     """
 
-    def __init__(self):
+    def __init__(self, field_match='contains', department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            field_match (str): Match mode for the field filter
+                ('contains', 'prefix' or 'exact')
+            department_repository: DepartmentRepository instance (optional)
+        """
         self.model = Publication
+        self.field_match = field_match
+        self.departments = department_repository or DepartmentRepository()
 
     def get_yearly_data(self, year=None, journal_grade=None, field=None):
         """
@@ -340,8 +611,7 @@ class PapersAnalyticsRepository:
 
         result = (
             queryset
-            .annotate(year=ExtractYear('publication_date'))
-            .values('year')
+            .values(year=F('pub_year'))
             .annotate(count=Count('id'))
             .order_by('year')
         )
@@ -358,7 +628,7 @@ class PapersAnalyticsRepository:
             field (str, optional): Filter by department/field
 
         Returns:
-            list: [{"journal_grade": "SCI", "count": 80}, ...]
+            list: [{"journal_grade": 1, "count": 80}, ...] keyed by JournalGrade code
         """
         queryset = self._apply_filters(
             self.model.objects.all(),
@@ -393,12 +663,12 @@ class PapersAnalyticsRepository:
 
         result = (
             queryset
-            .values('department')
+            .values('department_ref')
             .annotate(count=Count('id'))
             .order_by('-count')
         )
 
-        return list(result)
+        return with_department_names(result, self.departments)
 
     def _apply_filters(self, queryset, year, journal_grade, field):
         """
@@ -415,31 +685,123 @@ class PapersAnalyticsRepository:
         """
         if year:
             queryset = queryset.filter(
-                publication_date__year=year
+                year_range('publication_date', year)
             )
 
         if journal_grade:
-            queryset = queryset.filter(
-                journal_grade__iexact=journal_grade
-            )
+            code = JournalGrade.from_label(journal_grade)
+            if code is None:
+                return queryset.none()
+            queryset = queryset.filter(journal_grade=code)
 
         if field:
             queryset = queryset.filter(
-                department__icontains=field
+                text_match('department', field, self.field_match)
             )
 
         return queryset
 
 
+class StudentRollupRepository:
+    """
+    Repository for the student_rollup table.
+    Student analytics are answered from the rollup instead of scanning students.
+    """
+
+    def __init__(self, department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            department_repository: DepartmentRepository instance (optional)
+        """
+        self.departments = department_repository or DepartmentRepository()
+
+    ROLLUP_FIELDS = [
+        'department',
+        'grade',
+        'admission_year',
+        'enrollment_status',
+        'program_type',
+        'gender'
+    ]
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the rollup from the students table.
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        from django.db import transaction
+
+        rows = Student.objects.values(*self.ROLLUP_FIELDS).annotate(
+            student_count=Count('id')
+        ).order_by()
+
+        with transaction.atomic():
+            StudentRollup.objects.all().delete()
+            created = StudentRollup.objects.bulk_create(
+                [StudentRollup(**row) for row in rows],
+                batch_size=1000
+            )
+
+        return len(created)
+
+    def get_cells(self, department=None, grade=None):
+        """
+        Get rollup counts by admission year and enrollment status.
+
+        Args:
+            department (str, optional): Department filter
+            grade (int, optional): Grade filter
+
+        Returns:
+            list: [{"department", "grade", "admission_year",
+                    "enrollment_status", "student_count"}, ...]
+        """
+        queryset = StudentRollup.objects.all()
+
+        if department:
+            queryset = queryset.filter(
+                department=self.departments.get_canonical_name(department)
+            )
+
+        if grade is not None:
+            queryset = queryset.filter(grade=grade)
+
+        result = queryset.values(
+            'department', 'grade', 'admission_year', 'enrollment_status'
+        ).annotate(
+            student_count=Sum('student_count')
+        ).order_by()
+
+        return list(result)
+
+
+@reads_from_replica
 class BudgetRepository:
     """
     Repository for budget data access.
 
     Provides abstracted database queries for budget analysis.
     All queries use Django ORM for database independence.
+    Execution aggregates are read from the pre-aggregated budget_cube table
+    and budgets from the research_projects dimension, so query cost scales
+    with the number of cells and projects, not execution rows.
     """
 
-    def get_budget_by_department(self, department=None, year=None, category=None):
+    def __init__(self, department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            department_repository: DepartmentRepository instance (optional)
+        """
+        self.departments = department_repository or DepartmentRepository()
+
+    def get_budget_by_department(self, department=None, year=None, category=None,
+                                 category_match='contains'):
         """
         Get aggregated budget data by department.
 
@@ -447,40 +809,47 @@ class BudgetRepository:
             department (str, optional): Filter by specific department
             year (int, optional): Filter by year
             category (str, optional): Filter by category (execution_item)
+            category_match (str): Match mode for the category filter
+                ('contains', 'prefix' or 'exact')
 
         Returns:
             list: List of dicts with department, total_budget, project_count
         """
-        queryset = ResearchBudgetData.objects.filter(
-            status='집행완료'
+        queryset = BudgetCube.objects.filter(
+            status=ExecutionStatus.COMPLETED
         )
 
         # Apply filters
         if department:
-            queryset = queryset.filter(department=department)
-
-        if year:
             queryset = queryset.filter(
-                execution_date__year=year
+                department=self.departments.get_canonical_name(department)
             )
 
+        if year:
+            queryset = queryset.filter(year=year)
+
         if category:
             queryset = queryset.filter(
-                execution_item__icontains=category
+                text_match('execution_item', category, category_match)
             )
 
-        # Aggregate by department
-        result = queryset.values('department').annotate(
-            total_budget=Sum('total_budget', distinct=True),
-            project_count=Count('project_number', distinct=True)
-        ).order_by('-total_budget')
+        # Sum budgets over the matching projects, each counted once
+        projects = ResearchProject.objects.filter(
+            project_number__in=queryset.values('project_number')
+        ).values('department').annotate(
+            total_budget=Sum('total_budget'),
+            project_count=Count('id')
+        ).order_by('-total_budget', 'department')
 
-        return list(result)
+        return list(projects)
 
     def get_execution_by_department(self, department=None, year=None, start_date=None, end_date=None):
         """
         Get budget execution data by department.
 
+        Date ranges that cover whole months are answered from the cube;
+        ranges that start or end mid-month fall back to the execution rows.
+
         Args:
             department (str, optional): Filter by department
             year (int, optional): Filter by year
@@ -490,35 +859,41 @@ class BudgetRepository:
         Returns:
             list: List of dicts with department, total_budget, executed_amount
         """
-        queryset = ResearchBudgetData.objects.all()
+        if not self._is_month_aligned(start_date, end_date):
+            return self._get_execution_from_rows(department, year, start_date, end_date)
+
+        queryset = BudgetCube.objects.all()
 
         # Apply filters
         if department:
-            queryset = queryset.filter(department=department)
+            queryset = queryset.filter(
+                department=self.departments.get_canonical_name(department)
+            )
 
         if year:
-            queryset = queryset.filter(execution_date__year=year)
+            queryset = queryset.filter(year=year)
 
         if start_date:
-            queryset = queryset.filter(execution_date__gte=start_date)
+            queryset = queryset.filter(
+                Q(year__gt=start_date.year) |
+                Q(year=start_date.year, month__gte=start_date.month)
+            )
 
         if end_date:
-            queryset = queryset.filter(execution_date__lte=end_date)
+            queryset = queryset.filter(
+                Q(year__lt=end_date.year) |
+                Q(year=end_date.year, month__lte=end_date.month)
+            )
 
-        # Aggregate execution data
-        from django.db.models import Case, When, Value
+        projects = queryset.values('department', 'project_number').annotate(
+            project_budget=self._project_budget(),
+            executed_amount=Sum('execution_amount', filter=Q(status=ExecutionStatus.COMPLETED))
+        )
 
-        result = queryset.values('department').annotate(
-            total_budget=Sum('total_budget', distinct=True),
-            executed_amount=Sum(
-                Case(
-                    When(status='집행완료', then='execution_amount'),
-                    default=Value(0)
-                )
-            )
-        ).order_by('department')
+        result = self._fold_projects(projects, 'department')
+        result.sort(key=lambda x: x['department'])
 
-        return list(result)
+        return result
 
     def get_yearly_trends(self, department=None, start_year=None, end_year=None):
         """
@@ -532,15 +907,12 @@ class BudgetRepository:
         Returns:
             list: List of dicts with year, total_budget, executed_amount
         """
-        queryset = ResearchBudgetData.objects.all()
+        queryset = BudgetCube.objects.all()
 
         if department:
-            queryset = queryset.filter(department=department)
-
-        # Extract year and aggregate
-        queryset = queryset.annotate(
-            year=ExtractYear('execution_date')
-        )
+            queryset = queryset.filter(
+                department=self.departments.get_canonical_name(department)
+            )
 
         if start_year:
             queryset = queryset.filter(year__gte=start_year)
@@ -548,19 +920,526 @@ class BudgetRepository:
         if end_year:
             queryset = queryset.filter(year__lte=end_year)
 
-        from django.db.models import Case, When, Value
+        projects = queryset.values('year', 'project_number').annotate(
+            project_budget=self._project_budget(),
+            executed_amount=Sum('execution_amount', filter=Q(status=ExecutionStatus.COMPLETED))
+        )
+
+        result = self._fold_projects(projects, 'year')
+        result.sort(key=lambda x: x['year'])
+
+        return result
+
+    def _project_budget(self):
+        """
+        Budget of the grouped row's project, looked up in research_projects.
+
+        Returns:
+            Subquery: Correlated total_budget lookup by project_number
+        """
+        return Subquery(
+            ResearchProject.objects.filter(
+                project_number=OuterRef('project_number')
+            ).values('total_budget')[:1]
+        )
+
+    def _fold_projects(self, projects, key):
+        """
+        Fold per-project rows into per-key totals.
+
+        Args:
+            projects: Iterable of dicts with key, project_budget, executed_amount
+            key (str): Grouping key ('department', 'department_ref' or 'year')
+
+        Returns:
+            list: List of dicts with key, total_budget, executed_amount
+        """
+        totals = {}
+        for row in projects:
+            item = totals.setdefault(row[key], {
+                key: row[key],
+                'total_budget': 0,
+                'executed_amount': 0
+            })
+            item['total_budget'] += row['project_budget'] or 0
+            item['executed_amount'] += row['executed_amount'] or 0
+
+        return list(totals.values())
+
+    def _is_month_aligned(self, start_date, end_date):
+        """
+        Check whether a date range can be answered at month granularity.
+
+        Args:
+            start_date (date, optional): Range start
+            end_date (date, optional): Range end
+
+        Returns:
+            bool: True if start is a month start and end is a month end
+        """
+        if start_date and start_date.day != 1:
+            return False
+
+        if end_date and (end_date + timedelta(days=1)).day != 1:
+            return False
+
+        return True
+
+    def _get_execution_from_rows(self, department=None, year=None, start_date=None, end_date=None):
+        """
+        Aggregate execution data directly from research_budget_data.
+        Used for day-granular date ranges the cube cannot answer.
+
+        Returns:
+            list: List of dicts with department, total_budget, executed_amount
+        """
+        queryset = ResearchBudgetData.objects.all()
+
+        if department:
+            queryset = queryset.filter(self.departments.filter_by_name(department))
+
+        if year:
+            queryset = queryset.filter(year_range('execution_date', year))
+
+        if start_date:
+            queryset = queryset.filter(execution_date__gte=start_date)
+
+        if end_date:
+            queryset = queryset.filter(execution_date__lte=end_date)
+
+        projects = queryset.values('department_ref', 'project_number').annotate(
+            project_budget=self._project_budget(),
+            executed_amount=Sum('execution_amount', filter=Q(status=ExecutionStatus.COMPLETED))
+        )
+
+        result = with_department_names(
+            self._fold_projects(projects, 'department_ref'),
+            self.departments
+        )
+        result.sort(key=lambda x: x['department'])
+
+        return result
+
 
-        result = queryset.values('year').annotate(
-            total_budget=Sum('total_budget', distinct=True),
-            executed_amount=Sum(
-                Case(
-                    When(status='집행완료', then='execution_amount'),
-                    default=Value(0)
+class BudgetCubeRepository:
+    """
+    Repository for maintaining the budget_cube table.
+
+    Cells are addressed by (project_number, year, month) slices: ingest
+    collects the slices touched by a batch (before and after the upsert)
+    and only those slices are recomputed from research_budget_data.
+    """
+
+    # Maximum number of slices recomputed per query
+    SLICE_CHUNK_SIZE = 200
+
+    def get_slices(self, execution_ids):
+        """
+        Get the (project_number, year, month) slices holding given executions.
+
+        Args:
+            execution_ids: Iterable of execution IDs
+
+        Returns:
+            set: Set of (project_number, year, month) tuples
+        """
+        execution_ids = [e for e in execution_ids if e is not None]
+        if not execution_ids:
+            return set()
+
+        rows = ResearchBudgetData.objects.filter(
+            execution_id__in=execution_ids
+        ).annotate(
+            month=ExtractMonth('execution_date')
+        ).values_list('project_number', 'exec_year', 'month').distinct()
+
+        return set(rows)
+
+    def refresh_slices(self, slices) -> int:
+        """
+        Recompute the cube cells of the given slices from execution rows.
+
+        Args:
+            slices: Iterable of (project_number, year, month) tuples
+
+        Returns:
+            int: Number of cells written
+        """
+        from django.db import transaction
+
+        slices = sorted(set(slices))
+        if not slices:
+            return 0
+
+        cells_written = 0
+
+        with transaction.atomic():
+            for i in range(0, len(slices), self.SLICE_CHUNK_SIZE):
+                chunk = slices[i:i + self.SLICE_CHUNK_SIZE]
+
+                cube_filter = Q()
+                rows_filter = Q()
+                for project_number, year, month in chunk:
+                    cube_filter |= Q(project_number=project_number, year=year, month=month)
+                    month_start = date(year, month, 1)
+                    next_month = date(year + month // 12, month % 12 + 1, 1)
+                    rows_filter |= Q(
+                        project_number=project_number,
+                        execution_date__gte=month_start,
+                        execution_date__lt=next_month
+                    )
+
+                BudgetCube.objects.filter(cube_filter).delete()
+                cells_written += self._insert_cells(
+                    ResearchBudgetData.objects.filter(rows_filter)
                 )
+
+        return cells_written
+
+    def delete_year(self, year) -> int:
+        """
+        Delete the cube cells of one execution year.
+
+        Args:
+            year (int): Execution year
+
+        Returns:
+            int: Number of cells deleted
+        """
+        deleted, _ = BudgetCube.objects.filter(year=year).delete()
+        return deleted
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the whole cube from research_budget_data.
+
+        Returns:
+            int: Number of cells written
+        """
+        from django.db import transaction
+
+        with transaction.atomic():
+            BudgetCube.objects.all().delete()
+            cells_written = self._insert_cells(ResearchBudgetData.objects.all())
+
+        return cells_written
+
+    def _insert_cells(self, queryset) -> int:
+        """
+        Aggregate execution rows into cells and bulk insert them.
+
+        Args:
+            queryset: ResearchBudgetData queryset to aggregate
+
+        Returns:
+            int: Number of cells inserted
+        """
+        cells = queryset.annotate(
+            month=ExtractMonth('execution_date')
+        ).values(
+            'department', 'project_number', 'exec_year', 'month', 'execution_item', 'status'
+        ).annotate(
+            cell_amount=Sum('execution_amount'),
+            cell_count=Count('id')
+        ).order_by()
+
+        cells = list(cells)
+        if not cells:
+            return 0
+
+        BudgetCube.objects.bulk_create([
+            BudgetCube(
+                department=cell['department'],
+                project_number=cell['project_number'],
+                year=cell['exec_year'],
+                month=cell['month'],
+                execution_item=cell['execution_item'],
+                status=cell['status'],
+                execution_amount=cell['cell_amount'] or 0,
+                execution_count=cell['cell_count']
             )
-        ).order_by('year')
+            for cell in cells
+        ], batch_size=1000)
 
-        return list(result)
+        return len(cells)
+
+
+class ResearchProjectRepository:
+    """
+    Repository for maintaining the research_projects dimension.
+
+    Each project takes its attributes from its latest execution row
+    (by execution_date, then insertion order), so a re-uploaded budget
+    replaces the old one instead of being summed or maxed with it.
+    """
+
+    PROJECT_FIELDS = [
+        'project_name',
+        'principal_investigator',
+        'department',
+        'funding_agency',
+        'total_budget'
+    ]
+
+    # Maximum number of projects refreshed per query
+    CHUNK_SIZE = 500
+
+    def get_project_numbers(self, execution_ids):
+        """
+        Get the project numbers currently holding given executions.
+
+        Args:
+            execution_ids: Iterable of execution IDs
+
+        Returns:
+            set: Set of project numbers
+        """
+        execution_ids = [e for e in execution_ids if e is not None]
+        if not execution_ids:
+            return set()
+
+        rows = ResearchBudgetData.objects.filter(
+            execution_id__in=execution_ids
+        ).values_list('project_number', flat=True).distinct()
+
+        return set(rows)
+
+    def get_project_numbers_in_year(self, year):
+        """
+        Get the project numbers with executions in a given year.
+
+        Args:
+            year (int): Execution year
+
+        Returns:
+            set: Set of project numbers
+        """
+        rows = ResearchBudgetData.objects.filter(
+            year_range('execution_date', year)
+        ).values_list('project_number', flat=True).distinct()
+
+        return set(rows)
+
+    def refresh_projects(self, project_numbers) -> int:
+        """
+        Recompute the given projects from their execution rows.
+        Projects left without execution rows are deleted.
+
+        Args:
+            project_numbers: Iterable of project numbers
+
+        Returns:
+            int: Number of projects written
+        """
+        from django.db import transaction
+
+        project_numbers = sorted(p for p in set(project_numbers) if p is not None)
+        if not project_numbers:
+            return 0
+
+        projects_written = 0
+
+        with transaction.atomic():
+            for i in range(0, len(project_numbers), self.CHUNK_SIZE):
+                chunk = project_numbers[i:i + self.CHUNK_SIZE]
+
+                projects = self._latest_rows(
+                    ResearchBudgetData.objects.filter(project_number__in=chunk)
+                )
+
+                ResearchProject.objects.filter(
+                    project_number__in=chunk
+                ).exclude(
+                    project_number__in=[p.project_number for p in projects]
+                ).delete()
+
+                ResearchProject.objects.bulk_create(
+                    projects,
+                    update_conflicts=True,
+                    unique_fields=['project_number'],
+                    update_fields=self.PROJECT_FIELDS
+                )
+                projects_written += len(projects)
+
+        return projects_written
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the whole dimension from research_budget_data.
+
+        Returns:
+            int: Number of projects written
+        """
+        from django.db import transaction
+
+        with transaction.atomic():
+            ResearchProject.objects.all().delete()
+            projects = self._latest_rows(ResearchBudgetData.objects.all())
+            ResearchProject.objects.bulk_create(projects, batch_size=1000)
+
+        return len(projects)
+
+    def _latest_rows(self, queryset):
+        """
+        Build one unsaved ResearchProject per project from its latest row.
+
+        Args:
+            queryset: ResearchBudgetData queryset
+
+        Returns:
+            list: List of ResearchProject instances
+        """
+        rows = queryset.order_by(
+            'project_number', '-execution_date', '-id'
+        ).distinct('project_number').values('project_number', *self.PROJECT_FIELDS)
+
+        return [ResearchProject(**row) for row in rows]
+
+
+class BudgetPartitionRepository:
+    """
+    Repository for the yearly range partitions of research_budget_data.
+
+    Year N lives in research_budget_data_y<N>, bounded by [Jan 1, next Jan 1)
+    of execution_date, so year-filtered queries prune to one partition.
+    Rows for years without a partition land in research_budget_data_default
+    until their partition is created.
+    """
+
+    TABLE = 'research_budget_data'
+    DEFAULT_PARTITION = 'research_budget_data_default'
+
+    def partition_name(self, year) -> str:
+        """
+        Get the partition table name of an execution year.
+
+        Args:
+            year (int): Execution year
+
+        Returns:
+            str: Partition table name
+        """
+        return f"{self.TABLE}_y{int(year)}"
+
+    def get_years(self) -> list:
+        """
+        Get the execution years that have their own partition.
+
+        Returns:
+            list: Sorted list of years
+        """
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT pg_get_expr(c.relpartbound, c.oid)
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = %s::regclass
+                """,
+                [self.TABLE]
+            )
+            bounds = [row[0] for row in cursor.fetchall()]
+
+        years = []
+        for bound in bounds:
+            match = re.search(r"FROM \('(\d{4})-01-01'\)", bound)
+            if match:
+                years.append(int(match.group(1)))
+
+        return sorted(years)
+
+    def ensure_years(self, years) -> list:
+        """
+        Create the partitions of the given years if they are missing.
+        Rows already parked in the default partition move to the new one.
+
+        Args:
+            years: Iterable of execution years
+
+        Returns:
+            list: Years whose partition was created
+        """
+        from django.db import transaction
+
+        missing = sorted(set(int(y) for y in years if y) - set(self.get_years()))
+        if not missing:
+            return []
+
+        with transaction.atomic():
+            for year in missing:
+                self._create_partition(year)
+
+        return missing
+
+    def detach_year(self, year, drop=False):
+        """
+        Detach a year's partition from research_budget_data.
+        Detaching only changes the catalog, so old years leave without a
+        long DELETE; the rows stay in a standalone archive table unless dropped.
+
+        Args:
+            year (int): Execution year
+            drop (bool): Drop the detached table instead of keeping it
+
+        Returns:
+            str or None: Name of the archive table, None when dropped
+
+        Raises:
+            ValidationError: If the year has no partition
+        """
+        from django.db import connection
+
+        if int(year) not in self.get_years():
+            raise ValidationError(f"No partition for execution year {year}")
+
+        qn = connection.ops.quote_name
+        name = self.partition_name(year)
+        archive_name = f"{name}_detached"
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {qn(self.TABLE)} DETACH PARTITION {qn(name)}")
+            if drop:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+                return None
+            cursor.execute(f"ALTER TABLE {qn(name)} RENAME TO {qn(archive_name)}")
+
+        return archive_name
+
+    def _create_partition(self, year):
+        """
+        Create and attach the partition of one year.
+
+        Args:
+            year (int): Execution year
+        """
+        from django.db import connection
+
+        qn = connection.ops.quote_name
+        name = qn(self.partition_name(year))
+        start = date(year, 1, 1).isoformat()
+        end = date(year + 1, 1, 1).isoformat()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {name} (LIKE {qn(self.TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {qn(self.DEFAULT_PARTITION)}
+                    WHERE execution_date >= %s AND execution_date < %s
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """,
+                [start, end]
+            )
+            cursor.execute(
+                f"ALTER TABLE {qn(self.TABLE)} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
 
 
 class DataUploadRepository:
@@ -570,6 +1449,36 @@ class DataUploadRepository:
     Follows DIP: Domain layer depends on repository interface.
     """
 
+    # Advisory lock namespace of research_budget_data execution IDs
+    EXECUTION_LOCK_NAMESPACE = zlib.crc32(b'research_budget_data.execution_id') & 0x7FFFFFFF
+
+    def lock_execution_ids(self, execution_ids) -> None:
+        """
+        Wait for the locks of execution IDs, held until the current transaction ends.
+
+        The partitioned research_budget_data cannot keep a unique constraint
+        on execution_id, so concurrent uploads of the same executions take
+        these locks before upserting. Locks are taken in key order, so
+        overlapping uploads cannot deadlock.
+
+        Args:
+            execution_ids: Iterable of execution IDs
+        """
+        from django.db import connection
+
+        execution_ids = sorted({str(e) for e in execution_ids if e is not None})
+        if not execution_ids:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(key) FROM ("
+                "  SELECT DISTINCT (%s::bigint << 32) | (hashtext(id)::bigint & 4294967295) AS key"
+                "  FROM unnest(%s::text[]) AS id"
+                ") AS keys ORDER BY key",
+                [self.EXECUTION_LOCK_NAMESPACE, execution_ids]
+            )
+
     def bulk_upsert(self, model_class, data: list, unique_fields: list) -> int:
         """
         Bulk insert or update data using UPSERT strategy.
@@ -676,52 +1585,226 @@ class UploadHistoryRepository:
 
         return history
 
-    def get_history_list(self, page: int = 1, page_size: int = 20):
+    def get_history_list(self, position=None, backwards=False, page_size: int = 20):
         """
-        Get paginated upload history.
+        Get a page of upload history, newest first.
 
         Args:
-            page: Page number (1-indexed)
+            position: (uploaded_at, id) of the row the page starts after,
+                None for the newest page
+            backwards: Whether the page holds the rows before position
             page_size: Number of records per page
 
         Returns:
-            QuerySet of UploadHistory
+            tuple: (list of UploadHistory, whether more rows lie beyond the page)
         """
         from ..models import UploadHistory
 
-        offset = (page - 1) * page_size
-        queryset = UploadHistory.objects.select_related('user').order_by('-uploaded_at')
+        return self._get_page(UploadHistory.objects.all(), position, backwards, page_size)
 
-        return queryset[offset:offset + page_size]
-
-    def get_history_count(self):
+    def get_history_count(self, user_id: int = None, estimate: bool = False):
         """
-        Get total count of upload history records.
+        Get the number of upload history records.
+
+        Args:
+            user_id: Count only this user's records
+            estimate: Read the planner's row estimate instead of counting
 
         Returns:
             Total count
         """
         from ..models import UploadHistory
 
-        return UploadHistory.objects.count()
+        queryset = UploadHistory.objects.all()
+        if user_id is not None:
+            queryset = queryset.filter(user_id=user_id)
+
+        if estimate:
+            plan = json.loads(queryset.explain(format='json'))
+            return plan[0]['Plan']['Plan Rows']
+
+        return queryset.count()
 
-    def get_history_by_user(self, user_id: int, page: int = 1, page_size: int = 20):
+    def get_history_by_user(self, user_id: int, position=None, backwards=False, page_size: int = 20):
         """
-        Get history filtered by user.
+        Get a page of one user's upload history, newest first.
 
         Args:
             user_id: User ID to filter by
-            page: Page number (1-indexed)
+            position: (uploaded_at, id) of the row the page starts after,
+                None for the newest page
+            backwards: Whether the page holds the rows before position
             page_size: Number of records per page
 
         Returns:
-            QuerySet of UploadHistory for specified user
+            tuple: (list of UploadHistory, whether more rows lie beyond the page)
         """
         from ..models import UploadHistory
 
-        offset = (page - 1) * page_size
-        queryset = UploadHistory.objects.filter(
-            user_id=user_id
-        ).select_related('user').order_by('-uploaded_at')
+        return self._get_page(
+            UploadHistory.objects.filter(user_id=user_id), position, backwards, page_size
+        )
+
+    def _get_page(self, queryset, position, backwards, page_size):
+        """
+        Fetch a keyset page ordered by (uploaded_at, id) descending.
+        The bound on uploaded_at alone lets the uploaded_at indexes drive the
+        scan; the id comparison only breaks ties between equal timestamps.
+        """
+        if position is None:
+            queryset = queryset.order_by('-uploaded_at', '-id')
+        else:
+            uploaded_at, pk = position
+            if backwards:
+                queryset = queryset.filter(uploaded_at__gte=uploaded_at).filter(
+                    Q(uploaded_at__gt=uploaded_at) | Q(id__gt=pk)
+                ).order_by('uploaded_at', 'id')
+            else:
+                queryset = queryset.filter(uploaded_at__lte=uploaded_at).filter(
+                    Q(uploaded_at__lt=uploaded_at) | Q(id__lt=pk)
+                ).order_by('-uploaded_at', '-id')
+
+        rows = list(queryset.select_related('user')[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+
+        return rows, has_more
+
+
+# Raw-record datasets: the upload file type they come from, the columns they
+# expose and the filters they accept. Filters map a query parameter to
+# (lookup, parser) and only reach indexed columns; every dataset also takes
+# a department name or alias.
+RECORD_DATASETS = {
+    'students': {
+        'file_type': 'student_roster',
+        'model': Student,
+        'fields': (
+            'id', 'student_id', 'name', 'college', 'department', 'grade', 'program_type',
+            'enrollment_status', 'gender', 'admission_year', 'advisor', 'email'
+        ),
+        'filters': {
+            'student_id': ('student_id', str),
+            'enrollment_status': ('enrollment_status', EnrollmentStatus),
+            'grade': ('grade', int),
+        },
+    },
+    'publications': {
+        'file_type': 'publication_list',
+        'model': Publication,
+        'fields': (
+            'id', 'publication_id', 'publication_date', 'college', 'department', 'title',
+            'primary_author', 'co_authors', 'journal_name', 'journal_grade', 'impact_factor',
+            'is_project_linked'
+        ),
+        'filters': {
+            'year': ('publication_date__year', int),
+            'journal_grade': ('journal_grade', JournalGrade),
+            'date_from': ('publication_date__gte', date.fromisoformat),
+            'date_to': ('publication_date__lte', date.fromisoformat),
+        },
+    },
+    'budget': {
+        'file_type': 'research_project_data',
+        'model': ResearchBudgetData,
+        'fields': (
+            'id', 'execution_id', 'project_number', 'project_name', 'principal_investigator',
+            'department', 'funding_agency', 'total_budget', 'execution_date', 'execution_item',
+            'execution_amount', 'status', 'note'
+        ),
+        'filters': {
+            'year': ('execution_date__year', int),
+            'status': ('status', ExecutionStatus),
+            'project_number': ('project_number', str),
+            'date_from': ('execution_date__gte', date.fromisoformat),
+            'date_to': ('execution_date__lte', date.fromisoformat),
+        },
+    },
+}
+
+
+@reads_from_replica
+class RecordRepository:
+    """
+    Repository for browsing the raw rows of one dataset.
+    Rows come in primary key order and a page seeks past the last id of
+    the previous one, so deep pages cost the same as the first.
+    """
+
+    def __init__(self, dataset, department_repository=None):
+        """
+        Initialize repository.
+
+        Args:
+            dataset (str): Key of RECORD_DATASETS
+            department_repository: DepartmentRepository instance (optional)
+
+        Raises:
+            ValidationError: If the dataset is unknown
+        """
+        if dataset not in RECORD_DATASETS:
+            raise ValidationError(
+                f"Invalid dataset: {dataset}. Must be one of: {', '.join(RECORD_DATASETS)}"
+            )
+
+        self.spec = RECORD_DATASETS[dataset]
+        self.model = self.spec['model']
+        self.departments = department_repository or DepartmentRepository()
+
+    def get_rows(self, columns, filters=None, after=None, limit=100):
+        """
+        Get a page of rows as value tuples.
+
+        Args:
+            columns (list): Columns to read, from the dataset's fields
+            filters (dict, optional): Raw filter values by parameter name
+            after (int, optional): Id the page starts after
+            limit (int, optional): Maximum number of rows, None for all of them
+
+        Returns:
+            QuerySet: Tuples of the columns, in id order
 
-        return queryset[offset:offset + page_size]
+        Raises:
+            ValidationError: If a filter is unknown or its value invalid
+        """
+        queryset = self._apply_filters(self.model.objects.all(), filters or {})
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+
+        return queryset.order_by('id').values_list(*columns)[:limit]
+
+    def _apply_filters(self, queryset, filters):
+        """
+        Apply parameter filters to queryset.
+
+        Args:
+            queryset: Base queryset
+            filters (dict): Raw filter values by parameter name
+
+        Returns:
+            QuerySet: Filtered queryset
+        """
+        for name, value in filters.items():
+            if name == 'department':
+                queryset = queryset.filter(self.departments.filter_by_name(value))
+                continue
+
+            if name not in self.spec['filters']:
+                raise ValidationError(f"Unknown filter: {name}")
+
+            lookup, parser = self.spec['filters'][name]
+            if isinstance(parser, type) and issubclass(parser, LabeledChoices):
+                parsed = parser.from_label(value)
+            else:
+                try:
+                    parsed = parser(value)
+                except ValueError:
+                    parsed = None
+            if parsed is None:
+                raise ValidationError(f"Invalid {name}: {value}")
+
+            queryset = queryset.filter(**{lookup: parsed})
+
+        return queryset
@@ -0,0 +1,125 @@
+"""
+Management command to benchmark response serialization.
+Compares the DRF serializer trees and stdlib JSONRenderer with the compiled
+read path and ORJSONRenderer on synthetic analytics payloads, reporting
+CPU time per response. Touches no database.
+"""
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from apps.data_dashboard.presentation import serializers
+from core.renderers import ORJSONRenderer
+
+
+def make_payloads(departments, years, days):
+    """
+    Build payloads shaped like the analytics responses.
+
+    Args:
+        departments (int): Departments per breakdown
+        years (int): Years per trend
+        days (int): Points in the performance trend
+
+    Returns:
+        dict: {name: (serializer class, many, instance)}
+    """
+    names = [f'학과{i:03d}' for i in range(departments)]
+    budget_rows = [
+        {
+            'department': name,
+            'total_budget': 1_000_000 * (i + 1),
+            'executed_amount': 700_000 * (i + 1),
+            'percentage': Decimal('1.25') * (i % 7),
+            'execution_rate': Decimal('70.00') + i % 30,
+            'remaining_budget': 300_000 * (i + 1),
+            'status': 'normal',
+            'project_count': i % 12,
+        }
+        for i, name in enumerate(names)
+    ]
+
+    return {
+        'dashboard': (serializers.DashboardSerializer, False, {
+            'kpi_data': {
+                'total_performance': 71.5,
+                'publication_count': 1200,
+                'student_count': 8000,
+                'budget_status': {'total': 10 ** 9, 'executed': 7 * 10 ** 8, 'rate': 70.0},
+            },
+            'trend_data': [{'year': 2000 + i, 'value': 60.0 + i} for i in range(years)],
+            'department_data': [{'department': name, 'value': 50.5} for name in names],
+            'budget_data': [{'category': name, 'value': 10 ** 6} for name in names],
+            'last_updated': datetime.now(),
+        }),
+        'performance': (serializers.PerformanceResponseSerializer, False, {
+            'trendData': [
+                {'date': f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}', 'value': 1.5 * i, 'target': None}
+                for i in range(days)
+            ],
+            'departmentData': [
+                {'department': name, 'value': 12.0, 'percentage': 2.5} for name in names
+            ],
+            'achievementData': {'actual': 80.0, 'target': 100.0, 'rate': 80.0, 'status': 'warning'},
+        }),
+        'budget_allocation': (serializers.BudgetAllocationSerializer, True, budget_rows),
+        'budget_execution': (serializers.ExecutionStatusSerializer, True, budget_rows),
+        'budget_trends': (serializers.YearlyTrendsSerializer, True, [
+            {'year': 2000 + i, 'total_budget': 10 ** 9, 'executed_amount': 10 ** 8,
+             'execution_rate': Decimal('10.00')}
+            for i in range(years)
+        ]),
+    }
+
+
+def cpu_time_per_call(func, iterations):
+    """Get the average CPU seconds of one call."""
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations
+
+
+class Command(BaseCommand):
+    help = 'Benchmark DRF serializers and JSONRenderer against the compiled read path and orjson'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200,
+                            help='Responses rendered per measurement')
+        parser.add_argument('--departments', type=int, default=60,
+                            help='Departments per breakdown')
+        parser.add_argument('--years', type=int, default=20,
+                            help='Years per trend')
+        parser.add_argument('--days', type=int, default=365,
+                            help='Points in the performance trend')
+
+    def handle(self, *args, **options):
+        payloads = make_payloads(options['departments'], options['years'], options['days'])
+        iterations = options['iterations']
+        json_renderer = JSONRenderer()
+        orjson_renderer = ORJSONRenderer()
+
+        self.stdout.write(f"{'response':<20}{'DRF (us)':>12}{'fast (us)':>12}{'speedup':>10}")
+        for name, (serializer_class, many, instance) in payloads.items():
+            serialize = serializers.compile_serializer(serializer_class, many=many)
+
+            def before():
+                return json_renderer.render(serializer_class(instance, many=many).data)
+
+            def after():
+                return orjson_renderer.render(serialize(instance))
+
+            if json.loads(before()) != json.loads(after()):
+                self.stderr.write(self.style.ERROR(f"{name}: outputs differ"))
+                continue
+
+            before_seconds = cpu_time_per_call(before, iterations)
+            after_seconds = cpu_time_per_call(after, iterations)
+            self.stdout.write(
+                f"{name:<20}{before_seconds * 1e6:>12.0f}{after_seconds * 1e6:>12.0f}"
+                f"{before_seconds / after_seconds:>9.1f}x"
+            )
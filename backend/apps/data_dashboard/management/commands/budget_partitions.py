@@ -0,0 +1,54 @@
+"""
+Management command to manage the yearly partitions of research_budget_data.
+Lists partitions by default; creates partitions ahead of time or detaches
+old years, refreshing the budget cube and research projects they fed.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.data_dashboard.infrastructure.repositories import (
+    BudgetPartitionRepository,
+    BudgetCubeRepository,
+    ResearchProjectRepository
+)
+from core import response_cache
+
+
+class Command(BaseCommand):
+    help = 'List, create or detach the yearly partitions of research_budget_data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--create', type=int, nargs='+', metavar='YEAR',
+                            help='Create partitions for these execution years')
+        parser.add_argument('--detach', type=int, metavar='YEAR',
+                            help='Detach the partition of this execution year')
+        parser.add_argument('--drop', action='store_true',
+                            help='Drop the detached partition instead of keeping it')
+
+    def handle(self, *args, **options):
+        partitions = BudgetPartitionRepository()
+
+        if options['create']:
+            created = partitions.ensure_years(options['create'])
+            self.stdout.write(self.style.SUCCESS(
+                f"Created partitions: {', '.join(map(str, created)) or 'none'}"
+            ))
+
+        if options['detach']:
+            year = options['detach']
+            projects = ResearchProjectRepository()
+
+            with transaction.atomic():
+                project_numbers = projects.get_project_numbers_in_year(year)
+                archive = partitions.detach_year(year, drop=options['drop'])
+                cells_deleted = BudgetCubeRepository().delete_year(year)
+                projects.refresh_projects(project_numbers)
+                transaction.on_commit(response_cache.bump_version)
+
+            self.stdout.write(self.style.SUCCESS(
+                f"Detached {year}: {archive or 'dropped'}, "
+                f"{cells_deleted} cube cells and {len(project_numbers)} projects refreshed"
+            ))
+
+        years = partitions.get_years()
+        self.stdout.write(f"Partitioned years: {', '.join(map(str, years)) or 'none'}")
@@ -0,0 +1,45 @@
+"""
+Management command to export datasets and analytics results as Parquet or
+Arrow IPC files, one file per target. Needs the optional pyarrow package.
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.data_dashboard.presentation.exports import EXPORT_TARGETS, export
+from core import columnar
+from core.exceptions import BaseAPIException
+
+
+class Command(BaseCommand):
+    help = 'Export datasets and analytics results as Parquet or Arrow IPC files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='+', choices=EXPORT_TARGETS, metavar='TARGET',
+                            help=f"What to export: {', '.join(EXPORT_TARGETS)}")
+        parser.add_argument('--format', dest='file_format', choices=list(columnar.FORMATS), default='parquet',
+                            help='File format (default: parquet)')
+        parser.add_argument('--output-dir', default='.',
+                            help='Directory the files are written to (default: current directory)')
+        parser.add_argument('--filter', action='append', default=[], metavar='NAME=VALUE',
+                            help='Dataset filter or analytics parameter; repeatable')
+
+    def handle(self, *args, **options):
+        params = {}
+        for item in options['filter']:
+            name, separator, value = item.partition('=')
+            if not separator:
+                raise CommandError(f"Filters take the form NAME=VALUE, got: {item}")
+            params[name] = value
+
+        os.makedirs(options['output_dir'], exist_ok=True)
+        extension = columnar.FORMATS[options['file_format']][1]
+
+        for target in options['targets']:
+            path = os.path.join(options['output_dir'], f"{target}.{extension}")
+            try:
+                count = export(target, options['file_format'], path, params)
+            except BaseAPIException as e:
+                raise CommandError(f"{target}: {e}")
+
+            self.stdout.write(self.style.SUCCESS(f"Wrote {count} rows to {path}"))
@@ -0,0 +1,21 @@
+"""
+Management command to rebuild the budget_cube table.
+Use after bulk changes made outside the upload path; cached analytics
+responses are invalidated once the rebuild commits.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.data_dashboard.infrastructure.repositories import BudgetCubeRepository
+from core import response_cache
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the pre-aggregated budget_cube table from research_budget_data'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            cells_written = BudgetCubeRepository().rebuild()
+            # Cached analytics responses were built from the old rows
+            transaction.on_commit(response_cache.bump_version)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt budget cube: {cells_written} cells"))
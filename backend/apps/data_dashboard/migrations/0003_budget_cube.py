@@ -0,0 +1,75 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:39
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def populate_budget_cube(apps, schema_editor):
+    """Backfill the cube from existing research_budget_data rows."""
+    ResearchBudgetData = apps.get_model('data_dashboard', 'ResearchBudgetData')
+    BudgetCube = apps.get_model('data_dashboard', 'BudgetCube')
+
+    project_budgets = {
+        row['project_number']: row['budget'] or 0
+        for row in ResearchBudgetData.objects.values('project_number').annotate(
+            budget=Max('total_budget')
+        ).order_by()
+    }
+
+    cells = ResearchBudgetData.objects.annotate(
+        year=ExtractYear('execution_date'),
+        month=ExtractMonth('execution_date')
+    ).values(
+        'department', 'project_number', 'year', 'month', 'execution_item', 'status'
+    ).annotate(
+        cell_amount=Sum('execution_amount'),
+        cell_count=Count('id')
+    ).order_by()
+
+    BudgetCube.objects.bulk_create([
+        BudgetCube(
+            department=cell['department'],
+            project_number=cell['project_number'],
+            year=cell['year'],
+            month=cell['month'],
+            execution_item=cell['execution_item'],
+            status=cell['status'],
+            execution_amount=cell['cell_amount'] or 0,
+            execution_count=cell['cell_count'],
+            project_budget=project_budgets.get(cell['project_number'], 0)
+        )
+        for cell in cells
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetCube',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(help_text='Department name', max_length=100)),
+                ('project_number', models.CharField(help_text='Project number', max_length=50)),
+                ('year', models.IntegerField(help_text='Execution year')),
+                ('month', models.IntegerField(help_text='Execution month (1-12)')),
+                ('execution_item', models.CharField(help_text='Execution item', max_length=255)),
+                ('status', models.CharField(choices=[('집행완료', '집행완료'), ('처리중', '처리중'), ('취소', '취소')], help_text='Execution status', max_length=50)),
+                ('execution_amount', models.BigIntegerField(default=0, help_text='Summed execution amount of the cell (KRW)')),
+                ('execution_count', models.IntegerField(default=0, help_text='Number of execution rows in the cell')),
+                ('project_budget', models.BigIntegerField(default=0, help_text="Total budget of the cell's project (KRW)")),
+            ],
+            options={
+                'db_table': 'budget_cube',
+                'ordering': ['year', 'month', 'department'],
+                'indexes': [models.Index(fields=['year', 'department'], name='budget_cube_year_beadf2_idx'), models.Index(fields=['project_number', 'year', 'month'], name='budget_cube_project_57131b_idx')],
+                'unique_together': {('department', 'project_number', 'year', 'month', 'execution_item', 'status')},
+            },
+        ),
+        migrations.RunPython(populate_budget_cube, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:41
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_student_rollup(apps, schema_editor):
+    """Backfill the rollup from existing students rows."""
+    Student = apps.get_model('data_dashboard', 'Student')
+    StudentRollup = apps.get_model('data_dashboard', 'StudentRollup')
+
+    rows = Student.objects.values(
+        'department', 'grade', 'admission_year', 'enrollment_status', 'program_type', 'gender'
+    ).annotate(
+        student_count=Count('id')
+    ).order_by()
+
+    StudentRollup.objects.bulk_create(
+        [StudentRollup(**row) for row in rows],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0003_budget_cube'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(help_text='Department name', max_length=100)),
+                ('grade', models.IntegerField(blank=True, help_text='Grade (0 for graduate school)', null=True)),
+                ('admission_year', models.IntegerField(help_text='Admission year')),
+                ('enrollment_status', models.CharField(choices=[('재학', '재학'), ('휴학', '휴학'), ('졸업', '졸업'), ('자퇴', '자퇴'), ('제적', '제적')], help_text='Enrollment status', max_length=50)),
+                ('program_type', models.CharField(choices=[('학사', '학사'), ('석사', '석사'), ('박사', '박사')], help_text='Program type', max_length=50)),
+                ('gender', models.CharField(blank=True, help_text='Gender', max_length=10, null=True)),
+                ('student_count', models.IntegerField(default=0, help_text='Number of students in the combination')),
+            ],
+            options={
+                'db_table': 'student_rollup',
+                'ordering': ['department', 'admission_year'],
+                'indexes': [models.Index(fields=['department', 'grade'], name='student_rol_departm_2b63c3_idx')],
+            },
+        ),
+        migrations.RunPython(populate_student_rollup, migrations.RunPython.noop),
+    ]
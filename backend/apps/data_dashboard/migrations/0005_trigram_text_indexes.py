@@ -0,0 +1,66 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:42
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+TRIGRAM_INDEXES = [
+    ('publication', django.contrib.postgres.indexes.GinIndex(fields=['department'], name='publications_dept_trgm_idx', opclasses=['gin_trgm_ops'])),
+    ('budgetcube', django.contrib.postgres.indexes.GinIndex(fields=['execution_item'], name='budget_cube_item_trgm_idx', opclasses=['gin_trgm_ops'])),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Enable pg_trgm and build the GIN trigram indexes.
+    Skipped on servers that do not ship the pg_trgm contrib module;
+    substring filters still work there, just without index support.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model_name, index in TRIGRAM_INDEXES:
+        schema_editor.add_index(apps.get_model('data_dashboard', model_name), index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for _, index in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'DROP INDEX IF EXISTS {schema_editor.quote_name(index.name)}'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0004_student_rollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budgetcube',
+            index=models.Index(fields=['execution_item'], name='budget_cube_item_pattern_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['department'], name='publications_dept_pattern_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in TRIGRAM_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+        ),
+    ]
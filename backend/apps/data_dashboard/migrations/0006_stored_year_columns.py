@@ -0,0 +1,52 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:20
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractYear
+
+
+def populate_year_columns(apps, schema_editor):
+    """Backfill stored year columns from the existing date columns."""
+    Publication = apps.get_model('data_dashboard', 'Publication')
+    ResearchBudgetData = apps.get_model('data_dashboard', 'ResearchBudgetData')
+
+    Publication.objects.update(pub_year=ExtractYear('publication_date'))
+    ResearchBudgetData.objects.update(exec_year=ExtractYear('execution_date'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0005_trigram_text_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publication',
+            name='pub_year',
+            field=models.SmallIntegerField(editable=False, help_text='Publication year (stored copy of publication_date year)', null=True),
+        ),
+        migrations.AddField(
+            model_name='researchbudgetdata',
+            name='exec_year',
+            field=models.SmallIntegerField(editable=False, help_text='Execution year (stored copy of execution_date year)', null=True),
+        ),
+        migrations.RunPython(populate_year_columns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='publication',
+            name='pub_year',
+            field=models.SmallIntegerField(editable=False, help_text='Publication year (stored copy of publication_date year)'),
+        ),
+        migrations.AlterField(
+            model_name='researchbudgetdata',
+            name='exec_year',
+            field=models.SmallIntegerField(editable=False, help_text='Execution year (stored copy of execution_date year)'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['pub_year'], name='publications_pub_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['exec_year'], name='budget_data_exec_year_idx'),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:47
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0006_stored_year_columns'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='departmentkpi',
+            name='department__year_4bff5e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='departmentkpi',
+            name='department__departm_460480_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='publication',
+            name='publication_journal_5dc8eb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='researchbudgetdata',
+            name='research_bu_project_5b4320_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='researchbudgetdata',
+            name='research_bu_departm_c4ec24_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='students_enrollm_559cd0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='budgetcube',
+            index=models.Index(fields=['department', 'year', 'month'], name='budget_cube_dept_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetcube',
+            index=models.Index(condition=models.Q(('status', '집행완료')), fields=['year', 'department'], name='budget_cube_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='departmentkpi',
+            index=models.Index(fields=['year', 'department'], include=('employment_rate', 'tech_transfer_revenue', 'intl_conference_count'), name='kpi_year_dept_cover_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='departmentkpi',
+            index=models.Index(fields=['department', 'year'], name='kpi_dept_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(django.db.models.functions.text.Upper('journal_grade'), models.F('publication_date'), name='publications_grade_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['project_number', 'execution_date'], name='budget_data_project_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['department', 'execution_date'], name='budget_data_dept_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['status', 'department', 'execution_date'], include=('execution_amount',), name='budget_data_status_dept_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['enrollment_status', 'department', 'grade'], name='students_status_dept_grade_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('enrollment_status', '재학')), fields=['department', 'grade'], name='students_active_dept_grade_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadhistory',
+            index=models.Index(fields=['user', '-uploaded_at'], name='upload_history_user_idx'),
+        ),
+    ]
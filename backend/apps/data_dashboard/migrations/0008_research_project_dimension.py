@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:03
+
+from django.db import migrations, models
+
+
+def populate_research_projects(apps, schema_editor):
+    """Backfill one project per project_number from its latest execution row."""
+    ResearchBudgetData = apps.get_model('data_dashboard', 'ResearchBudgetData')
+    ResearchProject = apps.get_model('data_dashboard', 'ResearchProject')
+
+    rows = ResearchBudgetData.objects.order_by(
+        'project_number', '-execution_date', '-id'
+    ).distinct('project_number').values(
+        'project_number', 'project_name', 'principal_investigator',
+        'department', 'funding_agency', 'total_budget'
+    )
+
+    ResearchProject.objects.bulk_create(
+        [ResearchProject(**row) for row in rows],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0007_query_shape_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResearchProject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_number', models.CharField(help_text='Project number', max_length=50, unique=True)),
+                ('project_name', models.CharField(help_text='Project name', max_length=255)),
+                ('principal_investigator', models.CharField(help_text='Principal investigator name', max_length=100)),
+                ('department', models.CharField(help_text='Department name', max_length=100)),
+                ('funding_agency', models.CharField(help_text='Funding agency', max_length=255)),
+                ('total_budget', models.BigIntegerField(help_text='Total budget (KRW)')),
+            ],
+            options={
+                'db_table': 'research_projects',
+                'ordering': ['project_number'],
+                'indexes': [models.Index(fields=['department'], include=('total_budget',), name='research_projects_dept_idx')],
+            },
+        ),
+        migrations.RunPython(populate_research_projects, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='budgetcube',
+            name='project_budget',
+        ),
+    ]
@@ -0,0 +1,165 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+
+FACT_MODELS = ['DepartmentKPI', 'Publication', 'Student', 'ResearchBudgetData']
+
+
+def populate_departments(apps, schema_editor):
+    """Create a department per distinct name and point fact rows at it."""
+    Department = apps.get_model('data_dashboard', 'Department')
+
+    colleges = {}
+    for model_name in FACT_MODELS:
+        model = apps.get_model('data_dashboard', model_name)
+        fields = ['department']
+        if any(f.name == 'college' for f in model._meta.fields):
+            fields.append('college')
+        for row in model.objects.values(*fields).distinct().order_by():
+            if not colleges.get(row['department']):
+                colleges[row['department']] = row.get('college') or ''
+
+    Department.objects.bulk_create(
+        [Department(name=name, college=college) for name, college in sorted(colleges.items())],
+        batch_size=1000
+    )
+
+    for model_name in FACT_MODELS:
+        model = apps.get_model('data_dashboard', model_name)
+        model.objects.update(department_ref_id=Subquery(
+            Department.objects.filter(name=OuterRef('department')).values('id')[:1]
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0008_research_project_dimension'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Department',
+            fields=[
+                ('id', models.SmallAutoField(primary_key=True, serialize=False)),
+                ('college', models.CharField(blank=True, default='', help_text='College name', max_length=100)),
+                ('name', models.CharField(help_text='Canonical department name', max_length=100, unique=True)),
+            ],
+            options={
+                'db_table': 'departments',
+                'ordering': ['college', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DepartmentAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(help_text='Alternative department name', max_length=100, unique=True)),
+            ],
+            options={
+                'db_table': 'department_aliases',
+                'ordering': ['alias'],
+            },
+        ),
+        migrations.AddField(
+            model_name='departmentalias',
+            name='department',
+            field=models.ForeignKey(help_text='Canonical department', on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='data_dashboard.department'),
+        ),
+        migrations.AddField(
+            model_name='departmentkpi',
+            name='department_ref',
+            field=models.ForeignKey(db_index=False, help_text='Department dimension key', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='kpis', to='data_dashboard.department'),
+        ),
+        migrations.AddField(
+            model_name='publication',
+            name='department_ref',
+            field=models.ForeignKey(help_text='Department dimension key', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='publications', to='data_dashboard.department'),
+        ),
+        migrations.AddField(
+            model_name='researchbudgetdata',
+            name='department_ref',
+            field=models.ForeignKey(db_index=False, help_text='Department dimension key', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='budget_rows', to='data_dashboard.department'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='department_ref',
+            field=models.ForeignKey(help_text='Department dimension key', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='students', to='data_dashboard.department'),
+        ),
+        migrations.RunPython(populate_departments, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='departmentkpi',
+            name='department_ref',
+            field=models.ForeignKey(db_index=False, help_text='Department dimension key', on_delete=django.db.models.deletion.PROTECT, related_name='kpis', to='data_dashboard.department'),
+        ),
+        migrations.AlterField(
+            model_name='publication',
+            name='department_ref',
+            field=models.ForeignKey(help_text='Department dimension key', on_delete=django.db.models.deletion.PROTECT, related_name='publications', to='data_dashboard.department'),
+        ),
+        migrations.AlterField(
+            model_name='researchbudgetdata',
+            name='department_ref',
+            field=models.ForeignKey(db_index=False, help_text='Department dimension key', on_delete=django.db.models.deletion.PROTECT, related_name='budget_rows', to='data_dashboard.department'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='department_ref',
+            field=models.ForeignKey(help_text='Department dimension key', on_delete=django.db.models.deletion.PROTECT, related_name='students', to='data_dashboard.department'),
+        ),
+        migrations.RemoveIndex(
+            model_name='departmentkpi',
+            name='kpi_year_dept_cover_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='departmentkpi',
+            name='kpi_dept_year_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='researchbudgetdata',
+            name='budget_data_dept_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='researchbudgetdata',
+            name='budget_data_status_dept_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='students_departm_33c447_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='students_status_dept_grade_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='students_active_dept_grade_idx',
+        ),
+        migrations.AddIndex(
+            model_name='departmentkpi',
+            index=models.Index(fields=['year', 'department_ref'], include=('employment_rate', 'tech_transfer_revenue', 'intl_conference_count'), name='kpi_year_dept_cover_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='departmentkpi',
+            index=models.Index(fields=['department_ref', 'year'], name='kpi_dept_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['department_ref', 'execution_date'], name='budget_data_dept_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchbudgetdata',
+            index=models.Index(fields=['status', 'department_ref', 'execution_date'], include=('execution_amount',), name='budget_data_status_dept_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['enrollment_status', 'department_ref', 'grade'], name='students_status_dept_grade_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('enrollment_status', '재학')), fields=['department_ref', 'grade'], name='students_active_dept_grade_idx'),
+        ),
+    ]
@@ -0,0 +1,137 @@
+# Generated by Django 4.2.7 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+
+# (table, column, label length, {code: labels}, code for unknown labels)
+# Labels are matched upper-cased and trimmed; the first label is canonical.
+CODED_COLUMNS = [
+    ('students', 'enrollment_status', 50, {1: ['재학'], 2: ['휴학'], 3: ['졸업'], 4: ['자퇴'], 5: ['제적']}, None),
+    ('students', 'program_type', 50, {1: ['학사', '학부'], 2: ['석사'], 3: ['박사', '석박통합']}, None),
+    ('students', 'gender', 10, {1: ['남', 'M', 'MALE', '남자', '남성'], 2: ['여', 'F', 'FEMALE', '여자', '여성']}, None),
+    ('student_rollup', 'enrollment_status', 50, {1: ['재학'], 2: ['휴학'], 3: ['졸업'], 4: ['자퇴'], 5: ['제적']}, None),
+    ('student_rollup', 'program_type', 50, {1: ['학사', '학부'], 2: ['석사'], 3: ['박사', '석박통합']}, None),
+    ('student_rollup', 'gender', 10, {1: ['남', 'M', 'MALE', '남자', '남성'], 2: ['여', 'F', 'FEMALE', '여자', '여성']}, None),
+    ('publications', 'journal_grade', 50, {1: ['SCI', 'SCIE', 'SCI(E)', 'SCI-E'], 2: ['SCOPUS'], 3: ['KCI'], 4: ['기타']}, 4),
+    ('research_budget_data', 'status', 50, {1: ['집행완료', '완료', '집행'], 2: ['처리중', '진행중', '대기'], 3: ['취소']}, None),
+    ('budget_cube', 'status', 50, {1: ['집행완료', '완료', '집행'], 2: ['처리중', '진행중', '대기'], 3: ['취소']}, None),
+]
+
+
+def quote(label):
+    return "'" + label.replace("'", "''") + "'"
+
+
+def encode_sql(table, column, length, codes, unknown):
+    """
+    Convert a label column to smallint codes in place.
+    Unknown labels on required columns are left NULL so the NOT NULL
+    constraint aborts the migration instead of guessing a code.
+    """
+    branches = ' '.join(
+        f"WHEN upper(btrim({column})) IN ({', '.join(quote(label) for label in labels)}) THEN {code}"
+        for code, labels in codes.items()
+    )
+    return (
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint USING '
+        f'(CASE WHEN {column} IS NULL THEN NULL {branches} ELSE {unknown or "NULL"} END)'
+    )
+
+
+def decode_sql(table, column, length, codes, unknown):
+    """Restore canonical labels once the column is text again."""
+    branches = ' '.join(
+        f"WHEN '{code}' THEN {quote(labels[0])}"
+        for code, labels in codes.items()
+    )
+    return (
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar({length}) USING '
+        f'(CASE {column} {branches} END)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0009_department_dimension'),
+    ]
+
+    operations = [
+        # Label literals in these indexes cannot survive the type change
+        migrations.RemoveIndex(
+            model_name='budgetcube',
+            name='budget_cube_completed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='publication',
+            name='publications_grade_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='students_active_dept_grade_idx',
+        ),
+        *[
+            migrations.RunSQL(
+                encode_sql(*coded_column),
+                decode_sql(*coded_column),
+            )
+            for coded_column in CODED_COLUMNS
+        ],
+        migrations.AlterField(
+            model_name='budgetcube',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, '집행완료'), (2, '처리중'), (3, '취소')], help_text='Execution status'),
+        ),
+        migrations.AlterField(
+            model_name='publication',
+            name='journal_grade',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'SCI'), (2, 'SCOPUS'), (3, 'KCI'), (4, '기타')], help_text='Journal grade/tier', null=True),
+        ),
+        migrations.AlterField(
+            model_name='researchbudgetdata',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, '집행완료'), (2, '처리중'), (3, '취소')], help_text='Execution status'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='enrollment_status',
+            field=models.PositiveSmallIntegerField(choices=[(1, '재학'), (2, '휴학'), (3, '졸업'), (4, '자퇴'), (5, '제적')], help_text='Enrollment status'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='gender',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, '남'), (2, '여')], help_text='Gender', null=True),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='program_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, '학사'), (2, '석사'), (3, '박사')], help_text='Program type'),
+        ),
+        migrations.AlterField(
+            model_name='studentrollup',
+            name='enrollment_status',
+            field=models.PositiveSmallIntegerField(choices=[(1, '재학'), (2, '휴학'), (3, '졸업'), (4, '자퇴'), (5, '제적')], help_text='Enrollment status'),
+        ),
+        migrations.AlterField(
+            model_name='studentrollup',
+            name='gender',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, '남'), (2, '여')], help_text='Gender', null=True),
+        ),
+        migrations.AlterField(
+            model_name='studentrollup',
+            name='program_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, '학사'), (2, '석사'), (3, '박사')], help_text='Program type'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetcube',
+            index=models.Index(condition=models.Q(('status', 1)), fields=['year', 'department'], name='budget_cube_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['journal_grade', 'publication_date'], name='publications_grade_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('enrollment_status', 1)), fields=['department_ref', 'grade'], name='students_active_dept_grade_idx'),
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 4.2.7 on 2026-10-19 17:20
+
+import re
+
+from django.db import migrations, models
+
+
+TABLE = 'research_budget_data'
+
+
+def table_ddl(cursor, table):
+    """
+    Collect the index and foreign key DDL of a table, primary key excluded.
+    Index definitions are returned without their table name, as format strings.
+    """
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s",
+        [table, f'{table}_pkey']
+    )
+    indexes = [
+        re.sub(r' ON (ONLY )?(\S+\.)?' + table + ' ', ' ON {table} ', row[0])
+        for row in cursor.fetchall()
+    ]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table]
+    )
+    foreign_keys = cursor.fetchall()
+    return indexes, foreign_keys
+
+
+def restore_ddl(schema_editor, indexes, foreign_keys):
+    for name, definition in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}')
+    for definition in indexes:
+        schema_editor.execute(definition.format(table=TABLE))
+
+
+def partition_budget_rows(apps, schema_editor):
+    """
+    Rebuild research_budget_data as a table range-partitioned by execution_date.
+    One partition per existing execution year plus a default partition.
+    The primary key has to include the partition column, and identity columns
+    are not available on partitioned tables, so ids come from an owned sequence.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    old = f'{TABLE}_unpartitioned'
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = table_ddl(cursor, TABLE)
+        cursor.execute(f'SELECT DISTINCT exec_year FROM {TABLE} ORDER BY 1')
+        years = [row[0] for row in cursor.fetchall()]
+
+    schema_editor.execute(f'ALTER TABLE {TABLE} RENAME TO {old}')
+    schema_editor.execute(
+        f'CREATE TABLE {TABLE} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (execution_date)'
+    )
+    schema_editor.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+    for year in years:
+        schema_editor.execute(
+            f"CREATE TABLE {TABLE}_y{year} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    schema_editor.execute(f'INSERT INTO {TABLE} SELECT * FROM {old}')
+    schema_editor.execute(f'DROP TABLE {old}')
+
+    schema_editor.execute(f'CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id')
+    schema_editor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+    schema_editor.execute(
+        f"SELECT setval('{TABLE}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}"
+    )
+    schema_editor.execute(
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, execution_date)'
+    )
+    restore_ddl(schema_editor, indexes, foreign_keys)
+
+
+def unpartition_budget_rows(apps, schema_editor):
+    """Fold the partitions back into a plain table with an identity key."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    old = f'{TABLE}_partitioned'
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = table_ddl(cursor, TABLE)
+
+    schema_editor.execute(f'ALTER TABLE {TABLE} RENAME TO {old}')
+    schema_editor.execute(
+        f'CREATE TABLE {TABLE} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    schema_editor.execute(f'ALTER TABLE {TABLE} ALTER COLUMN id DROP DEFAULT')
+    schema_editor.execute(f'INSERT INTO {TABLE} SELECT * FROM {old}')
+    schema_editor.execute(f'DROP TABLE {old}')
+
+    schema_editor.execute(f'ALTER TABLE {TABLE} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}"
+    )
+    schema_editor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id)')
+    restore_ddl(schema_editor, indexes, foreign_keys)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_dashboard', '0010_coded_choice_columns'),
+    ]
+
+    operations = [
+        # A unique key must include the partition column; upserts keep it unique
+        migrations.AlterField(
+            model_name='researchbudgetdata',
+            name='execution_id',
+            field=models.CharField(db_index=True, help_text='Unique execution ID', max_length=50),
+        ),
+        migrations.RunPython(partition_budget_rows, unpartition_budget_rows),
+    ]
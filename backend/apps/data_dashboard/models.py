@@ -4,10 +4,210 @@ Following the common-modules.md and database.md specifications.
 Implements all 5 data models as defined in the database schema.
 """
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 
 
-class DepartmentKPI(models.Model):
+class LabeledChoices(models.IntegerChoices):
+    """
+    Small integer codes for low-cardinality label columns.
+    Uploads carry the Korean labels; they are coded at ingest and the API
+    maps codes back to labels on the way out.
+    """
+
+    @classmethod
+    def from_label(cls, value):
+        """
+        Get the member an ingested label refers to.
+
+        Args:
+            value: Label, member name, alias or code
+
+        Returns:
+            LabeledChoices or None: Matching member, None when unknown or blank
+        """
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return cls(value) if value in cls.values else None
+
+        key = str(value).strip().casefold()
+        if not key:
+            return None
+        for member in cls:
+            if key in (member.label.casefold(), member.name.casefold(), str(member.value)):
+                return member
+        return CHOICE_ALIASES.get(cls.__name__, {}).get(key)
+
+
+class EnrollmentStatus(LabeledChoices):
+    ENROLLED = 1, '재학'
+    ON_LEAVE = 2, '휴학'
+    GRADUATED = 3, '졸업'
+    WITHDRAWN = 4, '자퇴'
+    EXPELLED = 5, '제적'
+
+
+class ProgramType(LabeledChoices):
+    BACHELOR = 1, '학사'
+    MASTER = 2, '석사'
+    DOCTORATE = 3, '박사'
+
+
+class Gender(LabeledChoices):
+    MALE = 1, '남'
+    FEMALE = 2, '여'
+
+
+class JournalGrade(LabeledChoices):
+    SCI = 1, 'SCI'
+    SCOPUS = 2, 'SCOPUS'
+    KCI = 3, 'KCI'
+    OTHER = 4, '기타'
+
+
+class ExecutionStatus(LabeledChoices):
+    COMPLETED = 1, '집행완료'
+    PENDING = 2, '처리중'
+    CANCELLED = 3, '취소'
+
+
+# Alternative spellings seen in uploaded files (casefolded)
+CHOICE_ALIASES = {
+    'Gender': {
+        'm': Gender.MALE, 'male': Gender.MALE, '남자': Gender.MALE, '남성': Gender.MALE,
+        'f': Gender.FEMALE, 'female': Gender.FEMALE, '여자': Gender.FEMALE, '여성': Gender.FEMALE,
+    },
+    'JournalGrade': {
+        'scie': JournalGrade.SCI, 'sci(e)': JournalGrade.SCI, 'sci-e': JournalGrade.SCI,
+    },
+    'ProgramType': {
+        '학부': ProgramType.BACHELOR, '석박통합': ProgramType.DOCTORATE,
+    },
+    'ExecutionStatus': {
+        '완료': ExecutionStatus.COMPLETED, '집행': ExecutionStatus.COMPLETED,
+        '진행중': ExecutionStatus.PENDING, '대기': ExecutionStatus.PENDING,
+    },
+}
+
+
+class DepartmentManager(models.Manager):
+    """Manager resolving raw department strings to dimension rows."""
+
+    def resolve(self, name, college=None):
+        """
+        Get the department a raw name refers to, creating it if unknown.
+
+        Args:
+            name (str): Department name or alias as ingested
+            college (str, optional): College name, recorded on new departments
+
+        Returns:
+            Department: Canonical department
+        """
+        alias = DepartmentAlias.objects.select_related('department').filter(alias=name).first()
+        if alias is not None:
+            return alias.department
+
+        department, _ = self.get_or_create(
+            name=name,
+            defaults={'college': college or ''}
+        )
+        if college and not department.college:
+            department.college = college
+            department.save(update_fields=['college'])
+
+        return department
+
+
+class Department(models.Model):
+    """
+    Department dimension.
+    One row per canonical department with a small integer key; fact
+    tables reference it so grouping and joins compare integers.
+    """
+    id = models.SmallAutoField(primary_key=True)
+    college = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        help_text="College name"
+    )
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Canonical department name"
+    )
+
+    objects = DepartmentManager()
+
+    class Meta:
+        db_table = 'departments'
+        ordering = ['college', 'name']
+
+    def __str__(self):
+        return f"{self.college} - {self.name}" if self.college else self.name
+
+
+class DepartmentAlias(models.Model):
+    """
+    Alternative spelling of a department name.
+    Ingested rows using an alias are stored under the canonical department.
+    """
+    alias = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Alternative department name"
+    )
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name='aliases',
+        help_text="Canonical department"
+    )
+
+    class Meta:
+        db_table = 'department_aliases'
+        ordering = ['alias']
+
+    def __str__(self):
+        return f"{self.alias} → {self.department.name}"
+
+
+class DepartmentRefMixin(models.Model):
+    """
+    Keeps department_ref and the department name column in step.
+    Ingest resolves references in bulk; other writes resolve on save, for
+    new rows and for loaded rows whose department or college was changed.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_department = instance._department_key()
+        return instance
+
+    def _department_key(self):
+        # Deferred fields read as None rather than being fetched
+        return self.__dict__.get('department'), self.__dict__.get('college')
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_department', None)
+        if self.department_ref_id is None or (loaded is not None and loaded != self._department_key()):
+            department = Department.objects.resolve(
+                self.department, getattr(self, 'college', None)
+            )
+            self.department_ref = department
+            self.department = department.name
+        super().save(*args, **kwargs)
+        self._loaded_department = self._department_key()
+
+
+class DepartmentKPI(DepartmentRefMixin):
     """
     Department Key Performance Indicators data model.
     Stores annual performance metrics for each department.
@@ -23,6 +223,13 @@ class DepartmentKPI(models.Model):
         max_length=100,
         help_text="Department name"
     )
+    department_ref = models.ForeignKey(
+        Department,
+        on_delete=models.PROTECT,
+        related_name='kpis',
+        db_index=False,
+        help_text="Department dimension key"
+    )
     employment_rate = models.DecimalField(
         max_digits=5,
         decimal_places=2,
@@ -57,8 +264,14 @@ class DepartmentKPI(models.Model):
         db_table = 'department_kpis'
         unique_together = [['year', 'college', 'department']]
         indexes = [
-            models.Index(fields=['year']),
-            models.Index(fields=['department']),
+            # Year-range trends and per-year department breakdowns (covering)
+            models.Index(
+                fields=['year', 'department_ref'],
+                name='kpi_year_dept_cover_idx',
+                include=['employment_rate', 'tech_transfer_revenue', 'intl_conference_count']
+            ),
+            # Department filters over a year range
+            models.Index(fields=['department_ref', 'year'], name='kpi_dept_year_idx'),
         ]
         ordering = ['-year', 'college', 'department']
 
@@ -66,7 +279,7 @@ class DepartmentKPI(models.Model):
         return f"{self.college} - {self.department} ({self.year})"
 
 
-class Publication(models.Model):
+class Publication(DepartmentRefMixin):
     """
     Publication (paper) data model.
     Stores information about academic publications.
@@ -80,6 +293,10 @@ class Publication(models.Model):
     publication_date = models.DateField(
         help_text="Publication date"
     )
+    pub_year = models.SmallIntegerField(
+        editable=False,
+        help_text="Publication year (stored copy of publication_date year)"
+    )
     college = models.CharField(
         max_length=100,
         help_text="College name"
@@ -88,6 +305,12 @@ class Publication(models.Model):
         max_length=100,
         help_text="Department name"
     )
+    department_ref = models.ForeignKey(
+        Department,
+        on_delete=models.PROTECT,
+        related_name='publications',
+        help_text="Department dimension key"
+    )
     title = models.TextField(
         help_text="Publication title"
     )
@@ -104,8 +327,8 @@ class Publication(models.Model):
         max_length=255,
         help_text="Journal name"
     )
-    journal_grade = models.CharField(
-        max_length=50,
+    journal_grade = models.PositiveSmallIntegerField(
+        choices=JournalGrade.choices,
         null=True,
         blank=True,
         help_text="Journal grade/tier"
@@ -126,33 +349,43 @@ class Publication(models.Model):
         db_table = 'publications'
         indexes = [
             models.Index(fields=['publication_date']),
-            models.Index(fields=['journal_grade']),
+            models.Index(fields=['pub_year'], name='publications_pub_year_idx'),
+            # Journal grade filters within a date range
+            models.Index(
+                fields=['journal_grade', 'publication_date'],
+                name='publications_grade_date_idx'
+            ),
+            # Exact and prefix department filters
+            models.Index(
+                fields=['department'],
+                name='publications_dept_pattern_idx',
+                opclasses=['varchar_pattern_ops']
+            ),
+            # Substring department filters (created only where pg_trgm is available)
+            GinIndex(
+                fields=['department'],
+                name='publications_dept_trgm_idx',
+                opclasses=['gin_trgm_ops']
+            ),
         ]
         ordering = ['-publication_date']
 
+    def save(self, *args, **kwargs):
+        self.publication_date = self._meta.get_field('publication_date').to_python(
+            self.publication_date
+        )
+        self.pub_year = self.publication_date.year
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.title} ({self.publication_date.year})"
 
 
-class Student(models.Model):
+class Student(DepartmentRefMixin):
     """
     Student data model.
     Stores student information.
     """
-    PROGRAM_CHOICES = [
-        ('학사', '학사'),
-        ('석사', '석사'),
-        ('박사', '박사'),
-    ]
-
-    ENROLLMENT_CHOICES = [
-        ('재학', '재학'),
-        ('휴학', '휴학'),
-        ('졸업', '졸업'),
-        ('자퇴', '자퇴'),
-        ('제적', '제적'),
-    ]
-
     student_id = models.CharField(
         max_length=20,
         unique=True,
@@ -171,23 +404,27 @@ class Student(models.Model):
         max_length=100,
         help_text="Department name"
     )
+    department_ref = models.ForeignKey(
+        Department,
+        on_delete=models.PROTECT,
+        related_name='students',
+        help_text="Department dimension key"
+    )
     grade = models.IntegerField(
         null=True,
         blank=True,
         help_text="Grade (0 for graduate school)"
     )
-    program_type = models.CharField(
-        max_length=50,
-        choices=PROGRAM_CHOICES,
+    program_type = models.PositiveSmallIntegerField(
+        choices=ProgramType.choices,
         help_text="Program type"
     )
-    enrollment_status = models.CharField(
-        max_length=50,
-        choices=ENROLLMENT_CHOICES,
+    enrollment_status = models.PositiveSmallIntegerField(
+        choices=EnrollmentStatus.choices,
         help_text="Enrollment status"
     )
-    gender = models.CharField(
-        max_length=10,
+    gender = models.PositiveSmallIntegerField(
+        choices=Gender.choices,
         null=True,
         blank=True,
         help_text="Gender"
@@ -210,8 +447,16 @@ class Student(models.Model):
     class Meta:
         db_table = 'students'
         indexes = [
-            models.Index(fields=['department']),
-            models.Index(fields=['enrollment_status']),
+            models.Index(
+                fields=['enrollment_status', 'department_ref', 'grade'],
+                name='students_status_dept_grade_idx'
+            ),
+            # Active students only
+            models.Index(
+                fields=['department_ref', 'grade'],
+                name='students_active_dept_grade_idx',
+                condition=Q(enrollment_status=EnrollmentStatus.ENROLLED)
+            ),
         ]
         ordering = ['student_id']
 
@@ -219,20 +464,66 @@ class Student(models.Model):
         return f"{self.name} ({self.student_id})"
 
 
-class ResearchBudgetData(models.Model):
+class StudentRollup(models.Model):
+    """
+    Pre-aggregated student counts.
+    One row per (department, grade, admission_year, enrollment_status,
+    program_type, gender) combination, rebuilt on every roster upload.
+    """
+    department = models.CharField(
+        max_length=100,
+        help_text="Department name"
+    )
+    grade = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="Grade (0 for graduate school)"
+    )
+    admission_year = models.IntegerField(
+        help_text="Admission year"
+    )
+    enrollment_status = models.PositiveSmallIntegerField(
+        choices=EnrollmentStatus.choices,
+        help_text="Enrollment status"
+    )
+    program_type = models.PositiveSmallIntegerField(
+        choices=ProgramType.choices,
+        help_text="Program type"
+    )
+    gender = models.PositiveSmallIntegerField(
+        choices=Gender.choices,
+        null=True,
+        blank=True,
+        help_text="Gender"
+    )
+    student_count = models.IntegerField(
+        default=0,
+        help_text="Number of students in the combination"
+    )
+
+    class Meta:
+        db_table = 'student_rollup'
+        indexes = [
+            models.Index(fields=['department', 'grade']),
+        ]
+        ordering = ['department', 'admission_year']
+
+    def __str__(self):
+        return f"{self.department} {self.admission_year} ({self.enrollment_status}): {self.student_count}"
+
+
+class ResearchBudgetData(DepartmentRefMixin):
     """
     Research budget data model (denormalized).
     Combines research project and budget execution data.
-    """
-    STATUS_CHOICES = [
-        ('집행완료', '집행완료'),
-        ('처리중', '처리중'),
-        ('취소', '취소'),
-    ]
 
+    The table is range-partitioned by execution_date, one partition per
+    year (see BudgetPartitionRepository). PostgreSQL cannot enforce a
+    unique key that excludes the partition column, so execution_id is
+    kept unique by the upload upsert rather than by a constraint.
+    """
     execution_id = models.CharField(
         max_length=50,
-        unique=True,
         db_index=True,
         help_text="Unique execution ID"
     )
@@ -252,6 +543,13 @@ class ResearchBudgetData(models.Model):
         max_length=100,
         help_text="Department name"
     )
+    department_ref = models.ForeignKey(
+        Department,
+        on_delete=models.PROTECT,
+        related_name='budget_rows',
+        db_index=False,
+        help_text="Department dimension key"
+    )
     funding_agency = models.CharField(
         max_length=255,
         help_text="Funding agency"
@@ -262,6 +560,10 @@ class ResearchBudgetData(models.Model):
     execution_date = models.DateField(
         help_text="Execution date"
     )
+    exec_year = models.SmallIntegerField(
+        editable=False,
+        help_text="Execution year (stored copy of execution_date year)"
+    )
     execution_item = models.CharField(
         max_length=255,
         help_text="Execution item"
@@ -269,9 +571,8 @@ class ResearchBudgetData(models.Model):
     execution_amount = models.BigIntegerField(
         help_text="Execution amount (KRW)"
     )
-    status = models.CharField(
-        max_length=50,
-        choices=STATUS_CHOICES,
+    status = models.PositiveSmallIntegerField(
+        choices=ExecutionStatus.choices,
         help_text="Execution status"
     )
     note = models.TextField(
@@ -283,16 +584,158 @@ class ResearchBudgetData(models.Model):
     class Meta:
         db_table = 'research_budget_data'
         indexes = [
-            models.Index(fields=['project_number']),
-            models.Index(fields=['department']),
+            # Cube slice recomputation by project and month
+            models.Index(
+                fields=['project_number', 'execution_date'],
+                name='budget_data_project_date_idx'
+            ),
+            models.Index(
+                fields=['department_ref', 'execution_date'],
+                name='budget_data_dept_date_idx'
+            ),
             models.Index(fields=['execution_date']),
+            models.Index(fields=['exec_year'], name='budget_data_exec_year_idx'),
+            # Execution totals by status (covering)
+            models.Index(
+                fields=['status', 'department_ref', 'execution_date'],
+                name='budget_data_status_dept_idx',
+                include=['execution_amount']
+            ),
         ]
         ordering = ['-execution_date']
 
+    def save(self, *args, **kwargs):
+        self.execution_date = self._meta.get_field('execution_date').to_python(
+            self.execution_date
+        )
+        self.exec_year = self.execution_date.year
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.project_name} - {self.execution_item} ({self.execution_date})"
 
 
+class ResearchProject(models.Model):
+    """
+    Research project dimension.
+    One row per project_number, maintained at ingest from the latest
+    execution row of each project, so budget totals are sums over projects.
+    """
+    project_number = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text="Project number"
+    )
+    project_name = models.CharField(
+        max_length=255,
+        help_text="Project name"
+    )
+    principal_investigator = models.CharField(
+        max_length=100,
+        help_text="Principal investigator name"
+    )
+    department = models.CharField(
+        max_length=100,
+        help_text="Department name"
+    )
+    funding_agency = models.CharField(
+        max_length=255,
+        help_text="Funding agency"
+    )
+    total_budget = models.BigIntegerField(
+        help_text="Total budget (KRW)"
+    )
+
+    class Meta:
+        db_table = 'research_projects'
+        indexes = [
+            models.Index(
+                fields=['department'],
+                name='research_projects_dept_idx',
+                include=['total_budget']
+            ),
+        ]
+        ordering = ['project_number']
+
+    def __str__(self):
+        return f"{self.project_number} - {self.project_name}"
+
+
+class BudgetCube(models.Model):
+    """
+    Pre-aggregated research budget execution cube.
+    One row per (department, project, year, month, execution item, status) cell,
+    maintained incrementally from research_budget_data at ingest time.
+    """
+    department = models.CharField(
+        max_length=100,
+        help_text="Department name"
+    )
+    project_number = models.CharField(
+        max_length=50,
+        help_text="Project number"
+    )
+    year = models.IntegerField(
+        help_text="Execution year"
+    )
+    month = models.IntegerField(
+        help_text="Execution month (1-12)"
+    )
+    execution_item = models.CharField(
+        max_length=255,
+        help_text="Execution item"
+    )
+    status = models.PositiveSmallIntegerField(
+        choices=ExecutionStatus.choices,
+        help_text="Execution status"
+    )
+    execution_amount = models.BigIntegerField(
+        default=0,
+        help_text="Summed execution amount of the cell (KRW)"
+    )
+    execution_count = models.IntegerField(
+        default=0,
+        help_text="Number of execution rows in the cell"
+    )
+
+    class Meta:
+        db_table = 'budget_cube'
+        unique_together = [[
+            'department', 'project_number', 'year', 'month', 'execution_item', 'status'
+        ]]
+        indexes = [
+            models.Index(fields=['year', 'department']),
+            models.Index(fields=['project_number', 'year', 'month']),
+            # Department filters over a month range
+            models.Index(
+                fields=['department', 'year', 'month'],
+                name='budget_cube_dept_period_idx'
+            ),
+            # Budget allocation reads completed cells only
+            models.Index(
+                fields=['year', 'department'],
+                name='budget_cube_completed_idx',
+                condition=Q(status=ExecutionStatus.COMPLETED)
+            ),
+            # Exact and prefix category filters
+            models.Index(
+                fields=['execution_item'],
+                name='budget_cube_item_pattern_idx',
+                opclasses=['varchar_pattern_ops']
+            ),
+            # Substring category filters (created only where pg_trgm is available)
+            GinIndex(
+                fields=['execution_item'],
+                name='budget_cube_item_trgm_idx',
+                opclasses=['gin_trgm_ops']
+            ),
+        ]
+        ordering = ['year', 'month', 'department']
+
+    def __str__(self):
+        return f"{self.department} {self.project_number} {self.year}-{self.month:02d} ({self.status})"
+
+
 class UploadHistory(models.Model):
     """
     File upload history data model.
@@ -347,6 +790,8 @@ class UploadHistory(models.Model):
         db_table = 'upload_history'
         indexes = [
             models.Index(fields=['-uploaded_at']),
+            # Per-user history, newest first
+            models.Index(fields=['user', '-uploaded_at'], name='upload_history_user_idx'),
         ]
         ordering = ['-uploaded_at']
 
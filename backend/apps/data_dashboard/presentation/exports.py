@@ -0,0 +1,120 @@
+"""
+Columnar exports of the datasets and analytics results.
+Shared by the export endpoint and the export_columnar management command.
+"""
+from core.exceptions import ValidationError
+from ..application.use_cases import (
+    BudgetAnalysisUseCase,
+    ColumnarExportUseCase,
+    GetPapersAnalyticsUseCase
+)
+from ..infrastructure.repositories import RECORD_DATASETS
+from .serializers import (
+    BudgetFilterSerializer,
+    BudgetAllocationSerializer,
+    ExecutionStatusSerializer,
+    YearlyTrendsSerializer,
+    YearlyDataSerializer,
+    JournalDataSerializer,
+    FieldDataSerializer
+)
+
+
+def _budget_filters(params):
+    """Validate budget analysis filters as the budget endpoints do."""
+    serializer = BudgetFilterSerializer(data=params)
+    if not serializer.is_valid():
+        raise ValidationError(f"Invalid filters: {dict(serializer.errors)}")
+    return serializer.validated_data
+
+
+def _budget_allocation(params):
+    filters = _budget_filters(params)
+    return BudgetAnalysisUseCase().get_budget_allocation(
+        department=filters.get('department'),
+        year=filters.get('year'),
+        category=filters.get('category'),
+        category_match=filters.get('category_match', 'contains')
+    )
+
+
+def _budget_execution(params):
+    filters = _budget_filters(params)
+    return BudgetAnalysisUseCase().get_execution_status(
+        department=filters.get('department'),
+        year=filters.get('year'),
+        start_date=filters.get('start_date'),
+        end_date=filters.get('end_date')
+    )['data']
+
+
+def _budget_trends(params):
+    filters = _budget_filters(params)
+    return BudgetAnalysisUseCase().get_yearly_trends(
+        department=filters.get('department'),
+        start_year=filters.get('start_year'),
+        end_year=filters.get('end_year')
+    )
+
+
+def _papers(key):
+    def fetch(params):
+        year = params.get('year')
+        if year:
+            try:
+                year = int(year)
+            except ValueError:
+                raise ValidationError("Year must be an integer")
+
+        use_case = GetPapersAnalyticsUseCase(field_match=params.get('field_match') or 'contains')
+        return use_case.execute(
+            year=year or None,
+            journal_grade=params.get('journal'),
+            field=params.get('field')
+        )[key]
+
+    return fetch
+
+
+# Export name: (function computing the result from query parameters,
+# serializer of its rows)
+ANALYTICS_EXPORTS = {
+    'budget_allocation': (_budget_allocation, BudgetAllocationSerializer),
+    'budget_execution': (_budget_execution, ExecutionStatusSerializer),
+    'budget_trends': (_budget_trends, YearlyTrendsSerializer),
+    'papers_yearly': (_papers('yearly_data'), YearlyDataSerializer),
+    'papers_journals': (_papers('journal_data'), JournalDataSerializer),
+    'papers_fields': (_papers('field_data'), FieldDataSerializer),
+}
+
+EXPORT_TARGETS = tuple(RECORD_DATASETS) + tuple(ANALYTICS_EXPORTS)
+
+
+def export(target, file_format, sink, params=None):
+    """
+    Write a dataset or analytics result as a columnar file.
+
+    Args:
+        target (str): Dataset name or key of ANALYTICS_EXPORTS
+        file_format (str): 'parquet' or 'arrow'
+        sink: Writable binary file or path
+        params (dict, optional): Dataset filters or analytics query parameters
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValidationError: If the target, format or parameters are invalid
+        BaseAPIException: If pyarrow is not installed
+    """
+    params = params or {}
+    use_case = ColumnarExportUseCase(file_format)
+
+    if target in RECORD_DATASETS:
+        return use_case.export_dataset(target, sink, filters=params)
+
+    if target in ANALYTICS_EXPORTS:
+        fetch, serializer_class = ANALYTICS_EXPORTS[target]
+        return use_case.export_rows(fetch(params), serializer_class, sink)
+
+    raise ValidationError(f"Invalid export: {target}. Must be one of: {', '.join(EXPORT_TARGETS)}")
@@ -5,6 +5,24 @@ Follows plan.md specifications for data structure.
 """
 from rest_framework import serializers
 
+from core.serialization import compile_serializer
+from ..models import JournalGrade
+
+
+class ChoiceLabelField(serializers.Field):
+    """
+    Read-only field rendering a stored smallint choice code as its label.
+    """
+
+    def __init__(self, choices, **kwargs):
+        self.choices_class = choices
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        member = self.choices_class.from_label(value)
+        return member.label if member is not None else value
+
 
 class BudgetStatusSerializer(serializers.Serializer):
     """
@@ -230,8 +248,8 @@ class YearlyDataSerializer(serializers.Serializer):
 
 class JournalDataSerializer(serializers.Serializer):
     """Serializer for journal distribution data."""
-    journal_grade = serializers.CharField(
-        max_length=50,
+    journal_grade = ChoiceLabelField(
+        JournalGrade,
         help_text="Journal grade (SCI, KCI, SCOPUS, etc.)"
     )
     count = serializers.IntegerField(
@@ -295,6 +313,12 @@ class BudgetFilterSerializer(serializers.Serializer):
         max_length=100,
         help_text="Filter by budget category"
     )
+    category_match = serializers.ChoiceField(
+        required=False,
+        choices=['contains', 'prefix', 'exact'],
+        default='contains',
+        help_text="Category match mode (contains, prefix, exact)"
+    )
     start_date = serializers.DateField(
         required=False,
         allow_null=True,
@@ -558,18 +582,98 @@ class UploadHistorySerializer(serializers.Serializer):
 
 class UploadHistoryListSerializer(serializers.Serializer):
     """
-    Serializer for paginated upload history list.
+    Serializer for cursor-paginated upload history list.
     """
     results = UploadHistorySerializer(
         many=True,
         help_text="List of upload history records"
     )
-    total = serializers.IntegerField(
-        help_text="Total number of records"
+    next_cursor = serializers.CharField(
+        allow_null=True,
+        help_text="Cursor of the next (older) page, null on the last page"
     )
-    page = serializers.IntegerField(
-        help_text="Current page number"
+    prev_cursor = serializers.CharField(
+        allow_null=True,
+        help_text="Cursor of the previous (newer) page, null on the first page"
     )
     page_size = serializers.IntegerField(
         help_text="Number of records per page"
     )
+    total = serializers.IntegerField(
+        allow_null=True,
+        help_text="Total number of records, null when count=none"
+    )
+    total_is_estimate = serializers.BooleanField(
+        help_text="Whether total is the planner's estimate rather than an exact count"
+    )
+
+
+# Read Path
+# Compiled representations of the response serializers, used by the views
+# instead of instantiating the serializer trees on every request.
+
+serialize_dashboard = compile_serializer(DashboardSerializer)
+serialize_performance = compile_serializer(PerformanceResponseSerializer)
+serialize_papers_analytics = compile_serializer(PapersAnalyticsSerializer)
+serialize_budget_allocation = compile_serializer(BudgetAllocationSerializer, many=True)
+serialize_execution_status = compile_serializer(ExecutionStatusSerializer, many=True)
+serialize_execution_summary = compile_serializer(ExecutionSummarySerializer)
+serialize_yearly_trends = compile_serializer(YearlyTrendsSerializer, many=True)
+
+
+# Home Bundle Serializers
+
+class HomeBundleFilterSerializer(serializers.Serializer):
+    """Validates query parameters for the home bundle endpoint"""
+
+    widgets = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text="Comma-separated widget ids (default: all widgets)"
+    )
+    department = serializers.CharField(
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+        max_length=100,
+        help_text="Department filter shared by the widgets"
+    )
+    year = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=2000,
+        max_value=2100,
+        help_text="Year filter shared by the widgets"
+    )
+
+    def validate_widgets(self, value):
+        """Split the widget list, dropping blanks"""
+        return [widget.strip() for widget in value.split(',') if widget.strip()]
+
+
+class HomeBundleSerializer(serializers.Serializer):
+    """
+    Serializes the home bundle.
+    Each widget is serialized the way its own endpoint serializes it.
+    """
+
+    WIDGET_SERIALIZERS = {
+        'kpi': compile_serializer(KPIDataSerializer),
+        'trends': compile_serializer(TrendDataItemSerializer, many=True),
+        'department_performance': compile_serializer(DepartmentDataItemSerializer, many=True),
+        'budget_summary': compile_serializer(BudgetDataItemSerializer, many=True),
+        'budget_allocation': serialize_budget_allocation,
+        'papers': serialize_papers_analytics,
+    }
+
+    def to_representation(self, instance):
+        widgets = {}
+        for widget, data in instance['widgets'].items():
+            serialize = self.WIDGET_SERIALIZERS.get(widget)
+            widgets[widget] = serialize(data) if serialize else data
+
+        return {
+            'widgets': widgets,
+            'errors': instance['errors'],
+            'last_updated': instance['last_updated']
+        }
@@ -5,7 +5,10 @@ Following the common-modules.md specification.
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views_main import DashboardViewSet, PerformanceViewSet, PapersAnalyticsViewSet, BudgetAnalysisViewSet, UploadViewSet
+from .views_main import (
+    DashboardViewSet, PerformanceViewSet, PapersAnalyticsViewSet, BudgetAnalysisViewSet,
+    DepartmentViewSet, HomeViewSet, UploadViewSet, RecordsViewSet, ColumnarExportViewSet
+)
 from .views.students_views import StudentsViewSet
 
 app_name = 'data_dashboard'
@@ -17,7 +20,11 @@ router.register(r'performance', PerformanceViewSet, basename='performance')
 router.register(r'papers', PapersAnalyticsViewSet, basename='papers')
 router.register(r'students', StudentsViewSet, basename='students')
 router.register(r'budget', BudgetAnalysisViewSet, basename='budget')
+router.register(r'departments', DepartmentViewSet, basename='departments')
+router.register(r'home', HomeViewSet, basename='home')
 router.register(r'upload', UploadViewSet, basename='upload')
+router.register(r'records', RecordsViewSet, basename='records')
+router.register(r'export', ColumnarExportViewSet, basename='export')
 
 urlpatterns = [
     # Dashboard API endpoints
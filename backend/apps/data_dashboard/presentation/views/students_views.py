@@ -32,60 +32,19 @@ class StudentsViewSet(viewsets.ViewSet):
             500: Server error
         """
         try:
-            from ...models import Student
-            from django.db.models import Count, Q
+            from ...application.use_cases import GetStudentsAnalyticsUseCase
 
             # Extract filters from query params
-            department_filter = request.query_params.get('department')
-            grade_filter = request.query_params.get('grade')
-            year_filter = request.query_params.get('year')
-
-            # Build query
-            query = Student.objects.filter(enrollment_status='재학')
-
-            if department_filter:
-                query = query.filter(department=department_filter)
-            if grade_filter:
-                query = query.filter(grade=int(grade_filter))
-            if year_filter:
-                query = query.filter(admission_year=int(year_filter))
-
-            # Total students
-            total_students = query.count()
-
-            # Department stats (count by department)
-            department_stats = list(
-                Student.objects.filter(enrollment_status='재학')
-                .values('department')
-                .annotate(count=Count('id'))
-                .order_by('-count')
-            )
-
-            # Grade distribution
-            grade_distribution = list(
-                Student.objects.filter(enrollment_status='재학')
-                .values('grade')
-                .annotate(count=Count('id'))
-                .order_by('grade')
-            )
-
-            # Enrollment trend (by admission year)
-            enrollment_trend = list(
-                Student.objects.values('admission_year')
-                .annotate(
-                    total=Count('id'),
-                    enrolled=Count('id', filter=Q(enrollment_status='재학'))
-                )
-                .order_by('admission_year')
-            )
-
-            data = {
-                'total_students': total_students,
-                'department_stats': department_stats,
-                'grade_distribution': grade_distribution,
-                'enrollment_trend': enrollment_trend
+            filters = {
+                'department': request.query_params.get('department'),
+                'grade': request.query_params.get('grade'),
+                'year': request.query_params.get('year'),
             }
 
+            # All breakdowns are answered from the student rollup
+            use_case = GetStudentsAnalyticsUseCase()
+            data = use_case.execute(filters)
+
             return Response(data, status=status.HTTP_200_OK)
 
         except ValidationError as e:
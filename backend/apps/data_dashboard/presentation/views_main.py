@@ -8,14 +8,15 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 
-from core.exceptions import NotFoundError, ValidationError
+from core.authentication import IsAdminRole
+from core.exceptions import BaseAPIException, NotFoundError, ValidationError
 from ..infrastructure.repositories import DashboardRepository, PerformanceRepository
 from ..domain.services import DashboardService, PerformanceService
 from ..application.use_cases import GetDashboardDataUseCase, GetPerformanceDataUseCase
 from .serializers import (
-    DashboardSerializer,
     PerformanceFilterSerializer,
-    PerformanceResponseSerializer
+    serialize_dashboard,
+    serialize_performance
 )
 from datetime import datetime, timedelta
 
@@ -83,12 +84,9 @@ class DashboardViewSet(viewsets.ViewSet):
             # Execute use case
             data = use_case.execute()
 
-            # Serialize response
-            serializer = DashboardSerializer(data)
-
-            # Return successful response
+            # Serialize response and return it
             return Response(
-                serializer.data,
+                serialize_dashboard(data),
                 status=status.HTTP_200_OK
             )
 
@@ -224,13 +222,10 @@ class PerformanceViewSet(viewsets.ViewSet):
             )
 
             # 5. Serialize response
-            serializer = PerformanceResponseSerializer(data=result)
-            serializer.is_valid(raise_exception=True)
-
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(serialize_performance(result), status=status.HTTP_200_OK)
 
         except ValidationError as e:
-            # Validation error from use case or serializer
+            # Validation error from use case
             return Response(
                 {
                     'error': {
@@ -278,6 +273,7 @@ class PapersAnalyticsViewSet(viewsets.ViewSet):
             - year (optional): Filter by year (e.g., 2023)
             - journal (optional): Filter by journal grade (SCI, KCI, SCOPUS, 기타)
             - field (optional): Filter by department/field
+            - field_match (optional): contains (default), prefix or exact
 
         Authentication: Required (JWT token via Bearer header)
 
@@ -308,6 +304,7 @@ class PapersAnalyticsViewSet(viewsets.ViewSet):
             year = request.query_params.get('year', None)
             journal_grade = request.query_params.get('journal', None)
             field = request.query_params.get('field', None)
+            field_match = request.query_params.get('field_match') or 'contains'
 
             # Convert year to int if provided
             if year:
@@ -326,7 +323,7 @@ class PapersAnalyticsViewSet(viewsets.ViewSet):
 
             # Initialize use case
             from ..application.use_cases import GetPapersAnalyticsUseCase
-            use_case = GetPapersAnalyticsUseCase()
+            use_case = GetPapersAnalyticsUseCase(field_match=field_match)
 
             # Execute use case
             analytics_data = use_case.execute(
@@ -336,11 +333,10 @@ class PapersAnalyticsViewSet(viewsets.ViewSet):
             )
 
             # Serialize response
-            from .serializers import PapersAnalyticsSerializer
-            serializer = PapersAnalyticsSerializer(analytics_data)
+            from .serializers import serialize_papers_analytics
 
             return Response(
-                serializer.data,
+                serialize_papers_analytics(analytics_data),
                 status=status.HTTP_200_OK
             )
 
@@ -399,13 +395,14 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
         - department (optional): Filter by department
         - year (optional): Filter by year (default: current year)
         - category (optional): Filter by budget category
+        - category_match (optional): contains (default), prefix or exact
 
         Returns:
         - 200: List of budget allocation items
         - 400: Invalid filter parameters
         - 401: Unauthorized
         """
-        from .serializers import BudgetFilterSerializer, BudgetAllocationSerializer
+        from .serializers import BudgetFilterSerializer, serialize_budget_allocation
 
         try:
             # Validate query parameters
@@ -418,15 +415,16 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
             result = self.use_case.get_budget_allocation(
                 department=filters.get('department'),
                 year=filters.get('year'),
-                category=filters.get('category')
+                category=filters.get('category'),
+                category_match=filters.get('category_match', 'contains')
             )
 
             # Serialize response
-            serializer = BudgetAllocationSerializer(result, many=True)
+            data = serialize_budget_allocation(result)
 
             return Response({
-                'data': serializer.data,
-                'total': len(serializer.data)
+                'data': data,
+                'total': len(data)
             }, status=status.HTTP_200_OK)
 
         except ValidationError as e:
@@ -485,8 +483,8 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
         """
         from .serializers import (
             BudgetFilterSerializer,
-            ExecutionStatusSerializer,
-            ExecutionSummarySerializer
+            serialize_execution_status,
+            serialize_execution_summary
         )
 
         try:
@@ -502,12 +500,9 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
                 end_date=filters.get('end_date')
             )
 
-            data_serializer = ExecutionStatusSerializer(result['data'], many=True)
-            summary_serializer = ExecutionSummarySerializer(result['summary'])
-
             return Response({
-                'data': data_serializer.data,
-                'summary': summary_serializer.data
+                'data': serialize_execution_status(result['data']),
+                'summary': serialize_execution_summary(result['summary'])
             }, status=status.HTTP_200_OK)
 
         except ValidationError as e:
@@ -551,7 +546,7 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
         Returns:
         - 200: Yearly budget trends data
         """
-        from .serializers import BudgetFilterSerializer, YearlyTrendsSerializer
+        from .serializers import BudgetFilterSerializer, serialize_yearly_trends
 
         try:
             filter_serializer = BudgetFilterSerializer(data=request.query_params)
@@ -565,10 +560,8 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
                 end_year=filters.get('end_year')
             )
 
-            serializer = YearlyTrendsSerializer(result, many=True)
-
             return Response({
-                'data': serializer.data,
+                'data': serialize_yearly_trends(result),
                 'yearRange': {
                     'min': result[0]['year'] if result else None,
                     'max': result[-1]['year'] if result else None
@@ -602,6 +595,144 @@ class BudgetAnalysisViewSet(viewsets.ViewSet):
             )
 
 
+class DepartmentViewSet(viewsets.ViewSet):
+    """
+    Department API ViewSet.
+
+    Provides the department list used by filter dropdowns.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request):
+        """
+        GET /api/dashboard/departments/
+
+        Query Parameters:
+            - college (optional): College name filter
+
+        Response: 200 OK
+        {
+            "departments": [
+                {"id": 1, "college": "공과대학", "name": "컴퓨터공학과"},
+                ...
+            ]
+        }
+        """
+        try:
+            from ..application.use_cases import GetDepartmentsUseCase
+
+            data = GetDepartmentsUseCase().execute(
+                college=request.query_params.get('college')
+            )
+
+            return Response(data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Departments API error: {str(e)}", exc_info=True)
+            return Response(
+                {
+                    'error': {
+                        'message': 'Failed to fetch departments',
+                        'code': 'SERVER_ERROR'
+                    }
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class HomeViewSet(viewsets.ViewSet):
+    """
+    Home Bundle API ViewSet.
+
+    Returns every widget of the dashboard home page in one request, so the
+    page pays for middleware, authentication and shared lookups once.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request):
+        """
+        GET /api/dashboard/home/
+
+        Query Parameters:
+            - widgets (optional): Comma-separated widget ids (default: all)
+              kpi, trends, department_performance, budget_summary,
+              budget_allocation, papers, students
+            - department (optional): Department filter shared by the widgets
+            - year (optional): Year filter shared by the widgets
+
+        Response: 200 OK
+        {
+            "widgets": {
+                "kpi": {"total_performance": 85.5, ...},
+                "papers": {"yearly_data": [...], ..., "has_data": true},
+                ...
+            },
+            "errors": {
+                "students": "Invalid year format"
+            },
+            "last_updated": "2025-11-03T10:30:00.123456"
+        }
+
+        Each widget has the shape of its own endpoint's response.
+        Widgets failing on their filters are reported under "errors".
+
+        Error Responses:
+        - 400 Bad Request: Invalid parameters or unknown widget ids
+        - 500 Internal Server Error: Server error
+        """
+        from .serializers import HomeBundleFilterSerializer, HomeBundleSerializer
+        from ..application.use_cases import GetHomeBundleUseCase
+
+        filter_serializer = HomeBundleFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(
+                {
+                    'error': {
+                        'message': 'Invalid query parameters',
+                        'code': 'VALIDATION_ERROR',
+                        'details': filter_serializer.errors
+                    }
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        filters = filter_serializer.validated_data
+
+        try:
+            data = GetHomeBundleUseCase().execute(
+                widgets=filters.get('widgets') or list(GetHomeBundleUseCase.WIDGETS),
+                department=filters.get('department') or None,
+                year=filters.get('year')
+            )
+
+            return Response(HomeBundleSerializer(data).data, status=status.HTTP_200_OK)
+
+        except ValidationError as e:
+            return Response(
+                {
+                    'error': {
+                        'message': str(e),
+                        'code': 'VALIDATION_ERROR'
+                    }
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Home bundle API error: {str(e)}", exc_info=True)
+            return Response(
+                {
+                    'error': {
+                        'message': 'Failed to fetch home data',
+                        'code': 'SERVER_ERROR'
+                    }
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class UploadViewSet(viewsets.ViewSet):
     """
     Upload API ViewSet.
@@ -664,13 +795,19 @@ class UploadViewSet(viewsets.ViewSet):
         """
         GET /api/upload/history/
 
-        Get upload history with pagination.
+        Get upload history, newest first, one cursor page at a time.
+
+        Query params:
+            cursor: next_cursor or prev_cursor of a previous response
+            page_size: Records per page (default 20, max 100)
+            count: 'estimated' (default), 'exact' or 'none'
         """
         from .serializers import UploadHistoryListSerializer
 
         try:
-            page = int(request.query_params.get('page', 1))
+            cursor = request.query_params.get('cursor')
             page_size = int(request.query_params.get('page_size', 20))
+            count = request.query_params.get('count', 'estimated')
 
             # Safely check if user is staff (handle AnonymousUser case)
             is_admin = getattr(request.user, 'is_staff', False)
@@ -678,15 +815,263 @@ class UploadViewSet(viewsets.ViewSet):
 
             result = self.history_use_case.execute(
                 user_id=user_id,
-                page=page,
+                cursor=cursor,
                 page_size=page_size,
-                is_admin=is_admin
+                is_admin=is_admin,
+                count=count
             )
 
             serializer = UploadHistoryListSerializer(result)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
+        except ValidationError as e:
+            return Response({'error': {'message': str(e), 'code': 'VALIDATION_ERROR'}}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             import logging
             logging.getLogger(__name__).error(f"Upload history error: {str(e)}", exc_info=True)
             return Response({'error': {'message': 'Failed to fetch upload history', 'code': 'SERVER_ERROR'}}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class RecordsViewSet(viewsets.ViewSet):
+    """
+    Raw Records API ViewSet.
+
+    Read-only listing of the uploaded student, publication and research
+    budget rows, with field projection, indexed filters and keyset cursors.
+    Pages larger than RECORDS_STREAM_ROWS are streamed as they are read, as
+    are the CSV exports. Student rows hold personal data and are shown to
+    admins only.
+    """
+    permission_classes = [IsAuthenticated]
+
+    # Datasets restricted to admins
+    ADMIN_DATASETS = {'students'}
+
+    # Query parameters that are not filters
+    PAGE_PARAMS = ('fields', 'cursor', 'page_size')
+
+    @action(detail=False, methods=['get'], url_path='students')
+    def students(self, request):
+        """
+        GET /api/dashboard/records/students/
+
+        Filters: department, student_id, enrollment_status, grade
+        """
+        return self._browse(request, 'students')
+
+    @action(detail=False, methods=['get'], url_path='publications')
+    def publications(self, request):
+        """
+        GET /api/dashboard/records/publications/
+
+        Filters: department, year, journal_grade, date_from, date_to
+        """
+        return self._browse(request, 'publications')
+
+    @action(detail=False, methods=['get'], url_path='budget')
+    def budget(self, request):
+        """
+        GET /api/dashboard/records/budget/
+
+        Filters: department, year, status, project_number, date_from, date_to
+        """
+        return self._browse(request, 'budget')
+
+    @action(detail=False, methods=['get'], url_path=r'(?P<dataset>students|publications|budget)/export')
+    def export(self, request, dataset):
+        """
+        GET /api/dashboard/records/{students,publications,budget}/export/
+
+        Download a dataset as CSV in its upload format, streamed as it is read.
+
+        Query Parameters:
+            - headers (optional): 'en' (default) for column names, 'ko' for
+              the Korean headers the upload parsers accept
+            - any filter of the dataset, as for the list endpoints
+
+        Response: 200 OK, text/csv attachment
+
+        Error Responses:
+        - 400 Bad Request: Unknown filter, invalid value or header mode
+        - 401 Unauthorized: No credentials
+        - 403 Forbidden: Students dataset requested by a non-admin
+        - 500 Internal Server Error: Server error
+        """
+        from django.http import StreamingHttpResponse
+        from django.utils import timezone
+        from ..application.use_cases import ExportRecordsUseCase
+
+        try:
+            filters = {
+                name: value for name, value in request.query_params.items()
+                if name != 'headers' and value != ''
+            }
+
+            chunks = ExportRecordsUseCase(dataset).execute(
+                filters=filters,
+                headers=request.query_params.get('headers', 'en')
+            )
+
+            response = StreamingHttpResponse(chunks, content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = (
+                f'attachment; filename="{dataset}_{timezone.localdate():%Y%m%d}.csv"'
+            )
+            return response
+
+        except ValidationError as e:
+            return Response({'error': {'message': str(e), 'code': 'VALIDATION_ERROR'}}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Records export error: {str(e)}", exc_info=True)
+            return Response({'error': {'message': 'Failed to export records', 'code': 'SERVER_ERROR'}}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def get_permissions(self):
+        # Browsing actions are named after their dataset; exports take it from the URL
+        if self.kwargs.get('dataset', self.action) in self.ADMIN_DATASETS:
+            return [IsAdminRole()]
+        return super().get_permissions()
+
+    def _browse(self, request, dataset):
+        """
+        List one page of a dataset's rows.
+
+        Query Parameters:
+            - fields (optional): Comma-separated columns to include (default: all)
+            - cursor (optional): next_cursor of the previous page
+            - page_size (optional): Rows per page (default 100, max RECORDS_MAX_PAGE_SIZE)
+            - any filter of the dataset; coded columns take their labels
+
+        Response: 200 OK
+        {
+            "results": [{"id": 1, "student_id": "20240001", ...}, ...],
+            "next_cursor": "eyJhZnRlciI6MTAwfQ" or null,
+            "page_size": 100
+        }
+
+        Error Responses:
+        - 400 Bad Request: Unknown field or filter, invalid value or cursor
+        - 401 Unauthorized: No credentials
+        - 403 Forbidden: Students dataset requested by a non-admin
+        - 500 Internal Server Error: Server error
+        """
+        from django.conf import settings
+        from django.http import HttpResponse, StreamingHttpResponse
+        from ..application.use_cases import BrowseRecordsUseCase
+
+        try:
+            params = request.query_params
+            try:
+                page_size = int(params.get('page_size', 100))
+            except ValueError:
+                raise ValidationError("page_size must be an integer")
+            fields = [name.strip() for name in params.get('fields', '').split(',') if name.strip()]
+            filters = {
+                name: value for name, value in params.items()
+                if name not in self.PAGE_PARAMS and value != ''
+            }
+
+            chunks = BrowseRecordsUseCase(dataset).execute(
+                fields=fields,
+                filters=filters,
+                cursor=params.get('cursor'),
+                page_size=page_size
+            )
+
+            if page_size > settings.RECORDS_STREAM_ROWS:
+                return StreamingHttpResponse(chunks, content_type='application/json')
+            return HttpResponse(b''.join(chunks), content_type='application/json')
+
+        except ValidationError as e:
+            return Response({'error': {'message': str(e), 'code': 'VALIDATION_ERROR'}}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Records API error: {str(e)}", exc_info=True)
+            return Response({'error': {'message': 'Failed to fetch records', 'code': 'SERVER_ERROR'}}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ColumnarExportViewSet(viewsets.ViewSet):
+    """
+    Columnar Export API ViewSet.
+
+    Downloads the raw datasets and the analytics results as Parquet or
+    Arrow IPC files for notebooks. Needs the optional pyarrow package.
+    Bulk exports are the costliest reads and include student data, so they
+    are for admins only.
+    """
+    permission_classes = [IsAdminRole]
+    lookup_field = 'target'
+    lookup_value_regex = '[a-z_]+'
+
+    def list(self, request):
+        """
+        GET /api/dashboard/export/
+
+        Response: 200 OK
+        {
+            "available": true,
+            "formats": ["parquet", "arrow"],
+            "targets": ["students", ..., "papers_fields"]
+        }
+        """
+        from core import columnar
+        from .exports import EXPORT_TARGETS
+
+        return Response({
+            'available': columnar.is_available(),
+            'formats': list(columnar.FORMATS),
+            'targets': list(EXPORT_TARGETS)
+        }, status=status.HTTP_200_OK)
+
+    def retrieve(self, request, target=None):
+        """
+        GET /api/dashboard/export/{target}/
+
+        Query Parameters:
+            - file_format (optional): 'parquet' (default) or 'arrow'
+            - the dataset's filters, or the analytics endpoint's filters
+
+        Response: 200 OK, file attachment
+
+        Error Responses:
+        - 400 Bad Request: Unknown target or format, invalid filters
+        - 501 Not Implemented: pyarrow is not installed
+        - 500 Internal Server Error: Server error
+        """
+        import tempfile
+        from django.http import FileResponse
+        from django.utils import timezone
+        from core import columnar
+        from .exports import export
+
+        try:
+            file_format = request.query_params.get('file_format', 'parquet')
+            params = {
+                name: value for name, value in request.query_params.items()
+                if name != 'file_format' and value != ''
+            }
+
+            # Spooled to disk so only one record batch is held in memory
+            output = tempfile.TemporaryFile()
+            try:
+                export(target, file_format, output, params)
+            except Exception:
+                output.close()
+                raise
+            output.seek(0)
+
+            media_type, extension = columnar.FORMATS[file_format]
+            return FileResponse(
+                output,
+                as_attachment=True,
+                filename=f"{target}_{timezone.localdate():%Y%m%d}.{extension}",
+                content_type=media_type
+            )
+
+        except ValidationError as e:
+            return Response({'error': {'message': str(e), 'code': 'VALIDATION_ERROR'}}, status=status.HTTP_400_BAD_REQUEST)
+        except BaseAPIException as e:
+            return Response({'error': {'message': str(e), 'code': e.code}}, status=e.status_code)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).error(f"Columnar export error: {str(e)}", exc_info=True)
+            return Response({'error': {'message': 'Failed to export data', 'code': 'SERVER_ERROR'}}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
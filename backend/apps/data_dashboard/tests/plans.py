@@ -0,0 +1,339 @@
+"""
+Helpers for EXPLAIN-based query plan tests.
+Seeds synthetic datasets with server-side generate_series and ANALYZEs
+them so the planner sees realistic table statistics. The default size
+keeps a plain test run fast while still producing index plans; set
+PLAN_TEST_ROWS=1000000 to check the plans at production scale.
+"""
+import os
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+# Row count of generated datasets (override with PLAN_TEST_ROWS)
+PLAN_TEST_ROWS = int(os.environ.get('PLAN_TEST_ROWS', 20_000))
+
+# Number of distinct synthetic departments
+DEPARTMENT_COUNT = 500
+
+# Generated dates span this many days from 2000-01-01
+DATE_SPAN_DAYS = 9125
+
+
+def department_name(n):
+    """Synthetic department name used by the seeders."""
+    return f"D{n:04d} 공학과"
+
+
+def has_extension(name):
+    """Check whether a PostgreSQL extension is installed in the test database."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def analyze(*tables):
+    """Refresh planner statistics for the given tables."""
+    with connection.cursor() as cursor:
+        for table in tables:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+
+def explain(queryset):
+    """Return the EXPLAIN text of a queryset."""
+    return queryset.explain()
+
+
+def explain_sql(sql):
+    """Return the EXPLAIN text of a raw SQL statement."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN {sql}")
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@contextmanager
+def capture_plans():
+    """
+    Capture the EXPLAIN output of every SELECT run inside the block.
+
+    Yields a list that is filled with one plan per query when the block exits.
+    """
+    plans = []
+    with CaptureQueriesContext(connection) as queries:
+        yield plans
+
+    for query in queries.captured_queries:
+        if query['sql'].lstrip().upper().startswith('SELECT'):
+            plans.append(explain_sql(query['sql']))
+
+
+# Yearly and default partitions are named <parent>_y<year> / <parent>_default
+PARTITION_NAME = re.compile(r'^(\w+)_(?:y\d{4}|default)$')
+
+# Sequential scans estimated below this cost read a page or two at most
+TINY_SCAN_COST = 10
+
+
+def scanned_tables(plan):
+    """Get the relations read by any scan node of a plan."""
+    return set(re.findall(r'Scan(?: Backward)?(?: using \w+)? on (\w+)', plan))
+
+
+def scanned_partitions(plan, table):
+    """Get the partitions of `table` a plan reads, i.e. those left after pruning."""
+    partitions = set()
+    for name in scanned_tables(plan):
+        match = PARTITION_NAME.match(name)
+        if match and match.group(1) == table:
+            partitions.add(name)
+    return partitions
+
+
+def seq_scanned_tables(plans):
+    """
+    Get the tables read by a sequential scan in any of the plans.
+
+    A partition is reported as its parent table unless the plan was pruned
+    down to that single partition. Scans of near-empty partitions (such as
+    the default partition) are ignored.
+    """
+    tables = set()
+    for plan in plans:
+        seq_scans = re.findall(r'Seq Scan on (\w+)[^(\n]*\(cost=[\d.]+\.\.([\d.]+)', plan)
+        for table, cost in seq_scans:
+            match = PARTITION_NAME.match(table)
+            if match:
+                if float(cost) < TINY_SCAN_COST:
+                    continue
+                if len(scanned_partitions(plan, match.group(1))) > 1:
+                    table = match.group(1)
+            tables.add(table)
+    return tables
+
+
+def seed_departments():
+    """
+    Insert the synthetic departments, keyed 1..DEPARTMENT_COUNT.
+    Department n + 1 is named department_name(n). Safe to call repeatedly.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO departments (id, college, name)
+            SELECT n + 1, '공과대학', 'D' || lpad(n::text, 4, '0') || ' 공학과'
+            FROM generate_series(0, %s - 1) AS n
+            ON CONFLICT DO NOTHING
+            """,
+            [DEPARTMENT_COUNT]
+        )
+        cursor.execute(
+            "SELECT setval(pg_get_serial_sequence('departments', 'id'), "
+            "(SELECT MAX(id) FROM departments))"
+        )
+    analyze('departments')
+
+
+def seed_publications(rows=PLAN_TEST_ROWS):
+    """Insert `rows` synthetic publications and analyze the table."""
+    seed_departments()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO publications (
+                publication_id, publication_date, pub_year, college, department,
+                department_ref_id, title,
+                primary_author, co_authors, journal_name, journal_grade,
+                impact_factor, is_project_linked
+            )
+            SELECT
+                'PUB-' || g,
+                DATE '2000-01-01' + (g %% %s),
+                EXTRACT(YEAR FROM DATE '2000-01-01' + (g %% %s)),
+                '공과대학',
+                'D' || lpad((g %% %s)::text, 4, '0') || ' 공학과',
+                g %% %s + 1,
+                'Title ' || g,
+                'Author ' || (g %% 1000),
+                NULL,
+                'Journal ' || (g %% 300),
+                g %% 4 + 1,
+                NULL,
+                g %% 2 = 0
+            FROM generate_series(1, %s) AS g
+            """,
+            [DATE_SPAN_DAYS, DATE_SPAN_DAYS, DEPARTMENT_COUNT, DEPARTMENT_COUNT, rows]
+        )
+    analyze('publications')
+
+
+def seed_budget_rows(rows=PLAN_TEST_ROWS):
+    """Insert `rows` synthetic budget executions into yearly partitions and analyze them."""
+    from apps.data_dashboard.infrastructure.repositories import BudgetPartitionRepository
+
+    seed_departments()
+    last_year = (date(2000, 1, 1) + timedelta(days=DATE_SPAN_DAYS - 1)).year
+    BudgetPartitionRepository().ensure_years(range(2000, last_year + 1))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO research_budget_data (
+                execution_id, project_number, project_name, principal_investigator,
+                department, department_ref_id, funding_agency, total_budget,
+                execution_date, exec_year,
+                execution_item, execution_amount, status, note
+            )
+            SELECT
+                'EXE-' || g,
+                'PRJ-' || (g %% 5000),
+                'Project ' || (g %% 5000),
+                'PI ' || (g %% 5000),
+                'D' || lpad((g %% %s)::text, 4, '0') || ' 공학과',
+                g %% %s + 1,
+                '한국연구재단',
+                100000000,
+                DATE '2000-01-01' + (g %% %s),
+                EXTRACT(YEAR FROM DATE '2000-01-01' + (g %% %s)),
+                (ARRAY['인건비', '장비비', '재료비', '여비'])[g %% 4 + 1],
+                100000 + g %% 1000,
+                g %% 3 + 1,
+                NULL
+            FROM generate_series(1, %s) AS g
+            """,
+            [DEPARTMENT_COUNT, DEPARTMENT_COUNT, DATE_SPAN_DAYS, DATE_SPAN_DAYS, rows]
+        )
+    analyze('research_budget_data')
+
+
+def seed_kpis(rows=PLAN_TEST_ROWS // 10):
+    """Insert `rows` synthetic department KPIs (one per year and department)."""
+    seed_departments()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO department_kpis (
+                year, college, department, department_ref_id, employment_rate, full_time_faculty,
+                visiting_faculty, tech_transfer_revenue, intl_conference_count
+            )
+            SELECT
+                2000 + g %% 25,
+                'C' || (g / (25 * %s)),
+                'D' || lpad((g / 25 %% %s)::text, 4, '0') || ' 공학과',
+                g / 25 %% %s + 1,
+                50 + g %% 50,
+                g %% 40,
+                g %% 10,
+                g %% 1000,
+                g %% 20
+            FROM generate_series(1, %s) AS g
+            """,
+            [DEPARTMENT_COUNT, DEPARTMENT_COUNT, DEPARTMENT_COUNT, rows]
+        )
+    analyze('department_kpis')
+
+
+def seed_students(rows=PLAN_TEST_ROWS):
+    """Insert `rows` synthetic students and rebuild the student rollup in SQL."""
+    seed_departments()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO students (
+                student_id, name, college, department, department_ref_id, grade, program_type,
+                enrollment_status, gender, admission_year, advisor, email
+            )
+            SELECT
+                'S' || g,
+                'Student ' || g,
+                '공과대학',
+                'D' || lpad((g %% %s)::text, 4, '0') || ' 공학과',
+                g %% %s + 1,
+                g %% 5,
+                g %% 3 + 1,
+                g %% 5 + 1,
+                g %% 2 + 1,
+                2000 + g %% 25,
+                NULL,
+                NULL
+            FROM generate_series(1, %s) AS g
+            """,
+            [DEPARTMENT_COUNT, DEPARTMENT_COUNT, rows]
+        )
+        cursor.execute(
+            """
+            INSERT INTO student_rollup (
+                department, grade, admission_year, enrollment_status,
+                program_type, gender, student_count
+            )
+            SELECT department, grade, admission_year, enrollment_status,
+                   program_type, gender, COUNT(*)
+            FROM students
+            GROUP BY 1, 2, 3, 4, 5, 6
+            """
+        )
+    analyze('students', 'student_rollup')
+
+
+def seed_budget_cube():
+    """Aggregate the seeded budget rows into budget_cube in SQL."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO budget_cube (
+                department, project_number, year, month, execution_item, status,
+                execution_amount, execution_count
+            )
+            SELECT department, project_number, exec_year,
+                   EXTRACT(MONTH FROM execution_date), execution_item, status,
+                   SUM(execution_amount), COUNT(*)
+            FROM research_budget_data
+            GROUP BY 1, 2, 3, 4, 5, 6
+            """
+        )
+    analyze('budget_cube')
+
+
+def seed_research_projects():
+    """Derive research_projects from the seeded budget rows in SQL."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO research_projects (
+                project_number, project_name, principal_investigator,
+                department, funding_agency, total_budget
+            )
+            SELECT DISTINCT ON (project_number)
+                   project_number, project_name, principal_investigator,
+                   department, funding_agency, total_budget
+            FROM research_budget_data
+            ORDER BY project_number, execution_date DESC, id DESC
+            """
+        )
+    analyze('research_projects')
+
+
+def seed_upload_history(owner, other, rows=PLAN_TEST_ROWS // 10):
+    """Insert `rows` synthetic upload history entries, 1 in 100 owned by `owner`."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO upload_history (
+                user_id, file_name, file_type, status, records_processed,
+                error_message, uploaded_at
+            )
+            SELECT
+                CASE WHEN g %% 100 = 0 THEN %s ELSE %s END,
+                'upload_' || g || '.xlsx',
+                'publication_list',
+                'success',
+                g %% 1000,
+                NULL,
+                TIMESTAMPTZ '2020-01-01' + g * INTERVAL '1 minute'
+            FROM generate_series(1, %s) AS g
+            """,
+            [owner.id, other.id, rows]
+        )
+    analyze('upload_history')
@@ -0,0 +1,170 @@
+"""
+Unit tests for the budget cube.
+Tests incremental cube maintenance and cube-backed BudgetRepository queries.
+"""
+import io
+from datetime import date
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.data_dashboard.models import ResearchBudgetData, BudgetCube, ExecutionStatus
+from apps.data_dashboard.infrastructure.repositories import (
+    BudgetRepository,
+    BudgetCubeRepository,
+    DataUploadRepository,
+    ResearchProjectRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from core import response_cache
+
+
+def make_execution(execution_id, **overrides):
+    """Build an ingest row for research_budget_data."""
+    row = {
+        'execution_id': execution_id,
+        'project_number': 'P-001',
+        'project_name': '인공지능 연구',
+        'principal_investigator': '홍길동',
+        'department': '컴퓨터공학과',
+        'funding_agency': '한국연구재단',
+        'total_budget': 1000,
+        'execution_date': '2024-03-15',
+        'execution_item': '인건비',
+        'execution_amount': 100,
+        'status': '집행완료',
+        'note': None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestBudgetCubeMaintenance(TestCase):
+    """Test that ingest keeps budget_cube in sync with execution rows."""
+
+    def setUp(self):
+        self.cube_repository = BudgetCubeRepository()
+        self.service = DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=self.cube_repository,
+            project_repository=ResearchProjectRepository()
+        )
+
+    def test_ingest_creates_cells(self):
+        """Rows in the same cell are summed into one cube row."""
+        self.service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_amount=50),
+            make_execution('E3', execution_item='장비비', execution_amount=30),
+        ])
+
+        self.assertEqual(BudgetCube.objects.count(), 2)
+        cell = BudgetCube.objects.get(execution_item='인건비')
+        self.assertEqual(cell.execution_amount, 150)
+        self.assertEqual(cell.execution_count, 2)
+        self.assertEqual((cell.year, cell.month), (2024, 3))
+
+    def test_update_moves_row_between_cells(self):
+        """Re-uploading a row with a new status empties its old cell."""
+        self.service.process_research_budget([make_execution('E1')])
+        self.service.process_research_budget([make_execution('E1', status='취소')])
+
+        cells = list(BudgetCube.objects.values_list('status', 'execution_amount'))
+        self.assertEqual(cells, [(ExecutionStatus.CANCELLED, 100)])
+
+    def test_budget_change_reaches_untouched_months(self):
+        """A changed project budget applies to months the batch did not touch."""
+        self.service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_date='2024-05-02'),
+        ])
+        self.service.process_research_budget([
+            make_execution('E3', execution_date='2024-06-01', total_budget=2000),
+        ])
+
+        result = BudgetRepository().get_execution_by_department(
+            start_date=date(2024, 3, 1),
+            end_date=date(2024, 3, 31)
+        )
+        self.assertEqual(result[0]['total_budget'], 2000)
+
+    def test_rebuild_matches_incremental(self):
+        """A full rebuild produces the same cells as incremental maintenance."""
+        self.service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', project_number='P-002', total_budget=500),
+        ])
+        fields = ('department', 'project_number', 'year', 'month',
+                  'execution_item', 'status', 'execution_amount')
+        incremental = sorted(BudgetCube.objects.values_list(*fields))
+
+        self.cube_repository.rebuild()
+
+        self.assertEqual(sorted(BudgetCube.objects.values_list(*fields)), incremental)
+
+    def test_rebuild_command_invalidates_cached_responses(self):
+        version = response_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_budget_cube', stdout=io.StringIO())
+
+        self.assertEqual(response_cache.get_version(), version + 1)
+
+
+class TestCubeBackedBudgetRepository(TestCase):
+    """Test BudgetRepository aggregates read from the cube."""
+
+    def setUp(self):
+        service = DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=BudgetCubeRepository(),
+            project_repository=ResearchProjectRepository()
+        )
+        service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_date='2024-04-10', execution_amount=200),
+            make_execution('E3', project_number='P-002', total_budget=1000,
+                           execution_amount=300, status='처리중'),
+            make_execution('E4', project_number='P-003', department='전자공학과',
+                           total_budget=700, execution_date='2023-11-20'),
+        ])
+        self.repository = BudgetRepository()
+
+    def test_budget_by_department_counts_equal_budgets_separately(self):
+        """Two projects with the same budget are both counted."""
+        ResearchBudgetData.objects.filter(execution_id='E3').update(status=ExecutionStatus.COMPLETED)
+        BudgetCubeRepository().rebuild()
+
+        result = self.repository.get_budget_by_department(year=2024)
+
+        self.assertEqual(result, [
+            {'department': '컴퓨터공학과', 'total_budget': 2000, 'project_count': 2}
+        ])
+
+    def test_execution_by_department(self):
+        """Executed amount only includes completed executions."""
+        result = self.repository.get_execution_by_department(year=2024)
+
+        self.assertEqual(result, [
+            {'department': '컴퓨터공학과', 'total_budget': 2000, 'executed_amount': 300}
+        ])
+
+    def test_execution_by_department_mid_month_range(self):
+        """Day-granular ranges give the same shape from execution rows."""
+        result = self.repository.get_execution_by_department(
+            start_date=date(2024, 3, 10),
+            end_date=date(2024, 3, 20)
+        )
+
+        self.assertEqual(result, [
+            {'department': '컴퓨터공학과', 'total_budget': 2000, 'executed_amount': 100}
+        ])
+
+    def test_yearly_trends(self):
+        """Trends are grouped by execution year."""
+        result = self.repository.get_yearly_trends()
+
+        self.assertEqual(result, [
+            {'year': 2023, 'total_budget': 700, 'executed_amount': 100},
+            {'year': 2024, 'total_budget': 2000, 'executed_amount': 300},
+        ])
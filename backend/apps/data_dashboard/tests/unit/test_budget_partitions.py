@@ -0,0 +1,144 @@
+"""
+Unit tests for research_budget_data partitioning.
+Tests ingest routing to yearly partitions, execution ID uniqueness under
+concurrent uploads and detaching old years.
+"""
+import threading
+import time
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test import TestCase, TransactionTestCase
+
+from apps.data_dashboard.models import ResearchBudgetData, BudgetCube, ResearchProject, ExecutionStatus
+from apps.data_dashboard.infrastructure.repositories import (
+    BudgetCubeRepository,
+    BudgetPartitionRepository,
+    DataUploadRepository,
+    ResearchProjectRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+
+
+def partition_of(execution_id):
+    """Get the partition table holding an execution row."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tableoid::regclass::text FROM research_budget_data WHERE execution_id = %s",
+            [execution_id]
+        )
+        return cursor.fetchone()[0]
+
+
+class TestBudgetPartitions(TestCase):
+    """Test that execution rows are routed to their year's partition."""
+
+    def setUp(self):
+        self.partitions = BudgetPartitionRepository()
+        self.service = DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=BudgetCubeRepository(),
+            project_repository=ResearchProjectRepository(),
+            partition_repository=self.partitions
+        )
+
+    def test_ingest_creates_year_partitions(self):
+        self.service.process_research_budget([
+            make_execution('E1', execution_date='2031-05-01'),
+            make_execution('E2', execution_date='2032-01-01'),
+        ])
+
+        self.assertIn(2031, self.partitions.get_years())
+        self.assertEqual(partition_of('E1'), 'research_budget_data_y2031')
+        self.assertEqual(partition_of('E2'), 'research_budget_data_y2032')
+
+    def test_rows_in_default_partition_move_to_new_partition(self):
+        ResearchBudgetData.objects.create(**make_execution(
+            'E1', execution_date='2033-02-01', status=ExecutionStatus.COMPLETED
+        ))
+        self.assertEqual(partition_of('E1'), 'research_budget_data_default')
+
+        self.assertEqual(self.partitions.ensure_years([2033]), [2033])
+
+        self.assertEqual(partition_of('E1'), 'research_budget_data_y2033')
+        self.assertEqual(self.partitions.ensure_years([2033]), [])
+
+    def test_date_change_moves_row_between_partitions(self):
+        self.service.process_research_budget([make_execution('E1', execution_date='2031-05-01')])
+        self.service.process_research_budget([make_execution('E1', execution_date='2032-05-01')])
+
+        self.assertEqual(ResearchBudgetData.objects.count(), 1)
+        self.assertEqual(partition_of('E1'), 'research_budget_data_y2032')
+
+
+class TestConcurrentUploads(TransactionTestCase):
+    """Test that concurrent uploads of one execution keep a single row."""
+
+    def upload(self, **overrides):
+        DataProcessingService(DataUploadRepository()).process_research_budget([make_execution('E1', **overrides)])
+
+    def test_second_upload_waits_and_updates(self):
+        first_upserted = threading.Event()
+        errors = []
+
+        def second_upload():
+            try:
+                first_upserted.wait()
+                self.upload(status='처리중')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=second_upload)
+        thread.start()
+        with transaction.atomic():
+            self.upload()
+            first_upserted.set()
+            time.sleep(0.3)  # The second upload's lookup runs while this row is uncommitted
+        thread.join(10)
+
+        self.assertEqual(errors, [])
+        rows = ResearchBudgetData.objects.filter(execution_id='E1')
+        self.assertEqual(list(rows.values_list('status', flat=True)), [ExecutionStatus.PENDING])
+
+
+class TestDetachPartition(TestCase):
+    """Test detaching an execution year with the management command."""
+
+    def setUp(self):
+        DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=BudgetCubeRepository(),
+            project_repository=ResearchProjectRepository(),
+            partition_repository=BudgetPartitionRepository()
+        ).process_research_budget([
+            make_execution('E1', execution_date='2031-03-01'),
+            make_execution('E2', project_number='P-002', execution_date='2031-04-01'),
+            make_execution('E3', project_number='P-002', execution_date='2032-04-01'),
+        ])
+        # Fire the deferred foreign key checks so the partition can be dropped
+        connection.check_constraints()
+
+    def detach(self, *args):
+        out = StringIO()
+        call_command('budget_partitions', '--detach', '2031', *args, stdout=out)
+        return out.getvalue()
+
+    def test_detach_keeps_archive_table(self):
+        output = self.detach()
+
+        self.assertIn('research_budget_data_y2031_detached', output)
+        self.assertEqual(list(ResearchBudgetData.objects.values_list('execution_id', flat=True)), ['E3'])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM research_budget_data_y2031_detached")
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+    def test_detach_refreshes_derived_tables(self):
+        self.detach('--drop')
+
+        self.assertFalse(BudgetCube.objects.filter(year=2031).exists())
+        self.assertEqual(list(ResearchProject.objects.values_list('project_number', flat=True)), ['P-002'])
+        self.assertNotIn(2031, BudgetPartitionRepository().get_years())
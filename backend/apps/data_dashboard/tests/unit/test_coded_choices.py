@@ -0,0 +1,132 @@
+"""
+Unit tests for coded choice columns.
+Tests label parsing, ingest-time encoding, code filters and label output.
+"""
+from django.test import TestCase
+
+from apps.data_dashboard.models import (
+    Publication,
+    Student,
+    ResearchBudgetData,
+    EnrollmentStatus,
+    ExecutionStatus,
+    Gender,
+    JournalGrade,
+    ProgramType
+)
+from apps.data_dashboard.infrastructure.repositories import (
+    DataUploadRepository,
+    DepartmentRepository,
+    PapersAnalyticsRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService, FileValidationService
+from apps.data_dashboard.presentation.serializers import JournalDataSerializer
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+from apps.data_dashboard.tests.unit.test_departments import make_publication
+from apps.data_dashboard.tests.unit.test_student_rollup import make_student
+from core.exceptions import ValidationError
+
+
+class TestFromLabel(TestCase):
+    """Test label parsing on the choice classes."""
+
+    def test_labels_names_and_codes(self):
+        self.assertEqual(EnrollmentStatus.from_label('재학'), EnrollmentStatus.ENROLLED)
+        self.assertEqual(EnrollmentStatus.from_label(' enrolled '), EnrollmentStatus.ENROLLED)
+        self.assertEqual(ProgramType.from_label(3), ProgramType.DOCTORATE)
+        self.assertEqual(JournalGrade.from_label('scopus'), JournalGrade.SCOPUS)
+
+    def test_aliases(self):
+        self.assertEqual(Gender.from_label('F'), Gender.FEMALE)
+        self.assertEqual(Gender.from_label('남자'), Gender.MALE)
+        self.assertEqual(JournalGrade.from_label('SCIE'), JournalGrade.SCI)
+
+    def test_unknown_and_blank(self):
+        self.assertIsNone(ExecutionStatus.from_label('보류'))
+        self.assertIsNone(ExecutionStatus.from_label(9))
+        self.assertIsNone(Gender.from_label('  '))
+        self.assertIsNone(Gender.from_label(None))
+
+
+class TestIngestEncoding(TestCase):
+    """Test that uploads store codes instead of labels."""
+
+    def setUp(self):
+        self.service = DataProcessingService(
+            DataUploadRepository(),
+            department_repository=DepartmentRepository()
+        )
+
+    def test_student_labels_are_coded(self):
+        self.service.process_student([
+            make_student('S1', program_type='석사', enrollment_status='휴학', gender='F'),
+            make_student('S2', gender=''),
+        ])
+
+        self.assertEqual(
+            list(Student.objects.order_by('student_id').values_list(
+                'program_type', 'enrollment_status', 'gender'
+            )),
+            [
+                (ProgramType.MASTER, EnrollmentStatus.ON_LEAVE, Gender.FEMALE),
+                (ProgramType.BACHELOR, EnrollmentStatus.ENROLLED, None),
+            ]
+        )
+
+    def test_unknown_journal_grade_is_other(self):
+        self.service.process_publication([
+            make_publication('PUB-1', journal_grade='SSCI'),
+            make_publication('PUB-2', journal_grade=None),
+        ])
+
+        self.assertEqual(
+            list(Publication.objects.order_by('publication_id').values_list('journal_grade', flat=True)),
+            [JournalGrade.OTHER, None]
+        )
+
+    def test_unknown_status_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.service.process_research_budget([make_execution('E1', status='보류')])
+
+        self.assertFalse(ResearchBudgetData.objects.exists())
+
+    def test_business_rules_report_unknown_labels(self):
+        errors = FileValidationService().validate_business_rules('student_roster', [
+            make_student('S1', program_type='박사과정'),
+            make_student('S2', enrollment_status='enrolled'),
+        ])
+
+        self.assertEqual([(e['row'], e['column']) for e in errors], [(2, 'program_type')])
+
+
+class TestCodedFiltersAndOutput(TestCase):
+    """Test that filters compare codes and responses show labels."""
+
+    def setUp(self):
+        DataProcessingService(
+            DataUploadRepository(),
+            department_repository=DepartmentRepository()
+        ).process_publication([
+            make_publication('PUB-1', journal_grade='SCI'),
+            make_publication('PUB-2', journal_grade='SCIE'),
+            make_publication('PUB-3', journal_grade='KCI'),
+        ])
+        self.repository = PapersAnalyticsRepository()
+
+    def test_filter_accepts_any_spelling(self):
+        result = self.repository.get_journal_distribution(journal_grade='sci')
+
+        self.assertEqual(result, [{'journal_grade': JournalGrade.SCI, 'count': 2}])
+
+    def test_unknown_filter_matches_nothing(self):
+        self.assertEqual(self.repository.get_journal_distribution(journal_grade='ABC'), [])
+
+    def test_serializer_maps_codes_to_labels(self):
+        data = JournalDataSerializer(
+            self.repository.get_journal_distribution(), many=True
+        ).data
+
+        self.assertEqual(
+            [(row['journal_grade'], row['count']) for row in data],
+            [('SCI', 2), ('KCI', 1)]
+        )
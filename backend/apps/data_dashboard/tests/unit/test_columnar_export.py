@@ -0,0 +1,158 @@
+"""
+Unit tests for the Parquet and Arrow IPC exports.
+Tests declared schemas, batch-by-batch writing, analytics results, the
+download endpoint and the management command.
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from django.core.management import call_command
+
+from apps.data_dashboard.application.use_cases import ColumnarExportUseCase
+from apps.data_dashboard.tests.unit.test_raw_records import RawRecordsTestCase
+from apps.users.models import User
+from core import columnar
+from core.exceptions import BaseAPIException
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+def read_table(content, file_format='parquet'):
+    """Read an exported file's bytes into a pyarrow Table."""
+    if file_format == 'parquet':
+        return pq.read_table(io.BytesIO(content))
+    return pa.ipc.open_file(io.BytesIO(content)).read_all()
+
+
+@unittest.skipUnless(columnar.is_available(), "pyarrow is not installed")
+class TestDatasetExport(RawRecordsTestCase):
+    """Test dataset exports against the raw-record API."""
+
+    def download(self, target, **params):
+        response = self.client.get(f'/api/dashboard/export/{target}/', params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content)
+
+    def test_schema_mirrors_model(self):
+        table = read_table(self.download('budget'))
+
+        self.assertEqual(table.schema.field('id').type, pa.int64())
+        self.assertEqual(table.schema.field('execution_date').type, pa.date32())
+        self.assertEqual(table.schema.field('total_budget').type, pa.int64())
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('status').type))
+        self.assertFalse(table.schema.field('execution_id').nullable)
+        self.assertTrue(table.schema.field('note').nullable)
+
+    def test_rows_match_records_api(self):
+        records = json.loads(self.client.get('/api/dashboard/records/students/', {'page_size': 100}).content)
+
+        for file_format in columnar.FORMATS:
+            with self.subTest(file_format=file_format):
+                table = read_table(self.download('students', file_format=file_format), file_format)
+
+                self.assertEqual(table.to_pylist(), records['results'])
+
+    def test_filters(self):
+        table = read_table(self.download('budget', status='처리중', year='2024'))
+
+        self.assertEqual(table.column('execution_id').to_pylist(), ['E3'])
+
+    def test_batches(self):
+        expected = read_table(self.download('students'))
+
+        with mock.patch.object(ColumnarExportUseCase, 'BATCH_ROWS', 3):
+            output = io.BytesIO()
+            count = ColumnarExportUseCase('parquet').export_dataset('students', output)
+
+        table = read_table(output.getvalue())
+        self.assertEqual(count, 8)
+        self.assertEqual(pq.ParquetFile(io.BytesIO(output.getvalue())).num_row_groups, 3)
+        self.assertEqual(table.to_pylist(), expected.to_pylist())
+
+    def test_empty_export_keeps_schema(self):
+        table = read_table(self.download('students', department='없는학과'))
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.field('admission_year').type, pa.int32())
+
+    def test_invalid_requests(self):
+        for target, params in [('nope', {}), ('students', {'file_format': 'csv'}), ('students', {'grade': 'x'})]:
+            with self.subTest(target=target, **params):
+                response = self.client.get(f'/api/dashboard/export/{target}/', params)
+
+                self.assertEqual(response.status_code, 400)
+
+    def test_management_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            call_command('export_columnar', 'students', 'budget', '--format', 'arrow',
+                         '--output-dir', directory, '--filter', 'department=컴퓨터공학과', stdout=io.StringIO())
+
+            with open(os.path.join(directory, 'students.arrow'), 'rb') as file:
+                self.assertEqual(read_table(file.read(), 'arrow').num_rows, 7)
+            self.assertTrue(os.path.exists(os.path.join(directory, 'budget.arrow')))
+
+
+@unittest.skipUnless(columnar.is_available(), "pyarrow is not installed")
+class TestAnalyticsExport(RawRecordsTestCase):
+    """Test analytics exports against the analytics endpoints."""
+
+    def test_budget_execution(self):
+        response = self.client.get('/api/dashboard/export/budget_execution/', {'year': 2024})
+        table = read_table(b''.join(response.streaming_content))
+        expected = json.loads(self.client.get('/api/dashboard/budget/execution/', {'year': 2024}).content)['data']
+
+        self.assertEqual(table.schema.field('execution_rate').type, pa.decimal128(5, 2))
+        self.assertEqual(table.num_rows, len(expected))
+        for row, item in zip(table.to_pylist(), expected):
+            self.assertEqual(row, {**item, 'execution_rate': Decimal(item['execution_rate'])})
+
+    def test_labels_are_rendered(self):
+        from apps.data_dashboard.domain.services import DataProcessingService
+        from apps.data_dashboard.infrastructure.repositories import DataUploadRepository
+        from apps.data_dashboard.tests.unit.test_departments import make_publication
+
+        DataProcessingService(DataUploadRepository()).process_publication([
+            make_publication('PUB-1'), make_publication('PUB-2', journal_grade='KCI')
+        ])
+
+        response = self.client.get('/api/dashboard/export/papers_journals/', {'file_format': 'arrow'})
+        table = read_table(b''.join(response.streaming_content), 'arrow')
+
+        self.assertEqual(sorted(table.column('journal_grade').to_pylist()), ['KCI', 'SCI'])
+
+
+class TestExportAccess(RawRecordsTestCase):
+    """Test that only admins may export."""
+
+    def test_non_admins_are_rejected(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get('/api/dashboard/export/students/').status_code, 401)
+
+        user = User.objects.create(username='user', email='user@example.com', clerk_id='user_plain')
+        self.client.force_authenticate(user)
+        for url in ['/api/dashboard/export/', '/api/dashboard/export/budget_execution/']:
+            with self.subTest(url):
+                self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class TestUnavailable(RawRecordsTestCase):
+    """Test that exports are refused without pyarrow."""
+
+    def test_not_available(self):
+        with mock.patch.object(columnar, 'pa', None):
+            with self.assertRaises(BaseAPIException) as caught:
+                ColumnarExportUseCase('parquet')
+            response = self.client.get('/api/dashboard/export/students/')
+
+        self.assertEqual(caught.exception.status_code, 501)
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response.json()['error']['code'], 'NOT_AVAILABLE')
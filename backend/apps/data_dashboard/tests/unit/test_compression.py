@@ -0,0 +1,174 @@
+"""
+Unit tests for response compression and the versioned response cache.
+Tests encoding negotiation, compressed endpoints, streaming and cache reuse.
+"""
+import gzip
+import json
+
+import brotli
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.data_dashboard.models import DepartmentKPI
+from core import response_cache
+from core.checks import check_response_cache
+from core.compression import choose_encoding, compress_stream
+from core.middleware import ResponseCacheMiddleware
+from utils.date_utils import get_current_year
+
+
+class TestChooseEncoding(SimpleTestCase):
+    """Test Accept-Encoding negotiation."""
+
+    def test_preference_and_quality(self):
+        self.assertEqual(choose_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(choose_encoding('gzip, br;q=0'), 'gzip')
+        self.assertEqual(choose_encoding('*'), 'br')
+        self.assertIsNone(choose_encoding('identity'))
+        self.assertIsNone(choose_encoding(''))
+
+    def test_streams_decompress(self):
+        chunks = [f'row {i}\n'.encode() for i in range(100)]
+
+        self.assertEqual(gzip.decompress(b''.join(compress_stream(chunks, 'gzip'))), b''.join(chunks))
+        self.assertEqual(brotli.decompress(b''.join(compress_stream(chunks, 'br'))), b''.join(chunks))
+
+
+class CompressionTestCase(TestCase):
+    """Base class with KPI data behind the dashboard endpoint."""
+
+    URL = '/api/dashboard/dashboard/'
+
+    def setUp(self):
+        year = get_current_year()
+        for offset in range(30):
+            DepartmentKPI.objects.create(
+                college='공과대학', department=f'학과{offset:02d}', year=year - offset % 5, employment_rate=70
+            )
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class TestCompressionMiddleware(CompressionTestCase):
+    """Test compressed API responses."""
+
+    def test_gzip_and_brotli_bodies_match(self):
+        plain = self.client.get(self.URL)
+        gzipped = self.client.get(self.URL, HTTP_ACCEPT_ENCODING='gzip')
+        brotlied = self.client.get(self.URL, HTTP_ACCEPT_ENCODING='gzip, br')
+
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertIn('Accept-Encoding', plain['Vary'])
+        self.assertEqual(gzipped['Content-Encoding'], 'gzip')
+        self.assertEqual(brotlied['Content-Encoding'], 'br')
+        self.assertLess(len(brotlied.content), len(plain.content))
+        self.assertEqual(int(gzipped['Content-Length']), len(gzipped.content))
+        bodies = [
+            json.loads(content)['department_data']
+            for content in (plain.content, gzip.decompress(gzipped.content), brotli.decompress(brotlied.content))
+        ]
+        self.assertEqual(bodies[1], bodies[0])
+        self.assertEqual(bodies[2], bodies[0])
+
+    @override_settings(COMPRESSION_MIN_SIZE=10 ** 6)
+    def test_small_bodies_are_not_compressed(self):
+        response = self.client.get(self.URL, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertNotIn('Content-Encoding', response)
+
+
+@override_settings(RESPONSE_CACHE_SECONDS=60, COMPRESSION_MIN_SIZE=200)
+class TestResponseCache(CompressionTestCase):
+    """Test that hot responses are served compressed from the cache."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def get(self, encoding='br'):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, HTTP_ACCEPT_ENCODING=encoding)
+        return response, len(queries)
+
+    def test_hit_serves_stored_compressed_bytes(self):
+        first, first_queries = self.get()
+        second, second_queries = self.get()
+
+        self.assertGreater(first_queries, 0)
+        self.assertEqual(second_queries, 0)
+        self.assertEqual(second['Content-Encoding'], 'br')
+        self.assertEqual(second.content, first.content)
+
+    def test_entries_are_per_encoding(self):
+        self.get('br')
+        response, queries = self.get('gzip')
+
+        self.assertGreater(queries, 0)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_version_bump_invalidates(self):
+        self.get()
+        response_cache.bump_version()
+
+        self.assertGreater(self.get()[1], 0)
+
+    def test_entries_are_per_accept_header(self):
+        compact, _ = self.get()
+        with CaptureQueriesContext(connection) as queries:
+            indented = self.client.get(self.URL, HTTP_ACCEPT_ENCODING='br', HTTP_ACCEPT='application/json; indent=2')
+
+        self.assertGreater(len(queries), 0)
+        self.assertNotEqual(indented.content, compact.content)
+
+    def test_only_analytics_paths_are_cached(self):
+        self.assertTrue(response_cache.is_cached_path('/api/dashboard/budget/execution/'))
+        for path in ['/api/dashboard/upload/history/', '/api/dashboard/records/', '/api/dashboard/export/']:
+            with self.subTest(path):
+                self.assertFalse(response_cache.is_cached_path(path))
+
+
+@override_settings(RESPONSE_CACHE_SECONDS=60, DATABASE_REPLICA='replica', READ_YOUR_WRITES_SECONDS=30)
+class TestResponseCacheReplicaLag(SimpleTestCase):
+    """Test that a lagging replica's data is not cached under a new version."""
+
+    def setUp(self):
+        cache.clear()
+        self.replica_data = b'before upload'
+        self.middleware = ResponseCacheMiddleware(lambda request: HttpResponse(self.replica_data))
+
+    def get(self):
+        return self.middleware(RequestFactory().get('/api/dashboard/budget/execution/')).content
+
+    def test_upload_then_lagging_replica(self):
+        self.get()
+        response_cache.bump_version()  # An upload commits; the replica has not replayed it yet
+
+        self.assertEqual(self.get(), b'before upload')
+        self.replica_data = b'after upload'  # The replica catches up
+        self.assertEqual(self.get(), b'after upload')
+
+    def test_storing_resumes_after_the_window(self):
+        response_cache.bump_version()
+        cache.delete(response_cache.BUMPED_KEY)  # READ_YOUR_WRITES_SECONDS have passed
+
+        self.get()
+        self.replica_data = b'changed without an upload'
+        self.assertEqual(self.get(), b'before upload')
+
+
+class TestResponseCacheCheck(SimpleTestCase):
+    """Test that the response cache is refused while versions stay in one worker."""
+
+    def errors(self, seconds, backend, debug=False):
+        caches = {'default': {'BACKEND': backend, 'LOCATION': 'django_cache'}}
+        with override_settings(RESPONSE_CACHE_SECONDS=seconds, CACHES=caches, DEBUG=debug):
+            return [error.id for error in check_response_cache(None)]
+
+    def test_check(self):
+        local = 'django.core.cache.backends.locmem.LocMemCache'
+        self.assertEqual(self.errors(300, local), ['core.E002'])
+        self.assertEqual(self.errors(300, 'django.core.cache.backends.db.DatabaseCache'), [])
+        self.assertEqual(self.errors(300, local, debug=True), [])
+        self.assertEqual(self.errors(0, local), [])
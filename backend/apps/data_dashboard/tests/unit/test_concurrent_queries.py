@@ -0,0 +1,101 @@
+"""
+Unit tests for concurrent analytics queries.
+Tests gather_queries and the use cases that fan their repository calls out.
+"""
+import time
+
+from asgiref.sync import async_to_sync
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from apps.data_dashboard.models import DepartmentKPI
+from core.concurrency import gather_queries
+from utils.date_utils import get_current_year
+
+
+def backend_pid(sleep=0):
+    """Get the server process of the calling thread's connection."""
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_backend_pid(), pg_sleep(%s)', [sleep])
+        return cursor.fetchone()[0]
+
+
+@override_settings(DATABASE_POOL=True)
+class TestGatherQueries(TransactionTestCase):
+    """Test that independent calls run concurrently on their own connections."""
+
+    def test_calls_overlap_on_separate_connections(self):
+        started = time.monotonic()
+        pids = async_to_sync(gather_queries)(*[lambda: backend_pid(sleep=0.2)] * 4)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(len(set(pids)), 4)
+        self.assertLess(elapsed, 0.6)
+
+    def test_worker_connections_are_released(self):
+        def query_and_get_connection():
+            backend_pid()
+            return connections['default']  # This worker thread's wrapper
+
+        wrappers = async_to_sync(gather_queries)(query_and_get_connection, query_and_get_connection)
+
+        self.assertTrue(all(wrapper.connection is None for wrapper in wrappers))
+
+    def test_first_error_is_raised(self):
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            async_to_sync(gather_queries)(backend_pid, fail)
+
+
+@override_settings(DATABASE_POOL=False)
+class TestGatherQueriesWithoutPool(TransactionTestCase):
+    """Test that calls stay on the caller's persistent connection without a pool."""
+
+    def test_calls_share_the_callers_connection(self):
+        pid = backend_pid()
+
+        pids = async_to_sync(gather_queries)(backend_pid, backend_pid, backend_pid)
+
+        self.assertEqual(set(pids), {pid})
+        self.assertIsNotNone(connection.connection)
+
+
+class TestGatherQueriesInTransaction(TestCase):
+    """Test that calls inside a transaction stay on its connection."""
+
+    def test_calls_see_uncommitted_rows(self):
+        DepartmentKPI.objects.create(college='공과대학', department='컴퓨터공학과', year=2024)
+
+        counts = async_to_sync(gather_queries)(
+            DepartmentKPI.objects.count,
+            lambda: DepartmentKPI.objects.filter(year=2024).count()
+        )
+        pids = async_to_sync(gather_queries)(backend_pid, backend_pid)
+
+        self.assertEqual(counts, [1, 1])
+        self.assertEqual(set(pids), {backend_pid()})
+
+
+class TestConcurrentDashboard(TransactionTestCase):
+    """Test the dashboard endpoint end to end on the concurrent path."""
+
+    def setUp(self):
+        year = get_current_year()
+        for offset, rate in enumerate([70, 80]):
+            DepartmentKPI.objects.create(
+                college='공과대학',
+                department='컴퓨터공학과',
+                year=year - offset,
+                employment_rate=rate
+            )
+
+    def test_dashboard_response(self):
+        response = self.client.get('/api/dashboard/dashboard/')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['kpi_data']['total_performance'], 70.0)
+        self.assertEqual(len(data['trend_data']), 2)
+        self.assertEqual(data['department_data'][0]['department'], '컴퓨터공학과')
@@ -0,0 +1,182 @@
+"""
+Unit tests for the pooled PostgreSQL backend.
+Tests connection reuse, pool limits, health checks and the Django wrapper.
+"""
+import threading
+import time
+from functools import partial
+
+import psycopg2
+from django.db import connection
+from django.test import SimpleTestCase
+
+from core.backends.postgresql.base import DatabaseWrapper
+from core.db_pool import ConnectionPool, PoolTimeout, close_pools, pool_stats
+
+
+class PoolTestCase(SimpleTestCase):
+    """Base class opening real connections to the test database."""
+
+    databases = {'default'}
+
+    def setUp(self):
+        params = connection.get_connection_params()
+        params.pop('cursor_factory', None)
+        params.pop('pool', None)
+        self.connect = partial(psycopg2.connect, **params)
+        self.pools = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.close()
+
+    def make_pool(self, **options):
+        pool = ConnectionPool('default', self.connect, **options)
+        self.pools.append(pool)
+        return pool
+
+
+class TestConnectionPool(PoolTestCase):
+    """Test checkout, return and limits of the pool."""
+
+    def test_returned_connection_is_reused(self):
+        pool = self.make_pool()
+
+        first = pool.getconn()
+        pool.putconn(first)
+        second = pool.getconn()
+
+        self.assertIs(second, first)
+        stats = pool.stats()
+        self.assertEqual((stats['checkouts'], stats['connections_opened']), (2, 1))
+        self.assertEqual((stats['in_use'], stats['idle']), (1, 0))
+
+    def test_open_transaction_is_rolled_back_on_return(self):
+        pool = self.make_pool()
+        conn = pool.getconn()
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        self.assertEqual(conn.info.transaction_status, psycopg2.extensions.TRANSACTION_STATUS_INTRANS)
+
+        pool.putconn(conn)
+
+        self.assertEqual(conn.info.transaction_status, psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_exhausted_pool_times_out(self):
+        pool = self.make_pool(max_size=1, timeout=0.05)
+        pool.getconn()
+
+        with self.assertRaises(PoolTimeout):
+            pool.getconn()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_waiting_checkout_gets_returned_connection(self):
+        pool = self.make_pool(max_size=1, timeout=5)
+        conn = pool.getconn()
+        timer = threading.Timer(0.05, pool.putconn, [conn])
+        timer.start()
+
+        self.assertIs(pool.getconn(), conn)
+        timer.join()
+        self.assertEqual(pool.stats()['connections_opened'], 1)
+
+    def test_dead_connection_is_replaced(self):
+        pool = self.make_pool(check_interval=0)
+        conn = pool.getconn()
+        pid = conn.get_backend_pid()
+        pool.putconn(conn)
+
+        with self.connect() as admin, admin.cursor() as cursor:
+            cursor.execute('SELECT pg_terminate_backend(%s)', [pid])
+        admin.close()
+
+        replacement = pool.getconn()
+        self.assertIsNot(replacement, conn)
+        stats = pool.stats()
+        self.assertEqual((stats['health_check_failures'], stats['connections_closed']), (1, 1))
+
+    def test_idle_connections_above_min_size_are_closed(self):
+        pool = self.make_pool(min_size=1, max_idle=0)
+        first, second = pool.getconn(), pool.getconn()
+
+        pool.putconn(first)
+        pool.putconn(second)
+
+        stats = pool.stats()
+        self.assertEqual((stats['size'], stats['connections_closed']), (1, 1))
+
+    def test_closed_pool_discards_returned_connections(self):
+        pool = self.make_pool(min_size=2)
+        self.assertEqual(pool.fill(), 2)
+        conn = pool.getconn()
+
+        pool.close()
+        pool.putconn(conn)
+
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.stats()['size'], 0)
+
+
+class TestPooledBackend(PoolTestCase):
+    """Test the Django backend handing connections back to its pool."""
+
+    alias = 'pooled_test'
+
+    def setUp(self):
+        super().setUp()
+        settings_dict = {
+            **connection.settings_dict,
+            'ENGINE': 'core.backends.postgresql',
+            'OPTIONS': {'pool': {'max_size': 2}},
+        }
+        self.wrapper = DatabaseWrapper(settings_dict, self.alias)
+
+    def tearDown(self):
+        self.wrapper.close()
+        close_pools(self.alias)
+        super().tearDown()
+
+    def query_backend_pid(self):
+        with self.wrapper.cursor() as cursor:
+            cursor.execute('SELECT pg_backend_pid()')
+            return cursor.fetchone()[0]
+
+    def test_close_returns_session_to_pool(self):
+        pid = self.query_backend_pid()
+        self.wrapper.close()
+        self.assertEqual(self.query_backend_pid(), pid)
+
+        stats = [s for s in pool_stats() if s['alias'] == self.alias]
+        self.assertEqual(len(stats), 1)
+        self.assertEqual((stats[0]['connections_opened'], stats[0]['checkouts']), (1, 2))
+
+    def test_transaction_left_open_is_rolled_back(self):
+        self.wrapper.set_autocommit(False)
+        with self.wrapper.cursor() as cursor:
+            cursor.execute('CREATE TEMP TABLE pool_probe (id int)')
+        self.wrapper.close()
+
+        with self.wrapper.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('pg_temp.pool_probe')")
+            self.assertIsNone(cursor.fetchone()[0])
+
+    def test_threads_share_the_pool(self):
+        pids = []
+
+        def worker():
+            wrapper = DatabaseWrapper(self.wrapper.settings_dict, self.alias)
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT pg_backend_pid()')
+                pids.append(cursor.fetchone()[0])
+            time.sleep(0.02)
+            wrapper.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(pids), 6)
+        self.assertLessEqual(len(set(pids)), 2)
@@ -0,0 +1,196 @@
+"""
+Unit tests for the department dimension.
+Tests ingest-time key resolution, aliases and key-based grouping.
+"""
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.data_dashboard.models import (
+    Department,
+    DepartmentAlias,
+    Publication,
+    ResearchBudgetData,
+    JournalGrade
+)
+from apps.data_dashboard.infrastructure.repositories import (
+    DepartmentRepository,
+    DataUploadRepository,
+    PapersAnalyticsRepository,
+    BudgetRepository,
+    ResearchProjectRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+from apps.users.models import User
+
+
+def make_publication(publication_id, **overrides):
+    """Build an ingest row for publications."""
+    row = {
+        'publication_id': publication_id,
+        'publication_date': '2024-03-15',
+        'college': '공과대학',
+        'department': '컴퓨터공학과',
+        'title': 'Title',
+        'primary_author': '홍길동',
+        'journal_name': 'Journal',
+        'journal_grade': JournalGrade.SCI,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestDepartmentRepository(TestCase):
+    """Test cached department resolution."""
+
+    def test_resolves_each_name_once(self):
+        """Repeated names are answered from the in-memory cache."""
+        repository = DepartmentRepository()
+        first = repository.resolve('컴퓨터공학과', '공과대학')
+
+        with self.assertNumQueries(0):
+            second = repository.resolve('컴퓨터공학과', '공과대학')
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Department.objects.get().college, '공과대학')
+
+    def test_alias_resolves_to_canonical_department(self):
+        """Aliases map to the department they belong to."""
+        department = Department.objects.create(college='공과대학', name='컴퓨터공학과')
+        DepartmentAlias.objects.create(alias='컴공', department=department)
+        repository = DepartmentRepository()
+
+        self.assertEqual(repository.resolve('컴공').id, department.id)
+        self.assertEqual(repository.get_canonical_name('컴공'), '컴퓨터공학과')
+        self.assertEqual(Department.objects.count(), 1)
+
+    def test_unknown_name_filter_matches_nothing(self):
+        """Filtering on an unknown department returns no rows."""
+        Publication.objects.create(**make_publication('PUB-1'))
+
+        q = DepartmentRepository().filter_by_name('없는학과')
+
+        self.assertFalse(Publication.objects.filter(q).exists())
+
+
+class TestDepartmentIngest(TestCase):
+    """Test that ingest attaches department keys to fact rows."""
+
+    def setUp(self):
+        department = Department.objects.create(college='공과대학', name='컴퓨터공학과')
+        DepartmentAlias.objects.create(alias='컴공', department=department)
+        self.department = department
+        self.service = DataProcessingService(
+            DataUploadRepository(),
+            department_repository=DepartmentRepository()
+        )
+
+    def test_rows_reference_canonical_department(self):
+        """Rows ingested under an alias are stored under the canonical name."""
+        self.service.process_publication([
+            make_publication('PUB-1'),
+            make_publication('PUB-2', department='컴공'),
+        ])
+
+        rows = set(Publication.objects.values_list('department', 'department_ref_id'))
+        self.assertEqual(rows, {('컴퓨터공학과', self.department.id)})
+
+    def test_new_department_created_once(self):
+        """An unseen department is created once for the whole batch."""
+        self.service.process_research_budget([
+            make_execution('E1', department='전자공학과'),
+            make_execution('E2', department='전자공학과'),
+        ])
+
+        self.assertEqual(Department.objects.filter(name='전자공학과').count(), 1)
+        self.assertEqual(
+            ResearchBudgetData.objects.values('department_ref').distinct().count(),
+            1
+        )
+
+    def test_save_without_ingest_resolves_key(self):
+        """Rows saved outside ingest still get a department key."""
+        publication = Publication.objects.create(**make_publication('PUB-1', department='컴공'))
+
+        self.assertEqual(publication.department_ref_id, self.department.id)
+        self.assertEqual(publication.department, '컴퓨터공학과')
+
+    def test_renamed_row_is_re_resolved(self):
+        """Changing a saved row's department moves its key along."""
+        Publication.objects.create(**make_publication('PUB-1'))
+        publication = Publication.objects.get()
+
+        publication.department = '전자공학과'
+        publication.save()
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.department_ref.name, '전자공학과')
+        self.assertEqual(Department.objects.count(), 2)
+
+    def test_unchanged_row_is_not_re_resolved(self):
+        """Saving a loaded row without department changes costs no lookup."""
+        Publication.objects.create(**make_publication('PUB-1'))
+        publication = Publication.objects.get()
+        publication.title = 'New title'
+
+        with self.assertNumQueries(1):
+            publication.save()
+
+
+class TestKeyedAggregates(TestCase):
+    """Test aggregates grouped on department keys."""
+
+    def setUp(self):
+        department = Department.objects.create(college='공과대학', name='컴퓨터공학과')
+        DepartmentAlias.objects.create(alias='컴공', department=department)
+        service = DataProcessingService(
+            DataUploadRepository(),
+            project_repository=ResearchProjectRepository(),
+            department_repository=DepartmentRepository()
+        )
+        service.process_publication([
+            make_publication('PUB-1'),
+            make_publication('PUB-2', department='컴공'),
+            make_publication('PUB-3', department='전자공학과'),
+        ])
+        service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', department='컴공', execution_amount=50),
+        ])
+
+    def test_field_statistics_group_on_key(self):
+        """Publication counts are grouped per department key and named."""
+        result = PapersAnalyticsRepository().get_field_statistics()
+
+        self.assertEqual(result, [
+            {'count': 2, 'department': '컴퓨터공학과'},
+            {'count': 1, 'department': '전자공학과'},
+        ])
+
+    def test_execution_rows_filter_by_alias(self):
+        """Row-level budget queries accept department aliases."""
+        from datetime import date
+
+        result = BudgetRepository()._get_execution_from_rows(
+            department='컴공',
+            start_date=date(2024, 3, 10),
+            end_date=date(2024, 3, 20)
+        )
+
+        self.assertEqual(result, [
+            {'department': '컴퓨터공학과', 'total_budget': 1000, 'executed_amount': 150}
+        ])
+
+    def test_departments_endpoint(self):
+        """The dropdown endpoint lists the dimension to signed-in users."""
+        client = APIClient()
+        self.assertEqual(client.get('/api/dashboard/departments/').status_code, 401)
+
+        client.force_authenticate(User.objects.create(username='user', clerk_id='user_1'))
+        response = client.get('/api/dashboard/departments/', {'college': '공과대학'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [d['name'] for d in response.json()['departments']],
+            ['전자공학과', '컴퓨터공학과']
+        )
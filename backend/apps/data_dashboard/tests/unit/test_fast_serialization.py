@@ -0,0 +1,93 @@
+"""
+Unit tests for the read-only serialization path and the orjson renderer.
+Tests that compiled serializers and ORJSONRenderer match their DRF counterparts.
+"""
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+from django.test import SimpleTestCase
+from rest_framework import serializers as drf_serializers
+from rest_framework.renderers import JSONRenderer
+
+from apps.data_dashboard.management.commands.benchmark_serialization import make_payloads
+from apps.data_dashboard.models import JournalGrade
+from apps.data_dashboard.presentation import serializers
+from core.renderers import ORJSONRenderer
+from core.serialization import compile_serializer
+
+
+class OptionalFieldsSerializer(drf_serializers.Serializer):
+    """Serializer covering the missing-attribute rules."""
+    required = drf_serializers.IntegerField()
+    nullable = drf_serializers.FloatField(required=False, allow_null=True)
+    optional = drf_serializers.CharField(required=False)
+    defaulted = drf_serializers.IntegerField(default=7)
+    nested = serializers.BudgetStatusSerializer(required=False, allow_null=True)
+
+
+class TestCompileSerializer(SimpleTestCase):
+    """Test that compiled serializers produce the DRF representation."""
+
+    def assert_same_representation(self, serializer_class, instance, many=False):
+        expected = serializer_class(instance, many=many).data
+        self.assertEqual(compile_serializer(serializer_class, many=many)(instance), expected)
+
+    def test_analytics_responses(self):
+        for name, (serializer_class, many, instance) in make_payloads(3, 2, 5).items():
+            with self.subTest(name):
+                self.assert_same_representation(serializer_class, instance, many=many)
+
+    def test_papers_with_choice_labels(self):
+        self.assert_same_representation(serializers.PapersAnalyticsSerializer, {
+            'yearly_data': [{'year': 2024, 'count': 3}],
+            'journal_data': [{'journal_grade': JournalGrade.SCI, 'count': 3}],
+            'field_data': [{'department': '컴퓨터공학과', 'count': 3}],
+            'has_data': True,
+        })
+
+    def test_missing_attributes(self):
+        serialize = compile_serializer(OptionalFieldsSerializer)
+
+        self.assertEqual(serialize({'required': '1', 'nested': None}), {
+            'required': 1, 'nullable': None, 'defaulted': 7, 'nested': None
+        })
+        self.assert_same_representation(OptionalFieldsSerializer, {'required': 1})
+        with self.assertRaises(KeyError):
+            serialize({})
+
+    def test_objects_use_attribute_lookup(self):
+        instance = type('Point', (), {'year': 2024, 'value': Decimal('1.5')})()
+
+        self.assertEqual(
+            compile_serializer(serializers.TrendDataItemSerializer)(instance),
+            {'year': 2024, 'value': 1.5}
+        )
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    """Test that rendered JSON matches the stdlib renderer."""
+
+    def test_matches_json_renderer(self):
+        data = {
+            'name': '컴퓨터공학과',
+            'rate': Decimal('12.50'),
+            'day': date(2024, 3, 1),
+            'at': datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc),
+            'counts': {2024: 3},
+            'items': [1, 2.5, None, True],
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+        self.assertIn('"컴퓨터공학과"'.encode(), rendered)
+
+    def test_numpy_values(self):
+        data = {'total': np.int64(5), 'rates': np.array([1.5, 2.0])}
+
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), {'total': 5, 'rates': [1.5, 2.0]})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -0,0 +1,115 @@
+"""
+Unit tests for the home page bundle endpoint.
+Tests widget selection, shared filters, per-widget errors and shared lookups.
+"""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.data_dashboard.models import DepartmentKPI
+from apps.data_dashboard.infrastructure.repositories import (
+    BudgetCubeRepository,
+    BudgetPartitionRepository,
+    DataUploadRepository,
+    DepartmentRepository,
+    ResearchProjectRepository,
+    StudentRollupRepository
+)
+from apps.data_dashboard.application.use_cases import GetHomeBundleUseCase
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+from apps.data_dashboard.tests.unit.test_departments import make_publication
+from apps.data_dashboard.tests.unit.test_student_rollup import make_student
+from apps.users.models import User
+from utils.date_utils import get_current_year
+
+
+class TestHomeBundle(TestCase):
+    """Test the bundle against one small data set."""
+
+    URL = '/api/dashboard/home/'
+    client_class = APIClient
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.create(username='user', clerk_id='user_1'))
+        year = get_current_year()
+        service = DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=BudgetCubeRepository(),
+            student_rollup_repository=StudentRollupRepository(),
+            project_repository=ResearchProjectRepository(),
+            department_repository=DepartmentRepository(),
+            partition_repository=BudgetPartitionRepository()
+        )
+        for offset, rate in enumerate([70, 80]):
+            DepartmentKPI.objects.create(
+                college='공과대학', department='컴퓨터공학과', year=year - offset, employment_rate=rate
+            )
+        service.process_publication([
+            make_publication('PUB-1', publication_date=f'{year}-03-01', journal_grade='SCI'),
+            make_publication('PUB-2', department='전자공학과', journal_grade='KCI'),
+        ])
+        service.process_student([
+            make_student('S1'),
+            make_student('S2', department='전자공학과'),
+        ])
+        service.process_research_budget([
+            make_execution('E1', execution_date=f'{year}-02-01'),
+            make_execution('E2', project_number='P-002', department='전자공학과',
+                           total_budget=3000, execution_date=f'{year}-02-01'),
+        ])
+
+    def test_all_widgets_by_default(self):
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(list(data['widgets']), list(GetHomeBundleUseCase.WIDGETS))
+        self.assertEqual(data['errors'], {})
+        self.assertEqual(data['widgets']['kpi']['total_performance'], 70.0)
+        self.assertEqual(data['widgets']['kpi']['student_count'], 2)
+        self.assertEqual(len(data['widgets']['trends']), 2)
+        self.assertEqual(data['widgets']['budget_summary'][0], {'category': '전자공학과', 'value': 3000})
+        self.assertEqual(
+            sorted(row['journal_grade'] for row in data['widgets']['papers']['journal_data']),
+            ['KCI', 'SCI']
+        )
+        self.assertEqual(data['widgets']['students']['total_students'], 2)
+
+    def test_selected_widgets_share_filters(self):
+        response = self.client.get(self.URL, {
+            'widgets': 'budget_allocation, students,papers',
+            'department': '전자공학과',
+        })
+
+        widgets = response.json()['widgets']
+        self.assertEqual(list(widgets), ['budget_allocation', 'students', 'papers'])
+        self.assertEqual([row['department'] for row in widgets['budget_allocation']], ['전자공학과'])
+        self.assertEqual(widgets['students']['total_students'], 1)
+        self.assertEqual(widgets['papers']['journal_data'], [{'journal_grade': 'KCI', 'count': 1}])
+
+    def test_shared_lookups_run_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.URL, {'widgets': 'kpi,department_performance,budget_summary'})
+
+        sql = [query['sql'] for query in queries]
+        self.assertEqual(len([q for q in sql if 'MAX("department_kpis"."year")' in q]), 1)
+        self.assertEqual(len([q for q in sql if q.startswith('SELECT') and 'FROM "departments"' in q]), 1)
+
+    def test_anonymous_requests_are_rejected(self):
+        self.client.force_authenticate(None)
+
+        self.assertEqual(self.client.get(self.URL).status_code, 401)
+
+    def test_unknown_widget_is_rejected(self):
+        response = self.client.get(self.URL, {'widgets': 'kpi,weather'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('weather', response.json()['error']['message'])
+
+    def test_widget_errors_do_not_fail_the_bundle(self):
+        data = GetHomeBundleUseCase().execute(['kpi', 'students'], year=1990)
+
+        self.assertEqual(list(data['widgets']), ['kpi'])
+        self.assertEqual(data['errors'], {'students': 'Year must be between 2000 and 2100'})
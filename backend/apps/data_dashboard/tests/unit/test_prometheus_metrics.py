@@ -0,0 +1,117 @@
+"""
+Unit tests for the metrics endpoint.
+Tests the text format, merging across worker processes and request latency.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core import metrics
+
+
+class MetricsTestCase(SimpleTestCase):
+    """Base class registering throwaway metrics."""
+
+    def make(self, metric_class, name, *args, **kwargs):
+        metric = metric_class(name, f"Test metric {name}", *args, **kwargs)
+        self.addCleanup(metrics._registry.pop, name)
+        return metric
+
+
+class TestRender(MetricsTestCase):
+    """Test the Prometheus text format."""
+
+    def test_counter_and_histogram(self):
+        counter = self.make(metrics.Counter, 'test_rows_total', ('file_type',))
+        histogram = self.make(metrics.Histogram, 'test_latency_seconds', buckets=(0.1, 1.0))
+        counter.inc(5, file_type='student_roster')
+        counter.inc(2, file_type='student_roster')
+        for value in (0.05, 0.5, 3):
+            histogram.observe(value)
+
+        lines = metrics.render().splitlines()
+
+        self.assertIn('# TYPE test_rows_total counter', lines)
+        self.assertIn('test_rows_total{file_type="student_roster"} 7.0', lines)
+        self.assertIn('test_latency_seconds_bucket{le="0.1"} 1.0', lines)
+        self.assertIn('test_latency_seconds_bucket{le="1.0"} 2.0', lines)
+        self.assertIn('test_latency_seconds_bucket{le="+Inf"} 3.0', lines)
+        self.assertIn('test_latency_seconds_sum 3.55', lines)
+        self.assertIn('test_latency_seconds_count 3.0', lines)
+
+    def test_label_values_are_escaped(self):
+        gauge = self.make(metrics.Gauge, 'test_depth', ('queue',))
+        gauge.set(1, queue='a"b\\c')
+
+        self.assertIn('test_depth{queue="a\\"b\\\\c"} 1.0', metrics.render())
+
+
+class TestMultiprocess(MetricsTestCase):
+    """Test merging the files written by other workers."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        settings_override = override_settings(METRICS_DIR=self.directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.counter = self.make(metrics.Counter, 'test_uploads_total')
+        self.gauge = self.make(metrics.Gauge, 'test_queue_depth')
+
+    def write_worker(self, pid, counter, gauge):
+        data = {'pid': pid, 'metrics': {
+            'test_uploads_total': {**self.counter.snapshot(), 'samples': [[[], counter]]},
+            'test_queue_depth': {**self.gauge.snapshot(), 'samples': [[[], gauge]]},
+        }}
+        with open(os.path.join(self.directory, f'{pid}.json'), 'w') as f:
+            json.dump(data, f)
+
+    def test_workers_are_merged(self):
+        exited = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                                capture_output=True, text=True).stdout
+        self.write_worker(os.getppid(), counter=2, gauge=3)
+        self.write_worker(int(exited), counter=4, gauge=5)
+        self.counter.inc()
+        self.gauge.set(1)
+
+        lines = metrics.render().splitlines()
+
+        self.assertIn('test_uploads_total 7.0', lines)
+        self.assertIn('test_queue_depth 4.0', lines)
+
+    def test_flush_writes_own_file(self):
+        self.counter.inc(3)
+
+        metrics.flush(force=True)
+
+        with open(os.path.join(self.directory, f'{os.getpid()}.json')) as f:
+            data = json.load(f)
+        self.assertEqual(data['metrics']['test_uploads_total']['samples'], [[[], 3]])
+
+
+class TestMetricsEndpoint(TestCase):
+    """Test the endpoint and the request latency middleware."""
+
+    URL = '/api/metrics/'
+
+    def test_request_latency_by_view_action(self):
+        self.client.get('/api/dashboard/budget/execution/')
+
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn(
+            'http_request_duration_seconds_count{view="BudgetAnalysisViewSet.execution",method="GET",status="200"}',
+            response.content.decode()
+        )
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token_is_required_when_set(self):
+        self.assertEqual(self.client.get(self.URL).status_code, 401)
+        response = self.client.get(self.URL, HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,79 @@
+"""
+Unit tests for per-request SQL metrics.
+Tests the Server-Timing header, statement counting across worker threads,
+budget logging and the disabled pass-through.
+"""
+import re
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from apps.data_dashboard.models import DepartmentKPI
+from core.concurrency import gather_queries
+from core.query_metrics import QueryMetrics, collect_queries
+from utils.date_utils import get_current_year
+
+
+SERVER_TIMING = re.compile(
+    r'db;dur=[\d.]+;desc="(\d+) queries", serialize;dur=[\d.]+, app;dur=[\d.]+'
+)
+
+
+def count_kpis():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT COUNT(*) FROM department_kpis')
+        return cursor.fetchone()[0]
+
+
+class TestCollectQueries(TransactionTestCase):
+    """Test that statements on fanned-out worker threads are counted."""
+
+    def test_worker_thread_statements_are_counted(self):
+        metrics = QueryMetrics()
+
+        with collect_queries(metrics):
+            count_kpis()
+            async_to_sync(gather_queries)(count_kpis, count_kpis, count_kpis)
+        count_kpis()
+
+        self.assertEqual(metrics.count, 4)
+        self.assertGreater(metrics.db_seconds, 0)
+
+
+@override_settings(QUERY_METRICS_SAMPLE_RATE=1, QUERY_BUDGET_COUNT=30, QUERY_BUDGET_MS=10000)
+class TestQueryMetricsMiddleware(TestCase):
+    """Test the header and logging of sampled requests."""
+
+    URL = '/api/dashboard/dashboard/'
+
+    def setUp(self):
+        DepartmentKPI.objects.create(
+            college='공과대학', department='컴퓨터공학과', year=get_current_year(), employment_rate=70
+        )
+
+    def test_server_timing_header(self):
+        response = self.client.get(self.URL)
+
+        match = SERVER_TIMING.fullmatch(response['Server-Timing'])
+        self.assertIsNotNone(match)
+        self.assertGreater(int(match.group(1)), 0)
+
+    def test_request_within_budget_is_not_logged(self):
+        with self.assertNoLogs('core.middleware', level='WARNING'):
+            self.client.get(self.URL)
+
+    @override_settings(QUERY_BUDGET_COUNT=0)
+    def test_request_over_budget_is_logged_with_view_name(self):
+        with self.assertLogs('core.middleware', level='WARNING') as logs:
+            self.client.get('/api/dashboard/budget/execution/')
+
+        self.assertIn('BudgetAnalysisViewSet.execution GET', logs.output[0])
+
+    @override_settings(QUERY_METRICS_SAMPLE_RATE=0, QUERY_BUDGET_COUNT=0)
+    def test_unsampled_request_passes_through(self):
+        with self.assertNoLogs('core.middleware', level='WARNING'):
+            response = self.client.get(self.URL)
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(connection.execute_wrappers, [])
@@ -0,0 +1,190 @@
+"""
+Query plan tests.
+Checks that repository filters are served by indexes on a large generated dataset.
+"""
+import unittest
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.data_dashboard.models import (
+    Publication,
+    ResearchBudgetData,
+    ExecutionStatus,
+    JournalGrade
+)
+from apps.data_dashboard.infrastructure.repositories import (
+    BudgetRepository,
+    PapersAnalyticsRepository,
+    year_range
+)
+from apps.data_dashboard.tests import plans
+
+
+class TestPublicationDepartmentFilterPlans(TestCase):
+    """Test that department filters use an index instead of a sequential scan."""
+
+    @classmethod
+    def setUpTestData(cls):
+        plans.seed_publications()
+
+    def filtered(self, field, field_match):
+        repository = PapersAnalyticsRepository(field_match=field_match)
+        return repository._apply_filters(Publication.objects.all(), None, None, field)
+
+    def test_contains_uses_trigram_index(self):
+        """Substring filters are served by the pg_trgm GIN index."""
+        if not plans.has_extension('pg_trgm'):
+            raise unittest.SkipTest("pg_trgm is not installed")
+
+        plan = plans.explain(self.filtered('D0007', 'contains'))
+
+        self.assertIn('publications_dept_trgm_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_prefix_uses_pattern_index(self):
+        """Prefix filters are served by the varchar_pattern_ops index."""
+        plan = plans.explain(self.filtered('D0007', 'prefix'))
+
+        self.assertIn('publications_dept_pattern_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_exact_uses_pattern_index(self):
+        """Exact filters are served by the varchar_pattern_ops index."""
+        plan = plans.explain(self.filtered(plans.department_name(7), 'exact'))
+
+        self.assertIn('publications_dept_pattern_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_modes_agree_on_results(self):
+        """All match modes find the same rows for a full department name."""
+        name = plans.department_name(7)
+        counts = {
+            mode: self.filtered(name, mode).count()
+            for mode in ('contains', 'prefix', 'exact')
+        }
+
+        self.assertEqual(len(set(counts.values())), 1)
+        self.assertGreater(counts['exact'], 0)
+
+
+class TestYearFilterPlans(TestCase):
+    """Test that year filters are sargable and year grouping reads stored columns."""
+
+    @classmethod
+    def setUpTestData(cls):
+        plans.seed_publications()
+        plans.seed_budget_rows()
+
+    def test_publication_year_filter_uses_index(self):
+        """Year filters compare publication_date against a range."""
+        repository = PapersAnalyticsRepository()
+        queryset = repository._apply_filters(Publication.objects.all(), 2020, None, None)
+
+        plan = plans.explain(queryset)
+
+        self.assertIn('Index', plan)
+        self.assertNotIn('Seq Scan', plan)
+        self.assertNotIn('EXTRACT', str(queryset.query).upper())
+
+    def test_execution_year_filter_prunes_partitions(self):
+        """Year filters compare execution_date against a range the planner can prune on."""
+        queryset = ResearchBudgetData.objects.filter(year_range('execution_date', 2020))
+
+        plan = plans.explain(queryset)
+
+        self.assertEqual(
+            plans.scanned_partitions(plan, 'research_budget_data'),
+            {'research_budget_data_y2020'}
+        )
+
+    def test_year_range_matches_extract(self):
+        """Range filters select the same rows as EXTRACT(YEAR ...)."""
+        ranged = Publication.objects.filter(year_range('publication_date', 2020)).count()
+        extracted = Publication.objects.filter(pub_year=2020).count()
+
+        self.assertEqual(ranged, extracted)
+        self.assertGreater(ranged, 0)
+
+    def test_yearly_data_groups_on_stored_year(self):
+        """Yearly publication counts group on pub_year without EXTRACT."""
+        repository = PapersAnalyticsRepository()
+
+        with CaptureQueriesContext(connection) as queries:
+            result = repository.get_yearly_data(journal_grade='SCI')
+
+        self.assertNotIn('EXTRACT', queries[0]['sql'].upper())
+        self.assertEqual(result[0]['year'], 2000)
+        self.assertEqual(
+            sum(row['count'] for row in result),
+            Publication.objects.filter(journal_grade=JournalGrade.SCI).count()
+        )
+
+
+class TestStoredYearColumns(TestCase):
+    """Test that stored year columns are populated when rows are saved."""
+
+    def test_publication_year_populated_on_save(self):
+        publication = Publication.objects.create(
+            publication_id='PUB-1',
+            publication_date='2023-12-31',
+            college='공과대학',
+            department='컴퓨터공학과',
+            title='Title',
+            primary_author='Author',
+            journal_name='Journal',
+        )
+
+        self.assertEqual(publication.pub_year, 2023)
+
+    def test_execution_year_follows_date_updates(self):
+        execution = ResearchBudgetData.objects.create(
+            execution_id='EXE-1',
+            project_number='PRJ-1',
+            project_name='Project',
+            principal_investigator='PI',
+            department='컴퓨터공학과',
+            funding_agency='한국연구재단',
+            total_budget=1000,
+            execution_date='2023-12-31',
+            execution_item='인건비',
+            execution_amount=100,
+            status=ExecutionStatus.COMPLETED,
+        )
+        execution.execution_date = '2024-01-01'
+        execution.save()
+
+        execution.refresh_from_db()
+        self.assertEqual(execution.exec_year, 2024)
+
+
+class TestBudgetPartitionPruning(TestCase):
+    """Test that year-scoped budget queries read a single partition."""
+
+    @classmethod
+    def setUpTestData(cls):
+        plans.seed_budget_rows()
+
+    def test_day_granular_range_reads_one_partition(self):
+        """Mid-month ranges fall back to execution rows of one year only."""
+        with plans.capture_plans() as captured:
+            BudgetRepository().get_execution_by_department(
+                start_date=date(2020, 3, 5),
+                end_date=date(2020, 3, 20)
+            )
+
+        row_plans = [p for p in captured if 'research_budget_data' in p]
+        self.assertTrue(row_plans)
+        for plan in row_plans:
+            self.assertEqual(
+                plans.scanned_partitions(plan, 'research_budget_data'),
+                {'research_budget_data_y2020'}
+            )
+
+    def test_unfiltered_scan_is_reported_as_parent(self):
+        """A sequential scan over every partition counts as a table scan."""
+        plan = plans.explain(ResearchBudgetData.objects.filter(execution_amount__gt=0).order_by())
+
+        self.assertIn('research_budget_data', plans.seq_scanned_tables([plan]))
@@ -0,0 +1,231 @@
+"""
+Unit tests for the raw-record browsing and export APIs.
+Tests keyset paging, projection, filters, streaming, CSV round trips and
+parameter validation.
+"""
+import json
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.data_dashboard.application.use_cases import (
+    BrowseRecordsUseCase,
+    ExportRecordsUseCase,
+    UploadFileUseCase
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.infrastructure.repositories import DataUploadRepository
+from apps.data_dashboard.models import Publication, ResearchBudgetData, Student
+from apps.data_dashboard.tests.unit.test_departments import make_publication
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+from apps.data_dashboard.tests.unit.test_student_rollup import make_student
+from apps.users.models import User
+from core.pagination import encode_cursor
+
+
+class RawRecordsTestCase(TestCase):
+    """Base class with eight students and three budget executions, and an admin client."""
+
+    client_class = APIClient
+
+    def setUp(self):
+        self.admin = User.objects.create(username='admin', email='admin@example.com', clerk_id='user_admin',
+                                         role='admin')
+        self.client.force_authenticate(self.admin)
+        service = DataProcessingService(DataUploadRepository())
+        service.process_student(
+            [make_student(f'S{n}') for n in range(1, 6)]
+            + [make_student('S6', enrollment_status='휴학'), make_student('S7', department='전자공학과'),
+               make_student('S8', gender=None)]
+        )
+        service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_date='2023-05-01', status='처리중'),
+            make_execution('E3', status='처리중'),
+        ])
+
+    def get(self, dataset, **params):
+        response = self.client.get(f'/api/dashboard/records/{dataset}/', params)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, json.loads(content)
+
+
+class TestRecordAccess(RawRecordsTestCase):
+    """Test who may browse which dataset."""
+
+    def test_anonymous_requests_are_rejected(self):
+        self.client.force_authenticate(None)
+
+        for dataset in ['students', 'publications', 'budget']:
+            with self.subTest(dataset):
+                self.assertEqual(self.client.get(f'/api/dashboard/records/{dataset}/').status_code, 401)
+
+    def test_students_are_for_admins(self):
+        user = User.objects.create(username='user', email='user@example.com', clerk_id='user_plain')
+        self.client.force_authenticate(user)
+
+        self.assertEqual(self.client.get('/api/dashboard/records/students/').status_code, 403)
+        self.assertEqual(self.client.get('/api/dashboard/records/budget/').status_code, 200)
+
+    def test_anonymous_exports_are_rejected(self):
+        self.client.force_authenticate(None)
+
+        for dataset in ['students', 'publications', 'budget']:
+            with self.subTest(dataset):
+                self.assertEqual(self.client.get(f'/api/dashboard/records/{dataset}/export/').status_code, 401)
+
+    def test_student_export_is_for_admins(self):
+        user = User.objects.create(username='user', email='user@example.com', clerk_id='user_plain')
+        self.client.force_authenticate(user)
+
+        self.assertEqual(self.client.get('/api/dashboard/records/students/export/').status_code, 403)
+        self.assertEqual(self.client.get('/api/dashboard/records/budget/export/').status_code, 200)
+
+
+class TestRecordPaging(RawRecordsTestCase):
+    """Test walking a dataset through next cursors."""
+
+    def test_pages_cover_every_row_in_id_order(self):
+        ids, cursor = [], None
+        while True:
+            params = {'page_size': 3, 'fields': 'id'}
+            if cursor:
+                params['cursor'] = cursor
+            response, body = self.get('students', **params)
+            self.assertEqual(response.status_code, 200)
+            ids += [row['id'] for row in body['results']]
+            cursor = body['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(ids, list(Student.objects.order_by('id').values_list('id', flat=True)))
+
+    def test_projection_and_labels(self):
+        _, body = self.get('students', fields='student_id,gender', page_size=8)
+
+        self.assertEqual(body['results'][0], {'student_id': 'S1', 'gender': '남'})
+        self.assertEqual(body['results'][-1], {'student_id': 'S8', 'gender': None})
+        self.assertIsNone(body['next_cursor'])
+
+    def test_default_fields(self):
+        _, body = self.get('budget', page_size=1)
+
+        row = body['results'][0]
+        self.assertEqual(row['execution_id'], 'E1')
+        self.assertEqual(row['execution_date'], '2024-03-15')
+        self.assertEqual(row['status'], '집행완료')
+        self.assertIn('id', row)
+
+
+class TestRecordFilters(RawRecordsTestCase):
+    """Test the indexed filters of each dataset."""
+
+    def test_filters(self):
+        cases = [
+            ('students', {'enrollment_status': '휴학'}, ['S6']),
+            ('students', {'department': '전자공학과'}, ['S7']),
+            ('students', {'department': '없는학과'}, []),
+            ('budget', {'year': '2024', 'status': '처리중'}, ['E3']),
+            ('budget', {'date_to': '2023-12-31'}, ['E2']),
+        ]
+        for dataset, filters, expected in cases:
+            with self.subTest(dataset=dataset, **filters):
+                key = 'student_id' if dataset == 'students' else 'execution_id'
+                _, body = self.get(dataset, fields=key, **filters)
+
+                self.assertEqual([row[key] for row in body['results']], expected)
+
+    def test_invalid_parameters_are_bad_requests(self):
+        cases = [
+            ('students', {'fields': 'student_id,password'}),
+            ('students', {'advisor': '홍길동'}),
+            ('students', {'enrollment_status': '없음'}),
+            ('students', {'page_size': '0'}),
+            ('students', {'page_size': 'many'}),
+            ('students', {'cursor': encode_cursor({'after': 'x'})}),
+            ('publications', {'date_from': '2024-13-01'}),
+        ]
+        for dataset, params in cases:
+            with self.subTest(dataset=dataset, **params):
+                response, body = self.get(dataset, **params)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(body['error']['code'], 'VALIDATION_ERROR')
+
+
+class TestRecordStreaming(RawRecordsTestCase):
+    """Test that streamed pages carry the same JSON as buffered ones."""
+
+    def test_large_pages_are_streamed(self):
+        buffered, buffered_body = self.get('students', page_size=5)
+        with override_settings(RECORDS_STREAM_ROWS=4):
+            streamed, streamed_body = self.get('students', page_size=5)
+
+        self.assertFalse(buffered.streaming)
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed_body, buffered_body)
+
+    def test_chunk_boundaries(self):
+        expected = self.get('students', page_size=7)[1]
+
+        for chunk_rows in (1, 2, 7, 8):
+            with self.subTest(chunk_rows=chunk_rows), \
+                    mock.patch.object(BrowseRecordsUseCase, 'CHUNK_ROWS', chunk_rows):
+                chunks = list(BrowseRecordsUseCase('students').execute(page_size=7))
+
+                self.assertEqual(json.loads(b''.join(chunks)), expected)
+
+
+class TestRecordExport(RawRecordsTestCase):
+    """Test CSV exports and their round trip through the upload path."""
+
+    def export(self, dataset, **params):
+        response = self.client.get(f'/api/dashboard/records/{dataset}/export/', params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content)
+
+    def test_header_modes(self):
+        english = self.export('students').decode('utf-8-sig').splitlines()
+        korean = self.export('students', headers='ko').decode('utf-8-sig').splitlines()
+
+        self.assertTrue(english[0].startswith('student_id,name,college,department'))
+        self.assertTrue(korean[0].startswith('학번,이름,단과대학,학과'))
+        self.assertEqual(english[1:], korean[1:])
+        self.assertEqual(english[1], 'S1,홍길동,공과대학,컴퓨터공학과,1,학사,재학,남,2023,,')
+        self.assertEqual(self.client.get('/api/dashboard/records/students/export/', {'headers': 'jp'}).status_code, 400)
+
+    def test_filters(self):
+        lines = self.export('budget', status='처리중').decode('utf-8-sig').splitlines()
+
+        self.assertEqual([line.split(',')[0] for line in lines[1:]], ['E2', 'E3'])
+
+    def test_round_trip_through_upload(self):
+        DataProcessingService(DataUploadRepository()).process_publication([
+            make_publication('PUB-1', impact_factor=3.25, is_project_linked=True, co_authors='김철수;이영희'),
+            make_publication('PUB-2', journal_grade='KCI'),
+        ])
+        user = User.objects.create(username='analyst', clerk_id='analyst')
+
+        for dataset, model in [('students', Student), ('publications', Publication),
+                               ('budget', ResearchBudgetData)]:
+            with self.subTest(dataset=dataset):
+                exported = self.export(dataset, headers='ko')
+                model.objects.all().delete()
+
+                result = UploadFileUseCase().execute(
+                    user.id, SimpleUploadedFile(f'{dataset}.csv', exported, content_type='text/csv')
+                )
+
+                self.assertTrue(result['success'], result)
+                self.assertEqual(self.export(dataset, headers='ko'), exported)
+
+    def test_chunk_boundaries(self):
+        expected = self.export('students')
+
+        for chunk_rows in (1, 3, 8, 9):
+            with self.subTest(chunk_rows=chunk_rows), \
+                    mock.patch.object(ExportRecordsUseCase, 'CHUNK_ROWS', chunk_rows):
+                self.assertEqual(b''.join(ExportRecordsUseCase('students').execute()), expected)
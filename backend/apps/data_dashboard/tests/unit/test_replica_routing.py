@@ -0,0 +1,190 @@
+"""
+Unit tests for read replica routing.
+Tests router decisions, read-your-writes pinning and analytics reads on the replica.
+"""
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.cache.backends.db import DatabaseCache
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.functional import SimpleLazyObject
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.data_dashboard.models import DepartmentKPI, Publication
+from apps.data_dashboard.infrastructure.repositories import DashboardRepository, UploadHistoryRepository
+from core.checks import check_replica_pin_cache
+from core.db_router import ReplicaRouter, get_read_alias, pinned_to_primary, replica_reads
+from core.middleware import ReplicaPinningMiddleware
+
+
+@override_settings(DATABASE_REPLICA='replica')
+class TestReplicaRouter(TransactionTestCase):
+    """Test which alias the router picks."""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_analytics_reads_use_replica(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Publication), 'replica')
+
+        self.assertEqual(self.router.db_for_read(Publication), 'default')
+
+    def test_pinned_reads_use_primary(self):
+        with replica_reads(), pinned_to_primary():
+            self.assertEqual(self.router.db_for_read(Publication), 'default')
+
+    def test_reads_inside_transaction_use_primary(self):
+        with replica_reads():
+            with transaction.atomic():
+                self.assertEqual(self.router.db_for_read(Publication), 'default')
+            self.assertEqual(self.router.db_for_read(Publication), 'replica')
+
+    def test_database_cache_reads_use_primary(self):
+        cache_model = DatabaseCache('django_cache', {}).cache_model_class
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(cache_model), 'default')
+
+    def test_writes_and_migrations_use_primary(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(Publication), 'default')
+
+        self.assertTrue(self.router.allow_migrate('default', 'data_dashboard'))
+        self.assertFalse(self.router.allow_migrate('replica', 'data_dashboard'))
+
+    @override_settings(DATABASE_REPLICA=None)
+    def test_without_replica_everything_uses_primary(self):
+        with replica_reads():
+            self.assertEqual(get_read_alias(), 'default')
+
+
+@override_settings(DATABASE_REPLICA='replica', READ_YOUR_WRITES_SECONDS=30)
+class TestReplicaPinningMiddleware(SimpleTestCase):
+    """Test that a user's writes pin their following reads to the primary."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.status = 200
+        self.middleware = ReplicaPinningMiddleware(self.view)
+
+    def view(self, request):
+        with replica_reads():
+            request.read_alias = get_read_alias()
+        return HttpResponse(status=self.status)
+
+    def send(self, method, user_id=1):
+        request = getattr(self.factory, method)('/api/dashboard/')
+        request.user = SimpleNamespace(pk=user_id, is_authenticated=True)
+        self.middleware(request)
+        return request.read_alias
+
+    def test_write_pins_user_to_primary(self):
+        self.assertEqual(self.send('get'), 'replica')
+        self.assertEqual(self.send('post'), 'default')
+        self.assertEqual(self.send('get'), 'default')
+        self.assertEqual(self.send('get', user_id=2), 'replica')
+
+    def test_failed_write_does_not_pin(self):
+        self.status = 400
+        self.send('post')
+
+        self.status = 200
+        self.assertEqual(self.send('get'), 'replica')
+
+    def test_anonymous_requests_are_not_pinned(self):
+        request = self.factory.post('/api/dashboard/')
+        request.user = AnonymousUser()
+        self.middleware(request)
+
+        request = self.factory.get('/api/dashboard/')
+        request.user = AnonymousUser()
+        self.middleware(request)
+        self.assertEqual(request.read_alias, 'replica')
+
+    def test_pins_survive_drf_authentication(self):
+        # Without authentication classes DRF sets request.user to AnonymousUser
+        class View(APIView):
+            authentication_classes = []
+            permission_classes = []
+
+            def get(self, request):
+                with replica_reads():
+                    request._request.read_alias = get_read_alias()
+                return Response()
+
+            post = get
+
+        self.middleware = ReplicaPinningMiddleware(View.as_view())
+
+        self.assertEqual(self.send('post'), 'default')
+        self.assertEqual(self.send('get'), 'default')
+        self.assertEqual(self.send('get', user_id=2), 'replica')
+
+    def test_user_is_resolved_on_first_replica_read(self):
+        resolve = mock.Mock(return_value=SimpleNamespace(pk=1, is_authenticated=True))
+        request = self.factory.get('/api/health/')
+        request.user = SimpleLazyObject(resolve)
+        ReplicaPinningMiddleware(lambda request: HttpResponse())(request)
+        resolve.assert_not_called()
+
+        request = self.factory.get('/api/dashboard/')
+        request.user = SimpleLazyObject(resolve)
+        self.middleware(request)
+        resolve.assert_called_once()
+
+
+class TestReplicaPinCacheCheck(SimpleTestCase):
+    """Test that a replica is refused while pins would stay in one worker."""
+
+    LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    SHARED = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'django_cache'}}
+
+    def errors(self, replica, caches, debug=False):
+        with override_settings(DATABASE_REPLICA=replica, CACHES=caches, DEBUG=debug):
+            return [error.id for error in check_replica_pin_cache(None)]
+
+    def test_check(self):
+        self.assertEqual(self.errors('replica', self.LOCAL), ['core.E001'])
+        self.assertEqual(self.errors('replica', self.SHARED), [])
+        self.assertEqual(self.errors('replica', self.LOCAL, debug=True), [])
+        self.assertEqual(self.errors(None, self.LOCAL), [])
+
+
+@unittest.skipUnless(settings.DATABASE_REPLICA, "No read replica configured")
+class TestReplicaReads(TransactionTestCase):
+    """Test analytics queries against the configured replica alias."""
+
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        DepartmentKPI.objects.create(college='공과대학', department='컴퓨터공학과', year=2024)
+
+    def test_analytics_reads_run_on_replica(self):
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            queryset = DashboardRepository().get_latest_kpi_data()
+            self.assertEqual(queryset.db, 'replica')
+            self.assertEqual(len(queryset), 1)
+
+        self.assertEqual(len(replica_queries), 2)
+
+    def test_other_reads_stay_on_primary(self):
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            UploadHistoryRepository().get_history_count()
+            DepartmentKPI.objects.count()
+
+        self.assertEqual(len(replica_queries), 0)
+
+    def test_pinned_reads_stay_on_primary(self):
+        with CaptureQueriesContext(connections['replica']) as replica_queries, pinned_to_primary():
+            self.assertEqual(len(DashboardRepository().get_latest_kpi_data()), 1)
+
+        self.assertEqual(len(replica_queries), 0)
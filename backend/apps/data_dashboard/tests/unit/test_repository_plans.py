@@ -0,0 +1,228 @@
+"""
+Repository query plan regression tests.
+Runs every repository read method against a seeded dataset and checks
+the EXPLAIN output of each query it issues.
+"""
+import inspect
+from datetime import date, datetime, timezone
+
+from django.test import TestCase
+
+from apps.users.models import User
+from apps.data_dashboard.infrastructure.repositories import (
+    DepartmentRepository,
+    DashboardRepository,
+    PerformanceRepository,
+    PapersAnalyticsRepository,
+    StudentRollupRepository,
+    BudgetRepository,
+    BudgetCubeRepository,
+    ResearchProjectRepository,
+    BudgetPartitionRepository,
+    DataUploadRepository,
+    UploadHistoryRepository,
+    RecordRepository
+)
+from apps.data_dashboard.models import Publication
+from apps.data_dashboard.tests import plans
+
+
+DEPARTMENT = plans.department_name(7)
+
+# (method, call, tables that must not be sequentially scanned)
+PLAN_CASES = [
+    # The dimension is small and loaded whole
+    (DepartmentRepository.get_key,
+     lambda: DepartmentRepository().get_key(DEPARTMENT),
+     set()),
+    (DepartmentRepository.get_canonical_name,
+     lambda: DepartmentRepository().get_canonical_name(DEPARTMENT),
+     set()),
+    (DepartmentRepository.get_names,
+     lambda: DepartmentRepository().get_names(),
+     set()),
+    (DepartmentRepository.get_departments,
+     lambda: DepartmentRepository().get_departments(college='공과대학'),
+     set()),
+    (DepartmentRepository.filter_by_name,
+     lambda: DepartmentRepository().filter_by_name(DEPARTMENT),
+     set()),
+    (DashboardRepository.get_latest_kpi_year,
+     lambda: DashboardRepository().get_latest_kpi_year(),
+     {'department_kpis'}),
+    (DashboardRepository.get_latest_kpi_data,
+     lambda: list(DashboardRepository().get_latest_kpi_data()),
+     {'department_kpis'}),
+    (DashboardRepository.get_publication_count_current_year,
+     lambda: DashboardRepository().get_publication_count_current_year(),
+     {'publications'}),
+    (DashboardRepository.get_active_student_count,
+     lambda: DashboardRepository().get_active_student_count(),
+     {'students'}),
+    # Whole-table totals: a full scan is the expected plan
+    (DashboardRepository.get_budget_summary,
+     lambda: DashboardRepository().get_budget_summary(),
+     set()),
+    (DashboardRepository.get_yearly_trends,
+     lambda: list(DashboardRepository().get_yearly_trends(2020, 2021)),
+     {'department_kpis'}),
+    (DashboardRepository.get_department_performance,
+     lambda: list(DashboardRepository().get_department_performance(2020)),
+     {'department_kpis'}),
+    (DashboardRepository.get_budget_allocation,
+     lambda: list(DashboardRepository().get_budget_allocation()),
+     set()),
+    (PerformanceRepository.get_performance_trend,
+     lambda: PerformanceRepository().get_performance_trend(
+         date(2020, 1, 1), date(2020, 12, 31), department=DEPARTMENT),
+     {'department_kpis'}),
+    (PerformanceRepository.get_department_comparison,
+     lambda: PerformanceRepository().get_department_comparison(
+         date(2020, 1, 1), date(2020, 12, 31)),
+     {'department_kpis'}),
+    (PerformanceRepository.get_achievement_rate,
+     lambda: PerformanceRepository().get_achievement_rate(
+         date(2020, 1, 1), date(2020, 12, 31), department=DEPARTMENT),
+     {'department_kpis'}),
+    (PapersAnalyticsRepository.get_yearly_data,
+     lambda: PapersAnalyticsRepository().get_yearly_data(year=2020, journal_grade='sci'),
+     {'publications'}),
+    (PapersAnalyticsRepository.get_journal_distribution,
+     lambda: PapersAnalyticsRepository('exact').get_journal_distribution(field=DEPARTMENT),
+     {'publications'}),
+    (PapersAnalyticsRepository.get_field_statistics,
+     lambda: PapersAnalyticsRepository().get_field_statistics(year=2020),
+     {'publications'}),
+    (StudentRollupRepository.get_cells,
+     lambda: StudentRollupRepository().get_cells(department=DEPARTMENT, grade=1),
+     {'student_rollup'}),
+    (BudgetRepository.get_budget_by_department,
+     lambda: BudgetRepository().get_budget_by_department(year=2020),
+     {'budget_cube'}),
+    (BudgetRepository.get_execution_by_department,
+     lambda: BudgetRepository().get_execution_by_department(
+         department=DEPARTMENT, start_date=date(2020, 1, 1), end_date=date(2020, 6, 30)),
+     {'budget_cube'}),
+    (BudgetRepository._get_execution_from_rows,
+     lambda: BudgetRepository()._get_execution_from_rows(
+         department=DEPARTMENT, start_date=date(2020, 1, 15), end_date=date(2020, 6, 15)),
+     {'research_budget_data'}),
+    (BudgetRepository.get_yearly_trends,
+     lambda: BudgetRepository().get_yearly_trends(department=DEPARTMENT),
+     {'budget_cube'}),
+    (BudgetCubeRepository.get_slices,
+     lambda: BudgetCubeRepository().get_slices(['EXE-1', 'EXE-2']),
+     {'research_budget_data'}),
+    (ResearchProjectRepository.get_project_numbers,
+     lambda: ResearchProjectRepository().get_project_numbers(['EXE-1', 'EXE-2']),
+     {'research_budget_data'}),
+    (ResearchProjectRepository.get_project_numbers_in_year,
+     lambda: ResearchProjectRepository().get_project_numbers_in_year(2020),
+     {'research_budget_data'}),
+    # Catalog lookup
+    (BudgetPartitionRepository.get_years,
+     lambda: BudgetPartitionRepository().get_years(),
+     set()),
+    (DataUploadRepository.count_records,
+     lambda: DataUploadRepository().count_records(
+         Publication, {'publication_date__gte': date(2024, 12, 1)}),
+     {'publications'}),
+    (UploadHistoryRepository.get_history_list,
+     lambda: UploadHistoryRepository().get_history_list(
+         (datetime(2020, 1, 2, tzinfo=timezone.utc), 1000)),
+     {'upload_history'}),
+    (UploadHistoryRepository.get_history_by_user,
+     lambda: UploadHistoryRepository().get_history_by_user(
+         User.objects.get(username='owner').id,
+         (datetime(2020, 1, 2, tzinfo=timezone.utc), 1000), backwards=True),
+     {'upload_history'}),
+    # Raw-record pages seek past the previous page's id
+    (RecordRepository.get_rows,
+     lambda: list(RecordRepository('students').get_rows(
+         ['id', 'student_id'], {'department': DEPARTMENT, 'enrollment_status': '휴학'}, after=1000)),
+     {'students'}),
+    (RecordRepository.get_rows,
+     lambda: list(RecordRepository('publications').get_rows(
+         ['id', 'title'], {'year': '2020'}, after=1000)),
+     {'publications'}),
+    (RecordRepository.get_rows,
+     lambda: list(RecordRepository('budget').get_rows(
+         ['id', 'execution_id'], {'date_from': '2020-03-01', 'date_to': '2020-03-31'}, after=1000)),
+     {'research_budget_data'}),
+]
+
+# Methods that write, lock, issue no query, or only maintain derived tables wholesale
+UNPLANNED_METHODS = {
+    DepartmentRepository.resolve,
+    BudgetCubeRepository.refresh_slices,
+    BudgetCubeRepository.delete_year,
+    BudgetCubeRepository.rebuild,
+    StudentRollupRepository.rebuild,
+    ResearchProjectRepository.refresh_projects,
+    ResearchProjectRepository.rebuild,
+    BudgetPartitionRepository.partition_name,
+    BudgetPartitionRepository.ensure_years,
+    BudgetPartitionRepository.detach_year,
+    DataUploadRepository.lock_execution_ids,
+    DataUploadRepository.bulk_upsert,
+    UploadHistoryRepository.create_history,
+    UploadHistoryRepository.get_history_count,
+}
+
+REPOSITORIES = [
+    DepartmentRepository,
+    DashboardRepository,
+    PerformanceRepository,
+    PapersAnalyticsRepository,
+    StudentRollupRepository,
+    BudgetRepository,
+    BudgetCubeRepository,
+    ResearchProjectRepository,
+    BudgetPartitionRepository,
+    DataUploadRepository,
+    UploadHistoryRepository,
+    RecordRepository,
+]
+
+
+class TestRepositoryPlans(TestCase):
+    """Test that repository queries keep their index-backed plans."""
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create_user(username='owner', clerk_id='user_owner')
+        other = User.objects.create_user(username='other', clerk_id='user_other')
+
+        plans.seed_kpis()
+        plans.seed_publications()
+        plans.seed_students()
+        plans.seed_budget_rows()
+        plans.seed_budget_cube()
+        plans.seed_research_projects()
+        plans.seed_upload_history(owner, other)
+
+    def test_every_read_method_has_a_plan_case(self):
+        """New repository methods must come with a plan case."""
+        planned = {method for method, _, _ in PLAN_CASES} | UNPLANNED_METHODS
+        missing = [
+            f"{repository.__name__}.{name}"
+            for repository in REPOSITORIES
+            for name, method in inspect.getmembers(repository, inspect.isfunction)
+            if not name.startswith('_') and method not in planned
+        ]
+
+        self.assertEqual(missing, [])
+
+    def test_repository_plans(self):
+        """No plan sequentially scans a table its method should reach by index."""
+        for method, call, indexed_tables in PLAN_CASES:
+            with self.subTest(method=method.__qualname__):
+                with plans.capture_plans() as captured:
+                    call()
+
+                self.assertTrue(captured)
+                self.assertEqual(
+                    plans.seq_scanned_tables(captured) & indexed_tables,
+                    set(),
+                    "\n\n".join(captured)
+                )
@@ -0,0 +1,117 @@
+"""
+Unit tests for the research_projects dimension.
+Tests ingest maintenance and project-based budget totals.
+"""
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.data_dashboard.models import ResearchProject
+from apps.data_dashboard.infrastructure.repositories import (
+    DashboardRepository,
+    BudgetCubeRepository,
+    DataUploadRepository,
+    ResearchProjectRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.tests.unit.test_budget_cube import make_execution
+from core import response_cache
+
+
+class TestResearchProjectMaintenance(TestCase):
+    """Test that ingest keeps research_projects in sync with execution rows."""
+
+    def setUp(self):
+        self.project_repository = ResearchProjectRepository()
+        self.service = DataProcessingService(
+            DataUploadRepository(),
+            budget_cube_repository=BudgetCubeRepository(),
+            project_repository=self.project_repository
+        )
+
+    def test_one_row_per_project(self):
+        """Executions of the same project share one project row."""
+        self.service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_date='2024-04-01'),
+            make_execution('E3', project_number='P-002', total_budget=500),
+        ])
+
+        projects = list(ResearchProject.objects.values_list('project_number', 'total_budget'))
+        self.assertEqual(projects, [('P-001', 1000), ('P-002', 500)])
+
+    def test_latest_execution_sets_budget(self):
+        """A lowered budget on a later execution replaces the old one."""
+        self.service.process_research_budget([make_execution('E1')])
+        self.service.process_research_budget([
+            make_execution('E2', execution_date='2024-05-01', total_budget=800,
+                           principal_investigator='김철수'),
+        ])
+
+        project = ResearchProject.objects.get(project_number='P-001')
+        self.assertEqual(project.total_budget, 800)
+        self.assertEqual(project.principal_investigator, '김철수')
+
+    def test_moved_execution_removes_empty_project(self):
+        """A project whose only execution moves away is deleted."""
+        self.service.process_research_budget([make_execution('E1')])
+        self.service.process_research_budget([make_execution('E1', project_number='P-009')])
+
+        self.assertEqual(
+            list(ResearchProject.objects.values_list('project_number', flat=True)),
+            ['P-009']
+        )
+
+    def test_rebuild_matches_incremental(self):
+        """A full rebuild produces the same projects as incremental maintenance."""
+        self.service.process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', project_number='P-002', department='전자공학과'),
+        ])
+        fields = ('project_number', 'department', 'total_budget')
+        incremental = list(ResearchProject.objects.values_list(*fields))
+
+        self.project_repository.rebuild()
+
+        self.assertEqual(list(ResearchProject.objects.values_list(*fields)), incremental)
+
+    def test_rebuild_command_invalidates_cached_responses(self):
+        version = response_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_research_projects', stdout=io.StringIO())
+
+        self.assertEqual(response_cache.get_version(), version + 1)
+
+
+class TestProjectBasedBudgetTotals(TestCase):
+    """Test dashboard budget totals computed over research_projects."""
+
+    def setUp(self):
+        DataProcessingService(
+            DataUploadRepository(),
+            project_repository=ResearchProjectRepository()
+        ).process_research_budget([
+            make_execution('E1'),
+            make_execution('E2', execution_amount=50, status='처리중'),
+            make_execution('E3', project_number='P-002'),
+            make_execution('E4', project_number='P-003', department='전자공학과',
+                           total_budget=700),
+        ])
+        self.repository = DashboardRepository()
+
+    def test_budget_summary_counts_equal_budgets_separately(self):
+        """Two projects with the same budget are both counted."""
+        summary = self.repository.get_budget_summary()
+
+        self.assertEqual(summary, {'total_budget': 2700, 'executed_amount': 300})
+
+    def test_budget_allocation(self):
+        """Allocation sums project budgets per department."""
+        allocation = self.repository.get_budget_allocation()
+
+        self.assertEqual(allocation, [
+            {'department': '컴퓨터공학과', 'total_budget': 2000, 'executed_amount': 250},
+            {'department': '전자공학과', 'total_budget': 700, 'executed_amount': 100},
+        ])
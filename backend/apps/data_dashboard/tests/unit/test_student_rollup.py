@@ -0,0 +1,109 @@
+"""
+Unit tests for the student rollup.
+Tests rollup maintenance on roster ingest and rollup-backed analytics.
+"""
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.data_dashboard.models import StudentRollup, EnrollmentStatus, Gender
+from apps.data_dashboard.infrastructure.repositories import (
+    DataUploadRepository,
+    StudentRollupRepository
+)
+from apps.data_dashboard.domain.services import DataProcessingService
+from apps.data_dashboard.application.use_cases import GetStudentsAnalyticsUseCase
+from core import response_cache
+from core.exceptions import ValidationError
+
+
+def make_student(student_id, **overrides):
+    """Build an ingest row for students."""
+    row = {
+        'student_id': student_id,
+        'name': '홍길동',
+        'college': '공과대학',
+        'department': '컴퓨터공학과',
+        'grade': 1,
+        'program_type': '학사',
+        'enrollment_status': '재학',
+        'gender': '남',
+        'admission_year': 2023,
+        'advisor': None,
+        'email': None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestStudentRollupAnalytics(TestCase):
+    """Test student analytics answered from the rollup."""
+
+    def setUp(self):
+        service = DataProcessingService(
+            DataUploadRepository(),
+            student_rollup_repository=StudentRollupRepository()
+        )
+        service.process_student([
+            make_student('S1'),
+            make_student('S2', gender='여'),
+            make_student('S3', grade=2, admission_year=2022),
+            make_student('S4', department='전자공학과', admission_year=2022, grade=2),
+            make_student('S5', enrollment_status='휴학'),
+        ])
+        self.use_case = GetStudentsAnalyticsUseCase()
+
+    def test_ingest_rebuilds_rollup(self):
+        """Students with identical dimensions share one rollup row."""
+        self.assertEqual(StudentRollup.objects.count(), 5)
+        cell = StudentRollup.objects.get(
+            department='컴퓨터공학과', grade=1, enrollment_status=EnrollmentStatus.ENROLLED, gender=Gender.MALE
+        )
+        self.assertEqual(cell.student_count, 1)
+
+    def test_no_filters(self):
+        """Unfiltered analytics count active students only."""
+        result = self.use_case.execute({})
+
+        self.assertEqual(result['total_students'], 4)
+        self.assertEqual(result['department_stats'], [
+            {'department': '컴퓨터공학과', 'count': 3},
+            {'department': '전자공학과', 'count': 1},
+        ])
+        self.assertEqual(result['enrollment_trend'], [
+            {'admission_year': 2022, 'total': 2, 'enrolled': 2},
+            {'admission_year': 2023, 'total': 3, 'enrolled': 2},
+        ])
+
+    def test_filters_apply_to_breakdowns(self):
+        """Department and grade breakdowns respect the passed filters."""
+        result = self.use_case.execute({'grade': '2', 'year': '2022'})
+
+        self.assertEqual(result['total_students'], 2)
+        self.assertEqual(len(result['department_stats']), 2)
+        self.assertEqual(result['grade_distribution'], [{'grade': 2, 'count': 2}])
+        self.assertEqual(result['enrollment_trend'], [
+            {'admission_year': 2022, 'total': 2, 'enrolled': 2},
+        ])
+
+    def test_breakdowns_sum_to_total(self):
+        """Every breakdown is derived from the same cells."""
+        result = self.use_case.execute({'department': '컴퓨터공학과', 'year': '2023'})
+
+        self.assertEqual(result['total_students'], 2)
+        self.assertEqual(sum(d['count'] for d in result['department_stats']), 2)
+        self.assertEqual(sum(g['count'] for g in result['grade_distribution']), 2)
+
+    def test_invalid_grade(self):
+        """Invalid grade filters raise ValidationError."""
+        with self.assertRaises(ValidationError):
+            self.use_case.execute({'grade': 'invalid'})
+
+    def test_rebuild_command_invalidates_cached_responses(self):
+        version = response_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_student_rollup', stdout=io.StringIO())
+
+        self.assertEqual(response_cache.get_version(), version + 1)
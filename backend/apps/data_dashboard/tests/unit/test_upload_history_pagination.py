@@ -0,0 +1,116 @@
+"""
+Unit tests for keyset pagination of the upload history.
+Tests paging both ways across timestamp ties, cursor validation and count modes.
+"""
+from datetime import datetime, timedelta, timezone
+
+from django.test import TestCase
+
+from apps.data_dashboard.application.use_cases import GetUploadHistoryUseCase
+from apps.data_dashboard.models import UploadHistory
+from apps.users.models import User
+from core.exceptions import ValidationError
+from core.pagination import decode_cursor, encode_cursor
+
+
+class UploadHistoryPaginationTestCase(TestCase):
+    """Base class with 25 uploads, sharing timestamps in groups of three."""
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', email='owner@example.com', clerk_id='owner')
+        self.other = User.objects.create(username='other', email='other@example.com', clerk_id='other')
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for index in range(25):
+            record = UploadHistory.objects.create(
+                user=self.owner if index % 5 else self.other,
+                file_name=f'upload_{index}.xlsx',
+                file_type='publication_list',
+                status='success'
+            )
+            # uploaded_at is auto_now_add, so set it afterwards
+            UploadHistory.objects.filter(id=record.id).update(uploaded_at=start + timedelta(hours=index // 3))
+
+        self.use_case = GetUploadHistoryUseCase()
+        self.expected = [
+            record.id for record in UploadHistory.objects.order_by('-uploaded_at', '-id')
+        ]
+
+    def page(self, cursor=None, user=None, **kwargs):
+        return self.use_case.execute(
+            user_id=(user or self.owner).id, cursor=cursor, page_size=4, is_admin=user is None, **kwargs
+        )
+
+
+class TestKeysetPaging(UploadHistoryPaginationTestCase):
+    """Test walking the history through next and prev cursors."""
+
+    def test_forward_covers_every_row_once(self):
+        pages, cursor = [], None
+        while True:
+            page = self.page(cursor)
+            pages.append(page)
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        ids = [row['id'] for page in pages for row in page['results']]
+        self.assertEqual(ids, self.expected)
+        self.assertIsNone(pages[0]['prev_cursor'])
+        self.assertTrue(all(page['prev_cursor'] for page in pages[1:]))
+
+    def test_backward_returns_previous_pages(self):
+        first = self.page()
+        second = self.page(first['next_cursor'])
+        third = self.page(second['next_cursor'])
+
+        back = self.page(third['prev_cursor'])
+        self.assertEqual(back['results'], second['results'])
+        self.assertEqual(back['next_cursor'], second['next_cursor'])
+
+        back = self.page(back['prev_cursor'])
+        self.assertEqual(back['results'], first['results'])
+        self.assertIsNone(back['prev_cursor'])
+
+    def test_non_admin_sees_own_uploads(self):
+        ids, cursor = [], None
+        while True:
+            page = self.page(cursor, user=self.owner)
+            ids += [row['id'] for row in page['results']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        owned = set(UploadHistory.objects.filter(user=self.owner).values_list('id', flat=True))
+        self.assertEqual(ids, [record_id for record_id in self.expected if record_id in owned])
+
+
+class TestCursorsAndCounts(UploadHistoryPaginationTestCase):
+    """Test cursor validation and the count modes."""
+
+    def test_invalid_cursors_are_rejected(self):
+        for cursor in ['not a cursor', encode_cursor({'id': 1}), encode_cursor({'uploaded_at': 'x', 'id': 1})]:
+            with self.subTest(cursor=cursor), self.assertRaises(ValidationError):
+                self.page(cursor)
+
+        with self.assertRaises(ValidationError):
+            decode_cursor(encode_cursor([1, 2]))
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        response = self.client.get('/api/dashboard/upload/history/', {'cursor': '!!'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'VALIDATION_ERROR')
+
+    def test_count_modes(self):
+        exact = self.page(count='exact')
+        estimated = self.page(count='estimated')
+        skipped = self.page(count='none')
+
+        self.assertEqual(exact['total'], 25)
+        self.assertFalse(exact['total_is_estimate'])
+        self.assertIsInstance(estimated['total'], int)
+        self.assertTrue(estimated['total_is_estimate'])
+        self.assertIsNone(skipped['total'])
+        self.assertEqual(self.page(user=self.owner, count='exact')['total'], 20)
+        with self.assertRaises(ValidationError):
+            self.page(count='approximate')
@@ -0,0 +1,61 @@
+"""
+Unit tests for the columnar budget and performance calculations.
+Tests that they return exactly what the per-row implementations returned.
+"""
+from decimal import Decimal
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from apps.data_dashboard.management.commands.benchmark_services import get_cases, make_rows
+from utils.vectorized import rates, round_decimals, round_floats
+
+
+class TestRounding(SimpleTestCase):
+    """Test that array rounding matches per-value rounding on ties."""
+
+    # Decimal ties (x.xx5) and values whose binary form sits just off a tie
+    VALUES = [0.125, 0.375, 1.005, 2.675, 2.665, 10.245, 99.995, 0.0, 100.0, 12.3456, 1e-9] * 10
+
+    def test_decimals(self):
+        expected = [round(Decimal(str(value)), 2) for value in self.VALUES]
+
+        result = round_decimals(np.array(self.VALUES))
+
+        self.assertEqual(result, expected)
+        self.assertEqual([str(d) for d in result], [str(d) for d in expected])
+
+    def test_floats(self):
+        self.assertEqual(round_floats(np.array(self.VALUES)), [round(value, 2) for value in self.VALUES])
+
+    def test_rates_of_non_positive_denominators_are_zero(self):
+        self.assertEqual(rates([5, 5, 5], [10, 0, -1]).tolist(), [50.0, 0.0, 0.0])
+
+
+class TestColumnarServices(SimpleTestCase):
+    """Test the services against the per-row reference implementations."""
+
+    def assert_cases_match(self, rows):
+        for name, loop, columnar in get_cases(rows):
+            with self.subTest(name, rows=len(rows)):
+                self.assertEqual(columnar(), loop())
+
+    def test_random_rows(self):
+        for size, seed in [(0, 0), (1, 1), (10, 2), (500, 3), (5000, 4)]:
+            self.assert_cases_match(make_rows(size, seed))
+
+    def test_rates_on_ties(self):
+        rows = make_rows(200)
+        for index, row in enumerate(rows):
+            row['total_budget'] = 100000
+            row['executed_amount'] = 2675 + 1000 * (index % 100)
+
+        self.assert_cases_match(rows)
+
+    def test_zero_totals(self):
+        rows = [
+            {'department': '컴퓨터공학과', 'total_budget': 0, 'executed_amount': 0,
+             'project_count': 0, 'year': 2024, 'value': 0}
+        ] * 100
+
+        self.assert_cases_match(rows)
@@ -2,7 +2,7 @@
 Django admin configuration for users app.
 """
 from django.contrib import admin
-from .models import User
+from .models import ClerkWebhookEvent, User
 
 
 @admin.register(User)
@@ -11,3 +11,11 @@ class UserAdmin(admin.ModelAdmin):
     list_filter = ('role', 'is_active')
     search_fields = ('email', 'clerk_id', 'first_name', 'last_name')
     readonly_fields = ('clerk_id', 'date_joined', 'last_login')
+
+
+@admin.register(ClerkWebhookEvent)
+class ClerkWebhookEventAdmin(admin.ModelAdmin):
+    list_display = ('svix_id', 'event_type', 'received_at', 'processed_at', 'error_message')
+    list_filter = ('event_type',)
+    search_fields = ('svix_id',)
+    readonly_fields = ('svix_id', 'event_type', 'payload', 'received_at', 'processed_at', 'error_message')
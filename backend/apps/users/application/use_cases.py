@@ -4,12 +4,70 @@ Following the common-modules.md specification.
 Implements application layer logic for user operations.
 """
 import logging
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from core import clerk_auth, metrics
 from ..domain.services import UserService
-from ..infrastructure.repositories import UserRepository
+from ..infrastructure.repositories import ClerkWebhookEventRepository, UserRepository
 
 logger = logging.getLogger(__name__)
 
 
+HANDLED_EVENTS = ('user.created', 'user.updated', 'user.deleted')
+
+
+def parse_user_event(event_type: str, event_data: dict):
+    """
+    Extract the user fields of a Clerk webhook event.
+
+    Args:
+        event_type: Type of Clerk event
+        event_data: Event data from Clerk webhook
+
+    Returns:
+        tuple: (clerk_id, email, first_name, last_name)
+
+    Raises:
+        ValueError: If required event data is missing
+    """
+    # Extract user data from event
+    clerk_id = event_data.get('id')
+    email_addresses = event_data.get('email_addresses', [])
+
+    # Try to get email from email_addresses array or primary_email_address_id
+    email = None
+    if email_addresses and len(email_addresses) > 0:
+        # Handle both dict format and potential nested structure
+        if isinstance(email_addresses[0], dict):
+            email = email_addresses[0].get('email_address')
+        elif isinstance(email_addresses[0], str):
+            email = email_addresses[0]
+
+    # Fallback to other possible email fields
+    if not email:
+        email = event_data.get('email') or event_data.get('primary_email_address')
+
+    first_name = event_data.get('first_name')
+    last_name = event_data.get('last_name')
+
+    # Log event data for debugging
+    logger.info(f"Processing {event_type} event - clerk_id: {clerk_id}, email: {email}")
+
+    # Validate required fields
+    if not clerk_id:
+        error_msg = f"Invalid Clerk webhook event data: missing clerk_id for type {event_type}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    # For test events, use placeholder email if none provided
+    if not email:
+        logger.warning(f"No email found in {event_type} event, using placeholder")
+        email = f"test-{clerk_id}@clerk-webhook-test.com"
+
+    return clerk_id, email, first_name, last_name
+
+
 class UserWebhookUseCase:
     """
     Use case for handling Clerk webhook events.
@@ -17,62 +75,64 @@ class UserWebhookUseCase:
     Follows SRP by handling only webhook event processing.
     """
 
-    def __init__(self, user_service: UserService = None, user_repository: UserRepository = None):
+    def __init__(self, user_service: UserService = None, user_repository: UserRepository = None,
+                 event_repository: ClerkWebhookEventRepository = None):
         """
         Initialize UserWebhookUseCase with dependency injection.
 
         Args:
             user_service: UserService instance (DIP compliance)
             user_repository: UserRepository instance (DIP compliance)
+            event_repository: ClerkWebhookEventRepository instance (DIP compliance)
         """
         self.user_repository = user_repository or UserRepository()
         self.user_service = user_service or UserService(self.user_repository)
+        self.event_repository = event_repository or ClerkWebhookEventRepository()
 
-    def handle_event(self, event_type: str, event_data: dict):
+    def enqueue_event(self, svix_id: str, event_type: str, event_data: dict):
         """
-        Handle Clerk webhook event.
-        Orchestrates the appropriate service method based on event type.
+        Queue a Clerk webhook event for ProcessWebhookEventsUseCase.
+        Redelivered events (same Svix message ID) are queued only once.
 
         Args:
-            event_type: Type of Clerk event (e.g., 'user.created', 'user.updated', 'user.deleted')
+            svix_id: Svix message ID
+            event_type: Type of Clerk event
             event_data: Event data from Clerk webhook
 
+        Returns:
+            str: 'queued', 'duplicate', or 'ignored' for unhandled event types
+
         Raises:
             ValueError: If required event data is missing
         """
-        # Extract user data from event
-        clerk_id = event_data.get('id')
-        email_addresses = event_data.get('email_addresses', [])
+        if event_type not in HANDLED_EVENTS:
+            logger.warning(f"Unhandled Clerk webhook event type: {event_type}")
+            return 'ignored'
 
-        # Try to get email from email_addresses array or primary_email_address_id
-        email = None
-        if email_addresses and len(email_addresses) > 0:
-            # Handle both dict format and potential nested structure
-            if isinstance(email_addresses[0], dict):
-                email = email_addresses[0].get('email_address')
-            elif isinstance(email_addresses[0], str):
-                email = email_addresses[0]
+        # Reject malformed events now, while Clerk is still listening
+        parse_user_event(event_type, event_data)
 
-        # Fallback to other possible email fields
-        if not email:
-            email = event_data.get('email') or event_data.get('primary_email_address')
+        if not self.event_repository.add_event(svix_id, event_type, event_data):
+            logger.info(f"Clerk webhook event {svix_id} was already received")
+            return 'duplicate'
 
-        first_name = event_data.get('first_name')
-        last_name = event_data.get('last_name')
+        from .webhook_worker import wake
+        transaction.on_commit(wake)
+        return 'queued'
 
-        # Log event data for debugging
-        logger.info(f"Processing {event_type} event - clerk_id: {clerk_id}, email: {email}")
+    def handle_event(self, event_type: str, event_data: dict):
+        """
+        Handle Clerk webhook event.
+        Orchestrates the appropriate service method based on event type.
 
-        # Validate required fields
-        if not clerk_id:
-            error_msg = f"Invalid Clerk webhook event data: missing clerk_id for type {event_type}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        Args:
+            event_type: Type of Clerk event (e.g., 'user.created', 'user.updated', 'user.deleted')
+            event_data: Event data from Clerk webhook
 
-        # For test events, use placeholder email if none provided
-        if not email:
-            logger.warning(f"No email found in {event_type} event, using placeholder")
-            email = f"test-{clerk_id}@clerk-webhook-test.com"
+        Raises:
+            ValueError: If required event data is missing
+        """
+        clerk_id, email, first_name, last_name = parse_user_event(event_type, event_data)
 
         # Route to appropriate handler
         if event_type == 'user.created':
@@ -83,6 +143,10 @@ class UserWebhookUseCase:
             self._handle_user_deleted(clerk_id)
         else:
             logger.warning(f"Unhandled Clerk webhook event type: {event_type}")
+            return
+
+        # Authentication caches users per worker
+        clerk_auth.invalidate_users()
 
     def _handle_user_created(self, clerk_id: str, email: str,
                              first_name: str = None, last_name: str = None):
@@ -143,3 +207,91 @@ class UserWebhookUseCase:
         except Exception as e:
             logger.error(f"Error handling user.deleted event for clerk_id {clerk_id}: {e}", exc_info=True)
             raise
+
+
+class ProcessWebhookEventsUseCase:
+    """
+    Use case for applying queued Clerk webhook events.
+    Events are applied in batches of arrival order. Each batch is folded
+    into the latest state of every user it touches and written with bulk
+    upserts and deletes; if that fails, the batch's events are applied one
+    by one so a single bad event cannot block the queue.
+    """
+
+    def __init__(self, event_repository: ClerkWebhookEventRepository = None,
+                 webhook_use_case: UserWebhookUseCase = None):
+        """
+        Initialize ProcessWebhookEventsUseCase with dependency injection.
+
+        Args:
+            event_repository: ClerkWebhookEventRepository instance (DIP compliance)
+            webhook_use_case: UserWebhookUseCase applying single events (DIP compliance)
+        """
+        self.event_repository = event_repository or ClerkWebhookEventRepository()
+        self.webhook_use_case = webhook_use_case or UserWebhookUseCase(event_repository=self.event_repository)
+        self.user_service = self.webhook_use_case.user_service
+
+    def execute(self, batch_size: int = None):
+        """
+        Apply queued events until the queue is empty.
+
+        Args:
+            batch_size: Events per batch (default: settings.CLERK_WEBHOOK_BATCH_SIZE)
+
+        Returns:
+            int: Number of events processed
+        """
+        batch_size = batch_size or settings.CLERK_WEBHOOK_BATCH_SIZE
+        processed = 0
+
+        while True:
+            with transaction.atomic():
+                self.event_repository.lock_queue()
+                events = self.event_repository.get_queued(batch_size)
+                if events:
+                    self._apply(events)
+                    self.event_repository.mark_processed(events)
+
+            if not events:
+                break
+            processed += len(events)
+            # Authentication caches users per worker
+            clerk_auth.invalidate_users()
+            if len(events) < batch_size:
+                break
+            metrics.QUEUE_DEPTH.set(self.event_repository.count_queued(), queue='clerk_webhooks')
+
+        metrics.QUEUE_DEPTH.set(0, queue='clerk_webhooks')
+        if processed:
+            logger.info(f"Processed {processed} Clerk webhook events")
+        return processed
+
+    def _apply(self, events):
+        """Apply a batch of events, setting error_message on those that fail."""
+        changes = {}
+        for event in events:
+            try:
+                clerk_id, email, first_name, last_name = parse_user_event(event.event_type, event.payload)
+            except ValueError as e:
+                event.error_message = str(e)
+                continue
+            # Later events of a user replace earlier ones
+            changes[clerk_id] = None if event.event_type == 'user.deleted' else {
+                'email': email, 'first_name': first_name, 'last_name': last_name
+            }
+
+        try:
+            self.user_service.sync_users_from_clerk(changes)
+            return
+        except (IntegrityError, ValueError) as e:
+            logger.warning(f"Batch of {len(events)} Clerk webhook events failed, applying one by one: {e}")
+
+        for event in events:
+            if event.error_message:
+                continue
+            try:
+                with transaction.atomic():
+                    self.webhook_use_case.handle_event(event.event_type, event.payload)
+            except Exception as e:
+                logger.error(f"Error applying Clerk webhook event {event.svix_id}: {e}")
+                event.error_message = str(e)
@@ -0,0 +1,69 @@
+"""
+Background application of queued Clerk webhook events.
+
+Each web worker process runs one daemon thread, started on the process's
+first request (start() is connected to request_started) or first wake().
+Threads do not survive a fork, so the start is checked against the process
+ID, as for the JWKS refresher, and works with gunicorn --preload. The
+thread applies the queue right away, so events left behind by stopped
+processes are picked up after a restart, then whenever it is woken after a
+new event is committed, and every CLERK_WEBHOOK_POLL_SECONDS. With
+CLERK_WEBHOOK_WORKER off, events wait for the process_clerk_webhooks
+management command instead.
+"""
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import connections
+
+from .use_cases import ProcessWebhookEventsUseCase
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_wakeup = threading.Event()
+_worker_pid = None
+
+
+def start(**kwargs):
+    """Start this process's worker thread unless running; a request_started receiver."""
+    if settings.CLERK_WEBHOOK_WORKER:
+        _start()
+
+
+def wake():
+    """Have this process's worker thread apply the queue, starting it if needed."""
+    if not settings.CLERK_WEBHOOK_WORKER:
+        return
+    _start()
+    _wakeup.set()
+
+
+def _start():
+    """Start this process's worker thread; threads do not survive a fork."""
+    global _worker_pid
+    pid = os.getpid()
+    if _worker_pid == pid:
+        return
+
+    with _lock:
+        if _worker_pid == pid:
+            return
+        _worker_pid = pid
+
+    threading.Thread(target=_run, name='clerk-webhooks', daemon=True).start()
+
+
+def _run():
+    while True:
+        try:
+            ProcessWebhookEventsUseCase().execute()
+        except Exception as e:
+            logger.error(f"Error applying queued Clerk webhook events: {e}", exc_info=True)
+        finally:
+            connections.close_all()
+
+        _wakeup.wait(settings.CLERK_WEBHOOK_POLL_SECONDS)
+        _wakeup.clear()
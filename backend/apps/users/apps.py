@@ -8,3 +8,9 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
     label = 'users'
+
+    def ready(self):
+        from django.core.signals import request_started
+        from .application import webhook_worker
+
+        request_started.connect(webhook_worker.start, dispatch_uid='clerk_webhook_worker')
@@ -117,6 +117,37 @@ class UserService:
         else:
             logger.warning(f"User with clerk_id {clerk_id} not found for deletion.")
 
+    @transaction.atomic
+    def sync_users_from_clerk(self, changes: dict):
+        """
+        Apply the latest Clerk state of several users at once.
+        Business logic: Upsert changed users and delete deleted ones in bulk,
+        running the same post-creation and pre-deletion logic as single events.
+
+        Args:
+            changes: Clerk user ID -> dict with email, first_name and
+                last_name, or None if the user was deleted
+
+        Raises:
+            IntegrityError: If a new user's username is taken; nothing is applied
+        """
+        existing = self.user_repository.get_by_clerk_ids(changes)
+        upserts = [{'clerk_id': clerk_id, **fields} for clerk_id, fields in changes.items() if fields is not None]
+        deleted = [clerk_id for clerk_id, fields in changes.items() if fields is None]
+
+        if upserts:
+            self.user_repository.upsert_users(upserts)
+            created = [row['clerk_id'] for row in upserts if row['clerk_id'] not in existing]
+            if created:
+                for user in self.user_repository.get_by_clerk_ids(created).values():
+                    self._on_user_created(user)
+
+        deleted = [clerk_id for clerk_id in deleted if clerk_id in existing]
+        if deleted:
+            for clerk_id in deleted:
+                self._on_user_deleted(existing[clerk_id])
+            self.user_repository.delete_by_clerk_ids(deleted)
+
     def _on_user_created(self, user):
         """
         Business logic to execute after user creation.
@@ -23,6 +23,8 @@ def clerk_webhook_handler(request):
 
     This endpoint receives events from Clerk when user-related
     actions occur (user.created, user.updated, user.deleted).
+    Events are queued, keyed by their svix-id so Svix retries are
+    no-ops, and acknowledged at once; a background worker applies them.
 
     Args:
         request: HTTP request from Clerk
@@ -72,14 +74,14 @@ def clerk_webhook_handler(request):
 
     logger.info(f"Received Clerk webhook event: {event_type}")
 
-    # Process event using use case
+    # Queue the event; it is applied in the background
     try:
         use_case = UserWebhookUseCase()
-        use_case.handle_event(event_type, event_data)
+        status = use_case.enqueue_event(svix_id, event_type, event_data)
         return JsonResponse({
             "status": "success",
             "event_type": event_type,
-            "message": f"Event {event_type} processed successfully"
+            "message": f"Event {event_type} {status}"
         }, status=200)
 
     except ValueError as e:
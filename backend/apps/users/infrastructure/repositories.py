@@ -4,8 +4,12 @@ Following the common-modules.md specification.
 Implements Repository pattern for User model.
 """
 import logging
-from django.db import IntegrityError
+import zlib
+from django.db import IntegrityError, connection
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from ..models import ClerkWebhookEvent
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -126,6 +130,62 @@ class UserRepository:
         user.delete()
         logger.info(f"User deleted: {email} (Clerk ID: {clerk_id})")
 
+    def get_by_clerk_ids(self, clerk_ids):
+        """
+        Get the users with any of some Clerk IDs.
+
+        Args:
+            clerk_ids: Clerk user IDs
+
+        Returns:
+            dict: User objects by Clerk ID
+        """
+        return {user.clerk_id: user for user in User.objects.filter(clerk_id__in=list(clerk_ids))}
+
+    def upsert_users(self, rows):
+        """
+        Create or update users by Clerk ID in one statement.
+        New users get their email as username and the 'user' role; existing
+        users keep both.
+
+        Args:
+            rows (list): Dicts with clerk_id, email, first_name and last_name
+
+        Raises:
+            IntegrityError: If a new user's username is taken
+        """
+        User.objects.bulk_create(
+            [
+                User(
+                    clerk_id=row['clerk_id'],
+                    email=row['email'],
+                    username=row['email'],
+                    first_name=row['first_name'] or '',
+                    last_name=row['last_name'] or '',
+                    role='user'
+                )
+                for row in rows
+            ],
+            update_conflicts=True,
+            unique_fields=['clerk_id'],
+            update_fields=['email', 'first_name', 'last_name']
+        )
+        logger.info(f"Upserted {len(rows)} users")
+
+    def delete_by_clerk_ids(self, clerk_ids):
+        """
+        Delete the users with any of some Clerk IDs.
+
+        Args:
+            clerk_ids: Clerk user IDs
+
+        Returns:
+            int: Number of users deleted
+        """
+        count, _ = User.objects.filter(clerk_id__in=list(clerk_ids)).delete()
+        logger.info(f"Deleted {count} users by clerk_id")
+        return count
+
     def list_all_users(self):
         """
         List all users.
@@ -143,3 +203,87 @@ class UserRepository:
             QuerySet of admin users
         """
         return User.objects.filter(role='admin')
+
+
+class ClerkWebhookEventRepository:
+    """
+    Repository of queued Clerk webhook events.
+    The table is the queue: events wait with processed_at unset.
+    """
+
+    # Advisory lock key serializing the queue's consumers
+    LOCK_KEY = zlib.crc32(b'clerk_webhook_events')
+
+    def add_event(self, svix_id: str, event_type: str, payload: dict):
+        """
+        Queue an event unless its Svix message ID was seen before.
+
+        Args:
+            svix_id: Svix message ID
+            event_type: Clerk event type
+            payload: Event data from Clerk
+
+        Returns:
+            bool: Whether the event is new
+        """
+        _, created = ClerkWebhookEvent.objects.get_or_create(
+            svix_id=svix_id,
+            defaults={'event_type': event_type, 'payload': payload}
+        )
+        return created
+
+    def lock_queue(self):
+        """
+        Wait for the queue's lock, held until the current transaction ends.
+        Consumers take it for each batch, so batches apply in arrival order.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [self.LOCK_KEY])
+
+    def get_queued(self, limit: int):
+        """
+        Get the oldest queued events.
+
+        Args:
+            limit: Maximum number of events
+
+        Returns:
+            list: ClerkWebhookEvent objects in arrival order
+        """
+        return list(ClerkWebhookEvent.objects.filter(processed_at__isnull=True).order_by('id')[:limit])
+
+    def count_queued(self):
+        """
+        Count the queued events.
+
+        Returns:
+            int: Number of events waiting
+        """
+        return ClerkWebhookEvent.objects.filter(processed_at__isnull=True).count()
+
+    def mark_processed(self, events):
+        """
+        Mark events as applied, with the error_message set on each event.
+
+        Args:
+            events: ClerkWebhookEvent objects
+        """
+        now = timezone.now()
+        for event in events:
+            event.processed_at = now
+        ClerkWebhookEvent.objects.bulk_update(events, ['processed_at', 'error_message'])
+
+    def delete_processed_before(self, cutoff):
+        """
+        Delete applied events received before a time.
+
+        Args:
+            cutoff: datetime
+
+        Returns:
+            int: Number of events deleted
+        """
+        count, _ = ClerkWebhookEvent.objects.filter(
+            processed_at__isnull=False, received_at__lt=cutoff
+        ).delete()
+        return count
@@ -0,0 +1,31 @@
+"""
+Management command to apply queued Clerk webhook events.
+Use when CLERK_WEBHOOK_WORKER is off, or to drain the queue after an outage.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.users.application.use_cases import ProcessWebhookEventsUseCase
+from apps.users.infrastructure.repositories import ClerkWebhookEventRepository
+
+
+class Command(BaseCommand):
+    help = 'Apply queued Clerk webhook events in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Events per batch (default: CLERK_WEBHOOK_BATCH_SIZE)')
+        parser.add_argument('--purge-days', type=int, default=None,
+                            help='Also delete applied events received more than this many days ago; '
+                                 'keep them longer than Svix retries deliveries')
+
+    def handle(self, *args, **options):
+        processed = ProcessWebhookEventsUseCase().execute(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} Clerk webhook events"))
+
+        if options['purge_days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['purge_days'])
+            deleted = ClerkWebhookEventRepository().delete_processed_before(cutoff)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} applied events"))
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClerkWebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('svix_id', models.CharField(help_text='Svix message ID (idempotency key)', max_length=255, unique=True)),
+                ('event_type', models.CharField(help_text='Clerk event type, e.g. user.created', max_length=50)),
+                ('payload', models.JSONField(help_text='Event data from Clerk')),
+                ('received_at', models.DateTimeField(auto_now_add=True, help_text='Receipt timestamp')),
+                ('processed_at', models.DateTimeField(blank=True, help_text='When the event was applied; null while queued', null=True)),
+                ('error_message', models.TextField(blank=True, help_text='Error message if the event could not be applied', null=True)),
+            ],
+            options={
+                'db_table': 'clerk_webhook_events',
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['id'], name='clerk_events_queued_idx')],
+            },
+        ),
+    ]
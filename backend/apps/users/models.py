@@ -4,6 +4,7 @@ Following the common-modules.md and database.md specifications.
 """
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Q
 
 
 class User(AbstractUser):
@@ -37,3 +38,50 @@ class User(AbstractUser):
     def is_admin(self):
         """Check if user has admin role"""
         return self.role == 'admin'
+
+
+class ClerkWebhookEvent(models.Model):
+    """
+    Clerk webhook event waiting to be applied, or already applied.
+    The Svix message ID makes redelivered events no-ops.
+    """
+    svix_id = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="Svix message ID (idempotency key)"
+    )
+    event_type = models.CharField(
+        max_length=50,
+        help_text="Clerk event type, e.g. user.created"
+    )
+    payload = models.JSONField(
+        help_text="Event data from Clerk"
+    )
+    received_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Receipt timestamp"
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the event was applied; null while queued"
+    )
+    error_message = models.TextField(
+        null=True,
+        blank=True,
+        help_text="Error message if the event could not be applied"
+    )
+
+    class Meta:
+        db_table = 'clerk_webhook_events'
+        indexes = [
+            # Queued events in arrival order
+            models.Index(
+                fields=['id'],
+                name='clerk_events_queued_idx',
+                condition=Q(processed_at__isnull=True)
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} ({self.svix_id})"
@@ -0,0 +1,210 @@
+"""
+Unit tests for queued Clerk webhook processing.
+Tests Svix idempotency, immediate acknowledgement, batched upserts and
+deletes, per-event fallback, arrival order and the background worker.
+"""
+import base64
+import io
+import json
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from svix.webhooks import Webhook
+
+from apps.users.application import webhook_worker
+from apps.users.application.use_cases import ProcessWebhookEventsUseCase
+from apps.users.infrastructure.repositories import ClerkWebhookEventRepository
+from apps.users.models import ClerkWebhookEvent, User
+
+SECRET = 'whsec_' + base64.b64encode(b'clerk-webhook-test-secret').decode()
+URL = '/api/users/webhooks/clerk/'
+
+
+def user_data(clerk_id, email=None, first_name='Gildong', last_name='Hong'):
+    return {
+        'id': clerk_id,
+        'email_addresses': [{'email_address': email or f'{clerk_id}@example.com'}],
+        'first_name': first_name,
+        'last_name': last_name,
+    }
+
+
+def queue(*events):
+    """Queue (event type, data) pairs with svix-ids evt_1, evt_2, ..."""
+    repository = ClerkWebhookEventRepository()
+    for number, (event_type, data) in enumerate(events, start=ClerkWebhookEvent.objects.count() + 1):
+        repository.add_event(f'evt_{number}', event_type, data)
+
+
+@override_settings(CLERK_WEBHOOK_SECRET=SECRET, CLERK_WEBHOOK_WORKER=False)
+class TestWebhookEndpoint(TestCase):
+    """Test that deliveries are verified, queued once and acknowledged."""
+
+    def deliver(self, svix_id, event_type, data, secret=SECRET):
+        body = json.dumps({'type': event_type, 'data': data})
+        now = datetime.now(tz=dt_timezone.utc)
+        return self.client.post(
+            URL, body, content_type='application/json',
+            HTTP_SVIX_ID=svix_id,
+            HTTP_SVIX_TIMESTAMP=str(int(now.timestamp())),
+            HTTP_SVIX_SIGNATURE=Webhook(secret).sign(svix_id, now, body)
+        )
+
+    def test_event_is_queued_not_applied(self):
+        with mock.patch.object(webhook_worker, 'wake') as wake, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.deliver('msg_1', 'user.created', user_data('user_a'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ClerkWebhookEvent.objects.get().svix_id, 'msg_1')
+        self.assertFalse(User.objects.filter(clerk_id='user_a').exists())
+        wake.assert_called_once()
+
+    def test_retries_are_queued_once(self):
+        for _ in range(3):
+            self.assertEqual(self.deliver('msg_1', 'user.created', user_data('user_a')).status_code, 200)
+
+        self.assertEqual(ClerkWebhookEvent.objects.count(), 1)
+        self.assertEqual(ProcessWebhookEventsUseCase().execute(), 1)
+        self.assertEqual(User.objects.filter(clerk_id='user_a').count(), 1)
+
+    def test_rejected_deliveries(self):
+        cases = [
+            ('forged', self.deliver('msg_1', 'user.created', user_data('user_a'),
+                                    secret='whsec_' + base64.b64encode(b'other').decode())),
+            ('missing id', self.deliver('msg_2', 'user.created', {'email': 'a@example.com'})),
+        ]
+        for name, response in cases:
+            with self.subTest(name):
+                self.assertEqual(response.status_code, 400)
+
+        self.assertFalse(ClerkWebhookEvent.objects.exists())
+
+    def test_unhandled_events_are_not_queued(self):
+        response = self.deliver('msg_1', 'session.created', {'id': 'sess_1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ClerkWebhookEvent.objects.exists())
+
+
+class TestBatchProcessing(TestCase):
+    """Test that queued events are applied in bulk and in arrival order."""
+
+    def test_batches_fold_to_latest_state(self):
+        User.objects.create(username='admin@example.com', email='admin@example.com', clerk_id='user_admin',
+                            role='admin')
+        queue(
+            ('user.created', user_data('user_a')),
+            ('user.updated', user_data('user_a', email='a@new.example.com', first_name='Cheolsu')),
+            ('user.created', user_data('user_b')),
+            ('user.deleted', {'id': 'user_b', 'deleted': True}),
+            ('user.updated', user_data('user_admin', first_name='Admin')),
+            ('user.deleted', {'id': 'user_missing', 'deleted': True}),
+        )
+
+        self.assertEqual(ProcessWebhookEventsUseCase().execute(), 6)
+
+        user = User.objects.get(clerk_id='user_a')
+        self.assertEqual((user.email, user.username, user.first_name, user.role),
+                         ('a@new.example.com', 'a@new.example.com', 'Cheolsu', 'user'))
+        self.assertFalse(User.objects.filter(clerk_id='user_b').exists())
+        admin = User.objects.get(clerk_id='user_admin')
+        self.assertEqual((admin.first_name, admin.role), ('Admin', 'admin'))
+        self.assertFalse(ClerkWebhookEvent.objects.filter(processed_at__isnull=True).exists())
+        self.assertFalse(ClerkWebhookEvent.objects.exclude(error_message=None).exists())
+
+    def test_queries_do_not_grow_with_batch_size(self):
+        def run(count, offset):
+            queue(*[('user.created', user_data(f'user_{offset + n}')) for n in range(count)])
+            with self.assertNumQueries(10):
+                ProcessWebhookEventsUseCase().execute()
+
+        run(5, 0)
+        run(50, 100)
+        self.assertEqual(User.objects.count(), 55)
+
+    def test_order_is_kept_across_batches(self):
+        queue(
+            ('user.created', user_data('user_a')),
+            ('user.deleted', {'id': 'user_a', 'deleted': True}),
+            ('user.created', user_data('user_b')),
+        )
+
+        self.assertEqual(ProcessWebhookEventsUseCase().execute(batch_size=1), 3)
+
+        self.assertEqual(list(User.objects.values_list('clerk_id', flat=True)), ['user_b'])
+
+    def test_bad_events_do_not_block_the_batch(self):
+        User.objects.create(username='taken@example.com', email='taken@example.com', clerk_id='user_old')
+        queue(
+            ('user.created', user_data('user_a')),
+            ('user.created', user_data('user_new', email='taken@example.com')),
+            ('user.updated', {'email': 'no-id@example.com'}),
+        )
+
+        self.assertEqual(ProcessWebhookEventsUseCase().execute(), 3)
+
+        self.assertTrue(User.objects.filter(clerk_id='user_a').exists())
+        self.assertFalse(User.objects.filter(clerk_id='user_new').exists())
+        failed = ClerkWebhookEvent.objects.exclude(error_message=None).order_by('id')
+        self.assertEqual([event.svix_id for event in failed], ['evt_2', 'evt_3'])
+        self.assertFalse(ClerkWebhookEvent.objects.filter(processed_at__isnull=True).exists())
+
+    def test_management_command(self):
+        queue(('user.created', user_data('user_a')), ('user.created', user_data('user_b')))
+        ProcessWebhookEventsUseCase().execute(batch_size=1)
+        ClerkWebhookEvent.objects.filter(svix_id='evt_1').update(received_at=timezone.now() - timedelta(days=30))
+        queue(('user.created', user_data('user_c')))
+
+        output = io.StringIO()
+        call_command('process_clerk_webhooks', '--purge-days', '7', stdout=output)
+
+        self.assertIn('Processed 1 Clerk webhook events', output.getvalue())
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(sorted(ClerkWebhookEvent.objects.values_list('svix_id', flat=True)), ['evt_2', 'evt_3'])
+
+
+@override_settings(CLERK_WEBHOOK_WORKER=True, CLERK_WEBHOOK_POLL_SECONDS=3600)
+class TestWorkerThread(TransactionTestCase):
+    """Test that a started or woken worker thread applies committed events."""
+
+    def wait_for_queue(self):
+        deadline = time.monotonic() + 10
+        while ClerkWebhookEvent.objects.filter(processed_at__isnull=True).exists():
+            self.assertLess(time.monotonic(), deadline, "Worker did not apply the queue")
+            time.sleep(0.05)
+
+    def test_wake_applies_queue(self):
+        queue(('user.created', user_data('user_a')))
+
+        webhook_worker.wake()
+
+        self.wait_for_queue()
+        self.assertTrue(User.objects.filter(clerk_id='user_a').exists())
+
+    def test_new_process_applies_leftover_events(self):
+        queue(('user.created', user_data('user_a')))  # Left by a process that stopped
+
+        # As in a freshly forked worker: a thread recorded for another process does not count
+        with mock.patch.object(webhook_worker, '_worker_pid', -1):
+            webhook_worker.start()
+            self.wait_for_queue()
+
+        self.assertTrue(User.objects.filter(clerk_id='user_a').exists())
+
+    def test_first_request_starts_the_worker(self):
+        with mock.patch.object(webhook_worker, '_start') as start:
+            self.client.get('/api/health/')
+
+        start.assert_called_once()
+
+    @override_settings(CLERK_WEBHOOK_WORKER=False)
+    def test_start_is_off_with_the_setting(self):
+        with mock.patch.object(webhook_worker, '_start') as start:
+            webhook_worker.start()
+
+        start.assert_not_called()
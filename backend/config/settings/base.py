@@ -32,17 +32,27 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',  # First, so timings cover the rest
+    'core.middleware.QueryMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'core.middleware.ClerkAuthenticationMiddleware',  # Must be before AuthenticationMiddleware
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ResponseCacheMiddleware',  # Before authentication: cached responses are the same for every user
+    'core.middleware.CompressionMiddleware',  # Right inside ResponseCacheMiddleware
+    # Browser middleware, skipped on TOKEN_AUTH_PATHS
+    'core.middleware.BrowserCsrfViewMiddleware',
+    'core.middleware.BrowserSessionMiddleware',
+    'core.middleware.BrowserAuthenticationMiddleware',
+    'core.middleware.BrowserMessageMiddleware',
+    'core.middleware.BrowserXFrameOptionsMiddleware',
+    'core.middleware.ClerkAuthenticationMiddleware',  # Must be after AuthenticationMiddleware
+    'core.middleware.ReplicaPinningMiddleware',
 ]
 
+# Paths authenticated by Clerk tokens alone; the browser middleware (sessions,
+# CSRF, messages, X-Frame-Options) is skipped for them
+TOKEN_AUTH_PATHS = ['/api/']
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -75,6 +85,88 @@ DATABASES = {
     }
 }
 
+# Optional read replica for analytics reads (see core.db_router)
+if os.environ.get('DB_REPLICA_HOST') or os.environ.get('DB_REPLICA_NAME'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ.get('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': os.environ.get('DB_REPLICA_HOST', DATABASES['default']['HOST']),
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICA = 'replica' if 'replica' in DATABASES else None
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# Per-process connection pool (see core.backends.postgresql). Sizes are per
+# worker: keep workers * max_size under the server's connection limit.
+# Analytics fan their queries out over pooled connections only (core.concurrency).
+DATABASE_POOL = os.environ.get('DB_POOL', 'False') == 'True'
+DATABASE_POOL_OPTIONS = {
+    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '1')),
+    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', '4')),
+    'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+    'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', '300')),
+    'max_lifetime': float(os.environ.get('DB_POOL_MAX_LIFETIME', '3600')),
+    'check_interval': float(os.environ.get('DB_POOL_CHECK_INTERVAL', '30')),
+}
+
+if DATABASE_POOL:
+    for database in DATABASES.values():
+        database.update(ENGINE='core.backends.postgresql', CONN_MAX_AGE=0)
+        database.setdefault('OPTIONS', {})['pool'] = dict(DATABASE_POOL_OPTIONS)
+
+# Per-request SQL metrics (core.middleware.QueryMetricsMiddleware): share of
+# requests measured, and the statement count and latency budgets they are
+# logged against. A sample rate of 0 disables the measurement.
+QUERY_METRICS_SAMPLE_RATE = float(os.environ.get('QUERY_METRICS_SAMPLE_RATE', '0'))
+QUERY_BUDGET_COUNT = int(os.environ.get('QUERY_BUDGET_COUNT', '30'))
+QUERY_BUDGET_MS = float(os.environ.get('QUERY_BUDGET_MS', '500'))
+
+# Metrics served on /api/metrics/ (core.metrics). Each worker process writes
+# its metrics to METRICS_DIR for the others to merge; unset, the endpoint
+# only reports the worker serving it. METRICS_TOKEN, if set, is required as
+# a Bearer token to read them.
+METRICS_DIR = os.environ.get('METRICS_DIR', '')
+METRICS_FLUSH_SECONDS = float(os.environ.get('METRICS_FLUSH_SECONDS', '5'))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# API response compression (core.middleware.CompressionMiddleware). Bodies
+# under COMPRESSION_MIN_SIZE bytes are sent uncompressed; br is used when the
+# optional Brotli package is installed and the client accepts it.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', '6'))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', '5'))
+
+# Versioned cache of analytics responses, stored compressed
+# (core.middleware.ResponseCacheMiddleware). Off while RESPONSE_CACHE_SECONDS
+# is 0; uploads invalidate it. Needs a cache shared by the workers (checked
+# by core.checks outside DEBUG). Only the aggregate analytics endpoints are
+# cached: raw records and exports are large and rarely repeated.
+RESPONSE_CACHE_SECONDS = int(os.environ.get('RESPONSE_CACHE_SECONDS', '0'))
+RESPONSE_CACHE_PATHS = [
+    '/api/dashboard/dashboard/',
+    '/api/dashboard/performance/',
+    '/api/dashboard/papers/',
+    '/api/dashboard/students/',
+    '/api/dashboard/budget/',
+    '/api/dashboard/departments/',
+    '/api/dashboard/home/',
+]
+
+# Raw-record browsing (/api/dashboard/records/): largest page a client may
+# request, and the page size above which pages are streamed as they are read
+# instead of being built in memory.
+RECORDS_MAX_PAGE_SIZE = int(os.environ.get('RECORDS_MAX_PAGE_SIZE', '100000'))
+RECORDS_STREAM_ROWS = int(os.environ.get('RECORDS_STREAM_ROWS', '1000'))
+
+# Seconds a user keeps reading from the primary after a successful write.
+# Pins live in the default cache, which must be shared between workers
+# (checked by core.checks outside DEBUG).
+READ_YOUR_WRITES_SECONDS = int(os.environ.get('READ_YOUR_WRITES_SECONDS', '30'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -113,14 +205,16 @@ AUTH_USER_MODEL = 'users.User'
 
 # Django REST Framework settings
 REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'core.authentication.ClerkAuthentication',
+    ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_PAGINATION_CLASS': 'core.pagination.StandardResultsSetPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -141,3 +235,24 @@ CORS_ALLOW_CREDENTIALS = True
 # Clerk settings
 CLERK_SECRET_KEY = os.environ.get('CLERK_SECRET_KEY', '')
 CLERK_WEBHOOK_SECRET = os.environ.get('CLERK_WEBHOOK_SECRET', '')
+
+# Session token verification (core.clerk_auth): JWKS endpoint, or a JWKS file
+# read instead of it (tests, offline development), and its reload interval
+CLERK_JWKS_URL = os.environ.get('CLERK_JWKS_URL', 'https://api.clerk.com/v1/jwks')
+CLERK_JWKS_FILE = os.environ.get('CLERK_JWKS_FILE', '')
+CLERK_JWKS_REFRESH_SECONDS = int(os.environ.get('CLERK_JWKS_REFRESH_SECONDS', '3600'))
+# Accepted azp claims (frontend origins); any when empty
+CLERK_AUTHORIZED_PARTIES = [
+    party for party in os.environ.get('CLERK_AUTHORIZED_PARTIES', '').split(',') if party
+]
+# Per-worker cache sizes of verified tokens and users, and how long a user is
+# served from it; bounds how stale a user can be when the default cache is not shared
+CLERK_TOKEN_CACHE_SIZE = int(os.environ.get('CLERK_TOKEN_CACHE_SIZE', '10000'))
+CLERK_USER_CACHE_SIZE = int(os.environ.get('CLERK_USER_CACHE_SIZE', '10000'))
+CLERK_USER_CACHE_SECONDS = int(os.environ.get('CLERK_USER_CACHE_SECONDS', '60'))
+# Queued webhook events: applied by a background thread of each web worker
+# (or only by the process_clerk_webhooks command when off), in batches, with
+# a poll for leftover events every CLERK_WEBHOOK_POLL_SECONDS
+CLERK_WEBHOOK_WORKER = os.environ.get('CLERK_WEBHOOK_WORKER', 'True') == 'True'
+CLERK_WEBHOOK_BATCH_SIZE = int(os.environ.get('CLERK_WEBHOOK_BATCH_SIZE', '500'))
+CLERK_WEBHOOK_POLL_SECONDS = int(os.environ.get('CLERK_WEBHOOK_POLL_SECONDS', '60'))
@@ -7,5 +7,8 @@ DEBUG = True
 
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', '*']
 
+# Measure every request while developing
+QUERY_METRICS_SAMPLE_RATE = float(os.environ.get('QUERY_METRICS_SAMPLE_RATE', '1'))
+
 # Development-specific CORS settings
 CORS_ALLOW_ALL_ORIGINS = True
@@ -47,6 +47,49 @@ else:
         }
     }
 
+# Optional read replica for analytics reads (see core.db_router)
+if os.getenv('DATABASE_REPLICA_URL'):
+    DATABASES['replica'] = dj_database_url.config(
+        env='DATABASE_REPLICA_URL',
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
+elif os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('DB_REPLICA_HOST'),
+        'PORT': os.getenv('DB_REPLICA_PORT', DATABASES['default'].get('PORT', '5432')),
+    }
+
+if 'replica' in DATABASES:
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+DATABASE_REPLICA = 'replica' if 'replica' in DATABASES else None
+
+# Pool connections per worker; the pool replaces CONN_MAX_AGE persistence
+DATABASE_POOL = os.getenv('DB_POOL', 'True') == 'True'
+if DATABASE_POOL:
+    for database in DATABASES.values():
+        database.update(ENGINE='core.backends.postgresql', CONN_MAX_AGE=0)
+        database.setdefault('OPTIONS', {})['pool'] = dict(DATABASE_POOL_OPTIONS)
+
+# Cache shared by the workers: read-your-writes pins, the response cache and
+# the Clerk user version. Redis when REDIS_URL is set, otherwise a database
+# table created by `manage.py createcachetable`.
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR.parent, 'staticfiles')
@@ -11,6 +11,21 @@ def health_check(request):
     """Health check endpoint for Railway"""
     return JsonResponse({"status": "healthy"})
 
+def db_pool_stats(request):
+    """Connection pool statistics of the worker process serving the request"""
+    from core.db_pool import pool_stats
+    return JsonResponse({"pools": pool_stats()})
+
+def prometheus_metrics(request):
+    """Prometheus metrics merged across worker processes"""
+    from django.http import HttpResponse
+    from core import metrics
+
+    token = settings.METRICS_TOKEN
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return JsonResponse({"error": {"message": "Invalid metrics token", "code": "authentication_error"}}, status=401)
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 def debug_env(request):
     """Debug endpoint to check environment variables"""
     import os
@@ -27,6 +42,8 @@ def debug_env(request):
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/health/', health_check, name='health_check'),
+    path('api/health/db-pool/', db_pool_stats, name='db_pool_stats'),
+    path('api/metrics/', prometheus_metrics, name='metrics'),
     path('api/debug-env/', debug_env, name='debug_env'),
     path('api/users/', include('apps.users.presentation.urls')),
     path('api/dashboard/', include('apps.data_dashboard.presentation.urls')),
@@ -7,3 +7,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
 
 application = get_wsgi_application()
+
+from core.db_pool import warm_pools  # noqa: E402  (needs configured settings)
+
+warm_pools()
@@ -0,0 +1,31 @@
+"""
+DRF authentication and permission classes for the Clerk-authenticated API.
+"""
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import BasePermission
+
+
+class ClerkAuthentication(BaseAuthentication):
+    """
+    Hand the user ClerkAuthenticationMiddleware set from the bearer token
+    to DRF, which otherwise replaces request.user with AnonymousUser.
+    The user stays lazy, so views that check no permission do not verify
+    the token; an invalid token gives an anonymous user and a 403.
+    """
+
+    def authenticate(self, request):
+        if not request.headers.get('Authorization', '').startswith('Bearer '):
+            return None
+        return request._request.user, None
+
+    def authenticate_header(self, request):
+        # Makes unauthenticated requests 401 rather than 403
+        return 'Bearer'
+
+
+class IsAdminRole(BasePermission):
+    """Allow users with the admin role only."""
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.is_admin())
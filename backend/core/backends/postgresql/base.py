@@ -0,0 +1,61 @@
+"""
+PostgreSQL backend with a per-process connection pool.
+
+A drop-in for django.db.backends.postgresql: set ENGINE to
+'core.backends.postgresql' and put the pool options (see
+core.db_pool.DEFAULT_POOL_OPTIONS) under OPTIONS['pool']. Keep CONN_MAX_AGE
+at 0 so each request hands its connection back to the pool when it ends.
+"""
+from functools import partial
+
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from core.db_pool import close_pools, get_pool
+
+
+class DatabaseCreation(base.DatabaseCreation):
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled sessions on the test database would block DROP DATABASE
+        close_pools(self.connection.alias)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = None
+
+    def get_new_connection(self, conn_params):
+        pool_options = conn_params.pop('pool', None)
+        # Maintenance connections (test database setup) are never pooled
+        if pool_options is None or self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+
+        self.pool = get_pool(
+            self.alias,
+            repr(sorted(conn_params.items())),
+            partial(super().get_new_connection, conn_params),
+            pool_options
+        )
+        connection = self.pool.getconn()
+
+        # Reused sessions skip the parent's connect, which sets this
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = (
+            IsolationLevel.READ_COMMITTED if isolation_level is None
+            else IsolationLevel(isolation_level)
+        )
+        return connection
+
+    def _close(self):
+        if self.pool is None:
+            return super()._close()
+
+        pool, self.pool = self.pool, None
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
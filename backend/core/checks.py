@@ -0,0 +1,42 @@
+"""
+System checks of settings that only work with a cache shared by the worker processes.
+"""
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Cache backends whose entries other worker processes cannot see
+LOCAL_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def default_cache_is_local():
+    """Whether the default cache is private to each process."""
+    return settings.CACHES['default']['BACKEND'] in LOCAL_CACHE_BACKENDS
+
+
+@register(Tags.caches)
+def check_replica_pin_cache(app_configs, **kwargs):
+    """Refuse a read replica when read-your-writes pins cannot reach the other workers."""
+    if not settings.DATABASE_REPLICA or settings.DEBUG or not default_cache_is_local():
+        return []
+    return [Error(
+        "DATABASE_REPLICA is set but the default cache is not shared by the worker processes.",
+        hint="Read-your-writes pins would only be seen by the worker that wrote. "
+             "Set CACHES['default'] to a shared backend (Redis or the database cache).",
+        id='core.E001',
+    )]
+
+
+@register(Tags.caches)
+def check_response_cache(app_configs, **kwargs):
+    """Refuse the response cache when upload invalidations cannot reach the other workers."""
+    if not settings.RESPONSE_CACHE_SECONDS or settings.DEBUG or not default_cache_is_local():
+        return []
+    return [Error(
+        "RESPONSE_CACHE_SECONDS is set but the default cache is not shared by the worker processes.",
+        hint="Other workers would keep serving responses from before an upload. "
+             "Set CACHES['default'] to a shared backend (Redis or the database cache).",
+        id='core.E002',
+    )]
@@ -0,0 +1,310 @@
+"""
+Clerk session token verification with per-worker caches.
+
+Tokens are verified against the Clerk instance's JWKS, which is kept in
+memory and refreshed by a background thread every
+CLERK_JWKS_REFRESH_SECONDS (and right away when a token names an unknown
+key, so key rotation needs no restart). CLERK_JWKS_FILE reads the keys from
+a local file instead of CLERK_JWKS_URL, for tests and offline development.
+
+Verified claims are kept in an LRU keyed by the token's hash until the token
+expires, and users in an LRU keyed by Clerk ID for CLERK_USER_CACHE_SECONDS.
+User entries also carry a version stored in the default cache, which
+invalidate_users() bumps when the Clerk webhook changes a user; with a cache
+shared by the worker processes the bump reaches all of them at once, and
+otherwise the other workers see the change when their entries expire. A
+repeated token thus costs no database query.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+
+from core import metrics
+
+
+logger = logging.getLogger(__name__)
+
+# Algorithm Clerk signs session tokens with
+ALGORITHM = 'RS256'
+
+# Allowed clock difference with Clerk when checking exp, nbf and iat
+CLOCK_SKEW_SECONDS = 5
+
+USERS_VERSION_KEY = 'clerk_auth:users_version'
+
+# How long an unknown Clerk ID is remembered; the webhook may create it any moment
+UNKNOWN_USER_SECONDS = 5
+
+_lock = threading.Lock()
+_jwks = None
+_tokens = None
+_users = None
+
+
+class JWKSError(jwt.PyJWTError):
+    """The signing keys could not be loaded."""
+
+
+class LRUCache:
+    """Thread-safe mapping that drops its least recently used entries beyond maxsize."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class JWKSCache:
+    """
+    Signing keys of a Clerk instance, kept in memory.
+
+    Keys are loaded on first use. A daemon thread of each worker process
+    reloads them every refresh_seconds; a failed reload keeps the old keys.
+    """
+
+    # Shortest interval between reloads triggered by unknown key IDs
+    MIN_REFRESH_SECONDS = 30
+
+    def __init__(self, url='', path='', secret_key='', refresh_seconds=3600):
+        """
+        Initialize the cache.
+
+        Args:
+            url (str): JWKS endpoint
+            path (str): JWKS file read instead of the endpoint when set
+            secret_key (str): Clerk secret key sent to the endpoint when set
+            refresh_seconds (int): Interval of the background reload
+        """
+        self.url = url
+        self.path = path
+        self.secret_key = secret_key
+        self.refresh_seconds = refresh_seconds
+        self._keys = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._refresher_pid = None
+
+    def get_key(self, kid):
+        """
+        Get the signing key with an ID.
+
+        Args:
+            kid (str): Key ID from the token header
+
+        Returns:
+            jwt.PyJWK: Signing key
+
+        Raises:
+            JWKSError: If the keys cannot be loaded or hold no such key
+        """
+        self._start_refresher()
+        keys = self._keys
+        if keys is None or (kid not in keys and time.monotonic() - self._loaded_at >= self.MIN_REFRESH_SECONDS):
+            keys = self.refresh()
+
+        key = keys.get(kid)
+        if key is None:
+            raise JWKSError(f"Unknown signing key: {kid}")
+        return key
+
+    def refresh(self):
+        """
+        Reload the keys.
+
+        Returns:
+            dict: Signing keys by key ID
+
+        Raises:
+            JWKSError: If the keys cannot be loaded and none were loaded before
+        """
+        with self._lock:
+            try:
+                keys = {}
+                for data in self._fetch().get('keys', []):
+                    if data.get('use', 'sig') == 'sig' and 'kid' in data:
+                        keys[data['kid']] = jwt.PyJWK(data)
+            except Exception as e:
+                if self._keys is None:
+                    raise JWKSError(f"Could not load the JWKS: {e}")
+                logger.warning(f"Could not reload the JWKS, keeping the old keys: {e}")
+            else:
+                self._keys = keys
+
+            self._loaded_at = time.monotonic()
+            return self._keys
+
+    def _fetch(self):
+        if self.path:
+            with open(self.path, encoding='utf-8') as file:
+                return json.load(file)
+
+        request = urllib.request.Request(self.url)
+        if self.secret_key:
+            request.add_header('Authorization', f'Bearer {self.secret_key}')
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.load(response)
+
+    def _start_refresher(self):
+        """Start this process's reload thread; threads do not survive a fork."""
+        pid = os.getpid()
+        if self._refresher_pid == pid or not self.refresh_seconds:
+            return
+
+        with self._lock:
+            if self._refresher_pid == pid:
+                return
+            self._refresher_pid = pid
+
+        def run():
+            while True:
+                time.sleep(self.refresh_seconds)
+                try:
+                    self.refresh()
+                except JWKSError as e:
+                    logger.warning(str(e))
+
+        threading.Thread(target=run, name='jwks-refresh', daemon=True).start()
+
+
+def _caches():
+    global _jwks, _tokens, _users
+    if _jwks is None:
+        with _lock:
+            if _jwks is None:
+                _tokens = LRUCache(settings.CLERK_TOKEN_CACHE_SIZE)
+                _users = LRUCache(settings.CLERK_USER_CACHE_SIZE)
+                _jwks = JWKSCache(
+                    url=settings.CLERK_JWKS_URL,
+                    path=settings.CLERK_JWKS_FILE,
+                    secret_key=settings.CLERK_SECRET_KEY,
+                    refresh_seconds=settings.CLERK_JWKS_REFRESH_SECONDS
+                )
+    return _jwks, _tokens, _users
+
+
+def reset():
+    """Drop the keys and cached entries, so changed settings take effect."""
+    global _jwks, _tokens, _users
+    with _lock:
+        _jwks = _tokens = _users = None
+
+
+def verify_token(token):
+    """
+    Verify a Clerk session token.
+
+    Args:
+        token (str): Encoded JWT
+
+    Returns:
+        dict: Verified claims
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired, or the keys
+            cannot be loaded
+    """
+    jwks, tokens, _ = _caches()
+    digest = hashlib.sha256(token.encode()).digest()
+
+    entry = tokens.get(digest)
+    if entry is not None and entry[1] > time.time():
+        metrics.record_cache_lookup('clerk_token', True)
+        return entry[0]
+    metrics.record_cache_lookup('clerk_token', False)
+
+    header = jwt.get_unverified_header(token)
+    key = jwks.get_key(header.get('kid'))
+    claims = jwt.decode(
+        token,
+        key.key,
+        algorithms=[ALGORITHM],
+        leeway=CLOCK_SKEW_SECONDS,
+        options={'require': ['exp', 'sub']}
+    )
+
+    parties = settings.CLERK_AUTHORIZED_PARTIES
+    if parties and claims.get('azp') not in parties:
+        raise jwt.InvalidTokenError(f"Unauthorized party: {claims.get('azp')}")
+
+    tokens.set(digest, (claims, claims['exp'] + CLOCK_SKEW_SECONDS))
+    return claims
+
+
+def get_user(clerk_id):
+    """
+    Get the user with a Clerk ID.
+
+    Users are created by the Clerk webhook only, so an unknown Clerk ID
+    gives None (and is cached as such for UNKNOWN_USER_SECONDS).
+
+    Args:
+        clerk_id (str): Clerk user ID (the token's sub claim)
+
+    Returns:
+        User or None: A copy owned by the caller
+    """
+    from apps.users.models import User
+
+    _, _, users = _caches()
+    version = cache.get_or_set(USERS_VERSION_KEY, 1, None)
+
+    now = time.monotonic()
+
+    entry = users.get(clerk_id)
+    hit = entry is not None and entry[0] == version and entry[2] > now
+    metrics.record_cache_lookup('clerk_user', hit)
+    if hit:
+        user = entry[1]
+    else:
+        user = User.objects.filter(clerk_id=clerk_id).first()
+        seconds = settings.CLERK_USER_CACHE_SECONDS if user is not None else UNKNOWN_USER_SECONDS
+        users.set(clerk_id, (version, user, now + seconds))
+
+    return copy.copy(user)
+
+
+def invalidate_users():
+    """Drop the cached users of every worker after a user changed."""
+    try:
+        cache.incr(USERS_VERSION_KEY)
+    except ValueError:
+        cache.set(USERS_VERSION_KEY, 2, None)
+
+    if _users is not None:
+        _users.clear()
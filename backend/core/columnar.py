@@ -0,0 +1,196 @@
+"""
+Columnar (Parquet and Arrow IPC) file export.
+
+Schemas are declared from model or serializer fields instead of being
+inferred from the data, so every file of a dataset carries the same column
+types however few rows it holds. Files are written one record batch at a
+time. pyarrow is optional; without it is_available() is False and exports
+are refused.
+"""
+from rest_framework import fields as serializer_fields
+
+from core.exceptions import BaseAPIException, ValidationError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: columnar exports need pyarrow
+    pa = pq = None
+
+
+# File format: (media type, file extension)
+FORMATS = {
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.file', 'arrow'),
+}
+
+# Compression codec of both formats
+COMPRESSION = 'zstd'
+
+# Model field internal type: Arrow type factory
+_MODEL_TYPES = {
+    'AutoField': lambda field: pa.int32(),
+    'BigAutoField': lambda field: pa.int64(),
+    'SmallAutoField': lambda field: pa.int16(),
+    'IntegerField': lambda field: pa.int32(),
+    'BigIntegerField': lambda field: pa.int64(),
+    'SmallIntegerField': lambda field: pa.int16(),
+    'PositiveIntegerField': lambda field: pa.int32(),
+    'PositiveSmallIntegerField': lambda field: pa.int16(),
+    'FloatField': lambda field: pa.float64(),
+    'DecimalField': lambda field: pa.decimal128(field.max_digits, field.decimal_places),
+    'BooleanField': lambda field: pa.bool_(),
+    'CharField': lambda field: pa.string(),
+    'TextField': lambda field: pa.string(),
+    'DateField': lambda field: pa.date32(),
+    'DateTimeField': lambda field: pa.timestamp('us', tz='UTC'),
+}
+
+# Serializer field class: Arrow type factory (checked in order)
+_SERIALIZER_TYPES = [
+    (serializer_fields.BooleanField, lambda field: pa.bool_()),
+    (serializer_fields.IntegerField, lambda field: pa.int64()),
+    (serializer_fields.FloatField, lambda field: pa.float64()),
+    (serializer_fields.DecimalField, lambda field: pa.decimal128(field.max_digits, field.decimal_places)),
+    (serializer_fields.DateTimeField, lambda field: pa.timestamp('us', tz='UTC')),
+    (serializer_fields.DateField, lambda field: pa.date32()),
+]
+
+
+def is_available():
+    """Whether pyarrow is installed."""
+    return pa is not None
+
+
+def check_format(file_format):
+    """
+    Check that a file format can be written.
+
+    Args:
+        file_format (str): Key of FORMATS
+
+    Raises:
+        ValidationError: If the format is unknown
+        BaseAPIException: If pyarrow is not installed (501)
+    """
+    if file_format not in FORMATS:
+        raise ValidationError(f"file_format must be one of: {', '.join(FORMATS)}")
+    if not is_available():
+        raise BaseAPIException(
+            "Columnar exports need the pyarrow package", code='NOT_AVAILABLE', status_code=501
+        )
+
+
+def label_type():
+    """Arrow type of coded columns exported as their labels."""
+    return pa.dictionary(pa.int8(), pa.string())
+
+
+def model_schema(model, columns):
+    """
+    Build the schema of a model's columns.
+
+    Coded (choices) columns become dictionary-encoded label strings;
+    nullability follows the model field.
+
+    Args:
+        model: Django model class
+        columns (list): Field names
+
+    Returns:
+        pyarrow.Schema: Schema in column order
+    """
+    schema_fields = []
+    for name in columns:
+        field = model._meta.get_field(name)
+        arrow_type = label_type() if field.choices else _MODEL_TYPES[field.get_internal_type()](field)
+        schema_fields.append(pa.field(name, arrow_type, nullable=field.null))
+    return pa.schema(schema_fields)
+
+
+def serializer_schema(serializer_class):
+    """
+    Build the schema of a flat serializer's fields.
+
+    Numeric, boolean and date fields keep their type; any other field
+    (text, choices, labels) becomes a string column.
+
+    Args:
+        serializer_class: Serializer class with flat fields
+
+    Returns:
+        pyarrow.Schema: Schema in field order
+    """
+    schema_fields = []
+    for name, field in serializer_class().fields.items():
+        arrow_type = pa.string()
+        for field_class, factory in _SERIALIZER_TYPES:
+            if isinstance(field, field_class):
+                arrow_type = factory(field)
+                break
+        schema_fields.append(pa.field(name, arrow_type, nullable=field.allow_null or not field.required))
+    return pa.schema(schema_fields)
+
+
+def serializer_rows(serializer_class, items):
+    """
+    Get the row tuples of items in a serializer's field order.
+
+    Values of typed fields (see serializer_schema) are kept as they are;
+    other fields go through the field's representation, so codes become
+    labels as in the JSON responses.
+
+    Args:
+        serializer_class: Serializer class with flat fields
+        items (list): Dicts the serializer would render
+
+    Returns:
+        list: Row tuples
+    """
+    typed = tuple(field_class for field_class, _ in _SERIALIZER_TYPES)
+    converters = []
+    for name, field in serializer_class().fields.items():
+        convert = None if isinstance(field, typed) else field.to_representation
+        converters.append((name, convert))
+
+    rows = []
+    for item in items:
+        row = []
+        for name, convert in converters:
+            value = item.get(name)
+            row.append(convert(value) if convert is not None and value is not None else value)
+        rows.append(tuple(row))
+    return rows
+
+
+def write(file_format, schema, batches, sink):
+    """
+    Write row batches to a columnar file.
+
+    Args:
+        file_format (str): Key of FORMATS
+        schema (pyarrow.Schema): Column names and types
+        batches: Iterable of lists of row tuples in schema order
+        sink: Writable binary file or path
+
+    Returns:
+        int: Number of rows written
+    """
+    if file_format == 'parquet':
+        writer = pq.ParquetWriter(sink, schema, compression=COMPRESSION)
+    else:
+        writer = pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(compression=COMPRESSION))
+
+    count = 0
+    with writer:
+        for rows in batches:
+            if not rows:
+                continue
+            columns = zip(*rows)
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            ))
+            count += len(rows)
+
+    return count
@@ -0,0 +1,108 @@
+"""
+Response body compression.
+
+gzip is always available; br is offered when the optional Brotli package
+is installed. The encoding is picked from the client's Accept-Encoding,
+preferring br.
+"""
+import gzip
+import zlib
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # Optional: without Brotli only gzip is offered
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xml')
+
+
+def get_encodings():
+    """
+    Get the supported encodings in order of preference.
+
+    Returns:
+        tuple: ('br', 'gzip') with Brotli installed, ('gzip',) otherwise
+    """
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the preferred supported encoding the client accepts.
+
+    Args:
+        accept_encoding (str): Accept-Encoding header value
+
+    Returns:
+        str or None: 'br', 'gzip', or None to send the body as is
+    """
+    accepted = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in get_encodings():
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type):
+    """Whether a content type is text-like and not already compressed."""
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(data, encoding):
+    """
+    Compress a whole body.
+
+    Args:
+        data (bytes): Body
+        encoding (str): 'br' or 'gzip'
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_stream(chunks, encoding):
+    """
+    Compress a streamed body chunk by chunk, flushing after each chunk so
+    clients receive rows as they are produced.
+
+    Args:
+        chunks: Iterable of bytes
+        encoding (str): 'br' or 'gzip'
+
+    Yields:
+        bytes: Compressed chunks
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+
+    # wbits 31: zlib stream with a gzip header and trailer
+    compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
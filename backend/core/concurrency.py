@@ -0,0 +1,64 @@
+"""
+Concurrent execution of independent, blocking ORM work.
+
+Django's ORM is synchronous and each thread owns its own connection, so
+independent query sets run concurrently by giving each one a worker
+thread. The caller waits for the slowest call instead of their sum.
+
+Worker threads take their connections from the per-process pool
+(DATABASE_POOL). Without it each call would open and close a connection of
+its own, which costs more than the overlap saves, so the calls run one
+after another on the caller's persistent connection instead.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from core.query_metrics import instrument_connections
+
+
+def _in_transaction():
+    return any(
+        connection.in_atomic_block
+        for connection in connections.all(initialized_only=True)
+    )
+
+
+def _on_own_connection(call):
+    """
+    Wrap a call so the connections its worker thread opens are released,
+    and its statements count towards the request's query metrics.
+    """
+    def run():
+        try:
+            with instrument_connections():
+                return call()
+        finally:
+            connections.close_all()
+
+    return run
+
+
+async def gather_queries(*calls):
+    """
+    Run blocking callables concurrently, each on its own thread and pooled connection.
+
+    Without DATABASE_POOL, or inside an open transaction (whose uncommitted
+    rows other connections cannot see), the calls run one after another on
+    the caller's connection instead.
+
+    Args:
+        *calls: Zero-argument callables doing ORM work
+
+    Returns:
+        list: Results in the order of calls; the first exception is raised
+    """
+    if not settings.DATABASE_POOL or await sync_to_async(_in_transaction)():
+        return [await sync_to_async(call)() for call in calls]
+
+    return await asyncio.gather(*(
+        sync_to_async(_on_own_connection(call), thread_sensitive=False)()
+        for call in calls
+    ))
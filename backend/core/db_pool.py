@@ -0,0 +1,396 @@
+"""
+Per-process PostgreSQL connection pools for the pooled database backend.
+
+Django keeps one connection per thread and closes it at the end of each
+request when CONN_MAX_AGE is 0. The pooled backend (core.backends.postgresql)
+hands those closes back to a pool shared by every thread of the worker, so
+a worker holds at most max_size server connections whatever its thread or
+async concurrency, and sessions are reused instead of reopened.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import connections
+from psycopg2 import OperationalError, extensions
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POOL_OPTIONS = {
+    'min_size': 1,
+    'max_size': 4,
+    'timeout': 10.0,
+    'max_idle': 300.0,
+    'max_lifetime': 3600.0,
+    'check_interval': 30.0,
+}
+
+
+class PoolTimeout(OperationalError):
+    """
+    Raised when no pooled connection frees up within the pool timeout.
+    Django wraps it into django.db.OperationalError like any failed connect.
+    """
+
+    def __init__(self, alias, timeout):
+        super().__init__(
+            f"No database connection available for '{alias}' within {timeout:g}s"
+        )
+
+
+class _PooledConnection:
+    """A server connection with the timestamps the pool ages it by."""
+
+    __slots__ = ('connection', 'created_at', 'returned_at')
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = self.returned_at = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections for one database alias.
+
+    Connections are created on demand up to max_size. A checkout waits up
+    to timeout seconds for a connection to be returned before raising
+    PoolTimeout. Connections idle for check_interval seconds are pinged
+    before reuse, connections older than max_lifetime are recycled, and
+    idle connections above min_size are closed after max_idle seconds.
+    """
+
+    def __init__(self, alias, connect, min_size=1, max_size=4, timeout=10.0,
+                 max_idle=300.0, max_lifetime=3600.0, check_interval=30.0):
+        """
+        Initialize the pool.
+
+        Args:
+            alias (str): Database alias the pool serves
+            connect (callable): Opens a new server connection
+            min_size (int): Idle connections kept open
+            max_size (int): Most connections open at once
+            timeout (float): Seconds a checkout waits for a free connection
+            max_idle (float): Seconds an idle connection above min_size is kept
+            max_lifetime (float): Seconds before a connection is recycled
+            check_interval (float): Idle seconds after which a connection is pinged
+        """
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size, max_size >= 1")
+
+        self.alias = alias
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_interval = check_interval
+
+        self._idle = deque()
+        self._in_use = {}
+        self._opening = 0
+        self._waiting = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._counters = {
+            'checkouts': 0,
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'health_check_failures': 0,
+            'timeouts': 0,
+            'wait_seconds': 0.0,
+        }
+
+    def getconn(self):
+        """
+        Check out a healthy connection, opening one if the pool has room.
+
+        Returns:
+            psycopg2 connection, idle and in the state it was returned in
+
+        Raises:
+            PoolTimeout: If the pool stays exhausted for timeout seconds
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        while True:
+            with self._condition:
+                pooled = self._take_idle(deadline)
+                if pooled is None:
+                    self._opening += 1
+                else:
+                    self._in_use[id(pooled.connection)] = pooled
+
+            if pooled is None:
+                pooled = self._open(checkout=True)
+            elif not self._is_healthy(pooled):
+                with self._condition:
+                    del self._in_use[id(pooled.connection)]
+                self._discard(pooled)
+                continue
+
+            with self._condition:
+                self._counters['checkouts'] += 1
+                self._counters['wait_seconds'] += time.monotonic() - started
+            return pooled.connection
+
+    def putconn(self, connection):
+        """
+        Return a checked-out connection to the pool.
+        Open transactions are rolled back; broken or expired connections are closed.
+
+        Args:
+            connection: Connection obtained from getconn()
+        """
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+        if pooled is None:
+            connection.close()
+            return
+
+        if (
+            self._closed
+            or not self._reset(connection)
+            or self._expired(pooled, time.monotonic())
+        ):
+            self._discard(pooled)
+            return
+
+        pooled.returned_at = time.monotonic()
+        with self._condition:
+            self._idle.append(pooled)
+            stale = self._prune_idle(pooled.returned_at)
+            self._condition.notify()
+        self._close_all(stale)
+
+    def fill(self):
+        """
+        Open connections until min_size are available.
+
+        Returns:
+            int: Number of connections opened
+        """
+        opened = 0
+        while True:
+            with self._condition:
+                if len(self._idle) + len(self._in_use) + self._opening >= self.min_size:
+                    return opened
+                self._opening += 1
+            self._open(checkout=False)
+            opened += 1
+
+    def close(self):
+        """Close every idle connection; checked-out ones close when returned."""
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+            self._closed = True
+        self._close_all(idle)
+
+    def stats(self):
+        """
+        Get a snapshot of the pool's size and usage counters.
+
+        Returns:
+            dict: Sizes, idle/in-use/waiting counts and cumulative counters
+        """
+        with self._condition:
+            return {
+                'alias': self.alias,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': len(self._idle) + len(self._in_use) + self._opening,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': self._waiting,
+                **self._counters,
+            }
+
+    def _take_idle(self, deadline):
+        """
+        Pop the most recently returned idle connection, waiting for one if full.
+        Called with the condition held; None means the caller may open one.
+        """
+        while True:
+            if self._idle:
+                return self._idle.pop()
+            if len(self._in_use) + self._opening < self.max_size:
+                return None
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._counters['timeouts'] += 1
+                raise PoolTimeout(self.alias, self.timeout)
+            self._waiting += 1
+            try:
+                self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+    def _open(self, checkout):
+        """
+        Open a server connection in a slot reserved by the caller.
+        The connection is registered as checked out, or as idle for fill().
+        """
+        try:
+            pooled = _PooledConnection(self.connect())
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._opening -= 1
+            self._counters['connections_opened'] += 1
+            if checkout:
+                self._in_use[id(pooled.connection)] = pooled
+            else:
+                self._idle.append(pooled)
+                self._condition.notify()
+        return pooled
+
+    def _is_healthy(self, pooled):
+        now = time.monotonic()
+        if pooled.connection.closed or self._expired(pooled, now):
+            return False
+        if now - pooled.returned_at < self.check_interval:
+            return True
+
+        try:
+            with pooled.connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if not pooled.connection.autocommit:
+                pooled.connection.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy pooled connection for '{self.alias}': {e}")
+            with self._condition:
+                self._counters['health_check_failures'] += 1
+            return False
+
+    def _expired(self, pooled, now):
+        return self.max_lifetime is not None and now - pooled.created_at >= self.max_lifetime
+
+    def _reset(self, connection):
+        """Roll back whatever the last user left open; False if the connection is unusable."""
+        if connection.closed:
+            return False
+        try:
+            status = connection.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _prune_idle(self, now):
+        """Remove idle connections beyond min_size unused for max_idle seconds."""
+        stale = []
+        while (
+            len(self._idle) > self.min_size
+            and now - self._idle[0].returned_at >= self.max_idle
+        ):
+            stale.append(self._idle.popleft())
+        return stale
+
+    def _discard(self, pooled):
+        self._close_all([pooled])
+        with self._condition:
+            self._condition.notify()
+
+    def _close_all(self, pooled_connections):
+        for pooled in pooled_connections:
+            try:
+                pooled.connection.close()
+            except Exception:
+                pass
+        if pooled_connections:
+            with self._condition:
+                self._counters['connections_closed'] += len(pooled_connections)
+
+
+# Pools are per process: a forked worker must never share its parent's
+# sockets, so lookups are keyed by pid and a parent's pools are left alone.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, key, connect, options=None):
+    """
+    Get the pool for an alias and connection target, creating it on first use.
+
+    Args:
+        alias (str): Database alias
+        key (str): Identifies the connection target (database, host, user)
+        connect (callable): Opens a new server connection
+        options (dict, optional): Pool options, see DEFAULT_POOL_OPTIONS
+
+    Returns:
+        ConnectionPool
+    """
+    pool_key = (os.getpid(), alias, key)
+    with _pools_lock:
+        pool = _pools.get(pool_key)
+        if pool is None:
+            pool = ConnectionPool(alias, connect, **{**DEFAULT_POOL_OPTIONS, **(options or {})})
+            _pools[pool_key] = pool
+        return pool
+
+
+def get_pools():
+    """Get the pools of the current process."""
+    pid = os.getpid()
+    with _pools_lock:
+        return [pool for (pool_pid, _, _), pool in _pools.items() if pool_pid == pid]
+
+
+def close_pools(alias=None):
+    """
+    Close and forget the current process's pools.
+
+    Args:
+        alias (str, optional): Only close the pools of this alias
+    """
+    pid = os.getpid()
+    with _pools_lock:
+        keys = [
+            key for key in _pools
+            if key[0] == pid and (alias is None or key[1] == alias)
+        ]
+        pools = [_pools.pop(key) for key in keys]
+    for pool in pools:
+        pool.close()
+
+
+def pool_stats():
+    """
+    Get the statistics of every pool in the current process.
+
+    Returns:
+        list: One stats dict per pool
+    """
+    return [pool.stats() for pool in get_pools()]
+
+
+def warm_pools():
+    """
+    Open min_size connections for every pooled database alias.
+    Called by the WSGI and ASGI entry points so a worker's first requests do
+    not pay for connecting; a database that is down only logs a warning.
+    """
+    for alias in connections:
+        if 'pool' not in connections.settings[alias].get('OPTIONS', {}):
+            continue
+        connection = connections[alias]
+        try:
+            connection.ensure_connection()
+            pool = connection.pool
+            connection.close()
+            pool.fill()
+        except Exception as e:
+            logger.warning(f"Could not warm the connection pool for '{alias}': {e}")
@@ -0,0 +1,117 @@
+"""
+Database routing for the optional read replica.
+
+Analytics repositories read from the replica configured as
+settings.DATABASE_REPLICA. Everything else, all writes, and reads made
+while the request is pinned to the primary (read-your-writes) or while a
+transaction is open on the primary, use the default database.
+"""
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import QuerySet
+
+
+def _always():
+    return True
+
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_pinned_to_primary = ContextVar('pinned_to_primary', default=None)
+
+
+def get_read_alias():
+    """
+    Get the database alias analytics reads should use right now.
+
+    Returns:
+        str: Replica alias, or the default alias when no replica is configured,
+            the current context is pinned, or a primary transaction is open
+    """
+    replica = getattr(settings, 'DATABASE_REPLICA', None)
+    pinned = _pinned_to_primary.get()
+    if not replica or (pinned is not None and pinned()):
+        return DEFAULT_DB_ALIAS
+
+    # Reads inside a transaction must see its uncommitted writes
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+
+    return replica
+
+
+@contextmanager
+def replica_reads():
+    """Route reads made inside the block to the replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def pinned_to_primary(condition=None):
+    """
+    Keep every read made inside the block on the primary.
+
+    Args:
+        condition (callable, optional): Zero-argument predicate deciding
+            whether the block is pinned. It is called once, when the first
+            read is routed, so blocks that never read the replica never pay
+            for it. Pinned unconditionally when omitted.
+    """
+    token = _pinned_to_primary.set(_always if condition is None else functools.cache(condition))
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+def reads_from_replica(cls):
+    """
+    Class decorator routing the reads of every public method to the replica.
+    Lazy querysets a method returns are bound to the alias chosen at call time.
+    """
+    for name, member in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(member):
+            setattr(cls, name, _replica_method(member))
+    return cls
+
+
+def _replica_method(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with replica_reads():
+            result = method(*args, **kwargs)
+            if isinstance(result, QuerySet) and result._db is None:
+                result = result.using(get_read_alias())
+        return result
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Router sending analytics reads to the replica and everything else to default.
+    The replica holds the same data, so relations and migrations follow default.
+    """
+
+    def db_for_read(self, model, **hints):
+        # The database cache holds pins and versions the replica may not have yet
+        if _replica_reads.get() and model._meta.app_label != 'django_cache':
+            return get_read_alias()
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
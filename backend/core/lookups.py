@@ -0,0 +1,23 @@
+"""
+Custom ORM lookups for index-friendly text filtering.
+"""
+from django.db.models.lookups import IContains
+
+
+class TrigramIContains(IContains):
+    """
+    Case-insensitive substring match that compiles to `col ILIKE '%x%'`.
+
+    Django's `icontains` compiles to `UPPER(col::text) LIKE UPPER('%x%')`,
+    which a pg_trgm GIN index on the plain column cannot serve. ILIKE on
+    the bare column can. Other backends fall back to `icontains`.
+    """
+    lookup_name = 'trgm_icontains'
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
@@ -0,0 +1,378 @@
+"""
+Application metrics in the Prometheus text format, aggregated across workers.
+
+Every worker process records into its own in-memory registry. With
+settings.METRICS_DIR set, a worker writes its registry to
+<METRICS_DIR>/<pid>.json at most every METRICS_FLUSH_SECONDS, and whichever
+worker serves /api/metrics/ merges the files of all workers. Counters and
+histograms of exited workers are kept, so totals never go backwards;
+gauges only count live workers. The directory should be emptied when the
+service starts.
+"""
+import atexit
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = {}
+_collectors = []
+_lock = threading.Lock()
+_last_flush = 0.0
+
+
+class Metric:
+    """Base class of a labelled metric family."""
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        with _lock:
+            if name in _registry:
+                raise ValueError(f"Metric already registered: {name}")
+            _registry[name] = self
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self):
+        """
+        Get the current samples of this family.
+
+        Returns:
+            dict: Type, help text, label names and [label values, value] samples
+        """
+        with _lock:
+            samples = [[list(key), value] for key, value in self._values.items()]
+        return {
+            'type': self.type,
+            'help': self.documentation,
+            'labelnames': list(self.labelnames),
+            'samples': samples,
+        }
+
+
+class Counter(Metric):
+    """Monotonically increasing total."""
+
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value, **labels):
+        """Copy a total that is counted elsewhere, such as a pool's own counters."""
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = value
+
+
+class Gauge(Metric):
+    """Value that goes up and down; summed over live workers."""
+
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with _lock:
+            # [count per bucket..., count above the last bucket, sum]
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    break
+            else:
+                index = len(self.buckets)
+            values[index] += 1
+            values[-1] += value
+
+    def snapshot(self):
+        with _lock:
+            samples = [[list(key), list(values)] for key, values in self._values.items()]
+        return {
+            'type': self.type,
+            'help': self.documentation,
+            'labelnames': list(self.labelnames),
+            'buckets': list(self.buckets),
+            'samples': samples,
+        }
+
+
+def register_collector(collector):
+    """
+    Register a callable that refreshes metrics kept elsewhere.
+    Collectors run before each snapshot.
+
+    Args:
+        collector: Zero-argument callable
+    """
+    _collectors.append(collector)
+    return collector
+
+
+def snapshot():
+    """
+    Get the samples of every metric of the current process.
+
+    Returns:
+        dict: {'pid': int, 'metrics': {name: family snapshot}}
+    """
+    for collector in _collectors:
+        try:
+            collector()
+        except Exception as e:
+            logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+
+    return {
+        'pid': os.getpid(),
+        'metrics': {name: metric.snapshot() for name, metric in list(_registry.items())},
+    }
+
+
+def flush(force=False):
+    """
+    Write this process's snapshot to METRICS_DIR, at most every
+    METRICS_FLUSH_SECONDS unless forced. Does nothing without METRICS_DIR.
+    """
+    global _last_flush
+
+    directory = settings.METRICS_DIR
+    now = time.monotonic()
+    if not directory or (not force and now - _last_flush < settings.METRICS_FLUSH_SECONDS):
+        return
+    _last_flush = now
+
+    data = snapshot()
+    path = os.path.join(directory, f"{data['pid']}.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write metrics to {path}: {e}")
+
+
+atexit.register(flush, force=True)
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _load_snapshots():
+    """Get the snapshots of every worker, this one read live."""
+    current = snapshot()
+    snapshots = [current]
+
+    directory = settings.METRICS_DIR
+    if not directory:
+        return snapshots
+
+    for path in glob.glob(os.path.join(directory, '*.json')):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics file {path}: {e}")
+            continue
+        if data.get('pid') != current['pid']:
+            snapshots.append(data)
+
+    return snapshots
+
+
+def collect():
+    """
+    Merge the snapshots of every worker.
+
+    Returns:
+        dict: {name: family snapshot} with samples summed across workers
+    """
+    merged = {}
+
+    for data in _load_snapshots():
+        alive = data['pid'] == os.getpid() or _is_alive(data['pid'])
+        for name, family in data['metrics'].items():
+            if family['type'] == 'gauge' and not alive:
+                continue
+
+            target = merged.setdefault(name, {**family, 'samples': {}})
+            samples = target['samples']
+            for labels, value in family['samples']:
+                key = tuple(labels)
+                if key not in samples:
+                    samples[key] = list(value) if isinstance(value, list) else value
+                elif isinstance(value, list):
+                    samples[key] = [a + b for a, b in zip(samples[key], value)]
+                else:
+                    samples[key] += value
+
+    return merged
+
+
+def _escape(value):
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+def render():
+    """
+    Render the merged metrics of every worker.
+
+    Returns:
+        str: Prometheus text exposition format
+    """
+    lines = []
+
+    for name, family in sorted(collect().items()):
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        labelnames = family['labelnames']
+
+        for labels, value in sorted(family['samples'].items()):
+            if family['type'] != 'histogram':
+                lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+                continue
+
+            cumulative = 0
+            bounds = family['buckets'] + [float('inf')]
+            for bound, count in zip(bounds, value[:-1]):
+                cumulative += count
+                le = (('le', _format_value(bound)),)
+                lines.append(f"{name}_bucket{_format_labels(labelnames, labels, le)} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labelnames, labels)} {_format_value(value[-1])}")
+            lines.append(f"{name}_count{_format_labels(labelnames, labels)} {_format_value(cumulative)}")
+
+    return '\n'.join(lines) + '\n'
+
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by view action; the count gives throughput.',
+    ('view', 'method', 'status')
+)
+UPLOAD_ROWS = Counter(
+    'upload_rows_total',
+    'Rows saved from uploaded files; divide by upload_processing_seconds_total for rows/sec.',
+    ('file_type',)
+)
+UPLOAD_SECONDS = Counter(
+    'upload_processing_seconds_total',
+    'Time spent parsing, validating and saving uploaded files.',
+    ('file_type',)
+)
+QUEUE_DEPTH = Gauge(
+    'queue_depth',
+    'Jobs waiting in an in-process work queue.',
+    ('queue',)
+)
+CACHE_REQUESTS = Counter(
+    'cache_requests_total',
+    'Cache lookups by result; hit ratio is hit / (hit + miss).',
+    ('cache', 'result')
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'Pooled database connections by state.',
+    ('alias', 'state')
+)
+DB_POOL_CHECKOUTS = Counter(
+    'db_pool_checkouts_total',
+    'Connections handed out by the pool.',
+    ('alias',)
+)
+DB_POOL_TIMEOUTS = Counter(
+    'db_pool_timeouts_total',
+    'Checkouts that gave up waiting for a free connection.',
+    ('alias',)
+)
+DB_POOL_WAIT_SECONDS = Counter(
+    'db_pool_wait_seconds_total',
+    'Time spent waiting for a free pooled connection.',
+    ('alias',)
+)
+
+
+def record_cache_lookup(cache_name, hit):
+    """
+    Count a cache lookup towards the cache's hit ratio.
+
+    Args:
+        cache_name (str): Name of the cache
+        hit (bool): Whether the lookup was served from the cache
+    """
+    CACHE_REQUESTS.inc(cache=cache_name, result='hit' if hit else 'miss')
+
+
+@register_collector
+def collect_pool_stats():
+    """Copy the usage of this process's connection pools, summed per alias."""
+    from core.db_pool import pool_stats
+
+    totals = {}
+    for stats in pool_stats():
+        alias = totals.setdefault(stats['alias'], dict.fromkeys(
+            ('idle', 'in_use', 'waiting', 'checkouts', 'timeouts', 'wait_seconds'), 0
+        ))
+        for field in alias:
+            alias[field] += stats[field]
+
+    for alias, stats in totals.items():
+        for state in ('idle', 'in_use', 'waiting'):
+            DB_POOL_CONNECTIONS.set(stats[state], alias=alias, state=state)
+        DB_POOL_CHECKOUTS.set_total(stats['checkouts'], alias=alias)
+        DB_POOL_TIMEOUTS.set_total(stats['timeouts'], alias=alias)
+        DB_POOL_WAIT_SECONDS.set_total(stats['wait_seconds'], alias=alias)
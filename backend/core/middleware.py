@@ -3,16 +3,87 @@ Clerk authentication middleware for JWT token verification.
 Following the common-modules.md specification.
 """
 import logging
+import random
+import time
+
+import jwt
+from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
 from django.conf import settings
+from django.core.cache import cache
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import SimpleLazyObject
+
+from core import clerk_auth, metrics, response_cache
+from core.compression import choose_encoding, compress, compress_stream, is_compressible
+from core.db_router import pinned_to_primary
+from core.query_metrics import QueryMetrics, collect_queries, get_view_name
 
 logger = logging.getLogger(__name__)
 
 
+class BrowserOnlyMixin:
+    """
+    Skip a Django middleware on settings.TOKEN_AUTH_PATHS.
+
+    Those API paths are authenticated by Clerk tokens alone, so sessions,
+    session authentication, CSRF checks, messages and X-Frame-Options have
+    nothing to do there. The admin and other browser paths keep them.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.token_paths = tuple(settings.TOKEN_AUTH_PATHS)
+
+    def __call__(self, request):
+        if self._is_token_path(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def _is_token_path(self, request):
+        return request.path_info.startswith(self.token_paths)
+
+
+class BrowserSessionMiddleware(BrowserOnlyMixin, SessionMiddleware):
+    """SessionMiddleware for browser paths only."""
+
+
+class BrowserCsrfViewMiddleware(BrowserOnlyMixin, CsrfViewMiddleware):
+    """CsrfViewMiddleware for browser paths only."""
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if self._is_token_path(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class BrowserAuthenticationMiddleware(BrowserOnlyMixin, AuthenticationMiddleware):
+    """AuthenticationMiddleware (session users) for browser paths only."""
+
+
+class BrowserMessageMiddleware(BrowserOnlyMixin, MessageMiddleware):
+    """MessageMiddleware for browser paths only."""
+
+
+class BrowserXFrameOptionsMiddleware(BrowserOnlyMixin, XFrameOptionsMiddleware):
+    """XFrameOptionsMiddleware for browser paths only."""
+
+
 class ClerkAuthenticationMiddleware:
     """
     Clerk JWT token verification middleware.
     Verifies the JWT token from Authorization header and injects user into request.
+    The user is resolved lazily, on first access to request.user, so
+    requests that never look at it skip verification. Verified tokens and
+    users are cached per worker (see core.clerk_auth), so a repeated token
+    costs no database query. Users are only created by the Clerk webhook; a
+    token of an unknown user is treated as anonymous.
+    Must come after AuthenticationMiddleware: a token overrides the session
+    user, and requests without one keep it.
     """
 
     def __init__(self, get_response):
@@ -23,16 +94,9 @@ class ClerkAuthenticationMiddleware:
         auth_header = request.headers.get('Authorization', '')
 
         if auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
-            try:
-                # Verify Clerk JWT token
-                user = self._verify_clerk_token(token)
-                request.user = user
-                logger.info(f"User authenticated: {user}, is_authenticated: {user.is_authenticated if hasattr(user, 'is_authenticated') else 'N/A'}")
-            except Exception as e:
-                logger.warning(f"Clerk token verification failed: {e}")
-                request.user = AnonymousUser()
-        else:
+            token = auth_header[len('Bearer '):].strip()
+            request.user = SimpleLazyObject(lambda: self._verify_clerk_token(token))
+        elif not hasattr(request, 'user'):
             request.user = AnonymousUser()
 
         response = self.get_response(request)
@@ -40,51 +104,244 @@ class ClerkAuthenticationMiddleware:
 
     def _verify_clerk_token(self, token):
         """
-        Verify Clerk JWT token and return user.
+        Verify a Clerk JWT token and get its user.
 
-        Note: This is a simplified implementation. In production, use
-        the Clerk SDK to properly verify the JWT signature and claims.
-        """
-        from apps.users.models import User
-
-        # TODO: Implement proper Clerk JWT verification using clerk-sdk-python
-        # For now, this is a placeholder that assumes the token is valid
-        # In production, decode and verify the JWT using Clerk's public key
+        Args:
+            token (str): Encoded JWT from the Authorization header
 
+        Returns:
+            User or AnonymousUser: AnonymousUser if the token is invalid or
+                its user does not exist
+        """
         try:
-            import jwt
-            from jwt import PyJWKClient
-
-            # Decode token without verification for now (development only)
-            # In production, fetch Clerk JWKS and verify signature
-            decoded_token = jwt.decode(token, options={"verify_signature": False})
-            clerk_id = decoded_token.get('sub')
-
-            if clerk_id:
-                # Try to get existing user, or create new one (temporary solution)
-                try:
-                    user = User.objects.get(clerk_id=clerk_id)
-                except User.DoesNotExist:
-                    # Auto-create user from JWT token (temporary for development)
-                    email = decoded_token.get('email', f'{clerk_id}@temp.com')
-                    username = email.split('@')[0] if email else clerk_id[:30]
-
-                    user = User.objects.create(
-                        clerk_id=clerk_id,
-                        email=email,
-                        username=username[:150],  # Django username max length
-                        first_name=decoded_token.get('given_name', ''),
-                        last_name=decoded_token.get('family_name', ''),
-                    )
-                    logger.info(f"Auto-created user from JWT token: {email}")
-
-                return user
-            else:
-                return AnonymousUser()
-
-        except jwt.DecodeError as e:
-            logger.warning(f"Token decode error: {e}")
+            claims = clerk_auth.verify_token(token)
+        except jwt.PyJWTError as e:
+            logger.warning(f"Clerk token verification failed: {e}")
             return AnonymousUser()
-        except Exception as e:
-            logger.error(f"Unexpected error in token verification: {e}")
+
+        user = clerk_auth.get_user(claims['sub'])
+        if user is None:
+            logger.warning(f"No user with clerk_id {claims['sub']}; users are created by the Clerk webhook")
             return AnonymousUser()
+
+        logger.debug(f"User authenticated: {user}")
+        return user
+
+
+class ReplicaPinningMiddleware:
+    """
+    Read-your-writes for the read replica.
+    Write requests run against the primary, and a user whose write succeeded
+    keeps reading from the primary for READ_YOUR_WRITES_SECONDS so their own
+    uploads are never hidden by replica lag. Other requests look their pin
+    up on their first replica read, so those that never read the replica do
+    not resolve request.user for it.
+    Must come after ClerkAuthenticationMiddleware, which sets request.user.
+    The user is taken before the view runs: DRF views replace request.user
+    with the user of their own authentication classes (anonymous here).
+    """
+
+    WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        user = getattr(request, 'user', None)
+
+        if request.method not in self.WRITE_METHODS:
+            with pinned_to_primary(lambda: self._is_pinned(user)):
+                return self.get_response(request)
+
+        with pinned_to_primary():
+            response = self.get_response(request)
+
+        if response.status_code < 400:
+            key = self._pin_key(user)
+            if key is not None:
+                cache.set(key, True, settings.READ_YOUR_WRITES_SECONDS)
+
+        return response
+
+    def _is_pinned(self, user):
+        """Whether the user wrote within READ_YOUR_WRITES_SECONDS."""
+        key = self._pin_key(user)
+        return key is not None and cache.get(key) is not None
+
+    def _pin_key(self, user):
+        """Get the cache key of a user's pin, None for anonymous requests."""
+        if user is None or not user.is_authenticated:
+            return None
+        return f"replica_pin:{user.pk}"
+
+
+class RequestMetricsMiddleware:
+    """
+    Request latency per view action for the /api/metrics/ endpoint.
+    Also flushes this worker's metrics for the other workers to merge.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+
+        metrics.REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            view=getattr(request, 'metrics_view_name', 'unmatched'),
+            method=request.method,
+            status=response.status_code
+        )
+        metrics.flush()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics_view_name = get_view_name(view_func, request)
+
+
+class QueryMetricsMiddleware:
+    """
+    SQL statement count and timing for a sampled share of requests.
+
+    Sampled responses get a Server-Timing header splitting the request into
+    db (summed statement time), serialize (response rendering) and app (the
+    rest). Requests over QUERY_BUDGET_COUNT statements or QUERY_BUDGET_MS
+    milliseconds are logged with their view name. With
+    QUERY_METRICS_SAMPLE_RATE at 0 requests pass straight through.
+    Should come first so its timing covers the other middleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.QUERY_METRICS_SAMPLE_RATE
+        self.max_queries = settings.QUERY_BUDGET_COUNT
+        self.max_ms = settings.QUERY_BUDGET_MS
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        metrics = request.query_metrics = QueryMetrics()
+        started = time.perf_counter()
+        with collect_queries(metrics):
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        db_ms = metrics.db_seconds * 1000
+        serialize_ms = metrics.serialize_seconds * 1000
+        app_ms = max(total_ms - db_ms - serialize_ms, 0.0)
+        response['Server-Timing'] = (
+            f'db;dur={db_ms:.1f};desc="{metrics.count} queries", '
+            f'serialize;dur={serialize_ms:.1f}, '
+            f'app;dur={app_ms:.1f}'
+        )
+
+        if metrics.count > self.max_queries or total_ms > self.max_ms:
+            logger.warning(
+                f"Request over budget: {metrics.view_name or request.path} "
+                f"{request.method} ran {metrics.count} queries, "
+                f"{db_ms:.1f}ms db, {total_ms:.1f}ms total"
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = getattr(request, 'query_metrics', None)
+        if metrics is not None:
+            metrics.view_name = get_view_name(view_func, request)
+
+    def process_template_response(self, request, response):
+        metrics = getattr(request, 'query_metrics', None)
+        if metrics is not None:
+            # Runs last before rendering; the callback runs right after it
+            render_started = time.perf_counter()
+
+            def rendered(response):
+                metrics.serialize_seconds = time.perf_counter() - render_started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compress text and JSON responses with br or gzip.
+
+    Bodies under COMPRESSION_MIN_SIZE bytes are sent as is, since
+    compressing them saves nothing. Streamed responses are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            response.has_header('Content-Encoding')
+            or not is_compressible(response.get('Content-Type', ''))
+            or getattr(response, 'is_async', False)
+            or (not response.streaming and len(response.content) < self.min_size)
+        ):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response['Content-Length']
+        else:
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The compressed body differs byte for byte, so a strong ETag becomes weak
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        response['Content-Encoding'] = encoding
+        return response
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve repeated analytics GETs from the versioned response cache.
+
+    Must sit right outside CompressionMiddleware: responses are stored as
+    they leave it, compressed for the client's encoding, so hot responses
+    are served without rendering or compressing again. Cached paths
+    (RESPONSE_CACHE_PATHS) must return the same data to every user.
+    Responses are not stored while a replica may lag behind the last upload
+    (see core.response_cache). Disabled while RESPONSE_CACHE_SECONDS is 0.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.seconds = settings.RESPONSE_CACHE_SECONDS
+
+    def __call__(self, request):
+        if not self.seconds or request.method != 'GET' or not response_cache.is_cached_path(request.path):
+            return self.get_response(request)
+
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        key = response_cache.make_key(request, encoding)
+        response = response_cache.load(key)
+        metrics.record_cache_lookup('response', response is not None)
+        if response is not None:
+            return response
+
+        response = self.get_response(request)
+        if (response.status_code == 200 and not response.streaming and not response.cookies
+                and response_cache.may_store()):
+            response_cache.store(key, response)
+        return response
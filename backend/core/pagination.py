@@ -1,9 +1,14 @@
 """
-Standard pagination class for API responses.
+Standard pagination class for API responses, and opaque keyset cursors.
 Following the common-modules.md specification.
 """
+import base64
+import json
+
 from rest_framework.pagination import PageNumberPagination
 
+from core.exceptions import ValidationError
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     """
@@ -16,3 +21,41 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
     page_query_param = 'page'
+
+
+def encode_cursor(payload):
+    """
+    Encode a keyset position as an opaque cursor.
+
+    Args:
+        payload (dict): JSON-serializable position
+
+    Returns:
+        str: URL-safe cursor
+    """
+    data = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor (str): Cursor from a previous response
+
+    Returns:
+        dict: Position
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(data)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor")
+
+    if not isinstance(payload, dict):
+        raise ValidationError("Invalid cursor")
+    return payload
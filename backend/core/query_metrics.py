@@ -0,0 +1,94 @@
+"""
+Per-request SQL statement counting and timing.
+
+QueryMetricsMiddleware activates a QueryMetrics collector for sampled
+requests. The collector is installed with connection.execute_wrapper on the
+connections of the request thread, and core.concurrency installs it on the
+worker threads it fans queries out to. Unsampled requests install nothing.
+"""
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+
+_active_metrics = ContextVar('query_metrics', default=None)
+
+
+class QueryMetrics:
+    """
+    SQL statement count and database time of one request.
+    Database time is summed per statement, so statements running
+    concurrently on several connections can add up to more than wall time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.view_name = None
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.count += 1
+                self.db_seconds += elapsed
+
+
+@contextmanager
+def collect_queries(metrics):
+    """
+    Record the statements run inside the block, including on worker threads
+    started through core.concurrency.
+
+    Args:
+        metrics (QueryMetrics): Collector to record into
+    """
+    token = _active_metrics.set(metrics)
+    try:
+        with instrument_connections():
+            yield metrics
+    finally:
+        _active_metrics.reset(token)
+
+
+@contextmanager
+def instrument_connections():
+    """Install the active collector on this thread's connections, if there is one."""
+    metrics = _active_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(metrics))
+        yield
+
+
+def get_view_name(view_func, request):
+    """
+    Get a readable name for the view handling a request.
+
+    Args:
+        view_func: Resolved view function
+        request: Current request
+
+    Returns:
+        str: 'ViewSet.action' for DRF viewsets, 'View' for class-based views,
+            the function's qualified name otherwise
+    """
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if view_class is None:
+        return f"{view_func.__module__}.{view_func.__qualname__}"
+
+    actions = getattr(view_func, 'actions', None) or {}
+    action = actions.get(request.method.lower())
+    return f"{view_class.__name__}.{action}" if action else view_class.__name__
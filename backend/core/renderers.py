@@ -0,0 +1,60 @@
+"""
+JSON renderer backed by orjson.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer.
+
+    orjson serializes dicts, lists, dates, datetimes and NumPy values
+    natively; anything else (Decimal, lazy strings, querysets, ...) falls
+    back to DRF's encoder, so output types match the stdlib renderer.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+
+        Args:
+            data: Response data
+            accepted_media_type (str, optional): Negotiated media type; an
+                'indent' parameter switches to indented output
+            renderer_context (dict, optional): DRF renderer context
+
+        Returns:
+            bytes: UTF-8 encoded JSON, empty for None
+        """
+        if data is None:
+            return b''
+
+        options = self.options
+        if accepted_media_type and 'indent=' in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_encoder.default, option=options)
+
+
+def dumps(data):
+    """
+    Serialize data to JSON bytes exactly as ORJSONRenderer does.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(data, default=_encoder.default, option=ORJSONRenderer.options)
@@ -0,0 +1,108 @@
+"""
+Versioned cache of rendered API responses.
+
+Entries are keyed by a data version, the request path and query string,
+the Accept header (which picks the renderer) and the content encoding.
+Bumping the version after new data is uploaded
+invalidates every entry at once; old entries simply expire. The version
+lives in the default cache, so that cache must be shared by the worker
+processes for a bump to reach all of them (checked by core.checks outside
+DEBUG).
+
+With a read replica, responses are not stored for READ_YOUR_WRITES_SECONDS
+after a bump: a request reading from a lagging replica would otherwise
+cache pre-upload data under the new version, and serve it to the uploader
+too.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+VERSION_KEY = 'response_cache:version'
+
+# Present for READ_YOUR_WRITES_SECONDS after a bump
+BUMPED_KEY = 'response_cache:bumped'
+
+
+def get_version():
+    """
+    Get the current data version.
+
+    Returns:
+        int: Version, starting at 1
+    """
+    return cache.get_or_set(VERSION_KEY, 1, None)
+
+
+def bump_version():
+    """Invalidate every cached response after the underlying data changed."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, None)
+    cache.set(BUMPED_KEY, True, settings.READ_YOUR_WRITES_SECONDS)
+
+
+def may_store():
+    """Whether fresh responses can be stored, i.e. no replica may still lag behind a bump."""
+    return not settings.DATABASE_REPLICA or cache.get(BUMPED_KEY) is None
+
+
+def is_cached_path(path):
+    """Whether GET responses of a path are cached."""
+    return path.startswith(tuple(settings.RESPONSE_CACHE_PATHS))
+
+
+def make_key(request, encoding):
+    """
+    Build the cache key of a request's response.
+
+    Args:
+        request: GET request
+        encoding (str or None): Content encoding the response is sent with
+
+    Returns:
+        str: Cache key
+    """
+    accept = request.headers.get('Accept', '')
+    digest = hashlib.md5(f"{request.get_full_path()}\n{accept}".encode()).hexdigest()
+    return f"response_cache:{get_version()}:{encoding or 'identity'}:{digest}"
+
+
+def store(key, response):
+    """
+    Cache a response's status, headers and (possibly compressed) body.
+
+    Args:
+        key (str): Cache key from make_key
+        response: Rendered, non-streaming response
+    """
+    cache.set(
+        key,
+        (response.status_code, list(response.items()), response.content),
+        settings.RESPONSE_CACHE_SECONDS
+    )
+
+
+def load(key):
+    """
+    Rebuild a cached response.
+
+    Args:
+        key (str): Cache key from make_key
+
+    Returns:
+        HttpResponse or None: Cached response, None on a miss
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    status_code, headers, content = entry
+    response = HttpResponse(content, status=status_code)
+    for name, value in headers:
+        response[name] = value
+    return response
@@ -0,0 +1,107 @@
+"""
+Read-only fast path for DRF serializers.
+
+Analytics responses are plain dicts and lists built by the services, so
+running them through a Serializer tree mostly costs field deep copies,
+per-field dispatch and ReturnDict bookkeeping. compile_serializer walks a
+Serializer class once and returns a function producing the same output as
+Serializer(instance).data, with each field reduced to a single extractor.
+"""
+from collections.abc import Mapping
+
+from rest_framework import fields, serializers
+from rest_framework.fields import SkipField, empty
+
+
+# Fields whose to_representation is exactly a builtin conversion
+_BUILTIN_CONVERTERS = {
+    fields.IntegerField: int,
+    fields.FloatField: float,
+    fields.CharField: str,
+}
+
+
+def _get_converter(field):
+    """Get the function turning a non-null attribute into its representation."""
+    if isinstance(field, serializers.ListSerializer):
+        convert_item = _compile(field.child)
+        return lambda value: [convert_item(item) for item in value]
+    if isinstance(field, serializers.BaseSerializer):
+        return _compile(field)
+
+    converter = _BUILTIN_CONVERTERS.get(type(field))
+    return converter or field.to_representation
+
+
+def _get_missing_value(field):
+    """Get the value used when the attribute is missing; SkipField drops the key."""
+    if field.default is not empty:
+        return field.get_default()
+    if field.allow_null:
+        return None
+    if not field.required:
+        raise SkipField()
+    raise KeyError(field.field_name)
+
+
+def _compile(serializer):
+    """
+    Build the representation function of a bound serializer instance.
+
+    Args:
+        serializer: Serializer whose fields are bound
+
+    Returns:
+        callable: instance -> dict
+    """
+    extractors = [
+        (
+            field.field_name,
+            field.source_attrs[0] if len(field.source_attrs) == 1 else None,
+            field,
+            _get_converter(field)
+        )
+        for field in serializer._readable_fields
+    ]
+
+    def to_representation(instance):
+        is_mapping = isinstance(instance, Mapping)
+        data = {}
+        for name, key, field, convert in extractors:
+            try:
+                if is_mapping and key is not None:
+                    try:
+                        value = instance[key]
+                    except KeyError:
+                        value = _get_missing_value(field)
+                else:
+                    # Objects and dotted sources keep DRF's attribute lookup
+                    value = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            data[name] = None if value is None else convert(value)
+        return data
+
+    return to_representation
+
+
+def compile_serializer(serializer_class, many=False):
+    """
+    Compile a read-only representation function for a serializer class.
+
+    The result matches serializer_class(instance, many=many).data for the
+    plain fields and nested serializers used by the analytics responses,
+    without validation and without building serializer instances per call.
+
+    Args:
+        serializer_class: Serializer class
+        many (bool): Whether the function takes a list of instances
+
+    Returns:
+        callable: instance (or list of instances) -> dict (or list of dicts)
+    """
+    convert = _compile(serializer_class())
+    if many:
+        return lambda instances: [convert(instance) for instance in instances]
+    return convert
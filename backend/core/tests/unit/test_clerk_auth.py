@@ -0,0 +1,245 @@
+"""
+Unit tests for Clerk session token verification.
+Tests signature checks against a file-backed JWKS, key rotation, the token
+and user caches, their webhook invalidation, the middleware's query cost and
+the DRF authentication class.
+"""
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.users.application.use_cases import UserWebhookUseCase
+from apps.users.models import User
+from core import clerk_auth
+from core.middleware import ClerkAuthenticationMiddleware
+
+
+def make_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class ClerkAuthTestCase(TestCase):
+    """Base class with a JWKS file holding one key, and a user."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.key = make_key()
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.jwks_path = os.path.join(directory.name, 'jwks.json')
+        self.write_jwks({'key-1': self.key})
+
+        settings_override = override_settings(CLERK_JWKS_FILE=self.jwks_path, CLERK_JWKS_REFRESH_SECONDS=0)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        clerk_auth.reset()
+        self.addCleanup(clerk_auth.reset)
+
+        self.user = User.objects.create(username='alice', email='alice@example.com', clerk_id='user_alice')
+        self.middleware = ClerkAuthenticationMiddleware(lambda request: request.user)
+
+    def write_jwks(self, keys):
+        jwks = {'keys': []}
+        for kid, key in keys.items():
+            jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+            jwks['keys'].append({**jwk, 'kid': kid, 'use': 'sig', 'alg': 'RS256'})
+        with open(self.jwks_path, 'w') as file:
+            json.dump(jwks, file)
+
+    def make_token(self, sub='user_alice', kid='key-1', key=None, expires_in=60, **claims):
+        now = int(time.time())
+        payload = {'sub': sub, 'iat': now, 'nbf': now, 'exp': now + expires_in, **claims}
+        return jwt.encode(payload, key or self.key, algorithm='RS256', headers={'kid': kid})
+
+    def authenticate(self, token):
+        user = self.middleware(RequestFactory().get('/api/dashboard/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+        user.pk  # Resolve the lazy user here rather than in the caller's assertions
+        return user
+
+
+class TestTokenVerification(ClerkAuthTestCase):
+    """Test which tokens are accepted."""
+
+    def test_valid_token(self):
+        user = self.authenticate(self.make_token())
+
+        self.assertTrue(user.is_authenticated)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_rejected_tokens(self):
+        cases = {
+            'forged': self.make_token(key=make_key()),
+            'expired': self.make_token(expires_in=-60),
+            'unsigned': jwt.encode({'sub': 'user_alice', 'exp': int(time.time()) + 60}, None, algorithm='none'),
+            'unknown key': self.make_token(kid='key-2'),
+            'malformed': 'not-a-token',
+        }
+        for name, token in cases.items():
+            with self.subTest(name):
+                self.assertFalse(self.authenticate(token).is_authenticated)
+
+    def test_unknown_user_is_not_created(self):
+        user = self.authenticate(self.make_token(sub='user_bob'))
+
+        self.assertFalse(user.is_authenticated)
+        self.assertFalse(User.objects.filter(clerk_id='user_bob').exists())
+
+    @override_settings(CLERK_AUTHORIZED_PARTIES=['https://dashboard.example.com'])
+    def test_authorized_parties(self):
+        self.assertTrue(self.authenticate(self.make_token(azp='https://dashboard.example.com')).is_authenticated)
+        self.assertFalse(self.authenticate(self.make_token(azp='https://evil.example.com')).is_authenticated)
+
+    def test_rotated_key_is_loaded(self):
+        self.authenticate(self.make_token())
+        new_key = make_key()
+        self.write_jwks({'key-1': self.key, 'key-2': new_key})
+
+        with mock.patch.object(clerk_auth.JWKSCache, 'MIN_REFRESH_SECONDS', 0):
+            user = self.authenticate(self.make_token(kid='key-2', key=new_key))
+
+        self.assertTrue(user.is_authenticated)
+
+    def test_failed_reload_keeps_keys(self):
+        self.authenticate(self.make_token())
+        os.remove(self.jwks_path)
+
+        jwks, _, _ = clerk_auth._caches()
+        jwks.refresh()
+
+        self.assertEqual(jwks.get_key('key-1').key.public_numbers(), self.key.public_key().public_numbers())
+
+
+class TestCaches(ClerkAuthTestCase):
+    """Test that repeated tokens cost no database query."""
+
+    def test_repeated_token_costs_no_query(self):
+        token = self.make_token()
+        self.authenticate(token)
+
+        with self.assertNumQueries(0), mock.patch.object(jwt, 'decode', side_effect=AssertionError):
+            user = self.authenticate(token)
+
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_new_token_of_known_user_costs_no_query(self):
+        self.authenticate(self.make_token())
+
+        with self.assertNumQueries(0):
+            user = self.authenticate(self.make_token(sid='session-2'))
+
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_expired_claims_are_not_served(self):
+        token = self.make_token(expires_in=1)
+        self.authenticate(token)
+
+        with mock.patch.object(clerk_auth.time, 'time', return_value=time.time() + 60), \
+                mock.patch.object(jwt, 'decode', side_effect=jwt.ExpiredSignatureError) as decode:
+            self.assertFalse(self.authenticate(token).is_authenticated)
+
+        decode.assert_called_once()
+
+    def test_users_expire(self):
+        token = self.make_token()
+        self.authenticate(token)
+        # A change another worker applied without a shared cache to bump the version in
+        User.objects.filter(pk=self.user.pk).update(email='alice@new.example.com')
+        later = time.monotonic() + 61
+
+        with mock.patch.object(clerk_auth.time, 'monotonic', return_value=later):
+            self.assertEqual(self.authenticate(token).email, 'alice@new.example.com')
+
+    def test_unknown_users_are_soon_retried(self):
+        token = self.make_token(sub='user_bob')
+        self.assertFalse(self.authenticate(token).is_authenticated)
+        User.objects.create(username='bob', email='bob@example.com', clerk_id='user_bob')
+        later = time.monotonic() + clerk_auth.UNKNOWN_USER_SECONDS + 1
+
+        with mock.patch.object(clerk_auth.time, 'monotonic', return_value=later):
+            self.assertTrue(self.authenticate(token).is_authenticated)
+
+    def test_callers_get_their_own_copy(self):
+        token = self.make_token()
+        self.authenticate(token).first_name = 'Mallory'
+
+        self.assertEqual(self.authenticate(token).first_name, '')
+
+    def test_caches_are_bounded(self):
+        cache = clerk_auth.LRUCache(2)
+        for key in 'abc':
+            cache.set(key, key)
+        cache.get('b')
+        cache.set('d', 'd')
+
+        self.assertEqual([cache.get(key) for key in 'abcd'], [None, 'b', None, 'd'])
+
+
+class TestWebhookInvalidation(ClerkAuthTestCase):
+    """Test that webhook events reach the cached users."""
+
+    def event(self, event_type, clerk_id, email):
+        UserWebhookUseCase().handle_event(event_type, {
+            'id': clerk_id, 'email_addresses': [{'email_address': email}]
+        })
+
+    def test_updated_user(self):
+        token = self.make_token()
+        self.authenticate(token)
+
+        self.event('user.updated', 'user_alice', 'alice@new.example.com')
+
+        self.assertEqual(self.authenticate(token).email, 'alice@new.example.com')
+
+    def test_deleted_user(self):
+        token = self.make_token()
+        self.authenticate(token)
+
+        self.event('user.deleted', 'user_alice', 'alice@example.com')
+
+        self.assertFalse(self.authenticate(token).is_authenticated)
+
+    def test_created_user(self):
+        token = self.make_token(sub='user_bob')
+        self.assertFalse(self.authenticate(token).is_authenticated)
+
+        self.event('user.created', 'user_bob', 'bob@example.com')
+
+        self.assertTrue(self.authenticate(token).is_authenticated)
+
+    def test_other_workers_see_the_bump(self):
+        token = self.make_token()
+        self.authenticate(token)
+        # Another worker handles the webhook: the shared version moves, the local entries stay
+        User.objects.filter(pk=self.user.pk).update(email='alice@new.example.com')
+        with mock.patch.object(clerk_auth, '_users', None):
+            clerk_auth.invalidate_users()
+
+        self.assertEqual(self.authenticate(token).email, 'alice@new.example.com')
+
+
+class TestDrfAuthentication(ClerkAuthTestCase):
+    """Test that DRF permission checks see the token's user."""
+
+    URL = '/api/dashboard/records/students/'
+
+    def get(self, token):
+        return self.client.get(self.URL, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_admin_token(self):
+        User.objects.filter(pk=self.user.pk).update(role='admin')
+
+        self.assertEqual(self.get(self.make_token()).status_code, 200)
+
+    def test_rejected_requests(self):
+        self.assertEqual(self.client.get(self.URL).status_code, 401)
+        self.assertEqual(self.get(self.make_token(key=make_key())).status_code, 403)
+        self.assertEqual(self.get(self.make_token()).status_code, 403)  # Not an admin
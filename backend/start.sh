@@ -22,6 +22,11 @@ echo "Environment variables check:"
 echo "  DATABASE_URL exists: $([ -n "$DATABASE_URL" ] && echo 'YES' || echo 'NO')"
 echo "  CLERK_WEBHOOK_SECRET exists: $([ -n "$CLERK_WEBHOOK_SECRET" ] && echo 'YES' || echo 'NO')"
 
+# Workers share metrics through this directory; start each deploy empty
+export METRICS_DIR="${METRICS_DIR:-/tmp/dashboard-metrics}"
+rm -rf "$METRICS_DIR"
+mkdir -p "$METRICS_DIR"
+
 echo "Starting Gunicorn on 0.0.0.0:$PORT..."
 
 # Run gunicorn
@@ -0,0 +1,115 @@
+"""
+Columnar helpers for rate and percentage calculations.
+
+The services used to compute each row's rate in Python and round it with
+round(Decimal(str(rate)), 2). These helpers do the arithmetic on NumPy
+arrays and produce identical values: rows whose rate sits within rounding
+error of a tie fall back to the exact per-row rounding.
+"""
+from decimal import Decimal
+
+import numpy as np
+
+
+# Scaled values this close to k + 0.5 may round differently in binary
+# floating point than in their decimal representation
+_TIE_TOLERANCE = 1e-6
+
+# Below this many values per-row rounding beats NumPy's per-call overhead
+_MIN_VECTOR_SIZE = 64
+
+
+def take(values, order):
+    """
+    Reorder a list by an index array.
+
+    Args:
+        values (list): Values
+        order (np.ndarray): Indexes into values
+
+    Returns:
+        list: values[i] for each i in order
+    """
+    return [values[index] for index in order.tolist()]
+
+
+def column(rows, key, dtype=np.float64):
+    """
+    Extract one column of row dicts, with None as 0.
+
+    Args:
+        rows (list): Row dicts
+        key (str): Column name
+        dtype: NumPy dtype of the column
+
+    Returns:
+        np.ndarray: Column values
+    """
+    return np.fromiter((row[key] or 0 for row in rows), dtype=dtype, count=len(rows))
+
+
+def rates(numerators, denominators):
+    """
+    Calculate numerator / denominator * 100 per row, 0 where the
+    denominator is not positive.
+
+    Args:
+        numerators (np.ndarray): Numerators
+        denominators (np.ndarray): Denominators
+
+    Returns:
+        np.ndarray: Float64 rates
+    """
+    numerators = np.asarray(numerators, dtype=np.float64)
+    denominators = np.asarray(denominators, dtype=np.float64)
+    result = np.zeros(len(numerators))
+    np.divide(numerators, denominators, out=result, where=denominators > 0)
+    result *= 100
+    return result
+
+
+def _near_ties(scaled):
+    return np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE)
+
+
+def round_decimals(values):
+    """
+    Round values to two places as Decimals.
+
+    Args:
+        values (np.ndarray): Float values
+
+    Returns:
+        list: Decimals equal to round(Decimal(str(value)), 2) for each value
+    """
+    if len(values) < _MIN_VECTOR_SIZE:
+        return [round(Decimal(str(value)), 2) for value in values.tolist()]
+
+    scaled = values * 100
+    # Decimals are immutable, so rows sharing a value share one instance
+    hundredths, positions = np.unique(np.rint(scaled).astype(np.int64), return_inverse=True)
+    decimals = [Decimal(count).scaleb(-2) for count in hundredths.tolist()]
+    result = [decimals[position] for position in positions.tolist()]
+    for index in _near_ties(scaled):
+        result[index] = round(Decimal(str(float(values[index]))), 2)
+    return result
+
+
+def round_floats(values):
+    """
+    Round values to two places as floats.
+
+    Args:
+        values (np.ndarray): Float values
+
+    Returns:
+        list: Floats equal to round(value, 2) for each value
+    """
+    if len(values) < _MIN_VECTOR_SIZE:
+        return [round(value, 2) for value in values.tolist()]
+
+    scaled = values * 100
+    result = (np.rint(scaled) / 100).tolist()
+    for index in _near_ties(scaled):
+        result[index] = round(float(values[index]), 2)
+    return result